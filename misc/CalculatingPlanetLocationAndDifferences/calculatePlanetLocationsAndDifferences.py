@@ -38,6 +38,7 @@ if srcDir not in sys.path:
     sys.path.insert(0, srcDir)
 from astrologychart import AstrologyUtils
 from ephemeris import Ephemeris
+from ephemeris import CompactPlanetaryInfo
 from data_objects import *
 
 
@@ -653,9 +654,16 @@ def getLongitudeDiffBetweenDatetimes(planetName,
                                     loc1Latitude,
                                     loc1Elevation)
     
-    # List of PlanetaryInfo objects for this particular
-    # planet, sorted by timestamp.
+    # List of CompactPlanetaryInfo objects for this particular
+    # planet, sorted by timestamp.  Only the values used below are
+    # kept, in the compact form, since this list can get very long.
     planetData = []
+
+    def toCompactPlanetaryInfo(p):
+        return CompactPlanetaryInfo.\
+               fromPlanetaryInfo(p,
+                                 centricityTypes=[centricityType],
+                                 fieldNames=["longitude", "longitude_speed"])
                 
     # Step size to use in populating the data list with
     # PlanetaryInfos.
@@ -703,7 +711,7 @@ def getLongitudeDiffBetweenDatetimes(planetName,
     # Step through the timestamps, calculating the planet positions.
     while currDt < endTimestamp:
         p = Ephemeris.getPlanetaryInfo(planetName, currDt)
-        planetData.append(p)
+        planetData.append(toCompactPlanetaryInfo(p))
                     
         # Increment step size.
         currDt += stepSizeTd
@@ -713,7 +721,7 @@ def getLongitudeDiffBetweenDatetimes(planetName,
                                     loc2Latitude,
                                     loc2Elevation)
     p = Ephemeris.getPlanetaryInfo(planetName, endTimestamp)
-    planetData.append(p)
+    planetData.append(toCompactPlanetaryInfo(p))
                 
     # Geocentric measurement.
     if centricityType == "geocentric":
@@ -785,7 +793,7 @@ def getLongitudeDiffBetweenDatetimes(planetName,
                 # following the polarity change.
                 # Append this value to the list.
                 p = Ephemeris.getPlanetaryInfo(planetName, t2)
-                additionalPlanetaryInfos.append(p)
+                additionalPlanetaryInfos.append(toCompactPlanetaryInfo(p))
 
                 t1pi = planetData[i-1]
                 t2pi = Ephemeris.getPlanetaryInfo(planetName, t2)
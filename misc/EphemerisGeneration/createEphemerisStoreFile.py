@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+##############################################################################
+# Description:
+#
+#   Script to create an ephemeris store file, which holds precomputed
+#   planet positions sampled at a fixed step over a span of years.
+#   The file is read by ephemeris_store.EphemerisStore, and is shared
+#   (memory-mapped) by all the processes doing lookback calculations.
+#   See the class description of EphemerisStore for the file format.
+#
+# Usage:
+#
+#     ./createEphemerisStoreFile.py --help
+#     ./createEphemerisStoreFile.py --version
+#
+#     # Generate hourly planet longitudes from 1800 to 2100, and write
+#     # them to the default location of the store file.
+#     ./createEphemerisStoreFile.py --start-year=1800 --end-year=2100 --step-hours=1
+#
+#     # Generate daily longitudes and declinations of a few planets,
+#     # and write the output to a file.
+#     ./createEphemerisStoreFile.py --start-year=1900 --end-year=2050 --step-hours=24 --planets=Sun,Moon,Mars --fields=longitude,declination --output-file=/tmp/testing.pcs
+#
+##############################################################################
+
+# For obtaining current directory path information, and creating directories
+import os
+import sys
+
+# For dates.
+import datetime
+import pytz
+
+# For parsing command-line options
+from optparse import OptionParser
+
+# For logging.
+import logging
+
+# Include some PriceChartingTool modules.
+# This assumes that the relative directory from this script is: ../../src
+thisScriptDir = os.path.dirname(os.path.abspath(__file__))
+srcDir = os.path.dirname(os.path.dirname(thisScriptDir)) + os.sep + "src"
+if srcDir not in sys.path:
+    sys.path.insert(0, srcDir)
+from ephemeris import Ephemeris
+from ephemeris_store import EphemerisStore
+
+##############################################################################
+
+##############################################################################
+# Global variables
+
+# Version string.
+VERSION = "0.1"
+
+# Location information to use with the Ephemeris.
+# This is used for the house cusp, ascmc and topocentric values.
+locationName = "New York City"
+locationLongitude = -74.0064
+locationLatitude = 40.7142
+locationElevation = 0
+
+# Centricity types to generate.
+centricityTypes = ["geocentric", "heliocentric"]
+
+# Zodiac types to generate.
+zodiacTypes = ["tropical", "sidereal"]
+
+# For logging.
+logging.basicConfig(format='%(levelname)s: %(message)s')
+moduleName = globals()['__name__']
+log = logging.getLogger(moduleName)
+#log.setLevel(logging.DEBUG)
+log.setLevel(logging.INFO)
+
+##############################################################################
+
+def shutdown(rc):
+    """Exits the script, but first flushes all logging handles, etc."""
+
+    # Close the Ephemeris so it can do necessary cleanups.
+    Ephemeris.closeEphemeris()
+
+    logging.shutdown()
+
+    sys.exit(rc)
+
+##############################################################################
+
+# Create the parser
+parser = OptionParser()
+
+# Specify all valid options.
+parser.add_option("-v", "--version",
+                  action="store_true",
+                  dest="version",
+                  default=False,
+                  help="Display script version info and author contact.")
+
+parser.add_option("--start-year",
+                  action="store",
+                  type="int",
+                  dest="startYear",
+                  default=1800,
+                  help="Specify the first year of the data.  " + \
+                  "Default is 1800.",
+                  metavar="<YEAR>")
+
+parser.add_option("--end-year",
+                  action="store",
+                  type="int",
+                  dest="endYear",
+                  default=2100,
+                  help="Specify the last year of the data.  " + \
+                  "Default is 2100.",
+                  metavar="<YEAR>")
+
+parser.add_option("--step-hours",
+                  action="store",
+                  type="float",
+                  dest="stepHours",
+                  default=24,
+                  help="Specify the number of hours between samples.  " + \
+                  "Default is 24.",
+                  metavar="<HOURS>")
+
+parser.add_option("--planets",
+                  action="store",
+                  type="str",
+                  dest="planetsStr",
+                  default=None,
+                  help="Specify a comma-separated list of planet names.  " + \
+                  "Default is all the supported planet names.",
+                  metavar="<PLANETS>")
+
+parser.add_option("--fields",
+                  action="store",
+                  type="str",
+                  dest="fieldsStr",
+                  default="longitude",
+                  help="Specify a comma-separated list of field names.  " + \
+                  "Default is 'longitude'.",
+                  metavar="<FIELDS>")
+
+parser.add_option("--output-file",
+                  action="store",
+                  type="str",
+                  dest="outputFile",
+                  default=EphemerisStore.DEFAULT_STORE_FILENAME,
+                  help="Specify output store file.  " + \
+                  "Default is '{}'.".\
+                  format(EphemerisStore.DEFAULT_STORE_FILENAME),
+                  metavar="<FILE>")
+
+# Parse the arguments into options.
+(options, args) = parser.parse_args()
+
+# Print version information if the flag was used.
+if options.version == True:
+    print(os.path.basename(sys.argv[0]) + " (Version " + VERSION + ")")
+    print("By Ryan Luu, ryanluu@gmail.com")
+    shutdown(0)
+
+if options.startYear > options.endYear:
+    log.error("Start year cannot be after the end year.")
+    shutdown(1)
+
+if options.stepHours <= 0:
+    log.error("Step hours must be a positive number.")
+    shutdown(1)
+
+planetNames = None
+if options.planetsStr != None:
+    planetNames = [p.strip() for p in options.planetsStr.split(",")]
+
+    supportedPlanetNames = Ephemeris.getSupportedPlanetNamesList()
+    for planetName in planetNames:
+        if planetName not in supportedPlanetNames:
+            log.error("Unsupported planet name: {}".format(planetName))
+            shutdown(1)
+
+fieldNames = [f.strip() for f in options.fieldsStr.split(",")]
+
+outputFile = options.outputFile
+
+##############################################################################
+
+# Initialize Ephemeris (required).
+Ephemeris.initialize()
+
+# Set the Location (required).
+Ephemeris.setGeographicPosition(locationLongitude,
+                                locationLatitude,
+                                locationElevation)
+
+startDt = datetime.datetime(options.startYear, 1, 1, tzinfo=pytz.utc)
+endDt = datetime.datetime(options.endYear, 12, 31, 23, 59, tzinfo=pytz.utc)
+
+log.info("Generating ephemeris store for {} ...".format(locationName))
+
+try:
+    EphemerisStore.generate(outputFile,
+                            startDt,
+                            endDt,
+                            stepTd=datetime.timedelta(hours=options.stepHours),
+                            planetNames=planetNames,
+                            centricityTypes=centricityTypes,
+                            zodiacTypes=zodiacTypes,
+                            fieldNames=fieldNames)
+except ValueError as e:
+    log.error("Could not generate the ephemeris store: {}".format(e))
+    shutdown(1)
+
+log.info("Wrote output file '{}'.".format(outputFile))
+log.info("Done.")
+shutdown(0)
+
+##############################################################################
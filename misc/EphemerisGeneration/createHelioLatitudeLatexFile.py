@@ -508,8 +508,9 @@ while currDt < endDt:
     
     planetaryInfosDict = {}
     
-    for planetName in planetNames:
-        pi = Ephemeris.getPlanetaryInfo(planetName, currDt)
+    # Each planet is calculated once, and shared by the custom planets.
+    planetaryInfos = Ephemeris.getPlanetaryInfos(planetNames, currDt)
+    for planetName, pi in zip(planetNames, planetaryInfos):
         planetaryInfosDict[planetName] = pi
 
     dateStr = formatToDateStr(currDt)
@@ -743,8 +743,9 @@ tableDataDict = {}
 while currDt < endDt:
     currPlanetaryInfosDict = {}
     
-    for planetName in planetNames:
-        pi = Ephemeris.getPlanetaryInfo(planetName, currDt)
+    # Each planet is calculated once, and shared by the custom planets.
+    planetaryInfos = Ephemeris.getPlanetaryInfos(planetNames, currDt)
+    for planetName, pi in zip(planetNames, planetaryInfos):
         currPlanetaryInfosDict[planetName] = pi
     
     # Add text for a row in the table.
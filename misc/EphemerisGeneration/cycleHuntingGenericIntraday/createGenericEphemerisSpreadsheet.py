@@ -42,6 +42,9 @@ import logging
 # For math.floor()
 import math
 
+# For array.array of Julian Days.
+import array
+
 # Include some PriceChartingTool modules.
 # This assumes that the relative directory from this script is: ../../../src
 thisScriptDir = os.path.dirname(os.path.abspath(__file__))
@@ -261,84 +264,73 @@ def formatToDateAndTimeStr(dt):
 
     
     
-def getPlanetaryInfosForDatetime(dt):
-    """Helper function for getting a list of PlanetaryInfo objects
-    to display in the astrology chart.
+def getEphemerisValues(dts):
+    """Calculates the planetary position data used in the CSV lines,
+    for all the given timestamps.  Each planet is calculated once per
+    centricity type with Ephemeris.getPlanetPositionsBatch(), instead
+    of creating PlanetaryInfo objects for every timestamp.
+
+    Arguments:
+    dts - list of datetime.datetime objects with the timestamps seeked.
+
+    Returns:
+    dict of (planetName, centricityType, fieldName) to the sequence of
+    float values, one for each timestamp in 'dts'.
     """
 
     # Set the location again (required).
     Ephemeris.setGeographicPosition(locationLongitude,
                                     locationLatitude,
                                     locationElevation)
-    
-    # Get planetary info for all the planets.
-    planets = []
-    
-    # Astrological house system for getting the house cusps.
-    houseSystem = Ephemeris.HouseSys['Porphyry']
-    
-    planets.append(Ephemeris.getH1PlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getH2PlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getH3PlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getH4PlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getH5PlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getH6PlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getH7PlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getH8PlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getH9PlanetaryInfo(dt, houseSystem))
-    planets.append(Ephemeris.getH10PlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getH11PlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getH12PlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getARMCPlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getVertexPlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getEquatorialAscendantPlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getCoAscendant1PlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getCoAscendant2PlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getPolarAscendantPlanetaryInfo(dt, houseSystem))
-    #planets.append(Ephemeris.getHoraLagnaPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getGhatiLagnaPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getMeanLunarApogeePlanetaryInfo(dt))
-    #planets.append(Ephemeris.getOsculatingLunarApogeePlanetaryInfo(dt))
-    #planets.append(Ephemeris.getInterpolatedLunarApogeePlanetaryInfo(dt))
-    #planets.append(Ephemeris.getInterpolatedLunarPerigeePlanetaryInfo(dt))
-    planets.append(Ephemeris.getSunPlanetaryInfo(dt))
-    planets.append(Ephemeris.getMoonPlanetaryInfo(dt))
-    planets.append(Ephemeris.getMercuryPlanetaryInfo(dt))
-    planets.append(Ephemeris.getVenusPlanetaryInfo(dt))
-    planets.append(Ephemeris.getEarthPlanetaryInfo(dt))
-    planets.append(Ephemeris.getMarsPlanetaryInfo(dt))
-    planets.append(Ephemeris.getJupiterPlanetaryInfo(dt))
-    planets.append(Ephemeris.getSaturnPlanetaryInfo(dt))
-    planets.append(Ephemeris.getUranusPlanetaryInfo(dt))
-    planets.append(Ephemeris.getNeptunePlanetaryInfo(dt))
-    planets.append(Ephemeris.getPlutoPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getMeanNorthNodePlanetaryInfo(dt))
-    #planets.append(Ephemeris.getTrueSouthNodePlanetaryInfo(dt))
-    planets.append(Ephemeris.getTrueNorthNodePlanetaryInfo(dt))
-    #planets.append(Ephemeris.getTrueSouthNodePlanetaryInfo(dt))
-    #planets.append(Ephemeris.getCeresPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getPallasPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getJunoPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getVestaPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getIsisPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getNibiruPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getChironPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getGulikaPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getMandiPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getMeanOfFivePlanetaryInfo(dt))
-    #planets.append(Ephemeris.getCycleOfEightPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getAvgMaJuSaUrNePlPlanetaryInfo(dt))
-    #planets.append(Ephemeris.getAvgJuSaUrNePlanetaryInfo(dt))
-    #planets.append(Ephemeris.getAvgJuSaPlanetaryInfo(dt))
-
-    return planets
-
-
-def getEphemerisDataLineForDatetime(dt):
+
+    # Julian Days of all the timestamps.
+    jds = array.array('d')
+    for dt in dts:
+        jds.append(Ephemeris.datetimeToJulianDay(dt))
+
+    # Planet names, centricity type and field name of the values
+    # used in the CSV lines.
+    fieldsToCalculate = [\
+        (geocentricPlanetNames, "geocentric", "longitude"),
+        (heliocentricPlanetNames, "heliocentric", "longitude"),
+        (declinationPlanetNames, "geocentric", "declination"),
+        (geocentricLatitudePlanetNames, "geocentric", "latitude"),
+        (heliocentricLatitudePlanetNames, "heliocentric", "latitude")
+        ]
+
+    # Field names needed for each planet and centricity type.
+    fieldNamesToCalculate = {}
+    for (planetNames, centricityType, fieldName) in fieldsToCalculate:
+        for planetName in planetNames:
+            key = (planetName, centricityType)
+            if key not in fieldNamesToCalculate:
+                fieldNamesToCalculate[key] = []
+            if fieldName not in fieldNamesToCalculate[key]:
+                fieldNamesToCalculate[key].append(fieldName)
+
+    rv = {}
+    for (planetName, centricityType), fieldNames in \
+            fieldNamesToCalculate.items():
+
+        values = Ephemeris.getPlanetPositionsBatch(planetName,
+                                                   jds,
+                                                   centricityType,
+                                                   "tropical",
+                                                   fieldNames)
+        for fieldName in fieldNames:
+            rv[(planetName, centricityType, fieldName)] = values[fieldName]
+
+    return rv
+
+
+def getEphemerisDataLine(values, i):
     """Obtains the line of CSV text of planetary position data.
 
     Arguments:
-    dt - datetime.datetime object with the timestamp seeked.  
+    values - dict of planetary position data, as returned by
+             getEphemerisValues().
+    i      - int index of the timestamp seeked, in the list of
+             timestamps given to getEphemerisValues().
     
     Returns:
     
@@ -349,79 +341,56 @@ def getEphemerisDataLineForDatetime(dt):
     # Return value.
     rv = ""
 
-    planetaryInfos = getPlanetaryInfosForDatetime(dt)
-
-    log.debug("Just obtained planetaryInfos for timestamp: {}".\
-              format(Ephemeris.datetimeToStr(dt)))
-    
     # Planet geocentric longitude 15-degree axis points.
     for planetName in geocentricPlanetNames:
-        for pi in planetaryInfos:
-            if pi.name == planetName:
-                lon = pi.geocentric['tropical']['longitude']
-                rv += "{:.3f},".format(lon % 15.0)
-                    
+        lon = values[(planetName, "geocentric", "longitude")][i]
+        rv += "{:.3f},".format(lon % 15.0)
+            
     # Planet geocentric longitude.
     for planetName in geocentricPlanetNames:
-        for pi in planetaryInfos:
-            if pi.name == planetName:
-                lon = pi.geocentric['tropical']['longitude']
-                rv += "{:.3f},".format(lon)
-                    
+        lon = values[(planetName, "geocentric", "longitude")][i]
+        rv += "{:.3f},".format(lon)
+            
     # Planet geocentric longitude in zodiac str format.
     for planetName in geocentricPlanetNames:
-        for pi in planetaryInfos:
-            if pi.name == planetName:
-                lon = pi.geocentric['tropical']['longitude']
-                valueStr = \
-                         AstrologyUtils.\
-                         convertLongitudeToStrWithRasiAbbrev(lon)
-                rv += valueStr + ","
-                
+        lon = values[(planetName, "geocentric", "longitude")][i]
+        valueStr = \
+                 AstrologyUtils.\
+                 convertLongitudeToStrWithRasiAbbrev(lon)
+        rv += valueStr + ","
+        
     # Planet heliocentric longitude 15-degree axis points.
     for planetName in heliocentricPlanetNames:
-        for pi in planetaryInfos:
-            if pi.name == planetName:
-                lon = pi.heliocentric['tropical']['longitude']
-                rv += "{:.3f},".format(lon % 15.0)
-                    
+        lon = values[(planetName, "heliocentric", "longitude")][i]
+        rv += "{:.3f},".format(lon % 15.0)
+            
     # Planet heliocentric longitude.
     for planetName in heliocentricPlanetNames:
-        for pi in planetaryInfos:
-            if pi.name == planetName:
-                lon = pi.heliocentric['tropical']['longitude']
-                rv += "{:.3f},".format(lon)
-                    
+        lon = values[(planetName, "heliocentric", "longitude")][i]
+        rv += "{:.3f},".format(lon)
+            
     # Planet heliocentric longitude in zodiac str format.
     for planetName in heliocentricPlanetNames:
-        for pi in planetaryInfos:
-            if pi.name == planetName:
-                lon = pi.heliocentric['tropical']['longitude']
-                valueStr = \
-                         AstrologyUtils.\
-                         convertLongitudeToStrWithRasiAbbrev(lon)
-                rv += valueStr + ","
-                
+        lon = values[(planetName, "heliocentric", "longitude")][i]
+        valueStr = \
+                 AstrologyUtils.\
+                 convertLongitudeToStrWithRasiAbbrev(lon)
+        rv += valueStr + ","
+        
     # Planet declination.
     for planetName in declinationPlanetNames:
-        for pi in planetaryInfos:
-            if pi.name == planetName:
-                declination = pi.geocentric['tropical']['declination']
-                rv += "{:.3f},".format(declination)
+        declination = values[(planetName, "geocentric", "declination")][i]
+        rv += "{:.3f},".format(declination)
     
     # Planet geocentric latitude.
     for planetName in geocentricLatitudePlanetNames:
-        for pi in planetaryInfos:
-            if pi.name == planetName:
-                latitude = pi.geocentric['tropical']['latitude']
-                rv += "{:.3f},".format(latitude)
+        latitude = values[(planetName, "geocentric", "latitude")][i]
+        rv += "{:.3f},".format(latitude)
     
     # Planet heliocentric latitude.
     for planetName in heliocentricLatitudePlanetNames:
-        for pi in planetaryInfos:
-            if pi.name == planetName:
-                latitude = pi.heliocentric['tropical']['latitude']
-                rv += "{:.3f},".format(latitude)
+        latitude = values[(planetName, "heliocentric", "latitude")][i]
+        rv += "{:.3f},".format(latitude)
     
     
     # Remove trailing comma.
@@ -515,7 +484,24 @@ monthCount = 0
 
 log.info("Doing ephemeris calculations ...")
 
+# Timestamps of the lines in the output file.
+dts = []
 while currDt < endDt:
+    dts.append(currDt)
+
+    # Increment the currDt by the step size for the next iteration.
+    # Also, make sure the time is set.
+    currDt = currDt + stepSizeTd
+
+    # Only keep the same time of day if we are doing 1-day increments.  
+    if stepSizeTd == datetime.timedelta(days=1):
+        currDt = currDt.replace(hour=hourOfDay, minute=minuteOfHour)
+
+# Calculate the planetary positions for all the timestamps.
+ephemerisValues = getEphemerisValues(dts)
+
+for i in range(len(dts)):
+    currDt = dts[i]
     line = ""
 
     # Get date and time str.
@@ -577,7 +563,7 @@ while currDt < endDt:
             # Month count.
             line += "{}".format(monthCount) + ","
         
-    line += getEphemerisDataLineForDatetime(currDt) + ","
+    line += getEphemerisDataLine(ephemerisValues, i) + ","
     
     # Remove the last trailing comma. 
     line = line[:-1]
@@ -588,15 +574,8 @@ while currDt < endDt:
     # Save the date for the next iteration, so we can maintain our
     # time-keeping for day, week, and month counts.
     prevDate = currDt.date()
-    
-    # Increment the currDt by the step size for the next iteration.
-    # Also, make sure the time is set.
-    currDt = currDt + stepSizeTd
 
-    # Only keep the same time of day if we are doing 1-day increments.  
-    if stepSizeTd == datetime.timedelta(days=1):
-        currDt = currDt.replace(hour=hourOfDay, minute=minuteOfHour)
-    
+
 # Write outputLines to output file.
 try:
     with open(outputFilename, "w", encoding="utf-8") as f:
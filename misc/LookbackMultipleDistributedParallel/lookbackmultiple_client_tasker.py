@@ -3,14 +3,12 @@
 # 
 # Description:
 # 
-#   Runs a server that is a Python multiprocessing Manager for managing task
-#   queues and result queues.  Accepts connections on a certain port from other
-#   multiprocessing clients that are either workers or taskers.  Work tasks
-#   submitted to the task queue by the tasker is pulled out and consumed by the
-#   workers.  When the worker completes the task, the worker puts the result
-#   that is computed for the task onto the result queue.  The tasker can then
-#   pull results from the result queue.  There can be many workers in this
-#   model.
+#   Runs a client tasker that connects to a remote Python multiprocessing
+#   Manager server, submits LookbackMultiple work tasks as a job to the task
+#   broker on it, and takes the results of the job as the workers complete
+#   them.  This is an example test implementation of what PriceBarChartWidget
+#   does for the Remote / Parallel calculation model.  The job has batch
+#   priority by default, so the jobs of charts go ahead of it.
 #   
 # Usage:
 #   
@@ -18,6 +16,8 @@
 #
 #   ./lookbackmultiple_client_tasker.py --server-address=light.jumpingcrab.com --server-port=1940 --auth-key="passphrase"
 #
+#   ./lookbackmultiple_client_tasker.py --server-address=192.168.1.200 --server-port=1940 --auth-key="passphrase" --priority=10
+#
 #
 ##############################################################################
 
@@ -42,10 +42,6 @@ from optparse import OptionParser
 # For timing the calculations.
 import time
 
-# For multiprocessing features.
-from multiprocessing.managers import BaseManager
-from multiprocessing import JoinableQueue
-
 # Include some PriceChartingTool modules.
 # This assumes that the relative directory from this script is: ../../src
 thisScriptDir = os.path.dirname(os.path.abspath(__file__))
@@ -53,7 +49,8 @@ srcDir = os.path.dirname(os.path.dirname(thisScriptDir)) + os.sep + "src"
 if srcDir not in sys.path:
     sys.path.insert(0, srcDir)
 
-#from lookbackmultiple_parallel import LookbackMultipleParallel
+# For submitting tasks to the server.
+from lookbackmultiple_remote import LookbackMultipleRemoteClient
 
 ##############################################################################
 
@@ -61,7 +58,7 @@ if srcDir not in sys.path:
 # Global variables
 
 # Version string.
-VERSION = "0.1"
+VERSION = "0.3"
 
 # Server address (str).
 # Either a hostname or an IP address.
@@ -77,6 +74,15 @@ serverPort = None
 # by converting from str to bytes.
 serverAuthKey = b""
 
+# Number of seconds that no result arrives after which the remaining
+# results are given up on (float).
+# This value is obtained via command-line parameter.
+timeoutSec = 300.0
+
+# Priority of the job submitted (int).
+# This value is obtained via command-line parameter.
+priority = LookbackMultipleRemoteClient.PRIORITY_BATCH
+
 
 # For logging.
 #logLevel = logging.DEBUG
@@ -107,37 +113,31 @@ signal.signal(signal.SIGINT, signal_SIGINT_handler)
 
 ##############################################################################
 
-class QueueManager(BaseManager):
-    pass
-
 def runClientTasker():
     global serverAddress
     global serverPort
     global serverAuthKey
 
-    # Connect to a manager server and access its queues.
+    # Connect to a manager server and access its task broker.
 
-    QueueManager.register("getTaskQueue", callable=lambda: taskQueue)
-    QueueManager.register("getResultQueue", callable=lambda: resultQueue)
-    
-    manager = QueueManager(address=(serverAddress, serverPort), 
-                           authkey=serverAuthKey)
-    manager.connect()
+    client = LookbackMultipleRemoteClient(serverAddress,
+                                          serverPort,
+                                          serverAuthKey,
+                                          timeoutSec,
+                                          priority)
+    client.connect()
     
     log.info("LookbackMultiple client tasker connected to {}:{}".\
              format(serverAddress, serverPort))
     
-    taskQueue = manager.getTaskQueue()
-    resultQueue = manager.getResultQueue()
-    
     log.info("LookbackMultiple client tasker now creating tasks ...")
     
-    speedTestDistributedParallel(taskQueue, resultQueue)
+    speedTestDistributedParallel(client)
     
     log.info("LookbackMultiple client tasker is done.")
 
 
-def speedTestDistributedParallel(taskQueue, resultQueue):
+def speedTestDistributedParallel(client):
     """Tests to see how long it takes to do some distributed
     computations in parallel.
     """
@@ -164,7 +164,6 @@ def speedTestDistributedParallel(taskQueue, resultQueue):
         startTime = time.time()
         
         argsTupleList = []
-        resultsList = []
 
         for i in range(numIterations):
             planetName="MoSu"
@@ -174,13 +173,7 @@ def speedTestDistributedParallel(taskQueue, resultQueue):
             #desiredDeltaDegrees = 360 * 360
             desiredDeltaDegrees = 360 * ((i+1) * 37)
 
-            methodToRun = "getDatetimesOfLongitudeDeltaDegreesInFuture"
-            #methodToRun = "getDatetimesOfLongitudeDeltaDegreesInPast"
-            taskId = i
-
-            args = (methodToRun,
-                    taskId,
-                    planetName, 
+            args = (planetName, 
                     centricityType, 
                     longitudeType, 
                     referenceDt, 
@@ -192,96 +185,48 @@ def speedTestDistributedParallel(taskQueue, resultQueue):
             
             argsTupleList.append(args)
 
-        # Submit tasks.
+        # Submit tasks, and consume the results as they arrive.
         log.info("Submitting {} tasks ...".format(len(argsTupleList)))
-        for argsTuple in argsTupleList:
-            
-            log.debug("About to submit argsTuple: {}".\
-                      format(argsTuple))
-            taskQueue.put(argsTuple)
-
-        log.info("Submitting {} tasks completed.".\
-                  format(len(argsTupleList)))
-            
-        # Block, waiting for all the tasks to complete.
-        log.info("Waiting for all tasks to complete ...")
 
-        taskQueue.join()
+        direction = 1
+        #direction = -1
 
-        #log.debug("Tasks completed.  Now analyzing results ...")
-        log.info("Now analyzing results ...")
-        
         resultCount = 0
-        while resultCount < len(argsTupleList):
-
-            # Get a result.
-            (argsTuple, resultDts) = resultQueue.get()
-
-            argIndex = 0
-            methodToRun = argsTuple[argIndex]
-            argIndex += 1
-            taskId = argsTuple[argIndex]
-            argIndex += 1
-            planetName = argsTuple[argIndex]
-            argIndex += 1
-            centricityType = argsTuple[argIndex]
-            argIndex += 1
-            longitudeType = argsTuple[argIndex]
-            argIndex += 1
-            referenceDt = argsTuple[argIndex]
-            argIndex += 1
-            desiredDeltaDegrees = argsTuple[argIndex]
-            argIndex += 1
-            maxErrorTd = argsTuple[argIndex]
-            argIndex += 1
-            locationLongitudeDegrees = argsTuple[argIndex]
-            argIndex += 1
-            locationLatitudeDegrees = argsTuple[argIndex]
-            argIndex += 1
-            locationElevationMeters = argsTuple[argIndex]
-            argIndex += 1
-            
-            endl = os.linesep
-
-            argsTupleStr = \
-                "methodToRun == {}".format(methodToRun) + endl + \
-                "taskId == {}".format(taskId) + endl + \
-                "planetName == {}".format(planetName) + endl + \
-                "centricityType == {}".format(centricityType) + endl + \
-                "longitudeType == {}".format(longitudeType) + endl + \
-                "referenceDt == {}".format(referenceDt) + endl + \
-                "desiredDeltaDegrees == {}".\
-                format(desiredDeltaDegrees) + endl + \
-                "maxErrorTd == {}".format(maxErrorTd) + endl + \
-                "locationLongitudeDegrees == {}".\
-                format(locationLongitudeDegrees) + endl + \
-                "locationLatitudeDegrees == {}".\
-                format(locationLatitudeDegrees) + endl + \
-                "locationElevationMeters == {}".\
-                format(locationElevationMeters)
-
-
+        for (index, resultDts) in \
+                client.imapDatetimesOfLongitudeDeltaDegrees(argsTupleList,
+                                                            direction):
 
             log.debug("Obtained result: " + \
-                      "argsTuple == {}, ".format(argsTuple) + 
+                      "argsTuple == {}, ".format(argsTupleList[index]) + 
                       "len(resultDts) == {}".format(len(resultDts)))
             for i in range(len(resultDts)):
                 dt = resultDts[i]
                 log.debug("  resultDts[{}] == {}".format(i, dt))
 
-            # Notify that the consumption of this result is complete.
-            resultQueue.task_done()
-
             resultCount += 1
             log.info("We have consumed {} total results now.".\
                       format(resultCount))
      
-        log.info("Done consuming all tasks submitted.") 
+        if client.numResultsMissing > 0:
+            log.warning("{} results were not obtained.".\
+                        format(client.numResultsMissing))
+        else:
+            log.info("Done consuming all tasks submitted.") 
         endTime = time.time()
 
         log.info("  Calculations in distributed parallel took: {} sec".\
               format(endTime - startTime))
 
+        # Show how the workers did.
+        statistics = client.getStatistics()
+        for (workerId, worker) in sorted(statistics["workers"].items()):
+            log.info("  Worker {}: alive == {}, ".\
+                     format(workerId, worker["alive"]) + \
+                     "{} tasks completed, {} leases expired, ".\
+                     format(worker["numTasksCompleted"],
+                            worker["numLeasesExpired"]) + \
+                     "{:.2f} tasks/sec".format(worker["tasksPerSec"]))
+
 
 ##############################################################################
 
@@ -326,6 +271,30 @@ if __name__=="__main__":
                        "Example: 'passphrase'.  ",
                   metavar="<PASSWORD>")
 
+    parser.add_option("--timeout-sec",
+                  action="store",
+                  type="float",
+                  dest="timeoutSec",
+                  default=timeoutSec,
+                  help="Specify the number of seconds that no result " + \
+                       "arrives after which the remaining results are " + \
+                       "given up on.  " + \
+                       "Default: '{}'.".format(timeoutSec),
+                  metavar="<SECONDS>")
+
+    parser.add_option("--priority",
+                  action="store",
+                  type="int",
+                  dest="priority",
+                  default=priority,
+                  help="Specify the priority of the job.  Tasks of " + \
+                       "jobs with a higher priority are calculated " + \
+                       "first.  Charts use {}.  ".\
+                       format(LookbackMultipleRemoteClient.\
+                              PRIORITY_INTERACTIVE) + \
+                       "Default: '{}'.".format(priority),
+                  metavar="<NUM>")
+
     # Parse the arguments into options.
     (options, args) = parser.parse_args()
      
@@ -362,6 +331,14 @@ if __name__=="__main__":
         serverAuthKey = options.serverAuthKey.encode("utf-8")
         log.debug("serverAuthKey == {}".format(serverAuthKey))
 
+    # Timeout argument.
+    timeoutSec = options.timeoutSec
+    log.debug("timeoutSec == {}".format(timeoutSec))
+
+    # Priority argument.
+    priority = options.priority
+    log.debug("priority == {}".format(priority))
+
     # Run the client tasker.
     #
     # This runs until the tasks submitted return with results.
@@ -6,9 +6,12 @@
 #   Runs a client worker that connects to a remote Python multiprocessing
 #   Manager server for getting tasks and generating results.  
 # 
-#   Work tasks are obtained from the task queue on the Manager server.  When
-#   the worker completes a task, the worker puts the result that is computed
-#   for the task onto the result queue on the Manager server.  
+#   Work tasks are leased in batches from the task broker on the Manager
+#   server.  When the worker completes a batch, the worker puts the results
+#   computed for the tasks back on the Manager server.  While a batch is
+#   calculated, the next batches are already fetched, and heartbeats are sent
+#   to keep the leases of the batches alive.  If the worker dies, its leases
+#   expire and the tasks are handed out to other workers.
 # 
 #   This worker client runs forever, until the user either does Ctrl-C or sends
 #   a SIGINT signal to the process.
@@ -19,6 +22,10 @@
 #
 #   ./lookbackmultiple_client_worker.py --server-address=light.jumpingcrab.com --server-port=1940 --auth-key="passphrase"
 #
+#   ./lookbackmultiple_client_worker.py --server-address=192.168.1.200 --server-port=1940 --auth-key="passphrase" --cache-file=/tmp/lookbackmultiple.lookbackcache
+#
+#   ./lookbackmultiple_client_worker.py --server-address=192.168.1.200 --server-port=1940 --auth-key="passphrase" --batch-size=32 --prefetch=2
+#
 #
 ##############################################################################
 
@@ -40,9 +47,15 @@ import signal
 # For parsing command-line options.
 from optparse import OptionParser  
 
+# For the worker id.
+import socket
+
+# For fetching tasks and sending heartbeats while calculating.
+import threading
+import queue
+
 # For multiprocessing features.
 from multiprocessing.managers import BaseManager
-from multiprocessing import JoinableQueue
 
 # Include some PriceChartingTool modules.
 # This assumes that the relative directory from this script is: ../../src
@@ -54,13 +67,22 @@ if srcDir not in sys.path:
 # For doing LookbackMultiple calculations.
 from lookbackmultiple_calc import LookbackMultipleUtils
 
+# For caching LookbackMultiple results.
+from lookbackmultiple_cache import LookbackMultipleResultCache
+
+# For the encoding of the tasks and results.
+from lookbackmultiple_remote import decodeTask
+from lookbackmultiple_remote import encodeResultJulianDays
+from lookbackmultiple_remote import datetimeToJulianDay
+from lookbackmultiple_remote import julianDayToDatetime
+
 ##############################################################################
 
 ##############################################################################
 # Global variables
 
 # Version string.
-VERSION = "0.1"
+VERSION = "0.2"
 
 # Server address (str).
 # Either a hostname or an IP address.
@@ -76,6 +98,28 @@ serverPort = None
 # by converting from str to bytes.
 serverAuthKey = b""
 
+# LookbackMultipleResultCache consulted before doing calculations, or
+# None.  The cache file is obtained via command-line parameter.
+resultCache = None
+
+# Maximum number of tasks leased from the server at a time (int).
+# This value is obtained via command-line parameter.
+batchSize = 16
+
+# Number of batches leased ahead of the one being calculated (int).
+# This value is obtained via command-line parameter.
+numPrefetchBatches = 1
+
+# Number of heartbeats sent to the server per lease time of the
+# server.
+heartbeatsPerLease = 3
+
+# Number of seconds that a request for tasks waits on the server.
+fetchWaitSec = 5.0
+
+# Id of this worker, as seen by the server (str).
+workerId = "{}:{}".format(socket.gethostname(), os.getpid())
+
 
 # For logging.
 logLevel = logging.DEBUG
@@ -91,6 +135,10 @@ log.setLevel(logLevel)
 def shutdown(rc):
     """Exits the script, but first flushes all logging handles, etc."""
 
+    if resultCache != None:
+        log.info(resultCache.getStatisticsStr())
+        resultCache.close()
+
     logging.shutdown()
     sys.exit(rc)
 
@@ -112,8 +160,8 @@ class QueueManager(BaseManager):
 
 def runClientWorker():
     """Runs the client that does work, processing tasks.
-    Tasks are obtained from task queue on the Manager server.
-    Completed results are placed on the result queue on the Manager server.
+    Batches of tasks are leased from the task broker on the Manager server.
+    Completed results are put back on the Manager server.
 
     This method should run forever until the user presses Ctrl-C or
     SIGINT is sent to the process.
@@ -122,103 +170,267 @@ def runClientWorker():
     global serverPort
     global serverAuthKey
 
-    # Connect to a manager server and access its queues.
+    # Connect to a manager server and access its task broker.
 
-    QueueManager.register("getTaskQueue", callable=lambda: taskQueue)
-    QueueManager.register("getResultQueue", callable=lambda: resultQueue)
+    QueueManager.register("getTaskBroker")
     
     manager = QueueManager(address=(serverAddress, serverPort), 
                            authkey=serverAuthKey)
     manager.connect()
     
-    log.info("LookbackMultiple client worker connected to {}:{}".\
-             format(serverAddress, serverPort))
-    
-    taskQueue = manager.getTaskQueue()
-    resultQueue = manager.getResultQueue()
+    log.info("LookbackMultiple client worker {} connected to {}:{}".\
+             format(workerId, serverAddress, serverPort))
     
-    log.info("LookbackMultiple client worker now processing taskQueue ...")
+    broker = manager.getTaskBroker()
+
+    heartbeatIntervalSec = broker.getLeaseSec() / heartbeatsPerLease
+
+    # Leased batches of tasks, as tuples (leaseId, tasks), waiting to
+    # be calculated.
+    leaseQueue = queue.Queue()
+
+    # Slots for batches in leaseQueue.  The fetch thread takes one
+    # before leasing a batch, and it is given back when the batch is
+    # taken off leaseQueue.
+    prefetchSlots = threading.Semaphore(numPrefetchBatches)
+
+    # Lease ids of the batches fetched and not completed yet.  These
+    # are kept alive by the heartbeats.
+    heldLeaseIds = set()
+    heldLeaseIdsLock = threading.Lock()
+
+    # Set when a thread lost the connection to the server.
+    stopEvent = threading.Event()
+
+    fetchThread = \
+        threading.Thread(target=fetchLeases,
+                         args=(broker, leaseQueue, prefetchSlots,
+                               heldLeaseIds, heldLeaseIdsLock, stopEvent),
+                         daemon=True)
+    heartbeatThread = \
+        threading.Thread(target=sendHeartbeats,
+                         args=(broker, heartbeatIntervalSec,
+                               heldLeaseIds, heldLeaseIdsLock, stopEvent),
+                         daemon=True)
+    fetchThread.start()
+    heartbeatThread.start()
+
+    log.info("LookbackMultiple client worker now processing tasks " + \
+             "in batches of {}, prefetching {} ...".\
+             format(batchSize, numPrefetchBatches))
     
-    # Process the queues.
-    while True:
-        argsTuple = taskQueue.get() # If queue is empty, then this will block.
-        
-        log.debug("Obtained a task.  argsTuple == {}".format(argsTuple))
-
-        # Do computation.
-        argIndex = 0
-        methodToRun = argsTuple[argIndex]
-        argIndex += 1
-        taskId = argsTuple[argIndex]
-        argIndex += 1
-        planetName = argsTuple[argIndex]
-        argIndex += 1
-        centricityType = argsTuple[argIndex]
-        argIndex += 1
-        longitudeType = argsTuple[argIndex]
-        argIndex += 1
-        referenceDt = argsTuple[argIndex]
-        argIndex += 1
-        desiredDeltaDegrees = argsTuple[argIndex]
-        argIndex += 1
-        maxErrorTd = argsTuple[argIndex]
-        argIndex += 1
-        locationLongitudeDegrees = argsTuple[argIndex]
-        argIndex += 1
-        locationLatitudeDegrees = argsTuple[argIndex]
-        argIndex += 1
-        locationElevationMeters = argsTuple[argIndex]
-        argIndex += 1
-            
-
-        LookbackMultipleUtils.\
-            initializeEphemeris(locationLongitudeDegrees, 
-                                locationLatitudeDegrees,
-                                locationElevationMeters)
-    
-        if methodToRun == "getDatetimesOfLongitudeDeltaDegreesInFuture":
-
-            resultDts = \
-                LookbackMultipleUtils.\
-                getDatetimesOfLongitudeDeltaDegreesInFuture(\
-                    planetName, 
-                    centricityType,
-                    longitudeType,
-                    referenceDt,
-                    desiredDeltaDegrees,
-                    maxErrorTd)
-                
-            log.debug("len(resultDts) == {}".format(len(resultDts)))
-
-            result = (argsTuple, resultDts)
-                
-            resultQueue.put(result)
-                
-            taskQueue.task_done()
-
-            log.debug("Task done.")
-
-        elif methodToRun == "getDatetimesOfLongitudeDeltaDegreesInPast":
-
-            resultDts = \
-                LookbackMultipleUtils.\
-                getDatetimesOfLongitudeDeltaDegreesInPast(\
-                    planetName, 
-                    centricityType,
-                    longitudeType,
-                    referenceDt,
-                    desiredDeltaDegrees,
-                    maxErrorTd)
-
-            log.debug("len(resultDts) == {}".format(len(resultDts)))
-
-            result = (argsTuple, resultDts)
-                
-            resultQueue.put(result)
-            
-            taskQueue.task_done()
-
-            log.debug("Task done.")
+    # Process the batches.
+    while stopEvent.is_set() == False:
+        try:
+            (leaseId, tasks) = leaseQueue.get(timeout=1.0)
+        except queue.Empty:
+            continue
+
+        prefetchSlots.release()
+
+        log.debug("Obtained lease {} of {} tasks.".\
+                  format(leaseId, len(tasks)))
+
+        results = calculateTasks(tasks)
+
+        try:
+            broker.putResults(workerId, leaseId, results)
+        except (OSError, EOFError) as e:
+            log.error("Lost the connection to the server: {}".format(e))
+            break
+
+        with heldLeaseIdsLock:
+            heldLeaseIds.discard(leaseId)
+
+        log.debug("Lease {} done.".format(leaseId))
+
+    shutdown(1)
+
+
+def fetchLeases(broker, leaseQueue, prefetchSlots,
+                heldLeaseIds, heldLeaseIdsLock, stopEvent):
+    """Leases batches of tasks from the server and puts them on
+    'leaseQueue', whenever there is a slot in 'prefetchSlots', until
+    'stopEvent' is set.  This is run in a thread of its own, so the
+    next batches are on hand when a batch is completed.
+    """
+
+    try:
+        while stopEvent.is_set() == False:
+            if prefetchSlots.acquire(timeout=1.0) == False:
+                continue
+
+            (leaseId, tasks) = \
+                broker.getTasks(workerId, batchSize, fetchWaitSec)
+
+            if leaseId == None:
+                prefetchSlots.release()
+                continue
+
+            with heldLeaseIdsLock:
+                heldLeaseIds.add(leaseId)
+
+            leaseQueue.put((leaseId, tasks))
+
+    except (OSError, EOFError) as e:
+        log.error("Lost the connection to the server: {}".format(e))
+        stopEvent.set()
+
+
+def sendHeartbeats(broker, heartbeatIntervalSec,
+                   heldLeaseIds, heldLeaseIdsLock, stopEvent):
+    """Sends a heartbeat with the held lease ids to the server every
+    'heartbeatIntervalSec' seconds, until 'stopEvent' is set.  This is
+    run in a thread of its own, so leases stay alive during long
+    calculations.
+    """
+
+    try:
+        while stopEvent.wait(heartbeatIntervalSec) == False:
+            with heldLeaseIdsLock:
+                leaseIds = list(heldLeaseIds)
+
+            expiredLeaseIds = broker.heartbeat(workerId, leaseIds)
+
+            # Leases completed during the heartbeat are not expired.
+            with heldLeaseIdsLock:
+                expiredLeaseIds = [leaseId for leaseId in expiredLeaseIds \
+                                   if leaseId in heldLeaseIds]
+
+            if len(expiredLeaseIds) > 0:
+                log.warning("Leases {} expired on the server.".\
+                            format(expiredLeaseIds))
+
+    except (OSError, EOFError) as e:
+        log.error("Lost the connection to the server: {}".format(e))
+        stopEvent.set()
+
+
+def calculateTasks(tasks):
+    """Calculates a batch of tasks.
+
+    The tasks are grouped like in
+    PriceBarChartWidget._sweepLookbackMultipleDatetimesLocalSerial(),
+    and each group is calculated in a single pass through time, with
+    float Julian Days throughout.  Results in the result cache are not
+    calculated again.
+
+    Arguments:
+    tasks - list of tasks, as made by lookbackmultiple_remote.encodeTask().
+
+    Returns:
+    list of results, tuples (taskId, value), where value is made by
+    lookbackmultiple_remote.encodeResultJulianDays().  The value is
+    None for a task whose calculation failed.
+    """
+
+    resultJdsList = [None] * len(tasks)
+
+    # Decoded tasks, as tuples (taskId, direction, argsTuple).
+    decodedTasks = [decodeTask(task) for task in tasks]
+
+    # Use the cached results, if there are any.
+    if resultCache != None:
+        for direction in (1, -1):
+            indexes = [i for i in range(len(tasks)) \
+                       if decodedTasks[i][1] == direction]
+            if len(indexes) == 0:
+                continue
+
+            cachedResultsList = resultCache.getMany(\
+                [decodedTasks[i][2] for i in indexes], direction)
+
+            for j in range(len(indexes)):
+                if cachedResultsList[j] != None:
+                    resultJdsList[indexes[j]] = \
+                        [datetimeToJulianDay(dt) \
+                         for dt in cachedResultsList[j]]
+
+        log.debug("{} of {} results were cached.".\
+                  format(len([r for r in resultJdsList if r != None]),
+                         len(tasks)))
+
+    # Dictionary holding the indexes into tasks for each group.
+    #
+    # Key is the tuple:
+    #   (direction, planetName, centricityType, longitudeType,
+    #    maxErrorSec, locationLongitudeDegrees, locationLatitudeDegrees,
+    #    locationElevationMeters)
+    groups = {}
+    for i in range(len(tasks)):
+        if resultJdsList[i] == None:
+            task = tasks[i]
+            key = task[1:5] + task[7:11]
+            groups.setdefault(key, []).append(i)
+
+    calculatedIndexes = []
+
+    for (key, indexes) in groups.items():
+
+        # Extract variable values from the key.
+        direction = key[0]
+        planetName = key[1]
+        centricityType = key[2]
+        longitudeType = key[3]
+        maxErrorSec = key[4]
+        locationLongitudeDegrees = key[5]
+        locationLatitudeDegrees = key[6]
+        locationElevationMeters = key[7]
+
+        referenceJds = [tasks[i][5] for i in indexes]
+        desiredDeltaDegreesList = \
+            sorted(set([tasks[i][6] for i in indexes]))
+
+        try:
+            LookbackMultipleUtils.\
+                initializeEphemeris(locationLongitudeDegrees, 
+                                    locationLatitudeDegrees,
+                                    locationElevationMeters)
+
+            if direction > 0:
+                sweepFunc = LookbackMultipleUtils.\
+                    sweepJulianDaysOfLongitudeDeltaDegreesInFuture
+            else:
+                sweepFunc = LookbackMultipleUtils.\
+                    sweepJulianDaysOfLongitudeDeltaDegreesInPast
+
+            results = sweepFunc(planetName,
+                                centricityType,
+                                longitudeType,
+                                referenceJds,
+                                desiredDeltaDegreesList,
+                                maxErrorSec / 86400.0)
+
+        except Exception as e:
+            # The server hands out the tasks again.
+            log.exception("Calculations of {} tasks failed: {}".\
+                          format(len(indexes), e))
+            continue
+
+        for j in range(len(indexes)):
+            i = indexes[j]
+            deltaIndex = desiredDeltaDegreesList.index(tasks[i][6])
+            resultJdsList[i] = results[j][deltaIndex]
+            calculatedIndexes.append(i)
+
+        log.debug("Calculated {} tasks for {}.".\
+                  format(len(indexes), planetName))
+
+    if resultCache != None and len(calculatedIndexes) > 0:
+        for direction in (1, -1):
+            indexes = [i for i in calculatedIndexes \
+                       if decodedTasks[i][1] == direction]
+            if len(indexes) == 0:
+                continue
+
+            resultCache.putMany(\
+                [decodedTasks[i][2] for i in indexes],
+                direction,
+                [[julianDayToDatetime(jd) for jd in resultJdsList[i]] \
+                 for i in indexes])
+
+    return [(decodedTasks[i][0], encodeResultJulianDays(resultJdsList[i])) \
+            for i in range(len(tasks))]
 
 ##############################################################################
 
@@ -264,6 +476,41 @@ if __name__=="__main__":
                        "Example: 'passphrase'.  ",
                   metavar="<PASSWORD>")
 
+    parser.add_option("--cache-file",
+                  action="store",
+                  type="str",
+                  dest="cacheFile",
+                  default=None,
+                  help="Specify a LookbackMultiple result cache file.  " + \
+                       "Results in this file are not calculated again, " + \
+                       "and calculated results are added to it.  " + \
+                       "Workers on the same host can share the file.  " + \
+                       "This is an optional field.",
+                  metavar="<FILE>")
+
+    parser.add_option("--batch-size",
+                  action="store",
+                  type="int",
+                  dest="batchSize",
+                  default=batchSize,
+                  help="Specify the maximum number of tasks leased " + \
+                       "from the server at a time.  Larger batches " + \
+                       "take fewer round trips to the server, and " + \
+                       "tasks for the same planet in a batch are " + \
+                       "calculated together.  " + \
+                       "Default: '{}'.".format(batchSize),
+                  metavar="<NUM>")
+
+    parser.add_option("--prefetch",
+                  action="store",
+                  type="int",
+                  dest="numPrefetchBatches",
+                  default=numPrefetchBatches,
+                  help="Specify the number of batches of tasks " + \
+                       "leased ahead of the one being calculated.  " + \
+                       "Default: '{}'.".format(numPrefetchBatches),
+                  metavar="<NUM>")
+
     # Parse the arguments into options.
     (options, args) = parser.parse_args()
      
@@ -300,6 +547,28 @@ if __name__=="__main__":
         serverAuthKey = options.serverAuthKey.encode("utf-8")
         log.debug("serverAuthKey == {}".format(serverAuthKey))
 
+    # Result cache file argument.
+    if options.cacheFile != None:
+        log.debug("cacheFile == {}".format(options.cacheFile))
+        resultCache = LookbackMultipleResultCache(options.cacheFile)
+
+    # Batch size and prefetch arguments.
+    if options.batchSize < 1:
+        log.error("Please specify at least 1 to the " + \
+                  "--batch-size option.")
+        shutdown(1)
+    else:
+        batchSize = options.batchSize
+        log.debug("batchSize == {}".format(batchSize))
+
+    if options.numPrefetchBatches < 1:
+        log.error("Please specify at least 1 to the " + \
+                  "--prefetch option.")
+        shutdown(1)
+    else:
+        numPrefetchBatches = options.numPrefetchBatches
+        log.debug("numPrefetchBatches == {}".format(numPrefetchBatches))
+
     # Run the client worker.
     # 
     #
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+##############################################################################
+#
+# Description:
+#
+#   Exercises the LookbackMultipleHybridScheduler on this host.  Starts a
+#   server and some client workers as subprocesses on localhost, and
+#   makes LookbackMultiple calculations with the local pool and the
+#   workers together.  Then the calculations are made again with the
+#   server stopped, which are expected to be done all locally.  The
+#   results are compared with the results of the local pool alone, to
+#   within the maximum error of each task.
+#
+# Usage:
+#
+#   ./lookbackmultiple_hybrid_test.py
+#
+#   ./lookbackmultiple_hybrid_test.py --num-workers=4 --num-processes=2 --num-tasks=400
+#
+#
+##############################################################################
+
+# For obtaining current directory path information.
+import os
+import sys
+
+# For logging.
+import logging
+import logging.config
+
+# For timestamps and timezone information.
+import datetime
+import pytz
+
+# For parsing command-line options.
+from optparse import OptionParser
+
+# For running the server and workers.
+import subprocess
+
+# For timing the calculations.
+import time
+
+# Include some PriceChartingTool modules.
+# This assumes that the relative directory from this script is: ../../src
+thisScriptDir = os.path.dirname(os.path.abspath(__file__))
+srcDir = os.path.dirname(os.path.dirname(thisScriptDir)) + os.sep + "src"
+if srcDir not in sys.path:
+    sys.path.insert(0, srcDir)
+
+# For submitting tasks to the server.
+from lookbackmultiple_remote import LookbackMultipleRemoteClient
+
+# For the local pool, and the scheduler being tested.
+from lookbackmultiple_parallel import LookbackMultipleParallel
+from lookbackmultiple_hybrid import LookbackMultipleHybridScheduler
+
+##############################################################################
+
+##############################################################################
+# Global variables
+
+# Version string.
+VERSION = "0.1"
+
+# Server address, port and auth key used for the test.
+serverAddress = "localhost"
+serverPort = 19401
+serverAuthKey = "hybridtest"
+
+# Number of workers started (int).
+# This value is obtained via command-line parameter.
+numWorkers = 3
+
+# Number of processes of the local pool (int).
+# This value is obtained via command-line parameter.
+numProcesses = 2
+
+# Number of tasks calculated (int).
+# This value is obtained via command-line parameter.
+numTasks = 200
+
+
+# For logging.
+#logLevel = logging.DEBUG
+logLevel = logging.INFO
+#logging.basicConfig(format='%(levelname)s: %(message)s')
+logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s')
+moduleName = globals()['__name__']
+log = logging.getLogger(moduleName)
+log.setLevel(logLevel)
+
+# Show how the scheduler splits the tasks.
+logging.getLogger("lookbackmultiple_hybrid").setLevel(logLevel)
+
+##############################################################################
+
+def startProcess(scriptName, args):
+    """Starts one of the scripts in this directory as a subprocess,
+    and returns the subprocess.Popen object.
+    """
+
+    commandLine = [sys.executable,
+                   os.path.join(thisScriptDir, scriptName),
+                   "--server-address={}".format(serverAddress),
+                   "--server-port={}".format(serverPort),
+                   "--auth-key={}".format(serverAuthKey)] + args
+
+    return subprocess.Popen(commandLine)
+
+def waitForServer():
+    """Waits until the server accepts connections."""
+
+    client = LookbackMultipleRemoteClient(serverAddress,
+                                          serverPort,
+                                          serverAuthKey.encode("utf-8"))
+
+    for i in range(50):
+        try:
+            client.connect()
+            return
+        except ConnectionRefusedError:
+            time.sleep(0.2)
+
+    client.connect()
+
+def makeArgsTupleList():
+    """Returns the list of numTasks argument tuples calculated."""
+
+    maxErrorTd = datetime.timedelta(minutes=60)
+
+    argsTupleList = []
+    for i in range(numTasks):
+        referenceDt = \
+            datetime.datetime(1994, 10, 20, 0, 0, tzinfo=pytz.utc) + \
+            datetime.timedelta(days=i)
+        args = ("Mars", "geocentric", "tropical", referenceDt,
+                360 * (1 + (i % 3)), maxErrorTd,
+                -74.0064, 40.7142, 0)
+        argsTupleList.append(args)
+
+    return argsTupleList
+
+def runHybrid(name, argsTupleList, expectedResultsList):
+    """Makes the calculations with a LookbackMultipleHybridScheduler,
+    and returns a tuple (True if the results are the expected ones,
+    the scheduler).
+    """
+
+    remoteClient = \
+        LookbackMultipleRemoteClient(serverAddress,
+                                     serverPort,
+                                     serverAuthKey.encode("utf-8"),
+                                     10)
+    scheduler = LookbackMultipleHybridScheduler(remoteClient)
+
+    startTime = time.time()
+    resultsList = \
+        scheduler.getDatetimesOfLongitudeDeltaDegrees(argsTupleList, 1)
+    endTime = time.time()
+
+    log.info("{}: {} sec, {} local, {} remote, {} failed.".\
+             format(name,
+                    endTime - startTime,
+                    scheduler.numResultsLocal,
+                    scheduler.numResultsRemote,
+                    scheduler.numResultsMissing))
+
+    # The workers find the timestamps with
+    # LookbackMultipleUtils.sweepJulianDaysOfLongitudeDeltaDegreesInFuture(),
+    # and the local pool with
+    # LookbackMultipleUtils.getDatetimesOfLongitudeDeltaDegreesInFuture().
+    # Both are only accurate to the maximum error of the task
+    # (argsTuple[5]), so the results of the workers may differ from
+    # the expected ones by up to that much.
+    rv = True
+    for i in range(len(argsTupleList)):
+        resultDts = resultsList[i]
+        expectedResultDts = expectedResultsList[i]
+        maxErrorSec = argsTupleList[i][5].total_seconds()
+
+        if resultDts == None or \
+           len(resultDts) != len(expectedResultDts) or \
+           any(abs((resultDts[j] - expectedResultDts[j]).total_seconds()) \
+               > maxErrorSec for j in range(len(resultDts))):
+
+            log.error("{}: Wrong result for {}: {} != {}".\
+                      format(name, argsTupleList[i],
+                             resultDts, expectedResultDts))
+            rv = False
+
+    return (rv, scheduler)
+
+def runHybridTest():
+    """Runs the test.  Returns True if it passed."""
+
+    LookbackMultipleParallel.setPoolSize(numProcesses)
+
+    argsTupleList = makeArgsTupleList()
+
+    log.info("Calculating {} tasks with {} local processes ...".\
+             format(numTasks, numProcesses))
+
+    startTime = time.time()
+    expectedResultsList = \
+        LookbackMultipleParallel.\
+        getDatetimesOfLongitudeDeltaDegreesInFutureParallel(argsTupleList)
+    endTime = time.time()
+
+    log.info("Local: {} sec.".format(endTime - startTime))
+
+    processes = []
+
+    server = startProcess("lookbackmultiple_server.py", [])
+    processes.append(server)
+
+    try:
+        for i in range(numWorkers):
+            worker = startProcess("lookbackmultiple_client_worker.py",
+                                  ["--batch-size=4"])
+            processes.append(worker)
+
+        waitForServer()
+
+        log.info("Calculating {} tasks with {} local processes ".\
+                 format(numTasks, numProcesses) + \
+                 "and {} workers ...".format(numWorkers))
+
+        (rv, scheduler) = runHybrid("Hybrid", argsTupleList,
+                                    expectedResultsList)
+
+        if scheduler.numResultsRemote == 0:
+            log.error("Hybrid: No results were calculated remotely.")
+            rv = False
+
+    finally:
+        for process in processes:
+            if process.poll() == None:
+                process.kill()
+            process.wait()
+
+    log.info("Calculating {} tasks with the server stopped ...".\
+             format(numTasks))
+
+    (passed, scheduler) = runHybrid("Fallback", argsTupleList,
+                                    expectedResultsList)
+    rv = passed and rv
+
+    if scheduler.numResultsLocal != numTasks:
+        log.error("Fallback: Not all results were calculated locally.")
+        rv = False
+
+    return rv
+
+##############################################################################
+
+if __name__=="__main__":
+    # Create the parser
+    parser = OptionParser()
+
+    # Specify all valid options.
+    parser.add_option("-v", "--version",
+                      action="store_true",
+                      dest="version",
+                      default=False,
+                      help="Display script version info and author contact.")
+
+    parser.add_option("--num-workers",
+                  action="store",
+                  type="int",
+                  dest="numWorkers",
+                  default=numWorkers,
+                  help="Specify the number of workers to start.  " + \
+                       "Default: '{}'.".format(numWorkers),
+                  metavar="<NUM>")
+
+    parser.add_option("--num-processes",
+                  action="store",
+                  type="int",
+                  dest="numProcesses",
+                  default=numProcesses,
+                  help="Specify the number of processes of the " + \
+                       "local pool.  " + \
+                       "Default: '{}'.".format(numProcesses),
+                  metavar="<NUM>")
+
+    parser.add_option("--num-tasks",
+                  action="store",
+                  type="int",
+                  dest="numTasks",
+                  default=numTasks,
+                  help="Specify the number of tasks to calculate.  " + \
+                       "Default: '{}'.".format(numTasks),
+                  metavar="<NUM>")
+
+    # Parse the arguments into options.
+    (options, args) = parser.parse_args()
+
+    # Print version information if the flag was used.
+    if options.version == True:
+        print(os.path.basename(sys.argv[0]) + " (Version " + VERSION + ")")
+        print("By Ryan Luu, ryanluu@gmail.com")
+        sys.exit(0)
+
+    numWorkers = options.numWorkers
+    numProcesses = options.numProcesses
+    numTasks = options.numTasks
+
+    try:
+        passed = runHybridTest()
+    finally:
+        LookbackMultipleParallel.shutdown()
+
+    if passed == True:
+        log.info("PASSED: every result was obtained and matches.")
+        rc = 0
+    else:
+        log.error("FAILED.")
+        rc = 1
+
+    logging.shutdown()
+    sys.exit(rc)
+
+##############################################################################
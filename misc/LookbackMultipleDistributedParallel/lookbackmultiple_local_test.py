@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+##############################################################################
+#
+# Description:
+#
+#   Tests the fault tolerance and the job isolation of the distributed
+#   LookbackMultiple calculations on this host.  Starts a server and some
+#   client workers as subprocesses on localhost, and submits a batch priority
+#   job and an interactive priority job at the same time.  A worker is killed
+#   after the first results of the interactive job arrive.  The tasks leased
+#   to the killed worker are expected to be handed out again when their lease
+#   expires, so that every result of both jobs is still obtained.
+#   Apart from waiting for the expired leases, the interactive job is
+#   expected to complete first.
+#
+# Usage:
+#
+#   ./lookbackmultiple_local_test.py
+#
+#   ./lookbackmultiple_local_test.py --num-workers=4 --num-tasks=200 --lease-sec=5
+#
+#
+##############################################################################
+
+# For obtaining current directory path information.
+import os
+import sys
+
+# For logging.
+import logging
+import logging.config
+
+# For timestamps and timezone information.
+import datetime
+import pytz
+
+# For parsing command-line options.
+from optparse import OptionParser
+
+# For running the server and workers.
+import subprocess
+
+# For timing the calculations.
+import time
+
+# For running the batch job next to the interactive job.
+import threading
+
+# Include some PriceChartingTool modules.
+# This assumes that the relative directory from this script is: ../../src
+thisScriptDir = os.path.dirname(os.path.abspath(__file__))
+srcDir = os.path.dirname(os.path.dirname(thisScriptDir)) + os.sep + "src"
+if srcDir not in sys.path:
+    sys.path.insert(0, srcDir)
+
+# For submitting tasks to the server.
+from lookbackmultiple_remote import LookbackMultipleRemoteClient
+
+##############################################################################
+
+##############################################################################
+# Global variables
+
+# Version string.
+VERSION = "0.2"
+
+# Server address, port and auth key used for the test.
+serverAddress = "localhost"
+serverPort = 19400
+serverAuthKey = "localtest"
+
+# Number of workers started (int).
+# This value is obtained via command-line parameter.
+numWorkers = 3
+
+# Number of tasks submitted (int).
+# This value is obtained via command-line parameter.
+numTasks = 120
+
+# Lease time of the server in seconds (float).
+# This value is obtained via command-line parameter.
+leaseSec = 5.0
+
+
+# For logging.
+#logLevel = logging.DEBUG
+logLevel = logging.INFO
+#logging.basicConfig(format='%(levelname)s: %(message)s')
+logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s')
+moduleName = globals()['__name__']
+log = logging.getLogger(moduleName)
+log.setLevel(logLevel)
+
+##############################################################################
+
+def startProcess(scriptName, args):
+    """Starts one of the scripts in this directory as a subprocess,
+    and returns the subprocess.Popen object.
+    """
+
+    commandLine = [sys.executable,
+                   os.path.join(thisScriptDir, scriptName),
+                   "--server-address={}".format(serverAddress),
+                   "--server-port={}".format(serverPort),
+                   "--auth-key={}".format(serverAuthKey)] + args
+
+    return subprocess.Popen(commandLine)
+
+def connectClient(timeoutSec, priority):
+    """Returns a LookbackMultipleRemoteClient connected to the server,
+    retrying while the server is starting up.
+    """
+
+    client = LookbackMultipleRemoteClient(serverAddress,
+                                          serverPort,
+                                          serverAuthKey.encode("utf-8"),
+                                          timeoutSec,
+                                          priority)
+
+    for i in range(50):
+        try:
+            client.connect()
+            return client
+        except ConnectionRefusedError:
+            time.sleep(0.2)
+
+    client.connect()
+    return client
+
+def makeArgsTupleList(planetName):
+    """Returns the list of numTasks argument tuples submitted for
+    'planetName'.
+    """
+
+    maxErrorTd = datetime.timedelta(minutes=60)
+
+    argsTupleList = []
+    for i in range(numTasks):
+        referenceDt = \
+            datetime.datetime(1994, 10, 20, 0, 0, tzinfo=pytz.utc) + \
+            datetime.timedelta(days=i)
+        args = (planetName, "geocentric", "tropical", referenceDt,
+                360 * (1 + (i % 3)), maxErrorTd,
+                -74.0064, 40.7142, 0)
+        argsTupleList.append(args)
+
+    return argsTupleList
+
+def runJob(client, argsTupleList, jobResults, onResult=None):
+    """Submits a job with 'client', and stores in the dict
+    'jobResults' the list of indexes of the results obtained, and the
+    time the job ended.
+    """
+
+    indexes = []
+    for (index, resultDts) in \
+            client.imapDatetimesOfLongitudeDeltaDegrees(argsTupleList, 1):
+
+        indexes.append(index)
+
+        if onResult != None:
+            onResult(len(indexes))
+
+    jobResults["indexes"] = indexes
+    jobResults["endTime"] = time.time()
+
+def checkJobResults(name, jobResults):
+    """Logs how a job did, and returns True if it obtained every
+    result exactly once.
+    """
+
+    indexes = jobResults.get("indexes", [])
+
+    log.info("{} job obtained {} of {} results.".\
+             format(name, len(indexes), numTasks))
+
+    return sorted(indexes) == list(range(numTasks))
+
+def runLocalTest():
+    """Runs the test.  Returns True if every result was obtained."""
+
+    processes = []
+
+    server = startProcess("lookbackmultiple_server.py",
+                          ["--lease-sec={}".format(leaseSec)])
+    processes.append(server)
+
+    try:
+        workers = []
+        for i in range(numWorkers):
+            worker = startProcess("lookbackmultiple_client_worker.py",
+                                  ["--batch-size=4"])
+            workers.append(worker)
+            processes.append(worker)
+
+        # Wait for longer than a lease for any result, so that the
+        # tasks of the killed worker can be handed out again.
+        batchClient = \
+            connectClient(leaseSec * 4,
+                          LookbackMultipleRemoteClient.PRIORITY_BATCH)
+        interactiveClient = \
+            connectClient(leaseSec * 4,
+                          LookbackMultipleRemoteClient.PRIORITY_INTERACTIVE)
+
+        log.info("Submitting 2 jobs of {} tasks to {} workers ...".\
+                 format(numTasks, numWorkers))
+
+        startTime = time.time()
+
+        batchResults = {}
+        batchThread = \
+            threading.Thread(target=runJob,
+                             args=(batchClient,
+                                   makeArgsTupleList("Mars"),
+                                   batchResults))
+        batchThread.start()
+
+        def killWorker(numResults):
+            if numResults == 1:
+                log.info("Killing worker with pid {} ...".\
+                         format(workers[0].pid))
+                workers[0].kill()
+
+        interactiveResults = {}
+        runJob(interactiveClient,
+               makeArgsTupleList("Venus"),
+               interactiveResults,
+               killWorker)
+
+        batchThread.join()
+
+        log.info("Interactive job took {} sec, batch job took {} sec.".\
+                 format(interactiveResults["endTime"] - startTime,
+                        batchResults["endTime"] - startTime))
+
+        statistics = interactiveClient.getStatistics()
+        for (workerId, worker) in sorted(statistics["workers"].items()):
+            log.info("  Worker {}: alive == {}, ".\
+                     format(workerId, worker["alive"]) + \
+                     "{} tasks completed, {} leases expired".\
+                     format(worker["numTasksCompleted"],
+                            worker["numLeasesExpired"]))
+
+        rv = checkJobResults("Interactive", interactiveResults)
+        rv = checkJobResults("Batch", batchResults) and rv
+
+        return rv
+
+    finally:
+        for process in processes:
+            if process.poll() == None:
+                process.kill()
+            process.wait()
+
+##############################################################################
+
+if __name__=="__main__":
+    # Create the parser
+    parser = OptionParser()
+
+    # Specify all valid options.
+    parser.add_option("-v", "--version",
+                      action="store_true",
+                      dest="version",
+                      default=False,
+                      help="Display script version info and author contact.")
+
+    parser.add_option("--num-workers",
+                  action="store",
+                  type="int",
+                  dest="numWorkers",
+                  default=numWorkers,
+                  help="Specify the number of workers to start.  " + \
+                       "Default: '{}'.".format(numWorkers),
+                  metavar="<NUM>")
+
+    parser.add_option("--num-tasks",
+                  action="store",
+                  type="int",
+                  dest="numTasks",
+                  default=numTasks,
+                  help="Specify the number of tasks to submit.  " + \
+                       "Default: '{}'.".format(numTasks),
+                  metavar="<NUM>")
+
+    parser.add_option("--lease-sec",
+                  action="store",
+                  type="float",
+                  dest="leaseSec",
+                  default=leaseSec,
+                  help="Specify the lease time of the server.  " + \
+                       "Default: '{}'.".format(leaseSec),
+                  metavar="<SECONDS>")
+
+    # Parse the arguments into options.
+    (options, args) = parser.parse_args()
+
+    # Print version information if the flag was used.
+    if options.version == True:
+        print(os.path.basename(sys.argv[0]) + " (Version " + VERSION + ")")
+        print("By Ryan Luu, ryanluu@gmail.com")
+        sys.exit(0)
+
+    if options.numWorkers < 2:
+        log.error("Please specify at least 2 to the " + \
+                  "--num-workers option.")
+        sys.exit(1)
+
+    numWorkers = options.numWorkers
+    numTasks = options.numTasks
+    leaseSec = options.leaseSec
+
+    if runLocalTest() == True:
+        log.info("PASSED: every result was obtained.")
+        rc = 0
+    else:
+        log.error("FAILED: not every result was obtained.")
+        rc = 1
+
+    logging.shutdown()
+    sys.exit(rc)
+
+##############################################################################
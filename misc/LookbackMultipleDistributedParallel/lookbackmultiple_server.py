@@ -3,14 +3,24 @@
 # 
 # Description:
 # 
-#   Runs a server that is a Python multiprocessing Manager for managing task
-#   queues and result queues.  Accepts connections on a certain port from other
-#   multiprocessing clients that are either workers or taskers.  Work tasks
-#   submitted to the task queue by the tasker is pulled out and consumed by the
-#   workers.  When the worker completes the task, the worker puts the result
-#   that is computed for the task onto the result queue.  The tasker can then
-#   pull results from the result queue.  There can be many workers in this
-#   model.
+#   Runs a server that is a Python multiprocessing Manager for managing
+#   LookbackMultiple jobs of tasks and results.  Accepts connections on a
+#   certain port from other multiprocessing clients that are either workers or
+#   taskers.  Work tasks submitted by a tasker in a job are handed out to the
+#   workers in batches.  When a worker completes a batch, the worker puts the
+#   results computed for the tasks back on the server.  The tasker can then
+#   pull the results of its job as they arrive.  There can be many workers
+#   and many taskers in this model.
+#
+#   Each job has a priority.  Tasks of the jobs with the highest priority are
+#   handed out first, and jobs of the same priority take turns, so that e.g.
+#   an interactive chart redraw goes ahead of a large batch run.
+#
+#   A batch of tasks is handed out under a lease, which the worker keeps
+#   alive by sending heartbeats.  If a worker dies or loses its connection,
+#   its lease expires and the tasks are handed out again, up to a maximum
+#   number of attempts per task.  The server logs the heartbeats and
+#   throughput of the workers.
 #   
 #   This server runs forever, until the user either does Ctrl-C or sends a
 #   SIGINT signal to the process.
@@ -21,6 +31,8 @@
 #
 #   ./lookbackmultiple_server.py --server-address=light.jumpingcrab.com --server-port=1940 --auth-key="passphrase"
 #
+#   ./lookbackmultiple_server.py --server-address=192.168.1.200 --server-port=1940 --auth-key="passphrase" --lease-sec=30 --max-attempts=3 --job-idle-sec=300
+#
 #
 ##############################################################################
 
@@ -39,12 +51,20 @@ import pytz
 # For catching the signal interrupt.
 import signal
 
+# For the lease times.
+import time
+
+# For the pending tasks and results.
+import collections
+
+# For locking the tasks and results, and expiring leases.
+import threading
+
 # For parsing command-line options.
 from optparse import OptionParser  
 
 # For multiprocessing features.
 from multiprocessing.managers import BaseManager
-from multiprocessing import JoinableQueue
 
 # Include some PriceChartingTool modules.
 # This assumes that the relative directory from this script is: ../../src
@@ -61,7 +81,7 @@ if srcDir not in sys.path:
 # Global variables
 
 # Version string.
-VERSION = "0.1"
+VERSION = "0.3"
 
 # Server address (str).
 # Either a hostname or an IP address.
@@ -77,6 +97,20 @@ serverPort = None
 # by converting from str to bytes.
 serverAuthKey = b""
 
+# Number of seconds a lease of tasks lasts without a heartbeat from
+# the worker holding it (float).
+# This value is obtained via command-line parameter.
+leaseSec = 30.0
+
+# Number of times a task is handed out before it is given up on (int).
+# This value is obtained via command-line parameter.
+maxAttempts = 3
+
+# Number of seconds after which a job whose tasker does not ask for
+# results is closed (float).
+# This value is obtained via command-line parameter.
+jobIdleSec = 300.0
+
 
 # For logging.
 #logLevel = logging.DEBUG
@@ -107,13 +141,624 @@ signal.signal(signal.SIGINT, signal_SIGINT_handler)
 
 ##############################################################################
 
+class LookbackMultipleTaskBroker:
+    """Holds the LookbackMultiple jobs of the server, and hands out
+    their tasks to the workers under leases.
+
+    A tasker creates a job with createJob(), adds tasks to it with
+    putTasks(), takes the results of its own tasks with getResults(),
+    and closes the job with closeJob().  Each job has its own tasks
+    and results, so many taskers can share the server.
+
+    Tasks are the tuples made by lookbackmultiple_remote.encodeTask(),
+    whose first element is a task id that is unique within the job.
+    The tasks handed out to workers have the tuple (jobId, taskId) as
+    their first element instead.  Results are tuples (taskId, value),
+    where value is the bytes made by
+    lookbackmultiple_remote.encodeResultDts(), or None if the task
+    failed on every attempt.
+
+    Workers are given the tasks of the job with the highest priority
+    that has tasks waiting.  Jobs of the same priority take turns, one
+    batch at a time, so a job with many tasks does not hold up the
+    others.  A batch only holds tasks of one job.
+
+    A worker gets a batch of tasks with getTasks(), which are leased to
+    it for LookbackMultipleTaskBroker.leaseSec seconds.  Every
+    heartbeat() of the worker extends its leases.  Tasks of leases that
+    expire, and tasks that a worker could not calculate, are handed out
+    again, before the other tasks of the job, until they have been
+    handed out LookbackMultipleTaskBroker.maxAttempts times.  Jobs
+    whose tasker stops asking for results for
+    LookbackMultipleTaskBroker.jobIdleSec seconds are closed.
+
+    The methods are called by the threads of the Manager server, one
+    per connection, so all of the state is guarded by one lock.
+    """
+
+    # Maximum number of seconds that a call waits for tasks or
+    # results to become available.
+    maxWaitSec = 10.0
+
+    # Number of seconds between checks for expired leases.
+    leaseCheckIntervalSec = 1.0
+
+    # Number of seconds between logging of the worker statistics,
+    # while there is work.
+    statisticsLogIntervalSec = 60.0
+
+    def __init__(self, leaseSec, maxAttempts, jobIdleSec):
+        """Initializes the broker and starts the thread that expires
+        leases.
+
+        Arguments:
+        leaseSec    - float number of seconds a lease lasts without a
+                      heartbeat.
+        maxAttempts - int number of times a task is handed out before
+                      it is given up on.
+        jobIdleSec  - float number of seconds after which a job whose
+                      tasker does not ask for results is closed.
+        """
+
+        self.leaseSec = leaseSec
+        self.maxAttempts = maxAttempts
+        self.jobIdleSec = jobIdleSec
+
+        self.lock = threading.Lock()
+        self.tasksAvailable = threading.Condition(self.lock)
+        self.resultsAvailable = threading.Condition(self.lock)
+
+        # Dictionary of the jobs.
+        # Key is the job id.  Value is a dict with:
+        #   priority       - int priority.  Higher goes first.
+        #   description    - str describing the tasker.
+        #   tasks          - dict of the tasks not completed yet.
+        #                    Key is the task id.  Value is a list of
+        #                    [task, number of attempts, lease id or None].
+        #   pendingTaskIds - deque of the task ids waiting to be handed
+        #                    out.  This can hold ids of tasks that were
+        #                    completed since; those are skipped.
+        #   results        - deque of the results not taken yet.
+        #   numTasks, numCompleted, numFailed - int counts.
+        #   lastSeenTime   - time the tasker last asked for results.
+        self.jobs = {}
+        self.nextJobId = 0
+
+        # Job ids in the order they take turns.  A job moves to the
+        # end when it is given a batch.
+        self.jobTurns = []
+
+        # Dictionary of the leases.
+        # Key is the lease id.  Value is a list of
+        # [worker id, job id, list of task ids, expiry time].
+        self.leases = {}
+        self.nextLeaseId = 0
+
+        # Dictionary of the statistics of each worker.
+        # Key is the worker id.  Value is a dict.
+        self.workers = {}
+
+        self.lastStatisticsLogTime = time.time()
+
+        thread = threading.Thread(target=self._runLeaseChecks, daemon=True)
+        thread.start()
+
+    def getLeaseSec(self):
+        """Returns the float number of seconds a lease lasts without a
+        heartbeat.  Workers should send heartbeats well within this.
+        """
+
+        return self.leaseSec
+
+    def createJob(self, priority, description):
+        """Creates a job.
+
+        Arguments:
+        priority    - int priority of the job.  Tasks of jobs with a
+                      higher priority are handed out first.
+        description - str describing the tasker, for the logs.
+
+        Returns:
+        int job id.
+        """
+
+        with self.lock:
+            jobId = self.nextJobId
+            self.nextJobId += 1
+
+            self.jobs[jobId] = {
+                "priority" : priority,
+                "description" : description,
+                "tasks" : {},
+                "pendingTaskIds" : collections.deque(),
+                "results" : collections.deque(),
+                "numTasks" : 0,
+                "numCompleted" : 0,
+                "numFailed" : 0,
+                "lastSeenTime" : time.time(),
+                }
+            self.jobTurns.append(jobId)
+
+        log.info("Created job {} with priority {} for {}.".\
+                 format(jobId, priority, description))
+
+        return jobId
+
+    def closeJob(self, jobId):
+        """Removes a job.  Its tasks are not handed out anymore, and
+        results for them are dropped.
+
+        Arguments:
+        jobId - int job id from createJob().
+        """
+
+        with self.lock:
+            job = self._removeJob(jobId)
+
+        if job != None:
+            log.info("Closed job {}: {} of {} tasks completed, {} failed.".\
+                     format(jobId, job["numCompleted"], job["numTasks"],
+                            job["numFailed"]))
+
+    def putTasks(self, jobId, tasks):
+        """Adds tasks to be handed out to the workers.
+
+        Arguments:
+        jobId - int job id from createJob().
+        tasks - list of tasks.
+
+        Returns:
+        True if the tasks were added, or False if the job does not
+        exist (anymore).
+        """
+
+        with self.lock:
+            job = self.jobs.get(jobId, None)
+            if job == None:
+                return False
+
+            for task in tasks:
+                taskId = task[0]
+                job["tasks"][taskId] = [((jobId, taskId),) + task[1:], 0, None]
+                job["pendingTaskIds"].append(taskId)
+
+            job["numTasks"] += len(tasks)
+            job["lastSeenTime"] = time.time()
+
+            self.tasksAvailable.notify_all()
+
+        log.debug("Added {} tasks to job {}.".format(len(tasks), jobId))
+
+        return True
+
+    def getTasks(self, workerId, maxTasks, waitSec):
+        """Leases a batch of tasks of one job to a worker.
+
+        Arguments:
+        workerId - str that identifies the worker.
+        maxTasks - int maximum number of tasks in the batch.
+        waitSec  - float number of seconds to wait for tasks if there
+                   are none.
+
+        Returns:
+        tuple (leaseId, list of tasks).  If there are no tasks, then
+        this is (None, []).
+        """
+
+        endTime = time.time() + min(waitSec,
+                                    LookbackMultipleTaskBroker.maxWaitSec)
+
+        with self.lock:
+            self._updateWorker(workerId)
+
+            while True:
+                (jobId, taskIds) = self._takeTaskIds(maxTasks)
+                if len(taskIds) > 0:
+                    break
+
+                remainingSec = endTime - time.time()
+                if remainingSec <= 0:
+                    return (None, [])
+
+                self.tasksAvailable.wait(remainingSec)
+
+            leaseId = self.nextLeaseId
+            self.nextLeaseId += 1
+
+            job = self.jobs[jobId]
+            tasks = []
+            for taskId in taskIds:
+                entry = job["tasks"][taskId]
+                entry[1] += 1
+                entry[2] = leaseId
+                tasks.append(entry[0])
+
+            self.leases[leaseId] = \
+                [workerId, jobId, taskIds, time.time() + self.leaseSec]
+
+        if log.isEnabledFor(logging.DEBUG) == True:
+            log.debug("Leased {} tasks of job {} to worker {} in lease {}.".\
+                      format(len(tasks), jobId, workerId, leaseId))
+
+        return (leaseId, tasks)
+
+    def heartbeat(self, workerId, leaseIds):
+        """Records that a worker is alive, and extends its leases.
+
+        Arguments:
+        workerId - str that identifies the worker.
+        leaseIds - list of the lease ids held by the worker.
+
+        Returns:
+        list of the lease ids in 'leaseIds' that already expired.
+        The tasks of those can already be handed out to other
+        workers, but results for them are still taken.
+        """
+
+        expiredLeaseIds = []
+
+        with self.lock:
+            self._updateWorker(workerId)
+
+            expiryTime = time.time() + self.leaseSec
+
+            for leaseId in leaseIds:
+                lease = self.leases.get(leaseId, None)
+                if lease != None and lease[0] == workerId:
+                    lease[3] = expiryTime
+                else:
+                    expiredLeaseIds.append(leaseId)
+
+        return expiredLeaseIds
+
+    def putResults(self, workerId, leaseId, results):
+        """Adds the results of a batch of tasks, and ends its lease.
+
+        Results of tasks that were already completed by another
+        worker, or whose job was closed, are dropped.  Tasks of the
+        lease without a result, and tasks whose result value is None,
+        are handed out again, if they have attempts left.
+
+        Arguments:
+        workerId - str that identifies the worker.
+        leaseId  - int lease id from getTasks().
+        results  - list of results, with the tuple (jobId, taskId) as
+                   task id.
+        """
+
+        with self.lock:
+            worker = self._updateWorker(workerId)
+
+            numAdded = 0
+
+            for ((jobId, taskId), value) in results:
+                job = self.jobs.get(jobId, None)
+                if job == None:
+                    continue
+
+                entry = job["tasks"].get(taskId, None)
+                if entry == None:
+                    continue
+
+                if value == None:
+                    worker["numTasksFailed"] += 1
+                    self._retryTask(job, taskId, entry)
+                else:
+                    del job["tasks"][taskId]
+                    job["results"].append((taskId, value))
+                    job["numCompleted"] += 1
+                    worker["numTasksCompleted"] += 1
+                    numAdded += 1
+
+            self._endLease(leaseId)
+
+            if numAdded > 0:
+                self.resultsAvailable.notify_all()
+
+        if log.isEnabledFor(logging.DEBUG) == True:
+            log.debug("Worker {} completed {} of {} tasks of lease {}.".\
+                      format(workerId, numAdded, len(results), leaseId))
+
+    def getResults(self, jobId, maxResults, waitSec):
+        """Takes results of a job, in the order they were completed.
+
+        Arguments:
+        jobId      - int job id from createJob().
+        maxResults - int maximum number of results to take.
+        waitSec    - float number of seconds to wait for results if
+                     there are none.
+
+        Returns:
+        list of results.  This is empty if no result arrived in time.
+        None is returned if the job does not exist (anymore).
+        """
+
+        endTime = time.time() + min(waitSec,
+                                    LookbackMultipleTaskBroker.maxWaitSec)
+
+        with self.lock:
+            while True:
+                job = self.jobs.get(jobId, None)
+                if job == None:
+                    return None
+
+                job["lastSeenTime"] = time.time()
+
+                if len(job["results"]) > 0:
+                    break
+
+                remainingSec = endTime - time.time()
+                if remainingSec <= 0:
+                    return []
+
+                self.resultsAvailable.wait(remainingSec)
+
+            rv = []
+            while len(rv) < maxResults and len(job["results"]) > 0:
+                rv.append(job["results"].popleft())
+
+        return rv
+
+    def getStatistics(self):
+        """Returns a dict with the statistics of the server:
+
+          numTasks   - int number of tasks not completed yet.
+          numLeased  - int number of those that are leased.
+          jobs       - dict of the statistics of each job, keyed by job
+                       id.  Each is a dict with 'priority',
+                       'description', 'numTasks', 'numCompleted',
+                       'numFailed', and 'numWaiting' (tasks not
+                       completed yet).
+          workers    - dict of the statistics of each worker, keyed by
+                       worker id.  Each is a dict with 'alive' (bool),
+                       'secSinceHeartbeat', 'numTasksCompleted',
+                       'numTasksFailed', 'numLeasesExpired', and
+                       'tasksPerSec' (completed tasks per second since
+                       the worker was first seen).
+        """
+
+        now = time.time()
+
+        with self.lock:
+            jobs = {}
+            for (jobId, job) in self.jobs.items():
+                jobs[jobId] = {
+                    "priority" : job["priority"],
+                    "description" : job["description"],
+                    "numTasks" : job["numTasks"],
+                    "numCompleted" : job["numCompleted"],
+                    "numFailed" : job["numFailed"],
+                    "numWaiting" : len(job["tasks"]),
+                    }
+
+            workers = {}
+            for (workerId, worker) in self.workers.items():
+                elapsedSec = max(worker["lastSeenTime"] - \
+                                 worker["firstSeenTime"], 1.0)
+                workers[workerId] = {
+                    "alive" : worker["alive"],
+                    "secSinceHeartbeat" : now - worker["lastSeenTime"],
+                    "numTasksCompleted" : worker["numTasksCompleted"],
+                    "numTasksFailed" : worker["numTasksFailed"],
+                    "numLeasesExpired" : worker["numLeasesExpired"],
+                    "tasksPerSec" : worker["numTasksCompleted"] / elapsedSec,
+                    }
+
+            numTasks = sum([len(job["tasks"]) for job in self.jobs.values()])
+            numLeased = sum([len(lease[2]) for lease in self.leases.values()])
+
+            return {
+                "numTasks" : numTasks,
+                "numLeased" : numLeased,
+                "jobs" : jobs,
+                "workers" : workers,
+                }
+
+    def _takeTaskIds(self, maxTasks):
+        """Takes up to 'maxTasks' task ids waiting to be handed out,
+        from the job whose turn it is, and moves that job to the end
+        of the turns.  The lock must be held.
+
+        Returns:
+        tuple (jobId, list of task ids).  The list is empty if no job
+        has tasks waiting.
+        """
+
+        # The job with the highest priority that has tasks waiting,
+        # and is first in turn among those.
+        turnIndex = None
+        for i in range(len(self.jobTurns)):
+            job = self.jobs[self.jobTurns[i]]
+
+            # Skip task ids that were completed since.
+            pendingTaskIds = job["pendingTaskIds"]
+            while len(pendingTaskIds) > 0:
+                entry = job["tasks"].get(pendingTaskIds[0], None)
+                if entry != None and entry[2] == None:
+                    break
+                pendingTaskIds.popleft()
+
+            if len(pendingTaskIds) > 0 and \
+               (turnIndex == None or job["priority"] > \
+                self.jobs[self.jobTurns[turnIndex]]["priority"]):
+
+                turnIndex = i
+
+        if turnIndex == None:
+            return (None, [])
+
+        jobId = self.jobTurns.pop(turnIndex)
+        self.jobTurns.append(jobId)
+
+        job = self.jobs[jobId]
+        taskIds = []
+        while len(taskIds) < maxTasks and len(job["pendingTaskIds"]) > 0:
+            taskId = job["pendingTaskIds"].popleft()
+            entry = job["tasks"].get(taskId, None)
+            if entry != None and entry[2] == None:
+                taskIds.append(taskId)
+
+        return (jobId, taskIds)
+
+    def _removeJob(self, jobId):
+        """Removes a job, and returns its dict, or None if it does not
+        exist.  The lock must be held.
+        """
+
+        job = self.jobs.pop(jobId, None)
+        if job != None:
+            self.jobTurns.remove(jobId)
+
+            # Wake up a tasker waiting for results of the job.
+            self.resultsAvailable.notify_all()
+
+        return job
+
+    def _endLease(self, leaseId):
+        """Removes a lease, and hands out its tasks again that have no
+        result yet.  The lock must be held.
+        """
+
+        lease = self.leases.pop(leaseId, None)
+        if lease == None:
+            return
+
+        job = self.jobs.get(lease[1], None)
+        if job == None:
+            return
+
+        # Hand out in the original order.
+        for taskId in reversed(lease[2]):
+            entry = job["tasks"].get(taskId, None)
+            if entry != None and entry[2] == leaseId:
+                self._retryTask(job, taskId, entry)
+
+    def _updateWorker(self, workerId):
+        """Records that the worker was seen now, and returns its dict
+        of statistics.  The lock must be held.
+        """
+
+        now = time.time()
+
+        worker = self.workers.get(workerId, None)
+        if worker == None:
+            log.info("Worker {} connected.".format(workerId))
+            worker = {
+                "firstSeenTime" : now,
+                "lastSeenTime" : now,
+                "alive" : True,
+                "numTasksCompleted" : 0,
+                "numTasksFailed" : 0,
+                "numLeasesExpired" : 0,
+                }
+            self.workers[workerId] = worker
+
+        elif worker["alive"] == False:
+            log.info("Worker {} is back.".format(workerId))
+            worker["alive"] = True
+
+        worker["lastSeenTime"] = now
+
+        return worker
+
+    def _retryTask(self, job, taskId, entry):
+        """Hands out a task of a job again, ahead of the other tasks of
+        the job, or gives up on it with a None result if it has no
+        attempts left.  The lock must be held.
+        """
+
+        if entry[1] >= self.maxAttempts:
+            log.warning("Giving up on task {} after {} attempts.".\
+                        format(entry[0][0], entry[1]))
+            del job["tasks"][taskId]
+            job["results"].append((taskId, None))
+            job["numFailed"] += 1
+            self.resultsAvailable.notify_all()
+        else:
+            entry[2] = None
+            job["pendingTaskIds"].appendleft(taskId)
+            self.tasksAvailable.notify_all()
+
+    def _runLeaseChecks(self):
+        """Expires leases, closes idle jobs and logs statistics,
+        forever.  This is run in a thread of its own.
+        """
+
+        while True:
+            time.sleep(LookbackMultipleTaskBroker.leaseCheckIntervalSec)
+
+            now = time.time()
+
+            with self.lock:
+                for (leaseId, lease) in list(self.leases.items()):
+                    (workerId, jobId, taskIds, expiryTime) = lease
+                    if expiryTime > now:
+                        continue
+
+                    log.warning("Lease {} of {} tasks of worker {} expired.".\
+                                format(leaseId, len(taskIds), workerId))
+                    self.workers[workerId]["numLeasesExpired"] += 1
+                    self._endLease(leaseId)
+
+                for (jobId, job) in list(self.jobs.items()):
+                    if now - job["lastSeenTime"] > self.jobIdleSec:
+                        log.warning("Closing job {} of {}, ".\
+                                    format(jobId, job["description"]) + \
+                                    "whose results were not asked for " + \
+                                    "in {} sec.".format(self.jobIdleSec))
+                        self._removeJob(jobId)
+
+                for (workerId, worker) in self.workers.items():
+                    if worker["alive"] == True and \
+                       now - worker["lastSeenTime"] > self.leaseSec:
+
+                        log.warning("Worker {} stopped sending heartbeats.".\
+                                    format(workerId))
+                        worker["alive"] = False
+
+                busy = any([len(job["tasks"]) > 0 \
+                            for job in self.jobs.values()])
+
+            if busy and now - self.lastStatisticsLogTime >= \
+               LookbackMultipleTaskBroker.statisticsLogIntervalSec:
+
+                self.lastStatisticsLogTime = now
+                self._logStatistics()
+
+    def _logStatistics(self):
+        """Logs the statistics of the server, of the jobs, and of the
+        workers.
+        """
+
+        statistics = self.getStatistics()
+
+        log.info("Tasks: {}, leased: {}".\
+                 format(statistics["numTasks"], statistics["numLeased"]))
+
+        for (jobId, job) in sorted(statistics["jobs"].items()):
+            log.info("  Job {} (priority {}, {}): ".\
+                     format(jobId, job["priority"], job["description"]) + \
+                     "{} of {} tasks completed, {} failed".\
+                     format(job["numCompleted"], job["numTasks"],
+                            job["numFailed"]))
+
+        for (workerId, worker) in sorted(statistics["workers"].items()):
+            if worker["alive"] == True:
+                log.info("  Worker {}: {} tasks completed, ".\
+                         format(workerId, worker["numTasksCompleted"]) + \
+                         "{} failed, {} leases expired, {:.2f} tasks/sec".\
+                         format(worker["numTasksFailed"],
+                                worker["numLeasesExpired"],
+                                worker["tasksPerSec"]))
+
+
 class QueueManager(BaseManager):
     pass
 
 
 def runServer():
     """Runs the server that is a multiprocessing Manager.
-    This server manages task and result queues.
+    This server manages the LookbackMultipleTaskBroker.
 
     This method should run forever until the user presses Ctrl-C or
     SIGINT is sent to the process.
@@ -122,13 +767,11 @@ def runServer():
     global serverPort
     global serverAuthKey
 
-    # Start a shared manager server and access its queues.
+    # Start a shared manager server and access its task broker.
 
-    taskQueue = JoinableQueue()
-    resultQueue = JoinableQueue()
+    broker = LookbackMultipleTaskBroker(leaseSec, maxAttempts, jobIdleSec)
 
-    QueueManager.register("getTaskQueue", callable=lambda: taskQueue)
-    QueueManager.register("getResultQueue", callable=lambda: resultQueue)
+    QueueManager.register("getTaskBroker", callable=lambda: broker)
     
     manager = QueueManager(address=(serverAddress, serverPort), 
                               authkey=serverAuthKey)
@@ -137,6 +780,9 @@ def runServer():
 
     log.info("LookbackMultiple server starting on address {} and port {}".\
              format(serverAddress, serverPort))
+    log.info("Leases last {} sec, tasks get {} attempts, ".\
+             format(leaseSec, maxAttempts) + \
+             "idle jobs are closed after {} sec".format(jobIdleSec))
 
     server.serve_forever()
     
@@ -183,6 +829,39 @@ if __name__=="__main__":
                        "Example: 'passphrase'.  ",
                   metavar="<PASSWORD>")
 
+    parser.add_option("--lease-sec",
+                  action="store",
+                  type="float",
+                  dest="leaseSec",
+                  default=leaseSec,
+                  help="Specify the number of seconds that a worker " + \
+                       "holds a batch of tasks without sending a " + \
+                       "heartbeat, before the tasks are handed out " + \
+                       "to other workers.  " + \
+                       "Default: '{}'.".format(leaseSec),
+                  metavar="<SECONDS>")
+
+    parser.add_option("--max-attempts",
+                  action="store",
+                  type="int",
+                  dest="maxAttempts",
+                  default=maxAttempts,
+                  help="Specify the number of times a task is handed " + \
+                       "out to workers before it is given up on.  " + \
+                       "Default: '{}'.".format(maxAttempts),
+                  metavar="<NUM>")
+
+    parser.add_option("--job-idle-sec",
+                  action="store",
+                  type="float",
+                  dest="jobIdleSec",
+                  default=jobIdleSec,
+                  help="Specify the number of seconds after which a " + \
+                       "job whose tasker does not ask for results " + \
+                       "is closed, e.g. because the tasker died.  " + \
+                       "Default: '{}'.".format(jobIdleSec),
+                  metavar="<SECONDS>")
+
     # Parse the arguments into options.
     (options, args) = parser.parse_args()
      
@@ -219,6 +898,31 @@ if __name__=="__main__":
         serverAuthKey = options.serverAuthKey.encode("utf-8")
         log.debug("serverAuthKey == {}".format(serverAuthKey))
 
+    # Lease and attempts arguments.
+    if options.leaseSec <= 0:
+        log.error("Please specify a positive number of seconds to the " + \
+                  "--lease-sec option.")
+        shutdown(1)
+    else:
+        leaseSec = options.leaseSec
+        log.debug("leaseSec == {}".format(leaseSec))
+
+    if options.maxAttempts < 1:
+        log.error("Please specify at least 1 to the " + \
+                  "--max-attempts option.")
+        shutdown(1)
+    else:
+        maxAttempts = options.maxAttempts
+        log.debug("maxAttempts == {}".format(maxAttempts))
+
+    if options.jobIdleSec <= 0:
+        log.error("Please specify a positive number of seconds to the " + \
+                  "--job-idle-sec option.")
+        shutdown(1)
+    else:
+        jobIdleSec = options.jobIdleSec
+        log.debug("jobIdleSec == {}".format(jobIdleSec))
+
     # Run the server.  
     #
     # This method should run forever until the user presses Ctrl-C or SIGINT is
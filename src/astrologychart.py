@@ -33,6 +33,7 @@ from util import Util
 
 # For conversions from julian day to datetime.datetime and vice versa.
 from ephemeris import Ephemeris
+from ephemeris import DerivedPlanetEvaluator
 
 
 class AstrologyUtils:
@@ -7178,6 +7179,10 @@ class AstrologyChartWidget(QWidget):
         # Astrological house system for getting the house cusps.
         houseSystem = Ephemeris.HouseSys['Porphyry']
 
+        # Each planet is calculated only once, and shared by the
+        # custom planets that are calculated from it.
+        evaluator = DerivedPlanetEvaluator(dt, houseSystem)
+
         settings = QSettings()
         
         if settings.value(\
@@ -7186,126 +7191,126 @@ class AstrologyChartWidget(QWidget):
             type=bool):
 
             self.log.debug("Getting house 1 values...")
-            planets.append(Ephemeris.getH1PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("H1"))
         
         if settings.value(\
             SettingsKeys.planetH2CalculationsEnabledKey, \
             SettingsKeys.planetH2CalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getH2PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("H2"))
         
         if settings.value(\
             SettingsKeys.planetH3CalculationsEnabledKey, \
             SettingsKeys.planetH3CalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getH3PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("H3"))
 
         if settings.value(\
             SettingsKeys.planetH4CalculationsEnabledKey, \
             SettingsKeys.planetH4CalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getH4PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("H4"))
         
         if settings.value(\
             SettingsKeys.planetH5CalculationsEnabledKey, \
             SettingsKeys.planetH5CalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getH5PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("H5"))
         
         if settings.value(\
             SettingsKeys.planetH6CalculationsEnabledKey, \
             SettingsKeys.planetH6CalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getH6PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("H6"))
         
         if settings.value(\
             SettingsKeys.planetH7CalculationsEnabledKey, \
             SettingsKeys.planetH7CalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getH7PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("H7"))
         
         if settings.value(\
             SettingsKeys.planetH8CalculationsEnabledKey, \
             SettingsKeys.planetH8CalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getH8PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("H8"))
         
         if settings.value(\
             SettingsKeys.planetH9CalculationsEnabledKey, \
             SettingsKeys.planetH9CalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getH9PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("H9"))
         
         if settings.value(\
             SettingsKeys.planetH10CalculationsEnabledKey, \
             SettingsKeys.planetH10CalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getH10PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("H10"))
         
         if settings.value(\
             SettingsKeys.planetH11CalculationsEnabledKey, \
             SettingsKeys.planetH11CalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getH11PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("H11"))
         
         if settings.value(\
             SettingsKeys.planetH12CalculationsEnabledKey, \
             SettingsKeys.planetH12CalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getH12PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("H12"))
         
         if settings.value(\
             SettingsKeys.planetARMCCalculationsEnabledKey, \
             SettingsKeys.planetARMCCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getARMCPlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("ARMC"))
         
         if settings.value(\
             SettingsKeys.planetVertexCalculationsEnabledKey, \
             SettingsKeys.planetVertexCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getVertexPlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("Vertex"))
         
         if settings.value(\
             SettingsKeys.planetEquatorialAscendantCalculationsEnabledKey, \
             SettingsKeys.planetEquatorialAscendantCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getEquatorialAscendantPlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("EquatorialAscendant"))
         
         if settings.value(\
             SettingsKeys.planetCoAscendant1CalculationsEnabledKey, \
             SettingsKeys.planetCoAscendant1CalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getCoAscendant1PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("CoAscendant1"))
         
         if settings.value(\
             SettingsKeys.planetCoAscendant2CalculationsEnabledKey, \
             SettingsKeys.planetCoAscendant2CalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getCoAscendant2PlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("CoAscendant2"))
         
         if settings.value(\
             SettingsKeys.planetPolarAscendantCalculationsEnabledKey, \
             SettingsKeys.planetPolarAscendantCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getPolarAscendantPlanetaryInfo(dt, houseSystem))
+            planets.append(evaluator.getPlanetaryInfo("PolarAscendant"))
         
         if settings.value(\
             SettingsKeys.planetHoraLagnaCalculationsEnabledKey, \
@@ -7328,112 +7333,112 @@ class AstrologyChartWidget(QWidget):
             SettingsKeys.planetMeanLunarApogeeCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMeanLunarApogeePlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("MeanLunarApogee"))
         
         if settings.value(\
             SettingsKeys.planetOsculatingLunarApogeeCalculationsEnabledKey, \
             SettingsKeys.planetOsculatingLunarApogeeCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getOsculatingLunarApogeePlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("OsculatingLunarApogee"))
         
         if settings.value(\
             SettingsKeys.planetInterpolatedLunarApogeeCalculationsEnabledKey, \
             SettingsKeys.planetInterpolatedLunarApogeeCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getInterpolatedLunarApogeePlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("InterpolatedLunarApogee"))
         
         if settings.value(\
             SettingsKeys.planetInterpolatedLunarPerigeeCalculationsEnabledKey, \
             SettingsKeys.planetInterpolatedLunarPerigeeCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getInterpolatedLunarPerigeePlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("InterpolatedLunarPerigee"))
         
         if settings.value(\
             SettingsKeys.planetSunCalculationsEnabledKey, \
             SettingsKeys.planetSunCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getSunPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Sun"))
         
         if settings.value(\
             SettingsKeys.planetMoonCalculationsEnabledKey, \
             SettingsKeys.planetMoonCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMoonPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Moon"))
         
         if settings.value(\
             SettingsKeys.planetMercuryCalculationsEnabledKey, \
             SettingsKeys.planetMercuryCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMercuryPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Mercury"))
         
         if settings.value(\
             SettingsKeys.planetVenusCalculationsEnabledKey, \
             SettingsKeys.planetVenusCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getVenusPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Venus"))
         
         if settings.value(\
             SettingsKeys.planetEarthCalculationsEnabledKey, \
             SettingsKeys.planetEarthCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getEarthPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Earth"))
             
         if settings.value(\
             SettingsKeys.planetMarsCalculationsEnabledKey, \
             SettingsKeys.planetMarsCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMarsPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Mars"))
         
         if settings.value(\
             SettingsKeys.planetJupiterCalculationsEnabledKey, \
             SettingsKeys.planetJupiterCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getJupiterPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Jupiter"))
         
         if settings.value(\
             SettingsKeys.planetSaturnCalculationsEnabledKey, \
             SettingsKeys.planetSaturnCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getSaturnPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Saturn"))
         
         if settings.value(\
             SettingsKeys.planetUranusCalculationsEnabledKey, \
             SettingsKeys.planetUranusCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getUranusPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Uranus"))
         
         if settings.value(\
             SettingsKeys.planetNeptuneCalculationsEnabledKey, \
             SettingsKeys.planetNeptuneCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getNeptunePlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Neptune"))
         
         if settings.value(\
             SettingsKeys.planetPlutoCalculationsEnabledKey, \
             SettingsKeys.planetPlutoCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getPlutoPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Pluto"))
         
         if settings.value(\
             SettingsKeys.planetMeanNorthNodeCalculationsEnabledKey, \
             SettingsKeys.planetMeanNorthNodeCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMeanNorthNodePlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("MeanNorthNode"))
         
         if settings.value(\
             SettingsKeys.planetMeanSouthNodeCalculationsEnabledKey, \
@@ -7448,7 +7453,7 @@ class AstrologyChartWidget(QWidget):
             SettingsKeys.planetTrueNorthNodeCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getTrueNorthNodePlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("TrueNorthNode"))
         
         if settings.value(\
             SettingsKeys.planetTrueSouthNodeCalculationsEnabledKey, \
@@ -7463,49 +7468,49 @@ class AstrologyChartWidget(QWidget):
             SettingsKeys.planetCeresCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getCeresPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Ceres"))
         
         if settings.value(\
             SettingsKeys.planetPallasCalculationsEnabledKey, \
             SettingsKeys.planetPallasCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getPallasPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Pallas"))
         
         if settings.value(\
             SettingsKeys.planetJunoCalculationsEnabledKey, \
             SettingsKeys.planetJunoCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getJunoPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Juno"))
         
         if settings.value(\
             SettingsKeys.planetVestaCalculationsEnabledKey, \
             SettingsKeys.planetVestaCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getVestaPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Vesta"))
         
         if settings.value(\
             SettingsKeys.planetIsisCalculationsEnabledKey, \
             SettingsKeys.planetIsisCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getIsisPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Isis"))
         
         if settings.value(\
             SettingsKeys.planetNibiruCalculationsEnabledKey, \
             SettingsKeys.planetNibiruCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getNibiruPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Nibiru"))
         
         if settings.value(\
             SettingsKeys.planetChironCalculationsEnabledKey, \
             SettingsKeys.planetChironCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getChironPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("Chiron"))
         
         if settings.value(\
             SettingsKeys.planetGulikaCalculationsEnabledKey, \
@@ -7528,203 +7533,203 @@ class AstrologyChartWidget(QWidget):
             SettingsKeys.planetMeanOfFiveCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMeanOfFivePlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("MeanOfFive"))
         
         if settings.value(\
             SettingsKeys.planetCycleOfEightCalculationsEnabledKey, \
             SettingsKeys.planetCycleOfEightCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getCycleOfEightPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("CycleOfEight"))
         
         if settings.value(\
             SettingsKeys.planetAvgMaJuSaUrNePlCalculationsEnabledKey, \
             SettingsKeys.planetAvgMaJuSaUrNePlCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getAvgMaJuSaUrNePlPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("AvgMaJuSaUrNePl"))
         
         if settings.value(\
             SettingsKeys.planetAvgJuSaUrNeCalculationsEnabledKey, \
             SettingsKeys.planetAvgJuSaUrNeCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getAvgJuSaUrNePlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("AvgJuSaUrNe"))
         
         if settings.value(\
             SettingsKeys.planetAvgJuSaCalculationsEnabledKey, \
             SettingsKeys.planetAvgJuSaCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getAvgJuSaPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("AvgJuSa"))
 
         if settings.value(\
             SettingsKeys.planetAsSuCalculationsEnabledKey, \
             SettingsKeys.planetAsSuCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getAsSuPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("AsSu"))
 
         if settings.value(\
             SettingsKeys.planetAsMoCalculationsEnabledKey, \
             SettingsKeys.planetAsMoCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getAsMoPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("AsMo"))
 
         if settings.value(\
             SettingsKeys.planetMoSuCalculationsEnabledKey, \
             SettingsKeys.planetMoSuCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMoSuPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("MoSu"))
 
         if settings.value(\
             SettingsKeys.planetMeVeCalculationsEnabledKey, \
             SettingsKeys.planetMeVeCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMeVePlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("MeVe"))
 
         if settings.value(\
             SettingsKeys.planetMeEaCalculationsEnabledKey, \
             SettingsKeys.planetMeEaCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMeEaPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("MeEa"))
 
         if settings.value(\
             SettingsKeys.planetMeMaCalculationsEnabledKey, \
             SettingsKeys.planetMeMaCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMeMaPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("MeMa"))
 
         if settings.value(\
             SettingsKeys.planetMeJuCalculationsEnabledKey, \
             SettingsKeys.planetMeJuCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMeJuPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("MeJu"))
 
         if settings.value(\
             SettingsKeys.planetMeSaCalculationsEnabledKey, \
             SettingsKeys.planetMeSaCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMeSaPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("MeSa"))
 
         if settings.value(\
             SettingsKeys.planetMeUrCalculationsEnabledKey, \
             SettingsKeys.planetMeUrCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMeUrPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("MeUr"))
 
         if settings.value(\
             SettingsKeys.planetVeEaCalculationsEnabledKey, \
             SettingsKeys.planetVeEaCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getVeEaPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("VeEa"))
 
         if settings.value(\
             SettingsKeys.planetVeMaCalculationsEnabledKey, \
             SettingsKeys.planetVeMaCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getVeMaPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("VeMa"))
 
         if settings.value(\
             SettingsKeys.planetVeJuCalculationsEnabledKey, \
             SettingsKeys.planetVeJuCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getVeJuPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("VeJu"))
 
         if settings.value(\
             SettingsKeys.planetVeSaCalculationsEnabledKey, \
             SettingsKeys.planetVeSaCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getVeSaPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("VeSa"))
 
         if settings.value(\
             SettingsKeys.planetVeUrCalculationsEnabledKey, \
             SettingsKeys.planetVeUrCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getVeUrPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("VeUr"))
 
         if settings.value(\
             SettingsKeys.planetEaMaCalculationsEnabledKey, \
             SettingsKeys.planetEaMaCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getEaMaPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("EaMa"))
 
         if settings.value(\
             SettingsKeys.planetEaJuCalculationsEnabledKey, \
             SettingsKeys.planetEaJuCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getEaJuPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("EaJu"))
 
         if settings.value(\
             SettingsKeys.planetEaSaCalculationsEnabledKey, \
             SettingsKeys.planetEaSaCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getEaSaPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("EaSa"))
 
         if settings.value(\
             SettingsKeys.planetEaUrCalculationsEnabledKey, \
             SettingsKeys.planetEaUrCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getEaUrPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("EaUr"))
 
         if settings.value(\
             SettingsKeys.planetMaJuCalculationsEnabledKey, \
             SettingsKeys.planetMaJuCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMaJuPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("MaJu"))
 
         if settings.value(\
             SettingsKeys.planetMaSaCalculationsEnabledKey, \
             SettingsKeys.planetMaSaCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMaSaPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("MaSa"))
 
         if settings.value(\
             SettingsKeys.planetMaUrCalculationsEnabledKey, \
             SettingsKeys.planetMaUrCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getMaUrPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("MaUr"))
 
         if settings.value(\
             SettingsKeys.planetJuSaCalculationsEnabledKey, \
             SettingsKeys.planetJuSaCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getJuSaPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("JuSa"))
 
         if settings.value(\
             SettingsKeys.planetJuUrCalculationsEnabledKey, \
             SettingsKeys.planetJuUrCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getJuUrPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("JuUr"))
 
         if settings.value(\
             SettingsKeys.planetSaUrCalculationsEnabledKey, \
             SettingsKeys.planetSaUrCalculationsEnabledDefValue,
             type=bool):
 
-            planets.append(Ephemeris.getSaUrPlanetaryInfo(dt))
+            planets.append(evaluator.getPlanetaryInfo("SaUr"))
 
 
         return planets
@@ -3904,6 +3904,7 @@ class LookbackMultipleCalcModel(Enum):
     local_serial = 1
     local_parallel = 2
     remote_parallel = 3
+    hybrid_parallel = 4
 
 
 class PriceBarChartArtifact:
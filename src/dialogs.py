@@ -1661,6 +1661,47 @@ class AppPreferencesEditWidget(QWidget):
             QRadioButton("Local / Parallel")
         self.lookbackMultipleRemoteParallelRadioButton = \
             QRadioButton("Remote / Parallel")
+        self.lookbackMultipleHybridParallelRadioButton = \
+            QRadioButton("Local and Remote / Parallel " + \
+                         "(local first, falls back to local " + \
+                         "if the server is unreachable)")
+
+        # Local parallel: number of processes (int).
+        # Zero means the number of CPUs.
+        self.lookbackMultipleNumProcessesLabel = \
+            QLabel("Number of processes for Local / Parallel " + \
+                   "(0 for the number of CPUs): ")
+        self.lookbackMultipleNumProcessesSpinBox = QSpinBox()
+        self.lookbackMultipleNumProcessesSpinBox.setMinimum(0)
+        self.lookbackMultipleNumProcessesSpinBox.setMaximum(256)
+
+        # LookbackMultiple incremental redraw on scroll and zoom.
+        self.lookbackMultipleIncrementalRedrawEnabledCheckBox = \
+            QCheckBox("Update LookbackMultiplePriceBars " + \
+                      "when scrolling or zooming")
+
+        # LookbackMultiple ephemeris interpolator.
+        self.lookbackMultipleEphemerisInterpolatorEnabledCheckBox = \
+            QCheckBox("Interpolate planet longitudes in local " + \
+                      "calculations (faster, accurate to about " + \
+                      "1 arc second)")
+
+        # LookbackMultiple longitude timelines.
+        self.lookbackMultipleLongitudeTimelinesEnabledCheckBox = \
+            QCheckBox("Index planet longitudes in files next to " + \
+                      "the PriceChartDocument (Local / Serial)")
+
+        # LookbackMultiple result cache.
+        self.lookbackMultipleResultCacheEnabledCheckBox = \
+            QCheckBox("Cache LookbackMultiple results in a file " + \
+                      "next to the PriceChartDocument")
+        self.lookbackMultipleResultCacheMaxEntriesLabel = \
+            QLabel("Maximum number of cached results per " + \
+                   "PriceChartDocument: ")
+        self.lookbackMultipleResultCacheMaxEntriesSpinBox = QSpinBox()
+        self.lookbackMultipleResultCacheMaxEntriesSpinBox.setMinimum(1000)
+        self.lookbackMultipleResultCacheMaxEntriesSpinBox.setMaximum(100000000)
+        self.lookbackMultipleResultCacheMaxEntriesSpinBox.setSingleStep(1000)
 
         # LookbackMultiple remote parallel settings.
         self.lookbackMultipleRemoteParallelGroupBox = \
@@ -1693,6 +1734,14 @@ class AppPreferencesEditWidget(QWidget):
         self.lookbackMultipleServerAuthKeyLabel = QLabel("Server auth key (password): ")
         self.lookbackMultipleServerAuthKeyLineEdit = QLineEdit()
 
+        # Remote parallel: seconds to wait for any result before
+        # giving up on the rest (int).
+        self.lookbackMultipleServerTimeoutSecLabel = \
+            QLabel("Seconds without results before giving up: ")
+        self.lookbackMultipleServerTimeoutSecSpinBox = QSpinBox()
+        self.lookbackMultipleServerTimeoutSecSpinBox.setMinimum(1)
+        self.lookbackMultipleServerTimeoutSecSpinBox.setMaximum(86400)
+
         # Button for resetting all the above edit widgets.
         self.lookbackMultipleResetAllToDefaultButton = \
             QPushButton("Reset all the above to original default values")
@@ -1705,6 +1754,17 @@ class AppPreferencesEditWidget(QWidget):
             addWidget(self.lookbackMultipleLocalParallelRadioButton)
         radioButtonsLayout.\
             addWidget(self.lookbackMultipleRemoteParallelRadioButton)
+        radioButtonsLayout.\
+            addWidget(self.lookbackMultipleHybridParallelRadioButton)
+
+        numProcessesLayout = QHBoxLayout()
+        numProcessesLayout.\
+            addWidget(self.lookbackMultipleNumProcessesLabel)
+        numProcessesLayout.\
+            addWidget(self.lookbackMultipleNumProcessesSpinBox)
+        numProcessesLayout.addStretch()
+        radioButtonsLayout.addLayout(numProcessesLayout)
+
         self.lookbackMultipleCalcModelGroupBox.\
             setLayout(radioButtonsLayout)
         
@@ -1715,6 +1775,8 @@ class AppPreferencesEditWidget(QWidget):
                           self.lookbackMultipleServerPortSpinBox)
         formLayout.addRow(self.lookbackMultipleServerAuthKeyLabel,
                           self.lookbackMultipleServerAuthKeyLineEdit)
+        formLayout.addRow(self.lookbackMultipleServerTimeoutSecLabel,
+                          self.lookbackMultipleServerTimeoutSecSpinBox)
         
         remoteParallelSettingsLayout = QVBoxLayout()
         remoteParallelSettingsLayout.\
@@ -1731,6 +1793,21 @@ class AppPreferencesEditWidget(QWidget):
         
         mainLayout = QVBoxLayout()
         mainLayout.addWidget(self.lookbackMultipleCalcModelGroupBox)
+        mainLayout.addWidget(\
+            self.lookbackMultipleIncrementalRedrawEnabledCheckBox)
+        mainLayout.addWidget(\
+            self.lookbackMultipleEphemerisInterpolatorEnabledCheckBox)
+        mainLayout.addWidget(\
+            self.lookbackMultipleLongitudeTimelinesEnabledCheckBox)
+        mainLayout.addWidget(\
+            self.lookbackMultipleResultCacheEnabledCheckBox)
+        resultCacheMaxEntriesLayout = QHBoxLayout()
+        resultCacheMaxEntriesLayout.\
+            addWidget(self.lookbackMultipleResultCacheMaxEntriesLabel)
+        resultCacheMaxEntriesLayout.\
+            addWidget(self.lookbackMultipleResultCacheMaxEntriesSpinBox)
+        resultCacheMaxEntriesLayout.addStretch()
+        mainLayout.addLayout(resultCacheMaxEntriesLayout)
         mainLayout.addWidget(self.lookbackMultipleRemoteParallelGroupBox)
         mainLayout.addStretch()
         mainLayout.addLayout(hlayout)
@@ -10875,11 +10952,77 @@ class AppPreferencesEditWidget(QWidget):
             self.lookbackMultipleLocalParallelRadioButton.setChecked(True)
         elif value == str(LookbackMultipleCalcModel.remote_parallel):
             self.lookbackMultipleRemoteParallelRadioButton.setChecked(True)
+        elif value == str(LookbackMultipleCalcModel.hybrid_parallel):
+            self.lookbackMultipleHybridParallelRadioButton.setChecked(True)
         else:
             self.log.error(\
                 "Unknown or unsupported LookbackMultiple calculation model.")
             self.lookbackMultipleLocalParallelRadioButton.setChecked(True)
+
+        # Local parallel: number of processes (int).
+        key = SettingsKeys.lookbackMultipleCalcNumProcessesKey
+        value = settings.value(key, \
+            SettingsKeys.lookbackMultipleCalcNumProcessesDefValue,
+            type=int)
+        self.lookbackMultipleNumProcessesSpinBox.\
+            setValue(value)
             
+        # LookbackMultiple incremental redraw on scroll and zoom.
+        key = SettingsKeys.lookbackMultipleIncrementalRedrawEnabledKey
+        value = settings.value(key, \
+            SettingsKeys.lookbackMultipleIncrementalRedrawEnabledDefValue,
+            type=bool)
+        if value == True:
+            self.lookbackMultipleIncrementalRedrawEnabledCheckBox.\
+                setCheckState(Qt.Checked)
+        else:
+            self.lookbackMultipleIncrementalRedrawEnabledCheckBox.\
+                setCheckState(Qt.Unchecked)
+
+        # LookbackMultiple ephemeris interpolator enabled.
+        key = SettingsKeys.lookbackMultipleEphemerisInterpolatorEnabledKey
+        value = settings.value(key, \
+            SettingsKeys.lookbackMultipleEphemerisInterpolatorEnabledDefValue,
+            type=bool)
+        if value == True:
+            self.lookbackMultipleEphemerisInterpolatorEnabledCheckBox.\
+                setCheckState(Qt.Checked)
+        else:
+            self.lookbackMultipleEphemerisInterpolatorEnabledCheckBox.\
+                setCheckState(Qt.Unchecked)
+
+        # LookbackMultiple longitude timelines enabled.
+        key = SettingsKeys.lookbackMultipleLongitudeTimelinesEnabledKey
+        value = settings.value(key, \
+            SettingsKeys.lookbackMultipleLongitudeTimelinesEnabledDefValue,
+            type=bool)
+        if value == True:
+            self.lookbackMultipleLongitudeTimelinesEnabledCheckBox.\
+                setCheckState(Qt.Checked)
+        else:
+            self.lookbackMultipleLongitudeTimelinesEnabledCheckBox.\
+                setCheckState(Qt.Unchecked)
+
+        # LookbackMultiple result cache enabled.
+        key = SettingsKeys.lookbackMultipleResultCacheEnabledKey
+        value = settings.value(key, \
+            SettingsKeys.lookbackMultipleResultCacheEnabledDefValue,
+            type=bool)
+        if value == True:
+            self.lookbackMultipleResultCacheEnabledCheckBox.\
+                setCheckState(Qt.Checked)
+        else:
+            self.lookbackMultipleResultCacheEnabledCheckBox.\
+                setCheckState(Qt.Unchecked)
+
+        # LookbackMultiple result cache maximum number of results.
+        key = SettingsKeys.lookbackMultipleResultCacheMaxEntriesKey
+        value = settings.value(key, \
+            SettingsKeys.lookbackMultipleResultCacheMaxEntriesDefValue,
+            type=int)
+        self.lookbackMultipleResultCacheMaxEntriesSpinBox.\
+            setValue(value)
+
         # LookbackMultiple remote parallel settings.
 
         # Remote parallel: server address (str).
@@ -10907,6 +11050,14 @@ class AppPreferencesEditWidget(QWidget):
             type=str)
         self.lookbackMultipleServerAuthKeyLineEdit.\
             setText(value)
+
+        # Remote parallel: seconds to wait for any result (int).
+        key = SettingsKeys.lookbackMultipleCalcRemoteTimeoutSecKey
+        value = settings.value(key, \
+            SettingsKeys.lookbackMultipleCalcRemoteTimeoutSecDefValue,
+            type=int)
+        self.lookbackMultipleServerTimeoutSecSpinBox.\
+            setValue(value)
         
     def _planetCalculationsLoadValuesFromSettings(self):
         """Loads the widgets with values from the QSettings object.
@@ -19559,6 +19710,8 @@ class AppPreferencesEditWidget(QWidget):
             newValue = str(LookbackMultipleCalcModel.local_parallel)
         elif self.lookbackMultipleRemoteParallelRadioButton.isChecked() == True:
             newValue = str(LookbackMultipleCalcModel.remote_parallel)
+        elif self.lookbackMultipleHybridParallelRadioButton.isChecked() == True:
+            newValue = str(LookbackMultipleCalcModel.hybrid_parallel)
         else:
             self.log.error(\
                 "None of the expected radio buttons were checked for " + \
@@ -19570,7 +19723,77 @@ class AppPreferencesEditWidget(QWidget):
                 settings.setValue(key, newValue)
         else:
             settings.setValue(key, newValue)
+
+        # Local parallel: number of processes (int).
+        key = SettingsKeys.lookbackMultipleCalcNumProcessesKey
+        newValue = \
+            self.lookbackMultipleNumProcessesSpinBox.value()
+        if settings.contains(key):
+            oldValue = settings.value(key, type=int)
+            if oldValue != newValue:
+                settings.setValue(key, newValue)
+        else:
+            settings.setValue(key, newValue)
             
+        # LookbackMultiple incremental redraw on scroll and zoom.
+        key = SettingsKeys.lookbackMultipleIncrementalRedrawEnabledKey
+        newValue = \
+            self.lookbackMultipleIncrementalRedrawEnabledCheckBox.\
+            checkState() == Qt.Checked
+        if settings.contains(key):
+            oldValue = settings.value(key, type=bool)
+            if oldValue != newValue:
+                settings.setValue(key, newValue)
+        else:
+            settings.setValue(key, newValue)
+
+        # LookbackMultiple ephemeris interpolator enabled.
+        key = SettingsKeys.lookbackMultipleEphemerisInterpolatorEnabledKey
+        newValue = \
+            self.lookbackMultipleEphemerisInterpolatorEnabledCheckBox.\
+            checkState() == Qt.Checked
+        if settings.contains(key):
+            oldValue = settings.value(key, type=bool)
+            if oldValue != newValue:
+                settings.setValue(key, newValue)
+        else:
+            settings.setValue(key, newValue)
+
+        # LookbackMultiple longitude timelines enabled.
+        key = SettingsKeys.lookbackMultipleLongitudeTimelinesEnabledKey
+        newValue = \
+            self.lookbackMultipleLongitudeTimelinesEnabledCheckBox.\
+            checkState() == Qt.Checked
+        if settings.contains(key):
+            oldValue = settings.value(key, type=bool)
+            if oldValue != newValue:
+                settings.setValue(key, newValue)
+        else:
+            settings.setValue(key, newValue)
+
+        # LookbackMultiple result cache enabled.
+        key = SettingsKeys.lookbackMultipleResultCacheEnabledKey
+        newValue = \
+            self.lookbackMultipleResultCacheEnabledCheckBox.\
+            checkState() == Qt.Checked
+        if settings.contains(key):
+            oldValue = settings.value(key, type=bool)
+            if oldValue != newValue:
+                settings.setValue(key, newValue)
+        else:
+            settings.setValue(key, newValue)
+
+        # LookbackMultiple result cache maximum number of results.
+        key = SettingsKeys.lookbackMultipleResultCacheMaxEntriesKey
+        newValue = \
+            self.lookbackMultipleResultCacheMaxEntriesSpinBox.value()
+        if settings.contains(key):
+            oldValue = settings.value(key, type=int)
+            if oldValue != newValue:
+                settings.setValue(key, newValue)
+        else:
+            settings.setValue(key, newValue)
+
         # LookbackMultiple remote parallel settings.
 
         # Remote parallel: server address (str).
@@ -19607,6 +19830,17 @@ class AppPreferencesEditWidget(QWidget):
                 settings.setValue(key, newValue)
         else:
             settings.setValue(key, newValue)
+
+        # Remote parallel: seconds to wait for any result (int).
+        key = SettingsKeys.lookbackMultipleCalcRemoteTimeoutSecKey
+        newValue = \
+            self.lookbackMultipleServerTimeoutSecSpinBox.value()
+        if settings.contains(key):
+            oldValue = settings.value(key, type=int)
+            if oldValue != newValue:
+                settings.setValue(key, newValue)
+        else:
+            settings.setValue(key, newValue)
         
     def _planetCalculationsSaveValuesToSettings(self):
         """Saves the values in the widgets to the QSettings object.
@@ -31919,11 +32153,54 @@ class AppPreferencesEditWidget(QWidget):
             self.lookbackMultipleLocalParallelRadioButton.setChecked(True)
         elif value == str(LookbackMultipleCalcModel.remote_parallel):
             self.lookbackMultipleRemoteParallelRadioButton.setChecked(True)
+        elif value == str(LookbackMultipleCalcModel.hybrid_parallel):
+            self.lookbackMultipleHybridParallelRadioButton.setChecked(True)
         else:
             self.log.error(\
                 "Unknown or unsupported LookbackMultiple calculation model.")
             self.lookbackMultipleLocalParallelRadioButton.setChecked(True)
+
+        # Local parallel: number of processes (int).
+        self.lookbackMultipleNumProcessesSpinBox.setValue(\
+            SettingsKeys.lookbackMultipleCalcNumProcessesDefValue)
         
+        # LookbackMultiple incremental redraw on scroll and zoom.
+        if SettingsKeys.lookbackMultipleIncrementalRedrawEnabledDefValue \
+               == True:
+            self.lookbackMultipleIncrementalRedrawEnabledCheckBox.\
+                setCheckState(Qt.Checked)
+        else:
+            self.lookbackMultipleIncrementalRedrawEnabledCheckBox.\
+                setCheckState(Qt.Unchecked)
+
+        # LookbackMultiple ephemeris interpolator.
+        if SettingsKeys.lookbackMultipleEphemerisInterpolatorEnabledDefValue \
+               == True:
+            self.lookbackMultipleEphemerisInterpolatorEnabledCheckBox.\
+                setCheckState(Qt.Checked)
+        else:
+            self.lookbackMultipleEphemerisInterpolatorEnabledCheckBox.\
+                setCheckState(Qt.Unchecked)
+
+        # LookbackMultiple longitude timelines.
+        if SettingsKeys.lookbackMultipleLongitudeTimelinesEnabledDefValue \
+               == True:
+            self.lookbackMultipleLongitudeTimelinesEnabledCheckBox.\
+                setCheckState(Qt.Checked)
+        else:
+            self.lookbackMultipleLongitudeTimelinesEnabledCheckBox.\
+                setCheckState(Qt.Unchecked)
+
+        # LookbackMultiple result cache.
+        if SettingsKeys.lookbackMultipleResultCacheEnabledDefValue == True:
+            self.lookbackMultipleResultCacheEnabledCheckBox.\
+                setCheckState(Qt.Checked)
+        else:
+            self.lookbackMultipleResultCacheEnabledCheckBox.\
+                setCheckState(Qt.Unchecked)
+        self.lookbackMultipleResultCacheMaxEntriesSpinBox.setValue(\
+            SettingsKeys.lookbackMultipleResultCacheMaxEntriesDefValue)
+
         # LookbackMultiple remote parallel settings.
         
         # Remote parallel: server address (str).
@@ -31940,6 +32217,10 @@ class AppPreferencesEditWidget(QWidget):
         self.lookbackMultipleServerAuthKeyLineEdit.setText(\
             SettingsKeys.lookbackMultipleCalcRemoteServerAuthKeyDefValue)
 
+        # Remote parallel: seconds to wait for any result (int).
+        self.lookbackMultipleServerTimeoutSecSpinBox.setValue(\
+            SettingsKeys.lookbackMultipleCalcRemoteTimeoutSecDefValue)
+
     def _handlePlanetCalculationsResetAllToDefaultButtonClicked(self):
         """Called when the planetCalculationsResetAllToDefaultButton is
         clicked.  Resets the all the widget values in this widget tab
@@ -16,6 +16,22 @@ import pytz
 # For math.floor()
 import math
 
+# For array.array of floats.
+import array
+
+# For collections.OrderedDict and collections.abc.Mapping.
+import collections
+import collections.abc
+
+# For bisect.bisect_right().
+import bisect
+
+# For the lock around Swiss Ephemeris calls.
+import threading
+
+# For hashing the code of derived planet formulas.
+import hashlib
+
 # For logging.
 import logging
 import logging.config
@@ -210,6 +226,739 @@ class PlanetaryInfo:
         return returnStr
 
 
+class LazyCoordinateDict(dict):
+    """Dictionary of the planetary values for one centricity type and
+    one zodiac type (e.g. p.geocentric['tropical']) of a
+    LazyPlanetaryInfo.
+
+    The values are not calculated when this dict is created.  The
+    first time a field is accessed, only the coordinate system that
+    holds that field (ecliptical, equatorial or rectangular) is
+    calculated with the Swiss Ephemeris, and the resulting values are
+    stored in the dict for later accesses.
+
+    Operations that need the whole dict (iterating, len(), str(),
+    copy.deepcopy(), pickling, etc.) calculate all the coordinate
+    systems first.  Copies are plain dict objects.
+    """
+
+    # Map of field name to the coordinate system that the field is
+    # calculated in.  The order of the fields in each list is the
+    # order of the values returned by swe.calc_ut().
+    coordinateSystemFields = \
+        {'ecliptical'  : ['longitude',
+                          'latitude',
+                          'distance',
+                          'longitude_speed',
+                          'latitude_speed',
+                          'distance_speed'],
+         'equatorial'  : ['rectascension',
+                          'declination',
+                          'distance',
+                          'rectascension_speed',
+                          'declination_speed',
+                          'distance_speed'],
+         'rectangular' : ['X',
+                          'Y',
+                          'Z',
+                          'dX',
+                          'dY',
+                          'dZ']}
+
+    # Map of field name to coordinate system.  Fields available in
+    # more than one coordinate system ('distance' and
+    # 'distance_speed') are calculated in the equatorial system,
+    # which is the value that a full PlanetaryInfo has always held.
+    #
+    # Map of field name to the index of the field in the values
+    # returned by swe.calc_ut() for that coordinate system.
+    fieldCoordinateSystems = {}
+    fieldIndexes = {}
+    for coordinateSystemType in ['rectangular', 'ecliptical', 'equatorial']:
+        fieldNames = coordinateSystemFields[coordinateSystemType]
+        for i in range(len(fieldNames)):
+            fieldCoordinateSystems[fieldNames[i]] = coordinateSystemType
+            fieldIndexes[fieldNames[i]] = i
+    del coordinateSystemType
+    del fieldNames
+    del i
+
+    def __init__(self, planetId, julianDay, centricityType, zodiacType,
+                 context=None):
+        """Initializes the LazyCoordinateDict.
+
+        Arguments:
+        planetId       - int value for the planet ID in the Swiss Ephemeris.
+        julianDay      - float value for the Julian Day (UT) of the
+                         timestamp to calculate for.
+        centricityType - str value holding either "geocentric",
+                         "topocentric", or "heliocentric".
+        zodiacType     - str value holding either "tropical" or "sidereal".
+        context        - EphemerisContext to calculate the values with,
+                         or None to use the Ephemeris settings.
+        """
+
+        super().__init__()
+
+        self.planetId = planetId
+        self.julianDay = julianDay
+        self.centricityType = centricityType
+        self.zodiacType = zodiacType
+        self.context = context
+
+        # Topocentric values are calculated for the geographic position
+        # set in the Ephemeris when this dict is created, not for the
+        # one set when a field is first accessed.  The sidereal mode
+        # does not need to be kept, since the Ephemeris always uses
+        # the Lahiri ayanamsa.
+        self.sweTopoArgs = None
+        if context == None and centricityType == "topocentric":
+            self.sweTopoArgs = Ephemeris.sweTopoArgs
+
+        # Coordinate system types already calculated.
+        self.calculatedCoordinateSystems = set()
+
+    def calculateCoordinateSystem(self, coordinateSystemType):
+        """Calculates the values for the given coordinate system type
+        and stores them in this dict.  Fields that were already set
+        in the dict are not overwritten, and fields that are calculated
+        in another coordinate system (see fieldCoordinateSystems) are
+        not set, so that their values do not depend on which fields
+        were accessed first.
+
+        Arguments:
+        coordinateSystemType - str value holding either "ecliptical",
+                               "equatorial", or "rectangular".
+        """
+
+        if coordinateSystemType in self.calculatedCoordinateSystems:
+            return
+
+        if self.context != None:
+            values = \
+                self.context.calcPlanetCoordinates(self.julianDay,
+                                                   self.planetId,
+                                                   self.centricityType,
+                                                   self.zodiacType,
+                                                   coordinateSystemType)
+        else:
+            values = Ephemeris.calcPlanetCoordinates(self.julianDay,
+                                                     self.planetId,
+                                                     self.centricityType,
+                                                     self.zodiacType,
+                                                     coordinateSystemType,
+                                                     self.sweTopoArgs)
+
+        fieldNames = \
+            LazyCoordinateDict.coordinateSystemFields[coordinateSystemType]
+        fieldCoordinateSystems = LazyCoordinateDict.fieldCoordinateSystems
+        for i in range(len(fieldNames)):
+            if fieldCoordinateSystems[fieldNames[i]] == \
+                   coordinateSystemType and \
+               not dict.__contains__(self, fieldNames[i]):
+                dict.__setitem__(self, fieldNames[i], values[i])
+
+        self.calculatedCoordinateSystems.add(coordinateSystemType)
+
+    def calculateAll(self):
+        """Calculates the values for all the coordinate systems."""
+
+        for coordinateSystemType in ['ecliptical', 
+                                     'equatorial', 
+                                     'rectangular']:
+            self.calculateCoordinateSystem(coordinateSystemType)
+
+    def __missing__(self, key):
+        coordinateSystemType = \
+            LazyCoordinateDict.fieldCoordinateSystems.get(key, None)
+
+        if coordinateSystemType is None:
+            raise KeyError(key)
+
+        self.calculateCoordinateSystem(coordinateSystemType)
+
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or \
+               key in LazyCoordinateDict.fieldCoordinateSystems
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        else:
+            return default
+
+    def __iter__(self):
+        self.calculateAll()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self.calculateAll()
+        return dict.__len__(self)
+
+    def __eq__(self, other):
+        self.calculateAll()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def keys(self):
+        self.calculateAll()
+        return dict.keys(self)
+
+    def values(self):
+        self.calculateAll()
+        return dict.values(self)
+
+    def items(self):
+        self.calculateAll()
+        return dict.items(self)
+
+    def copy(self):
+        self.calculateAll()
+        return dict(dict.items(self))
+
+    def __repr__(self):
+        self.calculateAll()
+        return dict.__repr__(self)
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        # The values are all floats, so a shallow copy is sufficient.
+        return self.copy()
+
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles are plain, fully populated dicts.
+        return (dict, (self.copy(),))
+
+
+class LazyPlanetaryInfo(PlanetaryInfo):
+    """PlanetaryInfo for a planet supported by the Swiss Ephemeris,
+    where the field values are calculated on demand.
+
+    Accessing a field, for example:
+
+      p.heliocentric['sidereal']['longitude']
+
+    only calculates the values for that centricity, zodiac and
+    coordinate system (here heliocentric, sidereal, ecliptical), which
+    is one swe.calc_ut() call instead of the 18 needed to fill a full
+    PlanetaryInfo.  Calculated values are kept, so accessing the same
+    fields again does not call the Swiss Ephemeris again.
+
+    The values are calculated for the Ephemeris settings at the time
+    the LazyPlanetaryInfo is created, even if they are accessed after
+    the geographic position was changed with
+    Ephemeris.setGeographicPosition().  If it is created with an
+    EphemerisContext, then the settings of the context are used
+    instead.
+    """
+
+    def __init__(self, planetName, planetId, dt, julianDay, context=None):
+        """Initializes the LazyPlanetaryInfo class with the given
+        parameters.
+
+        Parameters are as follows:
+
+        planetName - String holding the name of the planet.
+        planetId   - Integer ID that represents the planet in the
+                     Swiss Ephemeris.
+        dt         - The datetime.datetime object that holds the timestamp for
+                     which the planetary information and data is valid for.
+        julianDay  - The float value that holds the timestamp for the
+                     which the planetary information and data is valid
+                     for.  This should be equivalent to the value in
+                     'dt' converted to julian day.
+        context    - EphemerisContext to calculate the values with,
+                     or None to use the Ephemeris settings.
+        """
+
+        geocentricDict = \
+            {'tropical': LazyCoordinateDict(planetId, julianDay,
+                                            'geocentric', 'tropical',
+                                            context),
+             'sidereal': LazyCoordinateDict(planetId, julianDay,
+                                            'geocentric', 'sidereal',
+                                            context)}
+        topocentricDict = \
+            {'tropical': LazyCoordinateDict(planetId, julianDay,
+                                            'topocentric', 'tropical',
+                                            context),
+             'sidereal': LazyCoordinateDict(planetId, julianDay,
+                                            'topocentric', 'sidereal',
+                                            context)}
+        heliocentricDict = \
+            {'tropical': LazyCoordinateDict(planetId, julianDay,
+                                            'heliocentric', 'tropical',
+                                            context),
+             'sidereal': LazyCoordinateDict(planetId, julianDay,
+                                            'heliocentric', 'sidereal',
+                                            context)}
+
+        super().__init__(planetName, planetId, dt, julianDay,
+                         geocentricDict,
+                         topocentricDict,
+                         heliocentricDict)
+
+
+class CompactCoordinateView(collections.abc.Mapping):
+    """Read-only, dict-compatible view of the values for one centricity
+    type and one zodiac type (e.g. p.geocentric['tropical']) of a
+    CompactPlanetaryInfo.  The values are read from the array of the
+    CompactPlanetaryInfo, so creating a view does not copy anything.
+
+    Fields that were not copied into the CompactPlanetaryInfo (stored
+    as NaN) are not in the view.
+    """
+
+    __slots__ = ("values", "offset")
+
+    def __init__(self, values, offset):
+        """Initializes the view.
+
+        Arguments:
+        values - array.array of floats of the CompactPlanetaryInfo.
+        offset - int value for the index in 'values' of the first
+                 field of this centricity type and zodiac type.
+        """
+
+        self.values = values
+        self.offset = offset
+
+    def __getitem__(self, fieldName):
+        index = CompactPlanetaryInfo.fieldIndexes.get(fieldName, None)
+        if index == None:
+            raise KeyError(fieldName)
+
+        value = self.values[self.offset + index]
+        if value != value:
+            # NaN, the field was not copied.
+            raise KeyError(fieldName)
+
+        return value
+
+    def __iter__(self):
+        for i in range(len(CompactPlanetaryInfo.fieldNames)):
+            value = self.values[self.offset + i]
+            if value == value:
+                yield CompactPlanetaryInfo.fieldNames[i]
+
+    def __len__(self):
+        count = 0
+        for i in range(len(CompactPlanetaryInfo.fieldNames)):
+            value = self.values[self.offset + i]
+            if value == value:
+                count += 1
+        return count
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class CompactCentricityView:
+    """Read-only view of the values for one centricity type
+    (e.g. p.geocentric) of a CompactPlanetaryInfo.  Indexing it with a
+    zodiac type ('tropical' or 'sidereal') returns a
+    CompactCoordinateView.
+    """
+
+    __slots__ = ("values", "offset")
+
+    def __init__(self, values, offset):
+        """Initializes the view.
+
+        Arguments:
+        values - array.array of floats of the CompactPlanetaryInfo.
+        offset - int value for the index in 'values' of the first
+                 field of this centricity type.
+        """
+
+        self.values = values
+        self.offset = offset
+
+    def __getitem__(self, zodiacType):
+        index = CompactPlanetaryInfo.zodiacTypeIndexes.get(zodiacType, None)
+        if index == None:
+            raise KeyError(zodiacType)
+
+        return CompactCoordinateView(\
+            self.values,
+            self.offset + index * len(CompactPlanetaryInfo.fieldNames))
+
+    def __contains__(self, zodiacType):
+        return zodiacType in CompactPlanetaryInfo.zodiacTypeIndexes
+
+    def __iter__(self):
+        return iter(CompactPlanetaryInfo.zodiacTypes)
+
+    def __len__(self):
+        return len(CompactPlanetaryInfo.zodiacTypes)
+
+    def keys(self):
+        return list(CompactPlanetaryInfo.zodiacTypes)
+
+    def items(self):
+        return [(zodiacType, self[zodiacType]) \
+                for zodiacType in CompactPlanetaryInfo.zodiacTypes]
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class CompactPlanetaryInfo:
+    """Memory-compact, read-only equivalent of a PlanetaryInfo.
+
+    A PlanetaryInfo holds three dicts of two dicts of about 16 floats
+    each, which is a few hundred Python objects (and about 8 KB) per
+    planet per timestamp.  A CompactPlanetaryInfo holds all the values
+    in a single array.array of floats (under 1 KB), and the class uses
+    __slots__, so scripts that keep tens of thousands of planet
+    positions in memory use much less memory, and put much less
+    pressure on the garbage collector.
+
+    The values are accessed the same way as with a PlanetaryInfo:
+
+      p.geocentric['tropical']['longitude']
+
+    p.geocentric, p.topocentric and p.heliocentric return
+    CompactCentricityView objects, and indexing those with a zodiac
+    type returns a CompactCoordinateView, which is a read-only
+    collections.abc.Mapping.  The views are created on access and do
+    not copy the values.  p.name, p.id, p.dt and p.julianDay are the
+    same as in a PlanetaryInfo.
+
+    Create one with CompactPlanetaryInfo.fromPlanetaryInfo(), and
+    convert back with toPlanetaryInfo() if code needs real dicts.
+    Values are stored in the order:
+    centricityTypes x zodiacTypes x fieldNames.
+    """
+
+    __slots__ = ("name", "id", "dt", "julianDay", "values")
+
+    # Order of the values in the array.
+    centricityTypes = ["geocentric", "topocentric", "heliocentric"]
+    zodiacTypes = ["tropical", "sidereal"]
+    fieldNames = ["longitude",
+                  "latitude",
+                  "distance",
+                  "longitude_speed",
+                  "latitude_speed",
+                  "distance_speed",
+                  "rectascension",
+                  "declination",
+                  "rectascension_speed",
+                  "declination_speed",
+                  "X",
+                  "Y",
+                  "Z",
+                  "dX",
+                  "dY",
+                  "dZ"]
+
+    # Maps of name to index in the lists above.
+    centricityTypeIndexes = {}
+    for i in range(len(centricityTypes)):
+        centricityTypeIndexes[centricityTypes[i]] = i
+    zodiacTypeIndexes = {}
+    for i in range(len(zodiacTypes)):
+        zodiacTypeIndexes[zodiacTypes[i]] = i
+    fieldIndexes = {}
+    for i in range(len(fieldNames)):
+        fieldIndexes[fieldNames[i]] = i
+    del i
+
+    # Number of values for one centricity type.
+    centricityTypeSize = len(zodiacTypes) * len(fieldNames)
+
+    def __init__(self, planetName, planetId, dt, julianDay, values):
+        """Initializes the CompactPlanetaryInfo.
+
+        Arguments:
+        planetName - str holding the name of the planet.
+        planetId   - int ID that represents the planet in the
+                     Swiss Ephemeris.
+        dt         - datetime.datetime object for the timestamp.
+        julianDay  - float value for the Julian Day of the timestamp.
+        values     - array.array('d') holding the values, in the order
+                     described in the class description.  Fields
+                     that are not available are NaN.
+        """
+
+        self.name = planetName
+        self.id = planetId
+        self.dt = dt
+        self.julianDay = julianDay
+        self.values = values
+
+    @property
+    def geocentric(self):
+        return CompactCentricityView(self.values, 0)
+
+    @property
+    def topocentric(self):
+        return CompactCentricityView(\
+            self.values, CompactPlanetaryInfo.centricityTypeSize)
+
+    @property
+    def heliocentric(self):
+        return CompactCentricityView(\
+            self.values, 2 * CompactPlanetaryInfo.centricityTypeSize)
+
+    @staticmethod
+    def fromPlanetaryInfo(planetaryInfo,
+                          centricityTypes=None,
+                          fieldNames=None):
+        """Returns a new CompactPlanetaryInfo holding the values of the
+        given PlanetaryInfo.
+
+        Copying all the values of a LazyPlanetaryInfo calculates all
+        of them, so callers that only need some of the values should
+        limit what is copied with 'centricityTypes' and 'fieldNames'.
+        Values that are not copied are not available in the returned
+        object.
+
+        Arguments:
+        planetaryInfo   - PlanetaryInfo to copy the values of.
+        centricityTypes - list of str holding the centricity types to
+                          copy, or None to copy all of them.
+        fieldNames      - list of str holding the field names to copy,
+                          or None to copy all of them.
+
+        Returns:
+        CompactPlanetaryInfo object.
+        """
+
+        if centricityTypes == None:
+            centricityTypes = CompactPlanetaryInfo.centricityTypes
+        if fieldNames == None:
+            fieldNames = CompactPlanetaryInfo.fieldNames
+
+        numFields = len(CompactPlanetaryInfo.fieldNames)
+        values = array.array('d', [float('nan')]) * \
+                 (len(CompactPlanetaryInfo.centricityTypes) * \
+                  CompactPlanetaryInfo.centricityTypeSize)
+
+        for centricityType in centricityTypes:
+            centricityDict = getattr(planetaryInfo, centricityType)
+            if centricityDict == None:
+                continue
+
+            centricityOffset = \
+                CompactPlanetaryInfo.centricityTypeIndexes[centricityType] * \
+                CompactPlanetaryInfo.centricityTypeSize
+
+            for zodiacType in CompactPlanetaryInfo.zodiacTypes:
+                fieldDict = centricityDict.get(zodiacType, None)
+                if fieldDict == None:
+                    continue
+
+                offset = centricityOffset + \
+                    CompactPlanetaryInfo.zodiacTypeIndexes[zodiacType] * \
+                    numFields
+
+                for fieldName in fieldNames:
+                    if fieldName in fieldDict:
+                        values[offset + \
+                               CompactPlanetaryInfo.fieldIndexes[fieldName]] = \
+                            fieldDict[fieldName]
+
+        return CompactPlanetaryInfo(planetaryInfo.name,
+                                    planetaryInfo.id,
+                                    planetaryInfo.dt,
+                                    planetaryInfo.julianDay,
+                                    values)
+
+    def toPlanetaryInfo(self):
+        """Returns a new PlanetaryInfo holding plain dicts of the values
+        in this object.
+        """
+
+        return PlanetaryInfo(self.name,
+                             self.id,
+                             self.dt,
+                             self.julianDay,
+                             self.__toDicts(self.geocentric),
+                             self.__toDicts(self.topocentric),
+                             self.__toDicts(self.heliocentric))
+
+    @staticmethod
+    def __toDicts(centricityView):
+        """Returns a dict of zodiac type to dict of field values for the
+        given CompactCentricityView.
+        """
+
+        return dict((zodiacType, dict(coordinateView.items())) \
+                    for (zodiacType, coordinateView) in centricityView.items())
+
+    def __str__(self):
+        """Returns a string representation of this object."""
+
+        return self.toString()
+
+    def toString(self):
+        """Returns a string representation of this object."""
+
+        return self.toPlanetaryInfo().toString()
+
+
+class EphemerisCache:
+    """Bounded LRU (least recently used) cache for the results of
+    Ephemeris calculations, e.g. PlanetaryInfo objects and house cusps.
+
+    The cache has a limit on the number of entries, and a limit on the
+    estimated memory used by the entries.  When either limit is
+    exceeded, the least recently used entries are removed.
+
+    Keys are created via Ephemeris.getCacheKey(), and they include the
+    Julian Day (quantized), the geographic position and the
+    Ephemeris flags, so a cached value is only returned for the same
+    calculation.  Ephemeris.setGeographicPosition() clears the cache.
+
+    Values in the cache are shared with the callers, so they must be
+    treated as read-only.  Code that modifies a PlanetaryInfo should
+    modify a copy (copy.deepcopy()) of it.
+    """
+
+    # Estimated memory used by one entry of each type of value,
+    # in bytes.  These were measured with sys.getsizeof() on values
+    # that have all their fields calculated.
+    planetaryInfoSizeBytes = 8000
+    houseSnapshotSizeBytes = 3000
+
+    def __init__(self, maxEntries=20000, maxSizeBytes=64*1024*1024):
+        """Initializes the cache.
+
+        Arguments:
+        maxEntries   - int value for the maximum number of entries.
+        maxSizeBytes - int value for the maximum estimated memory
+                       used by the entries, in bytes.
+        """
+
+        self.maxEntries = maxEntries
+        self.maxSizeBytes = maxSizeBytes
+
+        # Enabled flag.  If False, then get() always misses and put()
+        # does nothing.
+        self.enabled = True
+
+        # OrderedDict of key to tuple (value, sizeBytes).
+        # Most recently used entries are at the end.
+        self.entries = collections.OrderedDict()
+
+        # Total estimated memory used by the entries, in bytes.
+        self.sizeBytes = 0
+
+        # Statistics.
+        self.numHits = 0
+        self.numMisses = 0
+        self.numEvictions = 0
+
+    def setEnabled(self, enabled):
+        """Enables or disables the cache.  Disabling it also clears it.
+        """
+
+        self.enabled = enabled
+        if not enabled:
+            self.clear()
+
+    def setLimits(self, maxEntries, maxSizeBytes):
+        """Sets the maximum number of entries and the maximum estimated
+        memory used by the entries, in bytes.  Entries are removed if
+        needed to be within the new limits.
+        """
+
+        self.maxEntries = maxEntries
+        self.maxSizeBytes = maxSizeBytes
+        self.__evict()
+
+    def get(self, key):
+        """Returns the value cached for the given key, or None if there
+        is no value cached for it.
+        """
+
+        if not self.enabled:
+            return None
+
+        entry = self.entries.get(key, None)
+        if entry == None:
+            self.numMisses += 1
+            return None
+
+        self.numHits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, sizeBytes):
+        """Adds a value to the cache.
+
+        Arguments:
+        key       - hashable key for the value.
+        value     - object to cache.  This should not be None.
+        sizeBytes - int value for the estimated memory used by the
+                    value, in bytes.
+        """
+
+        if not self.enabled:
+            return
+
+        oldEntry = self.entries.pop(key, None)
+        if oldEntry != None:
+            self.sizeBytes -= oldEntry[1]
+
+        self.entries[key] = (value, sizeBytes)
+        self.sizeBytes += sizeBytes
+
+        self.__evict()
+
+    def clear(self):
+        """Removes all entries from the cache.  The statistics are not
+        reset.
+        """
+
+        self.entries.clear()
+        self.sizeBytes = 0
+
+    def resetStats(self):
+        """Resets the hit, miss and eviction counters."""
+
+        self.numHits = 0
+        self.numMisses = 0
+        self.numEvictions = 0
+
+    def getStats(self):
+        """Returns a dict holding the statistics of the cache:
+        'hits', 'misses', 'evictions', 'entries', 'sizeBytes'.
+        """
+
+        return {'hits'      : self.numHits,
+                'misses'    : self.numMisses,
+                'evictions' : self.numEvictions,
+                'entries'   : len(self.entries),
+                'sizeBytes' : self.sizeBytes}
+
+    def __evict(self):
+        """Removes the least recently used entries until the cache is
+        within its limits.
+        """
+
+        while len(self.entries) > 0 and \
+              (len(self.entries) > self.maxEntries or \
+               self.sizeBytes > self.maxSizeBytes):
+
+            (key, (value, sizeBytes)) = self.entries.popitem(last=False)
+            self.sizeBytes -= sizeBytes
+            self.numEvictions += 1
+
+
 class Ephemeris:
     """Provides access to ephemeris data.  Please exercise caution when 
     using this class in multithreaded environments because the underlying
@@ -259,6 +1008,52 @@ class Ephemeris:
     # We make mods to this variable to add options.
     iflag = 0
 
+    # Debug logging of the frequently called functions (calc_ut(),
+    # calcPlanetCoordinates(), swe_houses_ex(), the flag setting
+    # functions, datetimeToJulianDay(), julianDayToDatetime() and
+    # getPlanetaryInfo()) checks this bool instead of calling
+    # Ephemeris.log.isEnabledFor() several times per call.  It is set
+    # by configureDebugLogging(), which initialize() calls, so
+    # configureDebugLogging() must be called again if the log level
+    # is changed afterwards.
+    debugEnabled = False
+
+    # When debug logging is enabled, the frequently called functions
+    # only log 1 in this many calls.  1 logs every call.
+    # This is set via configureDebugLogging().
+    debugSampleInterval = 1
+
+    # Number of calls seen by isDebugSampled().
+    debugSampleCount = 0
+
+    # Flags of Ephemeris.iflag set by calcPlanetCoordinates(), and a map
+    # of (centricityType, zodiacType, coordinateSystemType) to the
+    # value of those flags.  When debug logging is disabled,
+    # calcPlanetCoordinates() sets the flags with these instead of
+    # calling the flag setting functions.
+    coordinateFlagMask = swe.FLG_HELCTR | swe.FLG_TOPOCTR | \
+                         swe.FLG_SIDEREAL | swe.FLG_EQUATORIAL | \
+                         swe.FLG_XYZ | swe.FLG_RADIANS
+    coordinateFlagBits = {}
+    for centricityType, centricityBits in \
+            (("geocentric", 0),
+             ("topocentric", swe.FLG_TOPOCTR),
+             ("heliocentric", swe.FLG_HELCTR)):
+        for zodiacType, zodiacBits in \
+                (("tropical", 0),
+                 ("sidereal", swe.FLG_SIDEREAL)):
+            for coordinateSystemType, coordinateSystemBits in \
+                    (("ecliptical", 0),
+                     ("equatorial", swe.FLG_EQUATORIAL),
+                     ("rectangular", swe.FLG_XYZ)):
+                coordinateFlagBits[(centricityType,
+                                    zodiacType,
+                                    coordinateSystemType)] = \
+                    centricityBits | zodiacBits | coordinateSystemBits
+    del centricityType, centricityBits
+    del zodiacType, zodiacBits
+    del coordinateSystemType, coordinateSystemBits
+
     # Holds the longitude, latitude, and altitude representing the 
     # geographic positions to use in calculations of houses 
     # (and in topocentric calculations).
@@ -269,6 +1064,55 @@ class Ephemeris:
     geoLongitudeDeg = 0
     geoLatitudeDeg = 0
     geoAltitudeMeters = 0
+
+    # Arguments last passed to swe.set_topo() by setGeographicPosition().
+    # EphemerisContext restores these after doing topocentric
+    # calculations for its own geographic position.
+    sweTopoArgs = (0.0, 0.0, 0.0)
+
+    # Sidereal mode last passed to swe.set_sid_mode() by
+    # setSweSiderealMode(), or None if it has not been set yet.
+    sweSiderealMode = None
+
+    # Lock held around the Swiss Ephemeris calls whose results depend
+    # on library state (the topo position and the sidereal mode), and
+    # around the changes to that state.  EphemerisContext holds it
+    # while it temporarily changes the library state, so the Ephemeris
+    # calls of other threads never see a context's state.  It is
+    # reentrant so that locked methods can call each other.
+    sweLock = threading.RLock()
+
+    # EphemerisStore object holding precomputed field values, or None.
+    # If set, getPlanetFieldValue() uses the stored values for the
+    # Julian Days that are on a sample of the store.
+    # This is set via setEphemerisStore().
+    ephemerisStore = None
+
+    # Process-wide EphemerisCache for getPlanetaryInfo(),
+    # getHouseCusps() and getAscmc().
+    cache = EphemerisCache()
+
+    # Julian Days used in cache keys are rounded to a multiple of this
+    # many days.  This is about 1 millisecond, which is finer than the
+    # 1 second resolution used by datetimeToJulianDay(), so only the
+    # same timestamps share an entry.
+    cacheJdQuantumDays = 1.0e-8
+
+    # Flags that are set by the Ephemeris methods for each calculation.
+    # These are excluded from the flags in cache keys, because the
+    # cached values hold the results for all of these settings.
+    cacheExcludedFlags = \
+        swe.FLG_SIDEREAL | swe.FLG_HELCTR | swe.FLG_TOPOCTR | \
+        swe.FLG_EQUATORIAL | swe.FLG_XYZ | swe.FLG_RADIANS
+
+    # Dictionary of the UTC offset tables of the pytz timezones,
+    # used by julianDayToDatetime().  The key is the timezone name,
+    # and the value is a tuple of (list of naive UTC datetimes of
+    # the timezone transitions, list of the pytz-created tzinfo in
+    # effect from each transition, list of the UTC offset
+    # datetime.timedelta in effect from each transition).
+    # Entries are created on first use via getUtcOffsetTable().
+    utcOffsetTables = {}
     
     # Dictionary for referencing various House Cusp Systems.
     HouseSys = { 'Placidus'      : b'P',
@@ -291,6 +1135,70 @@ class Ephemeris:
                  'KrusinskiPisa' : b'U',
                  'GauquelinSectors' : b'G'}
 
+    # Custom planets that are the average of other planets.
+    # The dict key is the custom planet name, and the value is the
+    # list of planet names that are averaged.
+    averagedPlanetConstituents = \
+        {'MeanOfFive'      : ['Jupiter', 'Saturn', 'Uranus', 'Neptune',
+                              'Pluto'],
+         'CycleOfEight'    : ['Mercury', 'Venus', 'Mars', 'Jupiter',
+                              'Saturn', 'Uranus', 'Neptune', 'Pluto'],
+         'AvgMaJuSaUrNePl' : ['Mars', 'Jupiter', 'Saturn', 'Uranus',
+                              'Neptune', 'Pluto'],
+         'AvgJuSaUrNe'     : ['Jupiter', 'Saturn', 'Uranus', 'Neptune'],
+         'AvgJuSa'         : ['Jupiter', 'Saturn']}
+
+    # Custom planets that are a combination of other planets.
+    # The dict key is the custom planet name, and the value is the
+    # list of planet names that are combined.  See
+    # createCombinationPlanetaryInfo() for how they are combined.
+    combinationPlanetConstituents = \
+        {'AsSu' : ['Ascendant', 'Sun'],
+         'AsMo' : ['Ascendant', 'Moon'],
+         'MoSu' : ['Moon', 'Sun'],
+         'MeVe' : ['Mercury', 'Venus'],
+         'MeEa' : ['Mercury', 'Earth'],
+         'MeMa' : ['Mercury', 'Mars'],
+         'MeJu' : ['Mercury', 'Jupiter'],
+         'MeSa' : ['Mercury', 'Saturn'],
+         'MeUr' : ['Mercury', 'Uranus'],
+         'VeEa' : ['Venus', 'Earth'],
+         'VeMa' : ['Venus', 'Mars'],
+         'VeJu' : ['Venus', 'Jupiter'],
+         'VeSa' : ['Venus', 'Saturn'],
+         'VeUr' : ['Venus', 'Uranus'],
+         'EaMa' : ['Earth', 'Mars'],
+         'EaJu' : ['Earth', 'Jupiter'],
+         'EaSa' : ['Earth', 'Saturn'],
+         'EaUr' : ['Earth', 'Uranus'],
+         'MaJu' : ['Mars', 'Jupiter'],
+         'MaSa' : ['Mars', 'Saturn'],
+         'MaUr' : ['Mars', 'Uranus'],
+         'JuSa' : ['Jupiter', 'Saturn'],
+         'JuUr' : ['Jupiter', 'Uranus'],
+         'SaUr' : ['Saturn', 'Uranus']}
+
+    # Custom planets that are calculated from other planets with a
+    # user-defined formula.  The dict key is the custom planet name,
+    # and the value is a tuple of (list of planet names used, formula
+    # function).  See registerDerivedPlanet() for how these are added.
+    derivedPlanetFormulas = {}
+
+    # Fields that are in both the ecliptical and the equatorial
+    # coordinate systems.  createAveragedPlanetaryInfo() and
+    # createCombinationPlanetaryInfo() apply their operation to these
+    # fields twice, once for each coordinate system.  The other ways
+    # of calculating custom planets do the same, so that they give
+    # the same values as the PlanetaryInfo.
+    doubledFieldNames = ('distance', 'distance_speed')
+
+    # Version of how the planet values are calculated.  This must be
+    # incremented whenever a change makes the same arguments give
+    # different values, so that results that were stored outside of
+    # the process (e.g. in a LookbackMultipleResultCache) are not
+    # used anymore.
+    calculationVersion = 1
+
     @staticmethod
     def getSupportedPlanetNamesList():
         """Returns a list of str objects that is the list of planet
@@ -390,9 +1298,221 @@ class Ephemeris:
           ascmcPlanetNames + \
           houseCuspPlanetNames + \
           customPlanetCombinationPlanetNames
+
+        # Planets added via registerDerivedPlanet().
+        for planetName in Ephemeris.getDerivedPlanetNames():
+            if planetName not in allPlanetNames:
+                allPlanetNames.append(planetName)
         
         return allPlanetNames
-  
+
+    @staticmethod
+    def getDerivedPlanetNames():
+        """Returns a list of str objects that is the list of planet
+        names of the custom planets that are calculated from other
+        planets (the averaged planets, the combination planets, and
+        the planets added via registerDerivedPlanet()).
+        """
+
+        return list(Ephemeris.averagedPlanetConstituents.keys()) + \
+               list(Ephemeris.combinationPlanetConstituents.keys()) + \
+               list(Ephemeris.derivedPlanetFormulas.keys())
+    
+    @staticmethod
+    def getPlanetConstituents(planetName):
+        """Returns the list of planet names that the given custom
+        planet is calculated from.  For planets that are not calculated
+        from other planets, an empty list is returned.
+        """
+
+        if planetName in Ephemeris.averagedPlanetConstituents:
+            return Ephemeris.averagedPlanetConstituents[planetName]
+        elif planetName in Ephemeris.combinationPlanetConstituents:
+            return Ephemeris.combinationPlanetConstituents[planetName]
+        elif planetName in Ephemeris.derivedPlanetFormulas:
+            return Ephemeris.derivedPlanetFormulas[planetName][0]
+        else:
+            return []
+
+    @staticmethod
+    def getDerivedPlanetDefinition(planetName):
+        """Returns a str describing how a planet added via
+        registerDerivedPlanet() is calculated.  It holds the
+        constituents and the formula, and the same for every derived
+        planet among the constituents.  If a definition changes, the
+        str changes too.  For planets that are not added via
+        registerDerivedPlanet(), an empty str is returned.
+
+        Formula functions are described by their name and their
+        compiled code.  Values that a function gets from its closure
+        or from global variables are not part of the str.
+        """
+
+        if planetName not in Ephemeris.derivedPlanetFormulas:
+            return ""
+
+        (constituents, formula) = \
+            Ephemeris.derivedPlanetFormulas[planetName]
+
+        if callable(formula):
+            code = getattr(formula, "__code__", None)
+            if code != None:
+                codeHash = hashlib.sha1(code.co_code + \
+                    repr((code.co_consts, code.co_names)).encode("utf-8")).\
+                    hexdigest()
+            else:
+                codeHash = ""
+            formulaStr = "{}.{}:{}".format(\
+                getattr(formula, "__module__", ""),
+                getattr(formula, "__qualname__", repr(formula)),
+                codeHash)
+        else:
+            formulaStr = formula
+
+        constituentStrs = []
+        for constituent in constituents:
+            definition = Ephemeris.getDerivedPlanetDefinition(constituent)
+            if definition != "":
+                constituentStrs.append(\
+                    "{}({})".format(constituent, definition))
+            else:
+                constituentStrs.append(constituent)
+
+        return "{}[{}]".format(formulaStr, ",".join(constituentStrs))
+
+    @staticmethod
+    def registerDerivedPlanet(planetName, constituents, formula):
+        """Adds a custom planet that is calculated from other planets,
+        without having to write a get<Name>PlanetaryInfo() method for
+        it.  After this call, the planet name can be used with
+        getPlanetaryInfo(), getPlanetFieldValue(),
+        getPlanetPositionsBatch() and DerivedPlanetEvaluator like the
+        built-in custom planets.
+
+        Arguments:
+        planetName   - str holding the name of the new planet.  This
+                       must not be the name of a built-in planet.
+                       Registering the same name again replaces the
+                       previous definition.
+        constituents - list of str holding the names of the planets
+                       used to calculate the new planet.  These can be
+                       any supported planet names, including other
+                       custom planets.
+        formula      - Either the str "average", for the average of
+                       the constituents (like MeanOfFive), the str
+                       "combination", for (A - (B - (C ...))) of the
+                       constituents (like MoSu), or a function
+                       formula(fieldName, values) that returns the
+                       float field value of the new planet, from the
+                       list of the float field values of the
+                       constituents, in the same order as
+                       'constituents'.  The function is called for
+                       every field of every centricity and zodiac type.
+
+        Raises:
+        ValueError if any of the arguments are invalid, or if the
+        constituents depend on the new planet.
+        """
+
+        if planetName in Ephemeris.getSupportedPlanetNamesList() and \
+           planetName not in Ephemeris.derivedPlanetFormulas:
+
+            raise ValueError("Cannot register a derived planet with " + \
+                             "the name of a built-in planet: {}".\
+                             format(planetName))
+
+        if len(constituents) == 0:
+            raise ValueError("No constituents given for derived " + \
+                             "planet: {}".format(planetName))
+
+        if formula != "average" and formula != "combination" and \
+           not callable(formula):
+            raise ValueError("Invalid formula for derived planet " + \
+                             "{}: {}".format(planetName, formula))
+
+        supportedPlanetNames = Ephemeris.getSupportedPlanetNamesList()
+        for constituent in constituents:
+            if constituent not in supportedPlanetNames and \
+                   constituent != planetName:
+                raise ValueError("Unsupported constituent planet name " + \
+                                 "for derived planet {}: {}".\
+                                 format(planetName, constituent))
+
+        # Make sure none of the constituents depend on the new planet.
+        # The previous definition is restored if they do.
+        previousDefinition = \
+            Ephemeris.derivedPlanetFormulas.get(planetName, None)
+        Ephemeris.derivedPlanetFormulas[planetName] = \
+            (list(constituents), formula)
+        try:
+            DerivedPlanetEvaluator.getEvaluationOrder([planetName])
+        except ValueError:
+            if previousDefinition == None:
+                del Ephemeris.derivedPlanetFormulas[planetName]
+            else:
+                Ephemeris.derivedPlanetFormulas[planetName] = \
+                    previousDefinition
+            raise
+
+        # Values cached for a previous definition are no longer valid.
+        Ephemeris.cache.clear()
+
+    @staticmethod
+    def unregisterDerivedPlanet(planetName):
+        """Removes a custom planet added via registerDerivedPlanet().
+        Nothing is done if there is no such custom planet.
+        """
+
+        if planetName in Ephemeris.derivedPlanetFormulas:
+            del Ephemeris.derivedPlanetFormulas[planetName]
+
+            # Values cached for it are no longer valid.
+            Ephemeris.cache.clear()
+
+    @staticmethod
+    def applyDerivedPlanetFormula(formula, fieldName, values):
+        """Returns the field value of a custom planet from the field
+        values of its constituents.
+
+        Arguments:
+        formula   - "average", "combination", or a function, as
+                    described in registerDerivedPlanet().
+        fieldName - str holding the name of the field.
+        values    - list of float values of the field, one for each
+                    constituent planet.
+
+        Note: For the fields in doubledFieldNames, "average" and
+        "combination" give the values of createAveragedPlanetaryInfo()
+        and createCombinationPlanetaryInfo(), which are not the plain
+        average and combination.  The average counts every value but
+        the first one twice, and divides by the number of values
+        squared.  The combination subtracts twice at each step, which
+        gives the value of the last constituent (up to rounding).
+        """
+
+        if formula == "average":
+            if fieldName in Ephemeris.doubledFieldNames:
+                total = values[0]
+                for value in values[1:]:
+                    total += value
+                    total += value
+                return total / len(values) / len(values)
+            return sum(values) / len(values)
+        elif formula == "combination":
+            # (A - (B - (C ...))).  Longitudes are normalized after
+            # each step, like createCombinationPlanetaryInfo().
+            combinedValue = values[-1]
+            for value in reversed(values[:-1]):
+                combinedValue = value - combinedValue
+                if fieldName in Ephemeris.doubledFieldNames:
+                    combinedValue = value - combinedValue
+                if fieldName == "longitude":
+                    combinedValue = \
+                        Ephemeris.__toNormalizedAngle(combinedValue)
+            return combinedValue
+        else:
+            return formula(fieldName, values)
+
     @staticmethod
     def initialize():
         """Initializes the Ephemeris with default settings."""
@@ -424,7 +1544,107 @@ class Ephemeris:
         if Ephemeris.log.isEnabledFor(logging.INFO) == True:
             Ephemeris.log.info("Setting to use true planetary positions")
         Ephemeris.setTruePlanetaryPositions()
+
+        # Pick the debug logging mode for the current log level.
+        Ephemeris.configureDebugLogging()
         
+    @staticmethod
+    def configureDebugLogging(sampleInterval=None):
+        """Sets up debug logging of the frequently called functions
+        of the Ephemeris for the current log level of Ephemeris.log.
+
+        If debug logging is disabled, then Ephemeris.calc_ut is bound
+        directly to swe.calc_ut, and the other frequently called
+        functions only check the bool Ephemeris.debugEnabled
+        ("fast mode").
+
+        If debug logging is enabled, then Ephemeris.calc_ut is bound to
+        loggedCalcUt(), and those functions log 1 in 'sampleInterval'
+        calls.  Sampling allows diagnosing problems in production
+        runs without the large slowdown of logging every calculation.
+
+        This is called by initialize().  It must be called again if
+        the log level of Ephemeris.log is changed later.
+
+        Arguments:
+        sampleInterval - int value for logging 1 in this many calls.
+                         1 logs every call.  If None, the current
+                         value of Ephemeris.debugSampleInterval is
+                         kept.
+        """
+
+        if sampleInterval != None:
+            if sampleInterval < 1:
+                raise ValueError("Invalid sampleInterval: {}".\
+                                 format(sampleInterval))
+            Ephemeris.debugSampleInterval = int(sampleInterval)
+
+        Ephemeris.debugSampleCount = 0
+        Ephemeris.debugEnabled = Ephemeris.log.isEnabledFor(logging.DEBUG)
+
+        if Ephemeris.debugEnabled == True:
+            Ephemeris.calc_ut = staticmethod(Ephemeris.loggedCalcUt)
+        else:
+            Ephemeris.calc_ut = swe.calc_ut
+
+        if Ephemeris.log.isEnabledFor(logging.INFO) == True:
+            Ephemeris.log.info("Debug logging of calculations is {}".\
+                format("enabled, logging 1 in {} calls".\
+                       format(Ephemeris.debugSampleInterval) \
+                       if Ephemeris.debugEnabled else "disabled"))
+
+    @staticmethod
+    def isDebugSampled():
+        """Returns True if the current call of a frequently called
+        function should be logged, according to
+        Ephemeris.debugSampleInterval.  This should only be called if
+        Ephemeris.debugEnabled is True.
+        """
+
+        if Ephemeris.debugSampleInterval <= 1:
+            return True
+
+        Ephemeris.debugSampleCount += 1
+
+        return \
+            (Ephemeris.debugSampleCount % Ephemeris.debugSampleInterval) == 0
+
+    @staticmethod
+    def setEphemerisStore(ephemerisStore):
+        """Sets the EphemerisStore to use in getPlanetFieldValue().
+
+        Arguments:
+        ephemerisStore - EphemerisStore object, or None to always
+                         calculate values with the Swiss Ephemeris.
+        """
+
+        Ephemeris.ephemerisStore = ephemerisStore
+
+    @staticmethod
+    def getCacheKey(valueType, name, jd):
+        """Returns the key to use in Ephemeris.cache for a value.
+
+        Arguments:
+        valueType - str describing the type of the value,
+                    e.g. "PlanetaryInfo".
+        name      - hashable object that identifies the value for
+                    the value type, e.g. the planet name or the
+                    house system.
+        jd        - float value for the Julian Day of the value.
+
+        Returns:
+        tuple that holds the arguments, the quantized Julian Day, the
+        geographic position, and the Ephemeris flags.
+        """
+
+        return (valueType,
+                name,
+                int(round(jd / Ephemeris.cacheJdQuantumDays)),
+                Ephemeris.geoLongitudeDeg,
+                Ephemeris.geoLatitudeDeg,
+                Ephemeris.geoAltitudeMeters,
+                Ephemeris.iflag & ~Ephemeris.cacheExcludedFlags)
+
     @staticmethod
     def closeEphemeris():
         """Does any cleanup needed to close the ephemeris.  
@@ -472,13 +1692,21 @@ class Ephemeris:
                                "-90 and 90.")
 
         # Set the topo values for use in topo calculations.
-        swe.set_topo(geoLatitudeDeg, geoLatitudeDeg, altitudeMeters)
+        with Ephemeris.sweLock:
+            Ephemeris.sweTopoArgs = \
+                Ephemeris.getSweTopoArgs(geoLongitudeDeg,
+                                         geoLatitudeDeg,
+                                         altitudeMeters)
+            swe.set_topo(*Ephemeris.sweTopoArgs)
 
         # Save off the values for future use (when getting house positions).
         Ephemeris.geoLongitudeDeg = geoLongitudeDeg
         Ephemeris.geoLatitudeDeg = geoLatitudeDeg
         Ephemeris.geoAltitudeMeters = altitudeMeters
 
+        # Cached values are for the previous location.
+        Ephemeris.cache.clear()
+
         if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
             infoStr = "Setting geographic location to: " + \
                       "(lon={}, lat={}, alt={})".\
@@ -489,6 +1717,28 @@ class Ephemeris:
 
             Ephemeris.log.debug("Exiting setGeographicPosition()")
 
+    @staticmethod
+    def getSweTopoArgs(geoLongitudeDeg, geoLatitudeDeg, altitudeMeters=0.0):
+        """Returns the tuple of arguments that setGeographicPosition()
+        passes to swe.set_topo() for the given geographic position.
+
+        Note: The latitude is passed as both the longitude and the
+        latitude.  Topocentric values have always been calculated this
+        way, so results of every calculation path (Ephemeris,
+        EphemerisContext, and the LookbackMultiple workers) stay the
+        same as the ones already saved and displayed.
+
+        Parameters:
+        geoLongitudeDeg - Longitude in degrees.  West is negative.
+        geoLatitudeDeg  - Latitude in degrees.  South is negative.
+        altitudeMeters  - Altitude in meters.
+
+        Returns:
+        Tuple of 3 floats.
+        """
+
+        return (geoLatitudeDeg, geoLatitudeDeg, altitudeMeters)
+
     @staticmethod
     def getUtcOffsetForStandardTime(timezoneObj):
         """Utility function for getting the utcoffset of the standard
@@ -534,7 +1784,10 @@ class Ephemeris:
         to a Julian Day utilizes the Swiss Ephemeris.
         """
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             Ephemeris.log.debug("Entering datetimeToJulianDay({})".format(dt))
 
         # Error checking of the input datetime object.
@@ -543,11 +1796,18 @@ class Ephemeris:
                 "in the datetime.datetime cannot be None"
             raise ValueError(errStr)
 
-        # Convert to UTC.
-        dtUtc = pytz.utc.normalize(dt.astimezone(pytz.utc))
+        # Convert to UTC.  The pytz-created tzinfo of a localized
+        # datetime holds the UTC offset in effect for that timestamp,
+        # so subtracting the offset gives the same year, month, day,
+        # hour, minute and second fields as
+        # pytz.utc.normalize(dt.astimezone(pytz.utc)), without
+        # creating and normalizing the intermediate objects.
+        # Only the fields are used below; the tzinfo is left as is.
+        dtUtc = dt - dt.utcoffset()
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
-            Ephemeris.log.debug("datetime converted to UTC is: {}".format(dtUtc))
+        if logDebug == True:
+            Ephemeris.log.debug("datetime converted to UTC is: {}".\
+                                format(dtUtc.replace(tzinfo=pytz.utc)))
 
         # Get the Julian Day as calculated by Swiss Ephemeris.
         cal = swe.GREG_CAL
@@ -559,10 +1819,11 @@ class Ephemeris:
         # We use the Julian Day for Universal Time (UT).
         jd = jd_ut
         
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        if logDebug == True:
             debugStr = "Swiss Ephemeris converted UTC datetime({}) to " + \
                        "jd_et={}, jd_ut={}.  Using jd_ut as julian day."
-            Ephemeris.log.debug(debugStr.format(dtUtc, jd_et, jd_ut))
+            Ephemeris.log.debug(debugStr.format(dtUtc.replace(tzinfo=pytz.utc),
+                                                jd_et, jd_ut))
 
             Ephemeris.log.debug("Exiting datetimeToJulianDay() and " + \
                                 "returning {}".format(jd))
@@ -579,15 +1840,18 @@ class Ephemeris:
         This conversion process utilizes the Swiss Ephemeris to 
         do the conversion and calculation.
         """
+
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
         
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        if logDebug == True:
             Ephemeris.log.debug("Entering julianDayToDatetime({}, {})".\
                                 format(jd, tzInfo))
 
         gregFlag = 1
         (year, month, day, hour, mins, secs) = swe.jdut1_to_utc(jd, gregFlag)
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        if logDebug == True:
             debugStr = "Got converted values from Swiss Ephemeris: " + \
                        "year={}, month={}, day={}, hour={}, mins={}, secs={}"
             Ephemeris.log.debug(debugStr.\
@@ -606,7 +1870,7 @@ class Ephemeris:
         if usecs > 999999:
             usecs = 999999
             
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        if logDebug == True:
             Ephemeris.log.debug("secs={}, secsTruncated={}, usecs={}".\
                                 format(secs, secsTruncated, usecs))
 
@@ -620,19 +1884,99 @@ class Ephemeris:
                              "is greater than datetime.MAXYEAR value " +
                              "{}.".format(datetime.MAXYEAR))
 
-        # Create a datetime.datetime in UTC.
+        # Create a naive datetime.datetime in UTC.
         dtUtc = datetime.datetime(year, month, day, hour, mins, 
-                                      secsTruncated, usecs, pytz.utc)
+                                  secsTruncated, usecs)
 
         # Convert to the timezone specified.
-        dt = tzInfo.normalize(dtUtc.astimezone(tzInfo))
+        dt = Ephemeris.utcToLocalizedDatetime(dtUtc, tzInfo)
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        if logDebug == True:
             Ephemeris.log.debug("Returning julian day converted from " + \
                                 "jd={} to datetime={}".format(jd, dt))
 
         return dt
 
+    @staticmethod
+    def getUtcOffsetTable(tzInfo):
+        """Returns the UTC offset table of a pytz timezone, creating
+        and caching it in Ephemeris.utcOffsetTables on the first call
+        for the timezone.
+
+        Arguments:
+        tzInfo - pytz-created datetime.tzinfo object.  This may be the
+                 tzinfo of the timezone itself, or the tzinfo of a
+                 datetime localized in that timezone.
+
+        Returns:
+        tuple of (list of naive UTC datetimes of the timezone
+        transitions, list of the pytz-created tzinfo in effect from
+        each transition, list of the UTC offset datetime.timedelta in
+        effect from each transition), or None if the timezone has a
+        fixed UTC offset (for example pytz.utc).
+        """
+
+        zoneName = getattr(tzInfo, "zone", None)
+        
+        if zoneName in Ephemeris.utcOffsetTables:
+            return Ephemeris.utcOffsetTables[zoneName]
+        
+        transitionTimes = getattr(tzInfo, "_utc_transition_times", None)
+        
+        if transitionTimes == None:
+            # Fixed UTC offset.  There is nothing to look up.
+            table = None
+        else:
+            tzInfos = []
+            utcOffsets = []
+            for transitionInfo in tzInfo._transition_info:
+                tzInfos.append(tzInfo._tzinfos[transitionInfo])
+                utcOffsets.append(transitionInfo[0])
+                
+            table = (transitionTimes, tzInfos, utcOffsets)
+
+        if zoneName != None:
+            Ephemeris.utcOffsetTables[zoneName] = table
+            
+        return table
+        
+    @staticmethod
+    def utcToLocalizedDatetime(dtUtc, tzInfo=pytz.utc):
+        """Converts a naive datetime.datetime holding a UTC timestamp
+        to a datetime.datetime localized in the given timezone.
+
+        The result is the same as what
+        tzInfo.normalize(dtUtc.replace(tzinfo=pytz.utc).astimezone(tzInfo))
+        returns, but the UTC offset is looked up in the cached UTC
+        offset table of the timezone, instead of having pytz convert
+        and then normalize the datetime on every call.
+        
+        Arguments:
+        dtUtc  - naive datetime.datetime (tzinfo is None) in UTC.
+        tzInfo - pytz-created datetime.tzinfo to localize to.
+
+        Returns:
+        datetime.datetime with the tzinfo set to the pytz-created
+        datetime.tzinfo in effect for the timestamp.
+        """
+
+        table = Ephemeris.getUtcOffsetTable(tzInfo)
+
+        if table == None:
+            # Fixed UTC offset.
+            return dtUtc.replace(tzinfo=pytz.utc).astimezone(tzInfo)
+
+        (transitionTimes, tzInfos, utcOffsets) = table
+
+        # Index of the transition interval the timestamp is in.
+        # Timestamps before the first transition use the first one.
+        # This is the same lookup pytz does in fromutc().
+        i = bisect.bisect_right(transitionTimes, dtUtc) - 1
+        if i < 0:
+            i = 0
+            
+        return (dtUtc + utcOffsets[i]).replace(tzinfo=tzInfos[i])
+    
     @staticmethod
     def datetimeToStr(datetimeObj):
         """Returns a string representation of a datetime.datetime object.
@@ -1001,33 +2345,56 @@ class Ephemeris:
         http://jyotish-blog.blogspot.com/2005/12/ayanamsha-in-jhora-702-vs-swiss.html
         """
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             Ephemeris.log.debug("Entering setSiderealZodiac()")
             Ephemeris.log.debug("swe.FLG_SIDEREAL == {}".format(swe.FLG_SIDEREAL))
             Ephemeris.log.debug("iflag before: {}".format(Ephemeris.iflag))
 
         Ephemeris.iflag |= swe.FLG_SIDEREAL
 
-        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        Ephemeris.setSweSiderealMode(swe.SIDM_LAHIRI)
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        if logDebug == True:
             Ephemeris.log.debug("iflag after: {}".format(Ephemeris.iflag))
             Ephemeris.log.debug("Exiting setSiderealZodiac()")
 
+    @staticmethod
+    def setSweSiderealMode(siderealMode):
+        """Sets the sidereal mode of the Swiss Ephemeris library.
+        swe.set_sid_mode() is only called if the mode differs from the
+        one last set, like setGeographicPosition() does for the topo
+        position.  All changes to the sidereal mode must go through
+        this function, so that the tracked mode stays correct.
+
+        Arguments:
+        siderealMode - int value for the ayanamsa, e.g. swe.SIDM_LAHIRI.
+        """
+
+        with Ephemeris.sweLock:
+            if siderealMode != Ephemeris.sweSiderealMode:
+                swe.set_sid_mode(siderealMode)
+                Ephemeris.sweSiderealMode = siderealMode
+
     @staticmethod
     def setTropicalZodiac():
         """Initializes the settings to use the tropical zodiac for
         calculations
         """
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             Ephemeris.log.debug("Entering setTropicalZodiac()")
             Ephemeris.log.debug("swe.FLG_SIDEREAL == {}".format(swe.FLG_SIDEREAL))
             Ephemeris.log.debug("iflag before: {}".format(Ephemeris.iflag))
             
         Ephemeris.iflag &= (~swe.FLG_SIDEREAL)
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        if logDebug == True:
             Ephemeris.log.debug("iflag after: {}".format(Ephemeris.iflag))
             Ephemeris.log.debug("Exiting setTropicalZodiac()")
         
@@ -1946,13 +3313,79 @@ class Ephemeris:
         
         return rv
         
+    @staticmethod
+    def createDerivedPlanetaryInfo(planetName, planetaryInfos, formula):
+        """Creates a new PlanetaryInfo object with the field values
+        calculated by 'formula' from the field values in
+        'planetaryInfos'.  This is used for the custom planets added
+        via registerDerivedPlanet().  In the created PlanetaryInfo
+        object, the 'id' field will be set to an invalid ID.
+
+        Arguments:
+        planetName     - Name of the new PlanetaryInfo to create.
+        planetaryInfos - list of PlanetaryInfo objects that will be
+                         used to create the new PlanetaryInfo object.
+                         It is assumed that the 'dt' field is the same
+                         value in all these PlanetaryInfo objects, and
+                         the 'julianDay' field is the same value also.
+        formula        - "average", "combination", or a function, as
+                         described in registerDerivedPlanet().
+
+        Returns:
+        PlanetaryInfo object for the custom planet.
+        """
+
+        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+            Ephemeris.log.debug("Entered createDerivedPlanetaryInfo()")
+            Ephemeris.log.debug("planetName == {}".format(planetName))
+            Ephemeris.log.debug("len(planetaryInfos) == {}".\
+                                format(len(planetaryInfos)))
+
+        if len(planetaryInfos) == 0:
+            functName = inspect.stack()[0][3]
+            Ephemeris.log.warn("Passed an empty list of PlanetaryInfos to " + \
+                               functName + "()")
+            return None
+
+        centricityDicts = {}
+        for centricityType in ["geocentric", "topocentric", "heliocentric"]:
+            centricityDicts[centricityType] = {}
+            
+            for zodiacType in ["tropical", "sidereal"]:
+                fieldDicts = [getattr(p, centricityType)[zodiacType] \
+                              for p in planetaryInfos]
+
+                fields = {}
+                for fieldName in LazyCoordinateDict.fieldCoordinateSystems:
+                    values = [fieldDict[fieldName] for fieldDict in fieldDicts]
+                    fields[fieldName] = \
+                        Ephemeris.applyDerivedPlanetFormula(formula,
+                                                            fieldName,
+                                                            values)
+                    
+                centricityDicts[centricityType][zodiacType] = fields
+
+        # Use an invalid planet ID, like the other custom planets.
+        rv = PlanetaryInfo(planetName,
+                           -9999,
+                           planetaryInfos[0].dt,
+                           planetaryInfos[0].julianDay,
+                           centricityDicts["geocentric"],
+                           centricityDicts["topocentric"],
+                           centricityDicts["heliocentric"])
+        
+        return rv
+        
     @staticmethod
     def __clearCoordinateSystemFlags():
         """Private function that clears the flags for the coordinate position
         calculations.
         """
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             debugStr ="Clearing flags for different coordinate systems." 
             Ephemeris.log.debug(debugStr)
 
@@ -1976,7 +3409,10 @@ class Ephemeris:
          )
         """
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             Ephemeris.log.debug("setEclipticalCoordinateSystemFlag()")
             
         # Just clear the coordinate system flags.  Ecliptical coordinates 
@@ -2000,7 +3436,10 @@ class Ephemeris:
          )
         """
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             Ephemeris.log.debug("setEquatorialCoordinateSystemFlag()")
             
         Ephemeris.__clearCoordinateSystemFlags()
@@ -2021,7 +3460,10 @@ class Ephemeris:
         )
         """
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             Ephemeris.log.debug("setRectangularCoordinateSystemFlag()")
             
         Ephemeris.__clearCoordinateSystemFlags()
@@ -2031,7 +3473,10 @@ class Ephemeris:
     def setRadiansCoordinateSystemFlag():
         """Sets the ephemeris to return results in radians coordinates"""
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             Ephemeris.log.debug("setRadiansCoordinateSystemFlag()")
             
         Ephemeris.__clearCoordinateSystemFlags()
@@ -2044,7 +3489,10 @@ class Ephemeris:
         return values in degrees.
         """
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             Ephemeris.log.debug("unsetRadiansCoordinateSystemFlag()")
             
         Ephemeris.iflag &= (~swe.FLG_RADIANS)
@@ -2053,7 +3501,10 @@ class Ephemeris:
     def setHeliocentricCalculations():
         """Sets the flag to do heliocentric calculations."""
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             Ephemeris.log.debug("setHeliocentricCalculations()")
             
         Ephemeris.iflag &= (~swe.FLG_TOPOCTR)
@@ -2063,7 +3514,10 @@ class Ephemeris:
     def setGeocentricCalculations():
         """Sets the flag to do geocentric calculations."""
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             Ephemeris.log.debug("setGeocentricCalculations()")
             
         Ephemeris.iflag &= (~swe.FLG_HELCTR)
@@ -2073,17 +3527,23 @@ class Ephemeris:
     def setTopocentricCalculations():
         """Sets the flag to do topocentric calculations."""
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             Ephemeris.log.debug("setTopocentricCalculations()")
             
         Ephemeris.iflag &= (~swe.FLG_HELCTR)
         Ephemeris.iflag |= swe.FLG_TOPOCTR
 
     @staticmethod
-    def calc_ut(jd, planet, flag=swe.FLG_SWIEPH+swe.FLG_SPEED):
+    def loggedCalcUt(jd, planet, flag=swe.FLG_SWIEPH+swe.FLG_SPEED):
         """Wrapper for the Swiss Ephemeris call calc_ut().
         Parameters and return values are the same as they are for calc_ut().
         This is added to enhance debugging.  
+
+        Ephemeris.calc_ut is set to this function when debug logging
+        is enabled.  See configureDebugLogging().
         
         Return value:
         Returns a tuple of 6 floats.
@@ -2093,8 +3553,11 @@ class Ephemeris:
         planet - Integer value for the planet to do the calculation for.
         flag - Integer for what flags to use in the calculation.
         """
+
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
         
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        if logDebug == True:
             Ephemeris.log.debug("Entering calc_ut(jd={}, planet={}, flag={})".\
                                 format(jd, planet, flag))
 
@@ -2102,17 +3565,115 @@ class Ephemeris:
         (arg1, arg2, arg3, arg4, arg5, arg6) = swe.calc_ut(jd, planet, flag)
 
         # Log some debug for the calculations and parameters.
-        if (Ephemeris.log.isEnabledFor(logging.DEBUG)):
+        if logDebug == True:
             Ephemeris.__logDebugCalcUTInfo(jd, planet, flag, 
                                            arg1, arg2, arg3, arg4, arg5, arg6)
         
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        if logDebug == True:
             Ephemeris.log.debug("Exiting calc_ut(jd={}, planet={}, flag={})".\
                                 format(jd, planet, flag))
 
         # Return calculated values.
         return (arg1, arg2, arg3, arg4, arg5, arg6)
 
+    # Function called for all the Swiss Ephemeris calc_ut() calls.
+    # configureDebugLogging() sets this to loggedCalcUt() when debug
+    # logging is enabled, and to swe.calc_ut itself when it is not,
+    # so that there is no wrapper overhead on each calculation.
+    calc_ut = loggedCalcUt
+
+    @staticmethod
+    def calcPlanetCoordinates(jd, 
+                              planetId, 
+                              centricityType, 
+                              zodiacType, 
+                              coordinateSystemType,
+                              sweTopoArgs=None):
+        """Sets the Ephemeris flags for the given centricity type,
+        zodiac type and coordinate system type, and then calls
+        calc_ut() for the planet.
+
+        Arguments:
+        jd                   - Float value for the Julian Day, UT.
+        planetId             - Integer value for the planet to do the
+                               calculation for.
+        centricityType       - str value holding either "geocentric",
+                               "topocentric", or "heliocentric".
+        zodiacType           - str value holding either "tropical" or
+                               "sidereal".
+        coordinateSystemType - str value holding either "ecliptical",
+                               "equatorial", or "rectangular".
+        sweTopoArgs          - Tuple of arguments for swe.set_topo(), as
+                               returned by getSweTopoArgs(), to use for
+                               this calculation instead of the ones set
+                               by setGeographicPosition().  If None,
+                               the ones of setGeographicPosition() are
+                               used.
+
+        Returns:
+        Tuple of 6 floats, as returned by calc_ut().
+        """
+
+        if sweTopoArgs != None and sweTopoArgs != Ephemeris.sweTopoArgs:
+            with Ephemeris.sweLock:
+                swe.set_topo(*sweTopoArgs)
+                try:
+                    return Ephemeris.calcPlanetCoordinates(\
+                        jd,
+                        planetId,
+                        centricityType,
+                        zodiacType,
+                        coordinateSystemType)
+                finally:
+                    swe.set_topo(*Ephemeris.sweTopoArgs)
+
+        # The sidereal mode and the calculation are done while holding
+        # the lock, so that an EphemerisContext in another thread
+        # cannot change the library state in between.
+        with Ephemeris.sweLock:
+            if Ephemeris.debugEnabled == False:
+                # Fast mode: set all the flags at once.  The result is the
+                # same as calling the flag setting functions below.
+                bits = Ephemeris.coordinateFlagBits.get(\
+                    (centricityType, zodiacType, coordinateSystemType), None)
+
+                if bits != None:
+                    Ephemeris.iflag = \
+                        (Ephemeris.iflag & ~Ephemeris.coordinateFlagMask) | bits
+                    if zodiacType == "sidereal":
+                        Ephemeris.setSweSiderealMode(swe.SIDM_LAHIRI)
+
+                    return Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
+
+            if centricityType == "geocentric":
+                Ephemeris.setGeocentricCalculations()
+            elif centricityType == "topocentric":
+                Ephemeris.setTopocentricCalculations()
+            elif centricityType == "heliocentric":
+                Ephemeris.setHeliocentricCalculations()
+            else:
+                raise ValueError("Invalid centricityType: {}".\
+                                 format(centricityType))
+
+            if zodiacType == "tropical":
+                Ephemeris.setTropicalZodiac()
+            elif zodiacType == "sidereal":
+                Ephemeris.setSiderealZodiac()
+            else:
+                raise ValueError("Invalid zodiacType: {}".format(zodiacType))
+
+            if coordinateSystemType == "ecliptical":
+                Ephemeris.setEclipticalCoordinateSystemFlag()
+            elif coordinateSystemType == "equatorial":
+                Ephemeris.setEquatorialCoordinateSystemFlag()
+            elif coordinateSystemType == "rectangular":
+                Ephemeris.setRectangularCoordinateSystemFlag()
+            else:
+                raise ValueError("Invalid coordinateSystemType: {}".\
+                                 format(coordinateSystemType))
+
+            return Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
+
     @staticmethod
     def swe_houses_ex(jd, 
                       geoLatitudeDeg, 
@@ -2182,21 +3743,26 @@ class Ephemeris:
                - swe.FLG_RADIANS
         """
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             Ephemeris.log.debug("Entering swe_houses_ex(" + \
                                 "jd={}, ".format(jd) + \
                                 "houseSystem={})".format(houseSystem))
 
-        # Do the calculation.
-        (cusps, ascmc) = \
-            swe.houses_ex(jd, 
-                          geoLatitudeDeg,
-                          geoLongitudeDeg,
-                          houseSystem,
-                          flag)
+        # Do the calculation.  Sidereal house cusps depend on the
+        # sidereal mode of the library.
+        with Ephemeris.sweLock:
+            (cusps, ascmc) = \
+                swe.houses_ex(jd, 
+                              geoLatitudeDeg,
+                              geoLongitudeDeg,
+                              houseSystem,
+                              flag)
 
         # Log some debug for the calculations and parameters.
-        if (Ephemeris.log.isEnabledFor(logging.DEBUG)):
+        if logDebug == True:
             Ephemeris.__logDebugSweHousesEx(jd, 
                                             geoLatitudeDeg,
                                             geoLongitudeDeg,
@@ -2205,7 +3771,7 @@ class Ephemeris:
                                             cusps,
                                             ascmc)
         
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        if logDebug == True:
             Ephemeris.log.debug("Exiting swe_houses_ex(" + \
                                 "jd={}, ".format(jd) + \
                                 "houseSystem={})".format(houseSystem))
@@ -2389,6 +3955,46 @@ class Ephemeris:
                 format(ascmc[7]))
 
         
+    @staticmethod
+    def getHouseSnapshot(dt,
+                         houseSystem=HouseSys['Porphyry'],
+                         calculateSpeeds=False):
+        """Returns a HouseSnapshot holding the house cusps and ascmc
+        values at the given timestamp.  HouseSnapshot objects are kept
+        in Ephemeris.cache, so the house cusps for a timestamp are only
+        calculated once for all the house cusp and ascmc planets.
+
+        Preconditions: 
+
+            Ephemeris.setGeographicPosition() has been called previously.
+
+        Arguments:
+        dt              - datetime.datetime object that holds the
+                          timestamp.
+        houseSystem     - byte string of length 1 for the house system.
+                          See getHouseCusps() for the values supported.
+        calculateSpeeds - bool value for whether or not the longitude
+                          speeds should be calculated.  See the class
+                          description of HouseSnapshot.
+
+        Returns:
+        HouseSnapshot object.  It must not be modified.
+        """
+
+        jd = Ephemeris.datetimeToJulianDay(dt)
+
+        cacheKey = Ephemeris.getCacheKey("HouseSnapshot",
+                                         (houseSystem, calculateSpeeds),
+                                         jd)
+        snapshot = Ephemeris.cache.get(cacheKey)
+
+        if snapshot == None:
+            snapshot = HouseSnapshot(dt, houseSystem, calculateSpeeds, jd)
+            Ephemeris.cache.put(cacheKey, snapshot,
+                                EphemerisCache.houseSnapshotSizeBytes)
+
+        return snapshot
+
     @staticmethod
     def getHouseCusps(dt, houseSystem=HouseSys['Porphyry']):
         """Returns a the degree locations of the house cusps, for both
@@ -2467,37 +4073,7 @@ class Ephemeris:
                 "Invalid house system specified: {}".format(houseSystem))
             return (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
 
-        # Convert datetime to julian day.
-        jd = Ephemeris.datetimeToJulianDay(dt)
-
-        # Get the house cusps in the tropical zodiac coordinates.
-        Ephemeris.setTropicalZodiac()
-        Ephemeris.unsetRadiansCoordinateSystemFlag()
-
-        # Obtain the house cusps.
-        (tropicalCusps, tropicalAscmc) = \
-            Ephemeris.swe_houses_ex(jd, 
-                                    Ephemeris.geoLatitudeDeg, 
-                                    Ephemeris.geoLongitudeDeg,
-                                    houseSystem,
-                                    Ephemeris.iflag)
-
-        # Get the house cusps in the sidereal zodiac coordinates.
-        Ephemeris.setSiderealZodiac()
-        Ephemeris.unsetRadiansCoordinateSystemFlag()
-
-        # Obtain the house cusps.
-        (siderealCusps, siderealAscmc) = \
-            Ephemeris.swe_houses_ex(jd, 
-                                    Ephemeris.geoLatitudeDeg, 
-                                    Ephemeris.geoLongitudeDeg,
-                                    houseSystem,
-                                    Ephemeris.iflag)
-
-        cusps = {'tropical' : tropicalCusps,
-                 'sidereal' : siderealCusps}
-
-        return cusps
+        return Ephemeris.getHouseSnapshot(dt, houseSystem).getHouseCusps()
 
 
     @staticmethod
@@ -2553,289 +4129,12 @@ class Ephemeris:
                                 format(houseNumber))
             return None
 
-        # Store some str in variables so they don't get instantiated a
-        # bunch of times.
-        tropicalStr = "tropical"
-        siderealStr = "sidereal"
-        
         # Planet name.
         planetName = "H{}".format(houseNumber)
 
-        # Planet ID.
-        # Here we will use an invalid planet ID.
-        #
-        # (Note: The number chosen has no meaning.
-        # I couldn't use -1, because -1 stands for SE_ECL_NUT.
-        # See documentation of the Swiss Ephemeris, in
-        # file: pyswisseph-1.77.00-0/doc/swephprg.htm)
-        #
-        planetId = -9999
-
-        # julian day for the timestamp.
-        jd = Ephemeris.datetimeToJulianDay(dt)
-        
-        # House cusp index.
-        houseCuspIndex = houseNumber - 1
-        
-        # Get the tuple holding values for the house cusps.
-        cusps = Ephemeris.getHouseCusps(dt, houseSystem)
-
-        # Now fill out the dictionaries that go into a PlanetaryInfo object.
-        
-        # Geocentric, Tropical.
-        longitude = cusps[tropicalStr][houseCuspIndex]
-        latitude = 0.0
-        distance = 0.0
-        longitude_speed = 360.0
-        latitude_speed = 0.0
-        distance_speed = 0.0
-        rectascension = 0.0
-        declination = 0.0
-        rectascension_speed = 0.0
-        declination_speed = 0.0
-        distance_speed = 0.0
-        x = 0.0
-        y = 0.0
-        z = 0.0
-        dx = 0.0
-        dy = 0.0
-        dz = 0.0
-        
-        geocentricTropicalDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Geocentric, Sidereal.
-        longitude = cusps[siderealStr][houseCuspIndex]
-        latitude = 0.0
-        distance = 0.0
-        longitude_speed = 360.0
-        latitude_speed = 0.0
-        distance_speed = 0.0
-        rectascension = 0.0
-        declination = 0.0
-        rectascension_speed = 0.0
-        declination_speed = 0.0
-        distance_speed = 0.0
-        x = 0.0
-        y = 0.0
-        z = 0.0
-        dx = 0.0
-        dy = 0.0
-        dz = 0.0
-        
-        geocentricSiderealDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Topocentric, Tropical.  Not supported, so all values set to 0.0
-        longitude = 0.0
-        latitude = 0.0
-        distance = 0.0
-        longitude_speed = 0.0
-        latitude_speed = 0.0
-        distance_speed = 0.0
-        rectascension = 0.0
-        declination = 0.0
-        rectascension_speed = 0.0
-        declination_speed = 0.0
-        distance_speed = 0.0
-        x = 0.0
-        y = 0.0
-        z = 0.0
-        dx = 0.0
-        dy = 0.0
-        dz = 0.0
-        
-        topocentricTropicalDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Topocentric, Sidereal.  Not supported, so all values set to 0.0
-        longitude = 0.0
-        latitude = 0.0
-        distance = 0.0
-        longitude_speed = 0.0
-        latitude_speed = 0.0
-        distance_speed = 0.0
-        rectascension = 0.0
-        declination = 0.0
-        rectascension_speed = 0.0
-        declination_speed = 0.0
-        distance_speed = 0.0
-        x = 0.0
-        y = 0.0
-        z = 0.0
-        dx = 0.0
-        dy = 0.0
-        dz = 0.0
-        
-        topocentricSiderealDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Heliocentric, Tropical.  Not supported, so all values set to 0.0
-        longitude = 0.0
-        latitude = 0.0
-        distance = 0.0
-        longitude_speed = 0.0
-        latitude_speed = 0.0
-        distance_speed = 0.0
-        rectascension = 0.0
-        declination = 0.0
-        rectascension_speed = 0.0
-        declination_speed = 0.0
-        distance_speed = 0.0
-        x = 0.0
-        y = 0.0
-        z = 0.0
-        dx = 0.0
-        dy = 0.0
-        dz = 0.0
-        
-        heliocentricTropicalDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Heliocentric, Sidereal.  Not supported, so all values set to 0.0
-        longitude = 0.0
-        latitude = 0.0
-        distance = 0.0
-        longitude_speed = 0.0
-        latitude_speed = 0.0
-        distance_speed = 0.0
-        rectascension = 0.0
-        declination = 0.0
-        rectascension_speed = 0.0
-        declination_speed = 0.0
-        distance_speed = 0.0
-        x = 0.0
-        y = 0.0
-        z = 0.0
-        dx = 0.0
-        dy = 0.0
-        dz = 0.0
-        
-        heliocentricSiderealDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Dictionary holding all the geocentric information.
-        geocentricDict = {'tropical': geocentricTropicalDict,
-                          'sidereal': geocentricSiderealDict}
-
-        # Dictionary holding all the topocentric information.
-        topocentricDict = {'tropical': topocentricTropicalDict,
-                           'sidereal': topocentricSiderealDict}
-
-        # Dictionary holding all the heliocentric information.
-        heliocentricDict = {'tropical': heliocentricTropicalDict,
-                            'sidereal': heliocentricSiderealDict}
-
-        # Create the PlanetaryInfo object.
-        planetaryInfo = PlanetaryInfo(planetName,
-                                      planetId,
-                                      dt,
-                                      jd,
-                                      geocentricDict,
-                                      topocentricDict,
-                                      heliocentricDict)
+        # All the house cusps are calculated together.
+        snapshot = Ephemeris.getHouseSnapshot(dt, houseSystem)
+        planetaryInfo = snapshot.getPlanetaryInfo(planetName)
 
         if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
             functName = inspect.stack()[0][3]
@@ -2925,58 +4224,7 @@ class Ephemeris:
                 "Invalid house system specified: {}".format(houseSystem))
             return (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
 
-        # Convert datetime to julian day.
-        jd = Ephemeris.datetimeToJulianDay(dt)
-
-        # Get the house cusps in the tropical zodiac coordinates.
-        Ephemeris.setTropicalZodiac()
-        Ephemeris.unsetRadiansCoordinateSystemFlag()
-
-        # Obtain the house cusps.
-        (tropicalCusps, tropicalAscmc) = \
-            Ephemeris.swe_houses_ex(jd, 
-                                    Ephemeris.geoLatitudeDeg, 
-                                    Ephemeris.geoLongitudeDeg,
-                                    houseSystem,
-                                    Ephemeris.iflag)
-        
-        # Get the house cusps in the sidereal zodiac coordinates.
-        Ephemeris.setSiderealZodiac()
-        Ephemeris.unsetRadiansCoordinateSystemFlag()
-
-        # Obtain the house cusps.
-        (siderealCusps, siderealAscmc) = \
-            Ephemeris.swe_houses_ex(jd, 
-                                    Ephemeris.geoLatitudeDeg, 
-                                    Ephemeris.geoLongitudeDeg,
-                                    houseSystem,
-                                    Ephemeris.iflag)
-
-        # Put the values into dictionaries.
-        tropicalAscmcDict = \
-            dict(Ascendant           = tropicalAscmc[0],
-                 MC                  = tropicalAscmc[1],
-                 ARMC                = tropicalAscmc[2],
-                 Vertex              = tropicalAscmc[3],
-                 EquatorialAscendant = tropicalAscmc[4],
-                 CoAscendant1        = tropicalAscmc[5],
-                 CoAscendant2        = tropicalAscmc[6],
-                 PolarAscendant      = tropicalAscmc[7])
-        
-        siderealAscmcDict = \
-            dict(Ascendant           = siderealAscmc[0],
-                 MC                  = siderealAscmc[1],
-                 ARMC                = siderealAscmc[2],
-                 Vertex              = siderealAscmc[3],
-                 EquatorialAscendant = siderealAscmc[4],
-                 CoAscendant1        = siderealAscmc[5],
-                 CoAscendant2        = siderealAscmc[6],
-                 PolarAscendant      = siderealAscmc[7])
-        
-        ascmc = {'tropical' : tropicalAscmcDict,
-                 'sidereal' : siderealAscmcDict}
-
-        return ascmc
+        return Ephemeris.getHouseSnapshot(dt, houseSystem).getAscmc()
     
     
     @staticmethod
@@ -3056,283 +4304,9 @@ class Ephemeris:
                                 "(): Unsupported planet name specified.")
             return None
 
-        # Store some str in variables so they don't get instantiated a
-        # bunch of times.
-        tropicalStr = "tropical"
-        siderealStr = "sidereal"
-        
-        # Planet ID.
-        # Here we will use an invalid planet ID.
-        #
-        # (Note: The number chosen has no meaning.
-        # I couldn't use -1, because -1 stands for SE_ECL_NUT.
-        # See documentation of the Swiss Ephemeris, in
-        # file: pyswisseph-1.77.00-0/doc/swephprg.htm)
-        #
-        planetId = -9999
-        
-        # julian day for the timestamp.
-        jd = Ephemeris.datetimeToJulianDay(dt)
-        
-        # Get the tuple holding values for the ascmc locations.
-        ascmc = Ephemeris.getAscmc(dt, houseSystem)
-        
-        # Now fill out the dictionaries that go into a PlanetaryInfo object.
-        
-        # Geocentric, Tropical.
-        longitude = ascmc[tropicalStr][planetName]
-        latitude = 0.0
-        distance = 0.0
-        longitude_speed = 360.0
-        latitude_speed = 0.0
-        distance_speed = 0.0
-        rectascension = 0.0
-        declination = 0.0
-        rectascension_speed = 0.0
-        declination_speed = 0.0
-        distance_speed = 0.0
-        x = 0.0
-        y = 0.0
-        z = 0.0
-        dx = 0.0
-        dy = 0.0
-        dz = 0.0
-        
-        geocentricTropicalDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-        
-        # Geocentric, Sidereal.
-        longitude = ascmc[siderealStr][planetName]
-        latitude = 0.0
-        distance = 0.0
-        longitude_speed = 360.0
-        latitude_speed = 0.0
-        distance_speed = 0.0
-        rectascension = 0.0
-        declination = 0.0
-        rectascension_speed = 0.0
-        declination_speed = 0.0
-        distance_speed = 0.0
-        x = 0.0
-        y = 0.0
-        z = 0.0
-        dx = 0.0
-        dy = 0.0
-        dz = 0.0
-        
-        geocentricSiderealDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Topocentric, Tropical.  Not supported, so all values set to 0.0
-        longitude = 0.0
-        latitude = 0.0
-        distance = 0.0
-        longitude_speed = 0.0
-        latitude_speed = 0.0
-        distance_speed = 0.0
-        rectascension = 0.0
-        declination = 0.0
-        rectascension_speed = 0.0
-        declination_speed = 0.0
-        distance_speed = 0.0
-        x = 0.0
-        y = 0.0
-        z = 0.0
-        dx = 0.0
-        dy = 0.0
-        dz = 0.0
-        
-        topocentricTropicalDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Topocentric, Sidereal.  Not supported, so all values set to 0.0
-        longitude = 0.0
-        latitude = 0.0
-        distance = 0.0
-        longitude_speed = 0.0
-        latitude_speed = 0.0
-        distance_speed = 0.0
-        rectascension = 0.0
-        declination = 0.0
-        rectascension_speed = 0.0
-        declination_speed = 0.0
-        distance_speed = 0.0
-        x = 0.0
-        y = 0.0
-        z = 0.0
-        dx = 0.0
-        dy = 0.0
-        dz = 0.0
-        
-        topocentricSiderealDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Heliocentric, Tropical.  Not supported, so all values set to 0.0
-        longitude = 0.0
-        latitude = 0.0
-        distance = 0.0
-        longitude_speed = 0.0
-        latitude_speed = 0.0
-        distance_speed = 0.0
-        rectascension = 0.0
-        declination = 0.0
-        rectascension_speed = 0.0
-        declination_speed = 0.0
-        distance_speed = 0.0
-        x = 0.0
-        y = 0.0
-        z = 0.0
-        dx = 0.0
-        dy = 0.0
-        dz = 0.0
-        
-        heliocentricTropicalDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Heliocentric, Sidereal.  Not supported, so all values set to 0.0
-        longitude = 0.0
-        latitude = 0.0
-        distance = 0.0
-        longitude_speed = 0.0
-        latitude_speed = 0.0
-        distance_speed = 0.0
-        rectascension = 0.0
-        declination = 0.0
-        rectascension_speed = 0.0
-        declination_speed = 0.0
-        distance_speed = 0.0
-        x = 0.0
-        y = 0.0
-        z = 0.0
-        dx = 0.0
-        dy = 0.0
-        dz = 0.0
-        
-        heliocentricSiderealDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Dictionary holding all the geocentric information.
-        geocentricDict = {'tropical': geocentricTropicalDict,
-                          'sidereal': geocentricSiderealDict}
-
-        # Dictionary holding all the topocentric information.
-        topocentricDict = {'tropical': topocentricTropicalDict,
-                           'sidereal': topocentricSiderealDict}
-
-        # Dictionary holding all the heliocentric information.
-        heliocentricDict = {'tropical': heliocentricTropicalDict,
-                            'sidereal': heliocentricSiderealDict}
-
-        # Create the PlanetaryInfo object.
-        planetaryInfo = PlanetaryInfo(planetName,
-                                      planetId,
-                                      dt,
-                                      jd,
-                                      geocentricDict,
-                                      topocentricDict,
-                                      heliocentricDict)
+        # All the ascmc planets are calculated together.
+        snapshot = Ephemeris.getHouseSnapshot(dt, houseSystem)
+        planetaryInfo = snapshot.getPlanetaryInfo(planetName)
         
         if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
             functName = inspect.stack()[0][3]
@@ -3358,16 +4332,94 @@ class Ephemeris:
         
         Returns:
         A PlanetaryInfo object for the given timestamp.
-        It has all fields populated.  The timestamp in the PlanetaryInfo 
+        It has all fields available.  For planets supported directly by
+        the Swiss Ephemeris, a LazyPlanetaryInfo is returned, and each
+        (centricity, zodiac, coordinate system) group of fields is
+        calculated the first time a field in it is accessed.
+        The timestamp in the PlanetaryInfo 
         object returned is the same timestamp passed into this function.
         See the class description for PlanetaryInfo for details on 
         all the fields available.
+
+        PlanetaryInfo objects are kept in Ephemeris.cache, and the same
+        object may be returned for later calls with the same planet
+        and timestamp.  The PlanetaryInfo returned must not be
+        modified; modify a copy of it instead.
         """
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
+        logDebug = (Ephemeris.debugEnabled == True and
+                    Ephemeris.isDebugSampled() == True)
+
+        if logDebug == True:
             debugStr = "Entered getPlanetaryInfo(planetName={}, datetime={}"
             Ephemeris.log.debug(debugStr.format(planetName, dt))
 
+        # Convert time to Julian Day.
+        jd = Ephemeris.datetimeToJulianDay(dt)
+
+        # Use the cached PlanetaryInfo if it was calculated before.
+        cacheKey = Ephemeris.getCacheKey("PlanetaryInfo", planetName, jd)
+        planetaryInfo = Ephemeris.cache.get(cacheKey)
+
+        if planetaryInfo != None:
+            if planetaryInfo.dt.tzinfo is not dt.tzinfo:
+                # Same moment, but the timestamp returned should be
+                # in the timezone given.  Share the field values.
+                planetaryInfo = copy.copy(planetaryInfo)
+                planetaryInfo.dt = dt
+        else:
+            planetaryInfo = \
+                Ephemeris.__calculatePlanetaryInfo(planetName, dt, jd)
+
+            if planetaryInfo != None:
+                Ephemeris.cache.put(cacheKey, planetaryInfo,
+                                    EphemerisCache.planetaryInfoSizeBytes)
+
+        if logDebug == True:
+            debugStr = "Exiting getPlanetaryInfo(planetName={}, datetime={}"
+            Ephemeris.log.debug(debugStr.format(planetName, dt))
+
+        return planetaryInfo
+
+    @staticmethod
+    def getPlanetaryInfos(planetNames, dt):
+        """Returns a list of PlanetaryInfo objects for the given planets
+        at a given date/time, in the same order as 'planetNames'.
+
+        This is faster than calling getPlanetaryInfo() for each
+        planet when custom planets (e.g. MeanOfFive, MoSu, JuSa) are
+        included, because a DerivedPlanetEvaluator is used, and the
+        planets that the custom planets are calculated from are only
+        calculated once.
+
+        Parameters:
+        planetNames - list of str holding the names of the planets.
+        dt          - datetime.datetime object that represents the date 
+                      and time for which the info is requested.  This
+                      object must have the tzinfo attribute defined and
+                      it must created from pytz.
+
+        Returns:
+        list of PlanetaryInfo objects.  The items for planet names
+        that are not supported are None.
+        """
+
+        evaluator = DerivedPlanetEvaluator(dt)
+        
+        return evaluator.getPlanetaryInfos(planetNames)
+
+    @staticmethod
+    def __calculatePlanetaryInfo(planetName, dt, jd):
+        """Helper function for getPlanetaryInfo().  Returns a new
+        PlanetaryInfo for the planet at the given timestamp, or None if
+        the planet name is not supported.
+
+        Arguments:
+        planetName - str that holds the name of the planet.
+        dt         - datetime.datetime object for the timestamp.
+        jd         - float value for the Julian Day of 'dt'.
+        """
+
         # Get the planet id.
         planetId = Ephemeris.getPlanetIdForName(planetName)
         
@@ -3494,6 +4546,10 @@ class Ephemeris:
                 return Ephemeris.getJuUrPlanetaryInfo(dt)
             elif planetName == "SaUr":
                 return Ephemeris.getSaUrPlanetaryInfo(dt)
+            elif planetName in Ephemeris.derivedPlanetFormulas:
+                # Planets added via registerDerivedPlanet().
+                evaluator = DerivedPlanetEvaluator(dt, houseSystem, jd)
+                return evaluator.getPlanetaryInfo(planetName)
             else:
                 Ephemeris.log.error("Unknown planetName given to " + \
                                     "getPlanetaryInfo(): {}".format(planetName))
@@ -3502,391 +4558,625 @@ class Ephemeris:
         # If it got here, then the planet name given is a standard
         # planet supported by the Swiss Ephemeris.
 
-        # Convert time to Julian Day.
-        jd = Ephemeris.datetimeToJulianDay(dt)
-        
-        # Geocentric, Tropical, Ecliptical info.
-        Ephemeris.setGeocentricCalculations()
-        Ephemeris.setTropicalZodiac()
-        Ephemeris.setEclipticalCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        longitude = arg1
-        latitude = arg2
-        distance = arg3
-        longitude_speed = arg4
-        latitude_speed = arg5
-        distance_speed = arg6
-
-        # Geocentric, Tropical, Equatorial info.
-        Ephemeris.setGeocentricCalculations()
-        Ephemeris.setTropicalZodiac()
-        Ephemeris.setEquatorialCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        rectascension = arg1
-        declination = arg2
-        distance = arg3
-        rectascension_speed = arg4
-        declination_speed = arg5
-        distance_speed = arg6
-
-        # Geocentric, Tropical, Rectangular info.
-        Ephemeris.setGeocentricCalculations()
-        Ephemeris.setTropicalZodiac()
-        Ephemeris.setRectangularCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        x = arg1
-        y = arg2
-        z = arg3
-        dx = arg4
-        dy = arg5
-        dz = arg6
-
-        geocentricTropicalDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Geocentric, Sidereal, Ecliptical info.
-        Ephemeris.setGeocentricCalculations()
-        Ephemeris.setSiderealZodiac()
-        Ephemeris.setEclipticalCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        longitude = arg1
-        latitude = arg2
-        distance = arg3
-        longitude_speed = arg4
-        latitude_speed = arg5
-        distance_speed = arg6
-
-        # Geocentric, Sidereal, Equatorial info.
-        Ephemeris.setGeocentricCalculations()
-        Ephemeris.setSiderealZodiac()
-        Ephemeris.setEquatorialCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        rectascension = arg1
-        declination = arg2
-        distance = arg3
-        rectascension_speed = arg4
-        declination_speed = arg5
-        distance_speed = arg6
-
-        # Geocentric, Sidereal, Rectangular info.
-        Ephemeris.setGeocentricCalculations()
-        Ephemeris.setSiderealZodiac()
-        Ephemeris.setRectangularCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        x = arg1
-        y = arg2
-        z = arg3
-        dx = arg4
-        dy = arg5
-        dz = arg6
-
-        geocentricSiderealDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-
-        # Topocentric, Tropical, Ecliptical info.
-        Ephemeris.setTopocentricCalculations()
-        Ephemeris.setTropicalZodiac()
-        Ephemeris.setEclipticalCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        longitude = arg1
-        latitude = arg2
-        distance = arg3
-        longitude_speed = arg4
-        latitude_speed = arg5
-        distance_speed = arg6
-
-        # Topocentric, Tropical, Equatorial info.
-        Ephemeris.setTopocentricCalculations()
-        Ephemeris.setTropicalZodiac()
-        Ephemeris.setEquatorialCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        rectascension = arg1
-        declination = arg2
-        distance = arg3
-        rectascension_speed = arg4
-        declination_speed = arg5
-        distance_speed = arg6
-
-        # Topocentric, Tropical, Rectangular info.
-        Ephemeris.setTopocentricCalculations()
-        Ephemeris.setTropicalZodiac()
-        Ephemeris.setRectangularCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        x = arg1
-        y = arg2
-        z = arg3
-        dx = arg4
-        dy = arg5
-        dz = arg6
-
-        topocentricTropicalDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Topocentric, Sidereal, Ecliptical info.
-        Ephemeris.setTopocentricCalculations()
-        Ephemeris.setSiderealZodiac()
-        Ephemeris.setEclipticalCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        longitude = arg1
-        latitude = arg2
-        distance = arg3
-        longitude_speed = arg4
-        latitude_speed = arg5
-        distance_speed = arg6
-
-        # Topocentric, Sidereal, Equatorial info.
-        Ephemeris.setTopocentricCalculations()
-        Ephemeris.setSiderealZodiac()
-        Ephemeris.setEquatorialCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        rectascension = arg1
-        declination = arg2
-        distance = arg3
-        rectascension_speed = arg4
-        declination_speed = arg5
-        distance_speed = arg6
-
-        # Topocentric, Sidereal, Rectangular info.
-        Ephemeris.setTopocentricCalculations()
-        Ephemeris.setSiderealZodiac()
-        Ephemeris.setRectangularCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        x = arg1
-        y = arg2
-        z = arg3
-        dx = arg4
-        dy = arg5
-        dz = arg6
-
-        topocentricSiderealDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Heliocentric, Tropical, Ecliptical info.
-        Ephemeris.setHeliocentricCalculations()
-        Ephemeris.setTropicalZodiac()
-        Ephemeris.setEclipticalCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        longitude = arg1
-        latitude = arg2
-        distance = arg3
-        longitude_speed = arg4
-        latitude_speed = arg5
-        distance_speed = arg6
-
-        # Heliocentric, Tropical, Equatorial info.
-        Ephemeris.setHeliocentricCalculations()
-        Ephemeris.setTropicalZodiac()
-        Ephemeris.setEquatorialCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        rectascension = arg1
-        declination = arg2
-        distance = arg3
-        rectascension_speed = arg4
-        declination_speed = arg5
-        distance_speed = arg6
-
-        # Heliocentric, Tropical, Rectangular info.
-        Ephemeris.setHeliocentricCalculations()
-        Ephemeris.setTropicalZodiac()
-        Ephemeris.setRectangularCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        x = arg1
-        y = arg2
-        z = arg3
-        dx = arg4
-        dy = arg5
-        dz = arg6
-
-        heliocentricTropicalDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Heliocentric, Sidereal, Ecliptical info.
-        Ephemeris.setHeliocentricCalculations()
-        Ephemeris.setSiderealZodiac()
-        Ephemeris.setEclipticalCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        longitude = arg1
-        latitude = arg2
-        distance = arg3
-        longitude_speed = arg4
-        latitude_speed = arg5
-        distance_speed = arg6
-
-        # Heliocentric, Sidereal, Equatorial info.
-        Ephemeris.setHeliocentricCalculations()
-        Ephemeris.setSiderealZodiac()
-        Ephemeris.setEquatorialCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        rectascension = arg1
-        declination = arg2
-        distance = arg3
-        rectascension_speed = arg4
-        declination_speed = arg5
-        distance_speed = arg6
-
-        # Heliocentric, Sidereal, Rectangular info.
-        Ephemeris.setHeliocentricCalculations()
-        Ephemeris.setSiderealZodiac()
-        Ephemeris.setRectangularCoordinateSystemFlag()
-        (arg1, arg2, arg3, arg4, arg5, arg6) = \
-                Ephemeris.calc_ut(jd, planetId, Ephemeris.iflag)
-        x = arg1
-        y = arg2
-        z = arg3
-        dx = arg4
-        dy = arg5
-        dz = arg6
-
-        heliocentricSiderealDict = \
-                {'longitude': longitude, 
-                 'latitude': latitude,
-                 'distance': distance,
-                 'longitude_speed': longitude_speed,
-                 'latitude_speed': latitude_speed,
-                 'distance_speed': distance_speed,
-                 'rectascension': rectascension, 
-                 'declination': declination,
-                 'distance': distance,
-                 'rectascension_speed': rectascension_speed,
-                 'declination_speed': declination_speed,
-                 'distance_speed': distance_speed,
-                 'X': x,
-                 'Y': y,
-                 'Z': z,
-                 'dX': dx,
-                 'dY': dy,
-                 'dZ': dz}
-
-        # Dictionary holding all the geocentric information.
-        geocentricDict = {'tropical': geocentricTropicalDict,
-                          'sidereal': geocentricSiderealDict}
-
-        # Dictionary holding all the topocentric information.
-        topocentricDict = {'tropical': topocentricTropicalDict,
-                           'sidereal': topocentricSiderealDict}
-
-        # Dictionary holding all the heliocentric information.
-        heliocentricDict = {'tropical': heliocentricTropicalDict,
-                            'sidereal': heliocentricSiderealDict}
-
-        # Create the PlanetaryInfo object.
-        planetaryInfo = PlanetaryInfo(planetName,
-                                      planetId,
-                                      dt,
-                                      jd,
-                                      geocentricDict,
-                                      topocentricDict,
-                                      heliocentricDict)
+        # Create the PlanetaryInfo object.  The values in it are
+        # only calculated by the Swiss Ephemeris when they are
+        # accessed.
+        return LazyPlanetaryInfo(planetName, planetId, dt, jd)
 
-        if Ephemeris.log.isEnabledFor(logging.DEBUG) == True:
-            debugStr = "Exiting getPlanetaryInfo(planetName={}, datetime={}"
-            Ephemeris.log.debug(debugStr.format(planetName, dt))
 
-        return planetaryInfo
+    @staticmethod
+    def getPlanetFieldValue(planetName, 
+                            jd, 
+                            centricityType, 
+                            zodiacType, 
+                            fieldName):
+        """Returns a single field value of a planet at the given
+        Julian Day.  This is the same value as what is in the
+        PlanetaryInfo returned by getPlanetaryInfo(), e.g.:
+
+          p.geocentric['tropical']['longitude']
+
+        but it is calculated without creating any PlanetaryInfo or
+        datetime.datetime objects, and only the Swiss Ephemeris calls
+        needed for this one value are made.
+
+        Supported planet names are the ones returned by
+        getSupportedPlanetNamesList().  House cusps and ascmc planets
+        use the Porphyry house system, like getPlanetaryInfo().
+
+        Arguments:
+        planetName     - str holding the name of the planet.
+        jd             - float value for the Julian Day, UT.
+        centricityType - str value holding either "geocentric",
+                         "topocentric", or "heliocentric".
+        zodiacType     - str value holding either "tropical" or "sidereal".
+        fieldName      - str holding the name of the field, e.g.
+                         'longitude'.  See the class description of
+                         PlanetaryInfo for the field names available.
+
+        If an EphemerisStore is set via setEphemerisStore() and the
+        Julian Day is on one of its samples, then the stored value is
+        returned instead of calculating it.
+
+        Returns:
+        float value for the field.  If the planet name is not supported,
+        then None is returned.
+        """
+
+        if fieldName not in LazyCoordinateDict.fieldCoordinateSystems:
+            raise ValueError("Invalid fieldName: {}".format(fieldName))
+
+        if Ephemeris.ephemerisStore != None:
+            value = Ephemeris.ephemerisStore.getValue(planetName,
+                                                      jd,
+                                                      centricityType,
+                                                      zodiacType,
+                                                      fieldName)
+            if value != None:
+                return value
+
+        planetId = Ephemeris.getPlanetIdForName(planetName)
+
+        if planetId != None:
+            # Planet supported by the Swiss Ephemeris.
+            coordinateSystemType = \
+                LazyCoordinateDict.fieldCoordinateSystems[fieldName]
+            values = Ephemeris.calcPlanetCoordinates(jd,
+                                                     planetId,
+                                                     centricityType,
+                                                     zodiacType,
+                                                     coordinateSystemType)
+            return values[LazyCoordinateDict.fieldIndexes[fieldName]]
+
+        elif Ephemeris.isHouseCuspPlanetName(planetName) or \
+             planetName in ["Ascendant", "MC", "ARMC", "Vertex",
+                            "EquatorialAscendant", "CoAscendant1",
+                            "CoAscendant2", "PolarAscendant"]:
+
+            # House cusps and ascmc planets only have values for
+            # geocentric longitude and longitude_speed.  Everything
+            # else is 0.0.
+            if centricityType != "geocentric":
+                return 0.0
+            elif fieldName == "longitude_speed":
+                return 360.0
+            elif fieldName != "longitude":
+                return 0.0
+
+            houseSystem = Ephemeris.HouseSys['Porphyry']
+
+            if zodiacType == "tropical":
+                Ephemeris.setTropicalZodiac()
+            elif zodiacType == "sidereal":
+                Ephemeris.setSiderealZodiac()
+            else:
+                raise ValueError("Invalid zodiacType: {}".format(zodiacType))
+            Ephemeris.unsetRadiansCoordinateSystemFlag()
+
+            (cusps, ascmc) = \
+                Ephemeris.swe_houses_ex(jd, 
+                                        Ephemeris.geoLatitudeDeg, 
+                                        Ephemeris.geoLongitudeDeg,
+                                        houseSystem,
+                                        Ephemeris.iflag)
+
+            if Ephemeris.isHouseCuspPlanetName(planetName):
+                houseNumber = int(planetName[1:])
+                if houseNumber < 1 or houseNumber > 12:
+                    Ephemeris.log.error("Unknown planetName given to " + \
+                        "getPlanetFieldValue(): {}".format(planetName))
+                    return None
+                return cusps[houseNumber - 1]
+            elif planetName == "Ascendant":
+                return ascmc[0]
+            elif planetName == "MC":
+                return ascmc[1]
+            elif planetName == "ARMC":
+                return ascmc[2]
+            elif planetName == "Vertex":
+                return ascmc[3]
+            elif planetName == "EquatorialAscendant":
+                return ascmc[4]
+            elif planetName == "CoAscendant1":
+                return ascmc[5]
+            elif planetName == "CoAscendant2":
+                return ascmc[6]
+            elif planetName == "PolarAscendant":
+                return ascmc[7]
+
+        elif planetName in Ephemeris.averagedPlanetConstituents:
+            # Average of the field values, like
+            # createAveragedPlanetaryInfo().
+            constituents = Ephemeris.averagedPlanetConstituents[planetName]
+
+            values = []
+            for constituent in constituents:
+                values.append(Ephemeris.getPlanetFieldValue(constituent,
+                                                            jd,
+                                                            centricityType,
+                                                            zodiacType,
+                                                            fieldName))
+
+            return Ephemeris.applyDerivedPlanetFormula("average",
+                                                       fieldName,
+                                                       values)
+
+        elif planetName in Ephemeris.combinationPlanetConstituents:
+            # (A - (B - (C ...))), like createCombinationPlanetaryInfo().
+            constituents = \
+                Ephemeris.combinationPlanetConstituents[planetName]
+
+            values = []
+            for constituent in constituents:
+                values.append(Ephemeris.getPlanetFieldValue(constituent,
+                                                            jd,
+                                                            centricityType,
+                                                            zodiacType,
+                                                            fieldName))
+
+            return Ephemeris.applyDerivedPlanetFormula("combination",
+                                                       fieldName,
+                                                       values)
+
+        elif planetName in Ephemeris.derivedPlanetFormulas:
+            # Planets added via registerDerivedPlanet().
+            (constituents, formula) = \
+                Ephemeris.derivedPlanetFormulas[planetName]
+
+            values = []
+            for constituent in constituents:
+                values.append(Ephemeris.getPlanetFieldValue(constituent,
+                                                            jd,
+                                                            centricityType,
+                                                            zodiacType,
+                                                            fieldName))
+                
+            return Ephemeris.applyDerivedPlanetFormula(formula,
+                                                       fieldName,
+                                                       values)
+
+        Ephemeris.log.error("Unknown planetName given to " + \
+                            "getPlanetFieldValue(): {}".format(planetName))
+        return None
+
+    @staticmethod
+    def getLongitude(planetName, jd, centricityType, zodiacType):
+        """Returns the longitude of a planet at the given Julian Day.
+        See getPlanetFieldValue() for details about the arguments and
+        return value.
+        """
+
+        return Ephemeris.getPlanetFieldValue(planetName,
+                                             jd,
+                                             centricityType,
+                                             zodiacType,
+                                             "longitude")
+
+    @staticmethod
+    def getLatitude(planetName, jd, centricityType, zodiacType):
+        """Returns the latitude of a planet at the given Julian Day.
+        See getPlanetFieldValue() for details about the arguments and
+        return value.
+        """
+
+        return Ephemeris.getPlanetFieldValue(planetName,
+                                             jd,
+                                             centricityType,
+                                             zodiacType,
+                                             "latitude")
+
+    @staticmethod
+    def getDeclination(planetName, jd, centricityType, zodiacType):
+        """Returns the declination of a planet at the given Julian Day.
+        See getPlanetFieldValue() for details about the arguments and
+        return value.
+        """
+
+        return Ephemeris.getPlanetFieldValue(planetName,
+                                             jd,
+                                             centricityType,
+                                             zodiacType,
+                                             "declination")
+
+    @staticmethod
+    def getLongitudeSpeed(planetName, jd, centricityType, zodiacType):
+        """Returns the longitude speed of a planet at the given Julian Day.
+        See getPlanetFieldValue() for details about the arguments and
+        return value.
+        """
+
+        return Ephemeris.getPlanetFieldValue(planetName,
+                                             jd,
+                                             centricityType,
+                                             zodiacType,
+                                             "longitude_speed")
+
+    @staticmethod
+    def getLongitudeAndSpeed(planetName, jd, centricityType, zodiacType):
+        """Returns the longitude and the longitude speed of a planet at
+        the given Julian Day.  For planets supported by the Swiss
+        Ephemeris, both values come from the same calc_ut() call, so
+        this is half the work of calling getLongitude() and
+        getLongitudeSpeed().
+
+        House cusps and ascmc planets do not have a real longitude
+        speed (the 360.0 in their PlanetaryInfo is a placeholder), so
+        for them, and for custom planets calculated from them, the
+        speed returned is None.
+
+        See getPlanetFieldValue() for details about the arguments.
+
+        Returns:
+        tuple (longitude, longitudeSpeed) of float values.
+        longitudeSpeed is in degrees per day, or None as described
+        above.  If the planet name is not supported, then
+        (None, None) is returned.
+        """
+
+        planetId = Ephemeris.getPlanetIdForName(planetName)
+
+        if planetId != None:
+            if Ephemeris.ephemerisStore != None:
+                longitude = \
+                    Ephemeris.ephemerisStore.getValue(planetName,
+                                                      jd,
+                                                      centricityType,
+                                                      zodiacType,
+                                                      "longitude")
+                longitudeSpeed = \
+                    Ephemeris.ephemerisStore.getValue(planetName,
+                                                      jd,
+                                                      centricityType,
+                                                      zodiacType,
+                                                      "longitude_speed")
+                if longitude != None and longitudeSpeed != None:
+                    return (longitude, longitudeSpeed)
+
+            values = Ephemeris.calcPlanetCoordinates(jd,
+                                                     planetId,
+                                                     centricityType,
+                                                     zodiacType,
+                                                     "ecliptical")
+            return (values[0], values[3])
+
+        constituents = Ephemeris.getPlanetConstituents(planetName)
+
+        if len(constituents) == 0:
+            # House cusps, ascmc planets, or an unknown planet name.
+            longitude = Ephemeris.getPlanetFieldValue(planetName,
+                                                      jd,
+                                                      centricityType,
+                                                      zodiacType,
+                                                      "longitude")
+            return (longitude, None)
+
+        if planetName in Ephemeris.averagedPlanetConstituents:
+            formula = "average"
+        elif planetName in Ephemeris.combinationPlanetConstituents:
+            formula = "combination"
+        else:
+            (constituents, formula) = \
+                Ephemeris.derivedPlanetFormulas[planetName]
+
+        longitudes = []
+        longitudeSpeeds = []
+        for constituent in constituents:
+            (longitude, longitudeSpeed) = \
+                Ephemeris.getLongitudeAndSpeed(constituent,
+                                               jd,
+                                               centricityType,
+                                               zodiacType)
+            longitudes.append(longitude)
+            longitudeSpeeds.append(longitudeSpeed)
+
+        longitude = Ephemeris.applyDerivedPlanetFormula(formula,
+                                                        "longitude",
+                                                        longitudes)
+        if None in longitudeSpeeds:
+            longitudeSpeed = None
+        else:
+            longitudeSpeed = \
+                Ephemeris.applyDerivedPlanetFormula(formula,
+                                                    "longitude_speed",
+                                                    longitudeSpeeds)
+
+        return (longitude, longitudeSpeed)
+
+    @staticmethod
+    def getPlanetPositionsBatch(planetName, 
+                                jds, 
+                                centricityType, 
+                                zodiacType, 
+                                fieldNames=['longitude']):
+        """Returns field values of a planet for many Julian Days in one
+        call.  This is the batch version of getPlanetFieldValue(), for
+        iterating over long time spans (e.g. years of daily or hourly
+        points).
+
+        The Ephemeris flags are set once per coordinate system needed,
+        and then the Swiss Ephemeris is called in a tight loop over
+        all the Julian Days, instead of flipping the flags on every
+        call.  No PlanetaryInfo or datetime.datetime objects are
+        created.
+
+        Supported planet names are the ones returned by
+        getSupportedPlanetNamesList().  House cusps and ascmc planets
+        use the Porphyry house system, like getPlanetaryInfo().
+
+        Arguments:
+        planetName     - str holding the name of the planet.
+        jds            - iterable of float values for the Julian Days, UT.
+        centricityType - str value holding either "geocentric",
+                         "topocentric", or "heliocentric".
+        zodiacType     - str value holding either "tropical" or "sidereal".
+        fieldNames     - list of str holding the names of the fields
+                         wanted, e.g. ['longitude', 'longitude_speed'].
+                         See the class description of PlanetaryInfo
+                         for the field names available.
+
+        Returns:
+        dict with the field names as keys, and for each an
+        array.array('d') of the values, in the same order as 'jds'.
+        If the planet name is not supported, then None is returned.
+        """
+
+        for fieldName in fieldNames:
+            if fieldName not in LazyCoordinateDict.fieldCoordinateSystems:
+                raise ValueError("Invalid fieldName: {}".format(fieldName))
+
+        if not isinstance(jds, array.array):
+            jds = array.array('d', jds)
+
+        numJds = len(jds)
+
+        # Return value.
+        rv = {}
+
+        planetId = Ephemeris.getPlanetIdForName(planetName)
+
+        if planetId != None:
+            # Planet supported by the Swiss Ephemeris.
+            
+            # Group the field names by the coordinate system they are
+            # calculated in, so that each coordinate system is only
+            # calculated once.
+            fieldNamesForCoordinateSystem = {}
+            for fieldName in fieldNames:
+                coordinateSystemType = \
+                    LazyCoordinateDict.fieldCoordinateSystems[fieldName]
+                fieldNamesForCoordinateSystem.\
+                    setdefault(coordinateSystemType, []).append(fieldName)
+
+            for coordinateSystemType, coordinateSystemFieldNames in \
+                    fieldNamesForCoordinateSystem.items():
+
+                # Set the flags once for this coordinate system.
+                if centricityType == "geocentric":
+                    Ephemeris.setGeocentricCalculations()
+                elif centricityType == "topocentric":
+                    Ephemeris.setTopocentricCalculations()
+                elif centricityType == "heliocentric":
+                    Ephemeris.setHeliocentricCalculations()
+                else:
+                    raise ValueError("Invalid centricityType: {}".\
+                                     format(centricityType))
+
+                if zodiacType == "tropical":
+                    Ephemeris.setTropicalZodiac()
+                elif zodiacType == "sidereal":
+                    Ephemeris.setSiderealZodiac()
+                else:
+                    raise ValueError("Invalid zodiacType: {}".\
+                                     format(zodiacType))
+
+                if coordinateSystemType == "ecliptical":
+                    Ephemeris.setEclipticalCoordinateSystemFlag()
+                elif coordinateSystemType == "equatorial":
+                    Ephemeris.setEquatorialCoordinateSystemFlag()
+                elif coordinateSystemType == "rectangular":
+                    Ephemeris.setRectangularCoordinateSystemFlag()
+
+                flag = Ephemeris.iflag
+
+                indexes = [LazyCoordinateDict.fieldIndexes[fieldName] \
+                           for fieldName in coordinateSystemFieldNames]
+                arrays = [array.array('d', bytes(8 * numJds)) \
+                          for fieldName in coordinateSystemFieldNames]
+                
+                calc_ut = swe.calc_ut
+                with Ephemeris.sweLock:
+                    for i in range(numJds):
+                        values = calc_ut(jds[i], planetId, flag)
+                        for j in range(len(indexes)):
+                            arrays[j][i] = values[indexes[j]]
+
+                for j in range(len(coordinateSystemFieldNames)):
+                    rv[coordinateSystemFieldNames[j]] = arrays[j]
+
+        elif Ephemeris.isHouseCuspPlanetName(planetName) or \
+             planetName in ["Ascendant", "MC", "ARMC", "Vertex",
+                            "EquatorialAscendant", "CoAscendant1",
+                            "CoAscendant2", "PolarAscendant"]:
+
+            # House cusps and ascmc planets only have values for
+            # geocentric longitude and longitude_speed.  Everything
+            # else is 0.0.
+            longitudes = None
+            
+            for fieldName in fieldNames:
+                if centricityType == "geocentric" and \
+                       fieldName == "longitude_speed":
+                    rv[fieldName] = array.array('d', [360.0]) * numJds
+                elif centricityType == "geocentric" and \
+                       fieldName == "longitude":
+
+                    if longitudes == None:
+                        longitudes = \
+                            Ephemeris.__getHouseLongitudesBatch(planetName,
+                                                                jds,
+                                                                zodiacType)
+                        if longitudes == None:
+                            return None
+                        
+                    rv[fieldName] = longitudes
+                else:
+                    rv[fieldName] = array.array('d', bytes(8 * numJds))
+
+        elif planetName in Ephemeris.averagedPlanetConstituents:
+            # Average of the field values, like
+            # createAveragedPlanetaryInfo().
+            constituents = Ephemeris.averagedPlanetConstituents[planetName]
+
+            for constituent in constituents:
+                values = Ephemeris.getPlanetPositionsBatch(constituent,
+                                                           jds,
+                                                           centricityType,
+                                                           zodiacType,
+                                                           fieldNames)
+                if len(rv) == 0:
+                    rv = values
+                else:
+                    for fieldName in fieldNames:
+                        totals = rv[fieldName]
+                        constituentValues = values[fieldName]
+                        for i in range(numJds):
+                            totals[i] += constituentValues[i]
+
+                        # See applyDerivedPlanetFormula().
+                        if fieldName in Ephemeris.doubledFieldNames:
+                            for i in range(numJds):
+                                totals[i] += constituentValues[i]
+
+            for fieldName in fieldNames:
+                totals = rv[fieldName]
+                for i in range(numJds):
+                    totals[i] /= len(constituents)
+
+                if fieldName in Ephemeris.doubledFieldNames:
+                    for i in range(numJds):
+                        totals[i] /= len(constituents)
+
+        elif planetName in Ephemeris.combinationPlanetConstituents:
+            # (A - (B - (C ...))), like createCombinationPlanetaryInfo().
+            constituents = \
+                Ephemeris.combinationPlanetConstituents[planetName]
+
+            for constituent in reversed(constituents):
+                values = Ephemeris.getPlanetPositionsBatch(constituent,
+                                                           jds,
+                                                           centricityType,
+                                                           zodiacType,
+                                                           fieldNames)
+                if len(rv) == 0:
+                    rv = values
+                else:
+                    for fieldName in fieldNames:
+                        combinedValues = rv[fieldName]
+                        constituentValues = values[fieldName]
+                        for i in range(numJds):
+                            combinedValues[i] = \
+                                constituentValues[i] - combinedValues[i]
+
+                        # See applyDerivedPlanetFormula().
+                        if fieldName in Ephemeris.doubledFieldNames:
+                            for i in range(numJds):
+                                combinedValues[i] = \
+                                    constituentValues[i] - combinedValues[i]
+
+                        if fieldName == "longitude":
+                            for i in range(numJds):
+                                combinedValues[i] = \
+                                    Ephemeris.__toNormalizedAngle(\
+                                    combinedValues[i])
+
+        elif planetName in Ephemeris.derivedPlanetFormulas:
+            # Planets added via registerDerivedPlanet().
+            (constituents, formula) = \
+                Ephemeris.derivedPlanetFormulas[planetName]
+
+            constituentsValues = []
+            for constituent in constituents:
+                values = Ephemeris.getPlanetPositionsBatch(constituent,
+                                                           jds,
+                                                           centricityType,
+                                                           zodiacType,
+                                                           fieldNames)
+                if values == None:
+                    return None
+                constituentsValues.append(values)
+
+            for fieldName in fieldNames:
+                derivedValues = array.array('d', bytes(8 * numJds))
+                for i in range(numJds):
+                    derivedValues[i] = \
+                        Ephemeris.applyDerivedPlanetFormula(\
+                        formula,
+                        fieldName,
+                        [values[fieldName][i] for values in constituentsValues])
+                rv[fieldName] = derivedValues
+
+        else:
+            Ephemeris.log.error("Unknown planetName given to " + \
+                                "getPlanetPositionsBatch(): {}".\
+                                format(planetName))
+            return None
+
+        return rv
+
+    @staticmethod
+    def __getHouseLongitudesBatch(planetName, jds, zodiacType):
+        """Helper function for getPlanetPositionsBatch() that returns
+        an array.array('d') of the longitudes of a house cusp or ascmc
+        planet, for each Julian Day in 'jds'.  The Porphyry house system
+        is used.  If the planet name is not supported, then None is
+        returned.
+        """
+
+        if Ephemeris.isHouseCuspPlanetName(planetName):
+            houseNumber = int(planetName[1:])
+            if houseNumber < 1 or houseNumber > 12:
+                Ephemeris.log.error("Unknown planetName given to " + \
+                                    "getPlanetPositionsBatch(): {}".\
+                                    format(planetName))
+                return None
+            useCusps = True
+            index = houseNumber - 1
+        else:
+            useCusps = False
+            index = ["Ascendant", "MC", "ARMC", "Vertex",
+                     "EquatorialAscendant", "CoAscendant1",
+                     "CoAscendant2", "PolarAscendant"].index(planetName)
+
+        # Set the flags once.
+        if zodiacType == "tropical":
+            Ephemeris.setTropicalZodiac()
+        elif zodiacType == "sidereal":
+            Ephemeris.setSiderealZodiac()
+        else:
+            raise ValueError("Invalid zodiacType: {}".format(zodiacType))
+        Ephemeris.unsetRadiansCoordinateSystemFlag()
+
+        flag = Ephemeris.iflag
+        houseSystem = Ephemeris.HouseSys['Porphyry']
+        geoLatitudeDeg = Ephemeris.geoLatitudeDeg
+        geoLongitudeDeg = Ephemeris.geoLongitudeDeg
+
+        longitudes = array.array('d', bytes(8 * len(jds)))
 
+        houses_ex = swe.houses_ex
+        with Ephemeris.sweLock:
+            for i in range(len(jds)):
+                (cusps, ascmc) = houses_ex(jds[i], 
+                                           geoLatitudeDeg,
+                                           geoLongitudeDeg,
+                                           houseSystem,
+                                           flag)
+                if useCusps:
+                    longitudes[i] = cusps[index]
+                else:
+                    longitudes[i] = ascmc[index]
+
+        return longitudes
 
     ######################################################################
 
@@ -6056,6 +7346,548 @@ class Ephemeris:
         
         return rv
 
+
+def _acquireSweLockBeforeFork():
+    """Acquires Ephemeris.sweLock before the process forks, so that
+    no other thread is in the middle of changing the library state.
+    """
+
+    Ephemeris.sweLock.acquire()
+
+
+def _releaseSweLockAfterForkInParent():
+    """Releases Ephemeris.sweLock in the parent after a fork."""
+
+    Ephemeris.sweLock.release()
+
+
+def _resetSweLockAfterForkInChild():
+    """Replaces Ephemeris.sweLock in the child after a fork.  The
+    child inherits the lock held by the thread that forked, which does
+    not exist in the child, so the lock could never be acquired again
+    (e.g. by the initializer of a pool process).
+    """
+
+    Ephemeris.sweLock = threading.RLock()
+
+
+# Processes forked while another thread holds Ephemeris.sweLock (e.g.
+# the processes of the LookbackMultipleParallel pool, created from a
+# background thread) would otherwise deadlock on it.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_acquireSweLockBeforeFork,
+                        after_in_parent=_releaseSweLockAfterForkInParent,
+                        after_in_child=_resetSweLockAfterForkInChild)
+
+
+class HouseSnapshot:
+    """Holds the house cusps and the ascmc values (Ascendant, MC, etc.)
+    for one timestamp and house system, in the tropical and sidereal
+    zodiacs.
+
+    There is one Swiss Ephemeris swe_houses_ex() call per zodiac type
+    for the snapshot, and the PlanetaryInfo objects for all the house
+    cusps (H1 to H12) and ascmc planets are created from those values.
+    Before, each of those PlanetaryInfo objects made its own calls.
+
+    If speeds are requested, the longitude speeds of the house cusps
+    and ascmc planets are calculated from the values half a minute
+    before and after the timestamp (two more calls per zodiac type).
+    Otherwise, the longitude speed is 360.0 degrees per day, which is
+    the value the house cusp PlanetaryInfo objects have always had.
+
+    HouseSnapshot objects are normally obtained with
+    Ephemeris.getHouseSnapshot(), which caches them.
+    """
+
+    # Names of the ascmc planets, in the order of the values returned
+    # by swe_houses_ex().
+    ascmcPlanetNames = ["Ascendant",
+                        "MC",
+                        "ARMC",
+                        "Vertex",
+                        "EquatorialAscendant",   # "Equatorial ascendant"
+                        "CoAscendant1",          # "Co-ascendant" (Walter Koch)
+                        "CoAscendant2",          # "Co-ascendant" (Michael Munkasey)
+                        "PolarAscendant"]        # "Polar ascendant" (M. Munkasey)
+
+    # Time between the two values used for calculating speeds, in days.
+    speedDeltaDays = 1.0 / (24 * 60)
+
+    # Planet ID used in the PlanetaryInfo objects.
+    # Here we will use an invalid planet ID.
+    #
+    # (Note: The number chosen has no meaning.
+    # I couldn't use -1, because -1 stands for SE_ECL_NUT.
+    # See documentation of the Swiss Ephemeris, in
+    # file: pyswisseph-1.77.00-0/doc/swephprg.htm)
+    #
+    planetId = -9999
+
+    def __init__(self, dt, houseSystem, calculateSpeeds=False, jd=None,
+                 context=None):
+        """Calculates the house cusps and ascmc values.
+
+        Preconditions:
+
+            Ephemeris.setGeographicPosition() has been called previously,
+            or a context is given.
+
+        Arguments:
+        dt              - datetime.datetime object holding the timestamp.
+        houseSystem     - byte string of length 1 for the house system.
+                          See Ephemeris.getHouseCusps() for the values
+                          supported.
+        calculateSpeeds - bool value for whether or not to calculate
+                          the longitude speeds.
+        jd              - float value for the Julian Day of 'dt'.  If
+                          None, then it is calculated from 'dt'.
+        context         - EphemerisContext to calculate the values
+                          with, or None to use the Ephemeris settings.
+        """
+
+        if jd == None:
+            jd = Ephemeris.datetimeToJulianDay(dt)
+
+        self.dt = dt
+        self.jd = jd
+        self.houseSystem = houseSystem
+        self.calculateSpeeds = calculateSpeeds
+        self.context = context
+
+        # Dicts of zodiac type to the tuple of house cusps and the
+        # tuple of ascmc values.
+        self.cusps = {}
+        self.ascmc = {}
+
+        # Dicts of zodiac type to the tuple of longitude speeds of the
+        # house cusps and ascmc values.  These are None if speeds are
+        # not calculated.
+        self.cuspSpeeds = None
+        self.ascmcSpeeds = None
+
+        for zodiacType in ["tropical", "sidereal"]:
+            (cusps, ascmc) = \
+                HouseSnapshot.calculateHouses(jd, houseSystem, zodiacType,
+                                              context)
+            self.cusps[zodiacType] = cusps
+            self.ascmc[zodiacType] = ascmc
+
+        if calculateSpeeds:
+            self.cuspSpeeds = {}
+            self.ascmcSpeeds = {}
+
+            halfDelta = HouseSnapshot.speedDeltaDays / 2.0
+
+            for zodiacType in ["tropical", "sidereal"]:
+                (cuspsBefore, ascmcBefore) = \
+                    HouseSnapshot.calculateHouses(jd - halfDelta,
+                                                  houseSystem,
+                                                  zodiacType,
+                                                  context)
+                (cuspsAfter, ascmcAfter) = \
+                    HouseSnapshot.calculateHouses(jd + halfDelta,
+                                                  houseSystem,
+                                                  zodiacType,
+                                                  context)
+
+                self.cuspSpeeds[zodiacType] = \
+                    HouseSnapshot.__calculateSpeeds(cuspsBefore, cuspsAfter)
+                self.ascmcSpeeds[zodiacType] = \
+                    HouseSnapshot.__calculateSpeeds(ascmcBefore, ascmcAfter)
+
+    @staticmethod
+    def calculateHouses(jd, houseSystem, zodiacType, context=None):
+        """Calls swe_houses_ex() once for the given Julian Day, house
+        system and zodiac type, at the geographic position set in the
+        Ephemeris, or at the geographic position of the
+        EphemerisContext if one is given.
+
+        Returns:
+        Tuple of (cusps, ascmc), as returned by Ephemeris.swe_houses_ex().
+        """
+
+        if context != None:
+            return context.calculateHouses(jd, houseSystem, zodiacType)
+
+        if zodiacType == "tropical":
+            Ephemeris.setTropicalZodiac()
+        elif zodiacType == "sidereal":
+            Ephemeris.setSiderealZodiac()
+        else:
+            raise ValueError("Invalid zodiacType: {}".format(zodiacType))
+        Ephemeris.unsetRadiansCoordinateSystemFlag()
+
+        return Ephemeris.swe_houses_ex(jd,
+                                       Ephemeris.geoLatitudeDeg,
+                                       Ephemeris.geoLongitudeDeg,
+                                       houseSystem,
+                                       Ephemeris.iflag)
+
+    @staticmethod
+    def __calculateSpeeds(valuesBefore, valuesAfter):
+        """Returns a tuple of the speeds, in degrees per day, of the
+        angles that went from 'valuesBefore' to 'valuesAfter' in
+        HouseSnapshot.speedDeltaDays days.
+        """
+
+        speeds = []
+        for i in range(len(valuesBefore)):
+            diff = (valuesAfter[i] - valuesBefore[i]) % 360.0
+            if diff > 180.0:
+                diff -= 360.0
+            speeds.append(diff / HouseSnapshot.speedDeltaDays)
+
+        return tuple(speeds)
+
+    def getHouseCusps(self):
+        """Returns the house cusps in the same format as
+        Ephemeris.getHouseCusps().
+        """
+
+        return {'tropical' : self.cusps['tropical'],
+                'sidereal' : self.cusps['sidereal']}
+
+    def getAscmc(self):
+        """Returns the ascmc values in the same format as
+        Ephemeris.getAscmc().
+        """
+
+        ascmc = {}
+        for zodiacType in ["tropical", "sidereal"]:
+            values = self.ascmc[zodiacType]
+            ascmc[zodiacType] = \
+                {HouseSnapshot.ascmcPlanetNames[i] : values[i] \
+                 for i in range(len(HouseSnapshot.ascmcPlanetNames))}
+
+        return ascmc
+
+    def getLongitude(self, planetName, zodiacType):
+        """Returns the longitude of a house cusp (e.g. 'H1') or ascmc
+        planet (e.g. 'MC'), or None if the planet name is not one of
+        those.
+        """
+
+        index = HouseSnapshot.__getIndex(planetName)
+        if index == None:
+            return None
+        elif Ephemeris.isHouseCuspPlanetName(planetName):
+            return self.cusps[zodiacType][index]
+        else:
+            return self.ascmc[zodiacType][index]
+
+    def getLongitudeSpeed(self, planetName, zodiacType):
+        """Returns the longitude speed, in degrees per day, of a house
+        cusp (e.g. 'H1') or ascmc planet (e.g. 'MC'), or None if the
+        planet name is not one of those.  If the snapshot was created
+        without calculating speeds, then this is 360.0.
+        """
+
+        index = HouseSnapshot.__getIndex(planetName)
+        if index == None:
+            return None
+        elif not self.calculateSpeeds:
+            return 360.0
+        elif Ephemeris.isHouseCuspPlanetName(planetName):
+            return self.cuspSpeeds[zodiacType][index]
+        else:
+            return self.ascmcSpeeds[zodiacType][index]
+
+    @staticmethod
+    def __getIndex(planetName):
+        """Returns the index of the planet in the tuple of house cusps
+        or in the tuple of ascmc values, or None if the planet name is
+        not a house cusp or ascmc planet.
+        """
+
+        if Ephemeris.isHouseCuspPlanetName(planetName):
+            houseNumber = int(planetName[1:])
+            if 1 <= houseNumber <= 12:
+                return houseNumber - 1
+        elif planetName in HouseSnapshot.ascmcPlanetNames:
+            return HouseSnapshot.ascmcPlanetNames.index(planetName)
+
+        return None
+
+    def getPlanetaryInfo(self, planetName):
+        """Returns a PlanetaryInfo for a house cusp (e.g. 'H1') or ascmc
+        planet (e.g. 'MC') at the timestamp of the snapshot.
+        Only the geocentric longitude and longitude_speed have values;
+        all the other fields are 0.0.
+
+        Returns:
+        PlanetaryInfo object, or None if the planet name is not a
+        house cusp or ascmc planet.
+        """
+
+        if HouseSnapshot.__getIndex(planetName) == None:
+            return None
+
+        geocentricDict = {}
+        topocentricDict = {}
+        heliocentricDict = {}
+
+        for zodiacType in ["tropical", "sidereal"]:
+            geocentricDict[zodiacType] = \
+                HouseSnapshot.__createFieldsDict(\
+                    self.getLongitude(planetName, zodiacType),
+                    self.getLongitudeSpeed(planetName, zodiacType))
+
+            # Topocentric and heliocentric are not supported, so all
+            # values set to 0.0.
+            topocentricDict[zodiacType] = \
+                HouseSnapshot.__createFieldsDict(0.0, 0.0)
+            heliocentricDict[zodiacType] = \
+                HouseSnapshot.__createFieldsDict(0.0, 0.0)
+
+        return PlanetaryInfo(planetName,
+                             HouseSnapshot.planetId,
+                             self.dt,
+                             self.jd,
+                             geocentricDict,
+                             topocentricDict,
+                             heliocentricDict)
+
+    def getPlanetaryInfos(self):
+        """Returns a list of PlanetaryInfo objects for all the house
+        cusps (H1 to H12) and then all the ascmc planets.
+        """
+
+        planetNames = ["H{}".format(i) for i in range(1, 13)] + \
+                      HouseSnapshot.ascmcPlanetNames
+
+        return [self.getPlanetaryInfo(planetName) \
+                for planetName in planetNames]
+
+    @staticmethod
+    def __createFieldsDict(longitude, longitudeSpeed):
+        """Returns the dict of PlanetaryInfo fields for one centricity
+        and zodiac type, with all fields except for longitude and
+        longitude_speed set to 0.0.
+        """
+
+        return {'longitude': longitude,
+                'latitude': 0.0,
+                'distance': 0.0,
+                'longitude_speed': longitudeSpeed,
+                'latitude_speed': 0.0,
+                'distance_speed': 0.0,
+                'rectascension': 0.0,
+                'declination': 0.0,
+                'rectascension_speed': 0.0,
+                'declination_speed': 0.0,
+                'X': 0.0,
+                'Y': 0.0,
+                'Z': 0.0,
+                'dX': 0.0,
+                'dY': 0.0,
+                'dZ': 0.0}
+
+class DerivedPlanetEvaluator:
+    """Calculates the PlanetaryInfo objects of many planets at one
+    timestamp, where each planet is calculated only once.
+
+    The custom planets (MeanOfFive, MoSu, JuSa, etc., and the planets
+    added via Ephemeris.registerDerivedPlanet()) are calculated from
+    the PlanetaryInfo objects of their constituent planets.  When the
+    get<Name>PlanetaryInfo() methods are used, each custom planet gets
+    its constituents on its own, so asking for MeanOfFive, JuSa and
+    AvgJuSa at the same timestamp gets Jupiter three times.  Here the
+    PlanetaryInfo objects are kept per planet name, and the
+    dependencies of the custom planets are resolved through them, so
+    Jupiter is calculated once and shared.  The house cusps and ascmc
+    planets all come from the one HouseSnapshot of the timestamp.
+
+    Example:
+
+        evaluator = DerivedPlanetEvaluator(dt)
+        planetaryInfos = evaluator.getPlanetaryInfos(["Jupiter",
+                                                      "MeanOfFive",
+                                                      "JuSa"])
+
+    The PlanetaryInfo objects returned are shared, so they must be
+    treated as read-only.
+    """
+
+    def __init__(self, dt, houseSystem=Ephemeris.HouseSys['Porphyry'],
+                 jd=None, context=None):
+        """Initializes the evaluator for a timestamp.
+
+        Preconditions:
+
+            Ephemeris.setGeographicPosition() has been called previously,
+            or a context is given.
+
+        Arguments:
+        dt          - datetime.datetime object for the timestamp.  This
+                      object must have the tzinfo attribute defined and
+                      it must be created from pytz.
+        houseSystem - House system to use for the house cusps and the
+                      ascmc planets.  See Ephemeris.HouseSys.
+        jd          - float value for the Julian Day of 'dt', if it is
+                      already known.  If None, it is calculated.
+        context     - EphemerisContext to calculate the planets with,
+                      or None to use the Ephemeris settings.  With a
+                      context, Ephemeris.cache is not used.
+        """
+
+        self.log = logging.getLogger("ephemeris.DerivedPlanetEvaluator")
+
+        if jd == None:
+            jd = Ephemeris.datetimeToJulianDay(dt)
+
+        self.dt = dt
+        self.jd = jd
+        self.houseSystem = houseSystem
+        self.context = context
+
+        # Dict of planet name to PlanetaryInfo calculated so far.
+        self.planetaryInfos = {}
+
+        # HouseSnapshot of the timestamp.  It is obtained the first
+        # time a house cusp or ascmc planet is needed.
+        self.houseSnapshot = None
+
+        # Number of PlanetaryInfo objects calculated (not shared).
+        self.numEvaluations = 0
+
+    @staticmethod
+    def getEvaluationOrder(planetNames):
+        """Returns the list of planet names that need to be calculated
+        for the given planet names, including the constituents of the
+        custom planets, ordered such that every planet comes after all
+        the planets it is calculated from.  Each planet name is in the
+        list only once.
+
+        Raises:
+        ValueError if there is a circular dependency between the
+        custom planets.
+        """
+
+        # Return value.
+        rv = []
+
+        # Planet names already added to the return value.
+        addedPlanetNames = set()
+
+        # Planet names that are being added; used for detecting
+        # circular dependencies.
+        pendingPlanetNames = []
+
+        def addPlanetName(planetName):
+            if planetName in addedPlanetNames:
+                return
+            
+            if planetName in pendingPlanetNames:
+                cycleStr = " -> ".join(\
+                    pendingPlanetNames[pendingPlanetNames.index(planetName):] + \
+                    [planetName])
+                raise ValueError("Circular dependency between planets: " + \
+                                 cycleStr)
+
+            pendingPlanetNames.append(planetName)
+            for constituent in Ephemeris.getPlanetConstituents(planetName):
+                addPlanetName(constituent)
+            pendingPlanetNames.pop()
+
+            addedPlanetNames.add(planetName)
+            rv.append(planetName)
+
+        for planetName in planetNames:
+            addPlanetName(planetName)
+
+        return rv
+
+    def getPlanetaryInfo(self, planetName):
+        """Returns the PlanetaryInfo of the planet at the timestamp of
+        this evaluator, or None if the planet name is not supported.
+        """
+
+        if planetName in self.planetaryInfos:
+            return self.planetaryInfos[planetName]
+
+        # Calculate the planets it depends on first, then the planet.
+        for name in DerivedPlanetEvaluator.getEvaluationOrder([planetName]):
+            if name not in self.planetaryInfos:
+                self.planetaryInfos[name] = self.__evaluate(name)
+
+        return self.planetaryInfos[planetName]
+
+    def getPlanetaryInfos(self, planetNames):
+        """Returns a list of the PlanetaryInfo objects of the planets,
+        in the same order as 'planetNames'.  See getPlanetaryInfo().
+        """
+
+        return [self.getPlanetaryInfo(planetName) \
+                for planetName in planetNames]
+
+    def __evaluate(self, planetName):
+        """Calculates the PlanetaryInfo of a planet.  The constituents
+        of a custom planet must already be in self.planetaryInfos.
+        """
+
+        if self.log.isEnabledFor(logging.DEBUG) == True:
+            self.log.debug("Evaluating {} at {}".\
+                           format(planetName,
+                                  Ephemeris.datetimeToStr(self.dt)))
+
+        self.numEvaluations += 1
+        
+        constituents = Ephemeris.getPlanetConstituents(planetName)
+        
+        if len(constituents) == 0:
+            # Not a custom planet.
+            if Ephemeris.isHouseCuspPlanetName(planetName) or \
+               Ephemeris.isAscmcPlanetName(planetName):
+
+                if self.houseSnapshot == None:
+                    if self.context != None:
+                        self.houseSnapshot = \
+                            HouseSnapshot(self.dt,
+                                          self.houseSystem,
+                                          jd=self.jd,
+                                          context=self.context)
+                    else:
+                        self.houseSnapshot = \
+                            Ephemeris.getHouseSnapshot(self.dt,
+                                                       self.houseSystem)
+                    
+                return self.houseSnapshot.getPlanetaryInfo(planetName)
+            elif self.context != None:
+                planetId = Ephemeris.getPlanetIdForName(planetName)
+                if planetId == None:
+                    self.log.error("Unknown planetName: {}".\
+                                   format(planetName))
+                    return None
+                return LazyPlanetaryInfo(planetName,
+                                         planetId,
+                                         self.dt,
+                                         self.jd,
+                                         self.context)
+            else:
+                return Ephemeris.getPlanetaryInfo(planetName, self.dt)
+
+        planetaryInfos = [self.planetaryInfos[constituent] \
+                          for constituent in constituents]
+        
+        if None in planetaryInfos:
+            self.log.error("Could not calculate all the constituents " + \
+                           "of planet {}".format(planetName))
+            return None
+        
+        if planetName in Ephemeris.averagedPlanetConstituents:
+            return Ephemeris.createAveragedPlanetaryInfo(planetName,
+                                                         planetaryInfos)
+        elif planetName in Ephemeris.combinationPlanetConstituents:
+            return Ephemeris.createCombinationPlanetaryInfo(planetName,
+                                                            planetaryInfos)
+        else:
+            formula = Ephemeris.derivedPlanetFormulas[planetName][1]
+            return Ephemeris.createDerivedPlanetaryInfo(planetName,
+                                                        planetaryInfos,
+                                                        formula)
+
+
 ##############################################################################
 
 def testTimezoneSpeed():
@@ -6091,7 +7923,402 @@ def testTimezoneSpeed():
         print("  Execution {}: pytz.timezone() took: {} sec".\
               format(i, endTime - startTime))
 
+
+def testJulianDayConversionSpeed():
+    """Compares the speed and the results of datetimeToJulianDay() and
+    julianDayToDatetime() against doing the same conversions with
+    pytz's astimezone() and normalize() on every call.  
+    Run testTimezoneSpeed() first so the pytz.timezone() creation
+    time is not counted here.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    import time
+
+    eastern = pytz.timezone('US/Eastern')
+    
+    startDt = datetime.datetime(1950, 1, 1, 0, 0, tzinfo=pytz.utc)
+    startJd = Ephemeris.datetimeToJulianDay(startDt)
+    numValues = 100000
+
+    # Spread the Julian Days over about 100 years, so that both
+    # standard time and daylight savings time are used.
+    jds = [startJd + (i * 0.37) for i in range(numValues)]
+    dts = [Ephemeris.julianDayToDatetime(jd, eastern) for jd in jds]
+    
+    startTime = time.time()
+    for dt in dts:
+        dtUtc = pytz.utc.normalize(dt.astimezone(pytz.utc))
+        swe.utc_to_jd(dtUtc.year, dtUtc.month, dtUtc.day,
+                      dtUtc.hour, dtUtc.minute, dtUtc.second,
+                      swe.GREG_CAL)
+    endTime = time.time()
+    print("  datetime to jd, via pytz normalize: {} sec".\
+          format(endTime - startTime))
+    
+    startTime = time.time()
+    for dt in dts:
+        Ephemeris.datetimeToJulianDay(dt)
+    endTime = time.time()
+    print("  datetime to jd, via datetimeToJulianDay(): {} sec".\
+          format(endTime - startTime))
+    
+    startTime = time.time()
+    for jd in jds:
+        (year, month, day, hour, mins, secs) = swe.jdut1_to_utc(jd, 1)
+        secsTruncated = int(math.floor(secs))
+        usecs = int(round((secs - secsTruncated) * 1000000))
+        if usecs > 999999:
+            usecs = 999999
+        dtUtc = datetime.datetime(year, month, day, hour, mins, 
+                                  secsTruncated, usecs, pytz.utc)
+        eastern.normalize(dtUtc.astimezone(eastern))
+    endTime = time.time()
+    print("  jd to datetime, via pytz normalize: {} sec".\
+          format(endTime - startTime))
+    
+    startTime = time.time()
+    for jd in jds:
+        Ephemeris.julianDayToDatetime(jd, eastern)
+    endTime = time.time()
+    print("  jd to datetime, via julianDayToDatetime(): {} sec".\
+          format(endTime - startTime))
+
+    numMismatches = 0
+    for i in range(numValues):
+        dt = dts[i]
+        dtUtc = pytz.utc.normalize(dt.astimezone(pytz.utc))
+        jd = swe.utc_to_jd(dtUtc.year, dtUtc.month, dtUtc.day,
+                           dtUtc.hour, dtUtc.minute, dtUtc.second,
+                           swe.GREG_CAL)[1]
+        if jd != Ephemeris.datetimeToJulianDay(dt):
+            numMismatches += 1
+        
+        dtConverted = eastern.normalize(\
+            Ephemeris.julianDayToDatetime(jds[i]).astimezone(eastern))
+        if dtConverted != dt or dtConverted.tzinfo is not dt.tzinfo:
+            numMismatches += 1
+            
+    print("  Number of mismatches: {}".format(numMismatches))
+    
+
+def testLazyPlanetaryInfoLocation():
+    """Checks that the topocentric values of a LazyPlanetaryInfo are
+    for the geographic position set when it was created, even when
+    they are first accessed after the position was changed.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    dt = datetime.datetime(2010, 5, 5, 12, 0, tzinfo=pytz.utc)
+
+    (lon, lat, alt) = (Ephemeris.geoLongitudeDeg,
+                       Ephemeris.geoLatitudeDeg,
+                       Ephemeris.geoAltitudeMeters)
+
+    p = Ephemeris.getPlanetaryInfo("Moon", dt)
+
+    # Tokyo.
+    Ephemeris.setGeographicPosition(139.6917, 35.6895)
+    actual = p.topocentric['tropical']['longitude']
+    other = Ephemeris.getPlanetaryInfo("Moon", dt).\
+            topocentric['tropical']['longitude']
+
+    # Setting the position clears Ephemeris.cache, so this is a new
+    # calculation.
+    Ephemeris.setGeographicPosition(lon, lat, alt)
+    expected = dict(Ephemeris.getPlanetaryInfo("Moon", dt).\
+                    topocentric['tropical'])
+
+    print("  Moon topocentric longitude: {} (expected: {}, Tokyo: {})".\
+          format(actual, expected['longitude'], other))
+    print("  Matches: {}".format(actual == expected['longitude'] and
+                                 dict(p.topocentric['tropical']) == expected))
+
+def testDerivedPlanetEvaluator():
+    """Compares DerivedPlanetEvaluator against getPlanetaryInfo() for
+    all the supported planets, and tries out a custom planet added via
+    Ephemeris.registerDerivedPlanet().
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    import time
+
+    eastern = pytz.timezone('US/Eastern')
+    dt = datetime.datetime(1994, 10, 20, 3, 0, tzinfo=eastern)
+    planetNames = Ephemeris.getSupportedPlanetNamesList()
+
+    # Without the cache, so the planets are calculated every time.
+    Ephemeris.cache.setEnabled(False)
+    
+    startTime = time.time()
+    for i in range(10):
+        for planetName in planetNames:
+            Ephemeris.getPlanetaryInfo(planetName, dt)
+    endTime = time.time()
+    print("  getPlanetaryInfo() of {} planets, 10 times took: {} sec".\
+          format(len(planetNames), endTime - startTime))
+    
+    startTime = time.time()
+    for i in range(10):
+        evaluator = DerivedPlanetEvaluator(dt)
+        evaluator.getPlanetaryInfos(planetNames)
+    endTime = time.time()
+    print("  DerivedPlanetEvaluator of {} planets, 10 times took: {} sec".\
+          format(len(planetNames), endTime - startTime))
+    print("  Number of PlanetaryInfo evaluations: {}".\
+          format(evaluator.numEvaluations))
+
+    numMismatches = 0
+    for planetName in planetNames:
+        p1 = Ephemeris.getPlanetaryInfo(planetName, dt)
+        p2 = evaluator.getPlanetaryInfo(planetName)
+        for centricityType in ["geocentric", "topocentric", "heliocentric"]:
+            for zodiacType in ["tropical", "sidereal"]:
+                if dict(getattr(p1, centricityType)[zodiacType]) != \
+                   dict(getattr(p2, centricityType)[zodiacType]):
+                    numMismatches += 1
+    print("  Number of mismatches: {}".format(numMismatches))
+
+    Ephemeris.cache.setEnabled(True)
+
+    # Custom planet: midpoint of the Sun and the Moon.
+    def midpoint(fieldName, values):
+        if fieldName == "longitude":
+            diff = (values[1] - values[0]) % 360.0
+            return (values[0] + (diff / 2.0)) % 360.0
+        return (values[0] + values[1]) / 2.0
+    
+    Ephemeris.registerDerivedPlanet("SuMoMidpoint", ["Sun", "Moon"], midpoint)
+    
+    p = Ephemeris.getPlanetaryInfo("SuMoMidpoint", dt)
+    jd = Ephemeris.datetimeToJulianDay(dt)
+    print("  SuMoMidpoint geocentric tropical longitude: {}, {}".\
+          format(p.geocentric['tropical']['longitude'],
+                 Ephemeris.getLongitude("SuMoMidpoint", jd,
+                                        "geocentric", "tropical")))
+    
+    try:
+        Ephemeris.registerDerivedPlanet("SuMoMidpoint",
+                                        ["Sun", "SuMoMidpoint"],
+                                        midpoint)
+        print("  Circular dependency was not detected.")
+    except ValueError as e:
+        print("  Circular dependency detected: {}".format(e))
+
+    Ephemeris.unregisterDerivedPlanet("SuMoMidpoint")
+
+    
+def testCompactPlanetaryInfo():
+    """Compares CompactPlanetaryInfo values to the PlanetaryInfo values
+    of all the supported planets, and prints the memory used by each.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    import tracemalloc
+
+    eastern = pytz.timezone('US/Eastern')
+    dt = datetime.datetime(1994, 10, 20, 3, 0, tzinfo=eastern)
+
+    numMismatches = 0
+    for planetName in Ephemeris.getSupportedPlanetNamesList():
+        p1 = Ephemeris.getPlanetaryInfo(planetName, dt)
+        p2 = CompactPlanetaryInfo.fromPlanetaryInfo(p1)
+        for centricityType in CompactPlanetaryInfo.centricityTypes:
+            for zodiacType in CompactPlanetaryInfo.zodiacTypes:
+                if dict(getattr(p1, centricityType)[zodiacType]) != \
+                   dict(getattr(p2, centricityType)[zodiacType]):
+                    numMismatches += 1
+    print("  Number of mismatches: {}".format(numMismatches))
+
+    Ephemeris.cache.setEnabled(False)
+
+    numPlanetaryInfos = 1000
+    for compact in [False, True]:
+        tracemalloc.start()
+        planetaryInfos = []
+        for i in range(numPlanetaryInfos):
+            p = Ephemeris.getPlanetaryInfo("Mars",
+                                           dt + datetime.timedelta(days=i))
+            p = CompactPlanetaryInfo.fromPlanetaryInfo(p)
+            if not compact:
+                p = p.toPlanetaryInfo()
+            planetaryInfos.append(p)
+        (currentBytes, peakBytes) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("  {} {}: {} bytes each".\
+              format(numPlanetaryInfos,
+                     type(planetaryInfos[0]).__name__,
+                     int(currentBytes / numPlanetaryInfos)))
+
+    Ephemeris.cache.setEnabled(True)
+
+def testDebugLoggingModes():
+    """Times planet calculations in fast mode (debug logging
+    disabled), and with sampled debug logging.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    import time
+
+    dt = datetime.datetime(1994, 10, 20, 3, 0, tzinfo=pytz.utc)
+
+    Ephemeris.cache.setEnabled(False)
+    originalLevel = Ephemeris.log.level
+
+    for (level, sampleInterval) in [(logging.INFO, 1),
+                                    (logging.DEBUG, 1000),
+                                    (logging.DEBUG, 100)]:
+        Ephemeris.log.setLevel(level)
+        Ephemeris.configureDebugLogging(sampleInterval)
+
+        startTime = time.time()
+        for i in range(500):
+            p = Ephemeris.getPlanetaryInfo("Mars",
+                                           dt + datetime.timedelta(days=i))
+            p.geocentric['tropical']['longitude']
+            p.geocentric['sidereal']['declination']
+        endTime = time.time()
+        print("  debugEnabled={}, debugSampleInterval={}: {} sec".\
+              format(Ephemeris.debugEnabled,
+                     Ephemeris.debugSampleInterval,
+                     endTime - startTime))
+
+    Ephemeris.log.setLevel(originalLevel)
+    Ephemeris.configureDebugLogging(1)
+    Ephemeris.cache.setEnabled(True)
+
+def testGetPlanetFieldValue():
+    """Compares the values of getPlanetFieldValue() and
+    getPlanetPositionsBatch() to the ones in the PlanetaryInfo, for
+    all the fields of all the supported planets, and prints the
+    mismatches.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    startDt = datetime.datetime(1994, 10, 20, 3, 0, tzinfo=pytz.utc)
+    dts = [startDt + datetime.timedelta(days=i * 97.3) for i in range(5)]
+    jds = array.array('d', [Ephemeris.datetimeToJulianDay(dt) for dt in dts])
+
+    fieldNames = list(LazyCoordinateDict.fieldCoordinateSystems.keys())
+
+    numValues = 0
+    numMismatches = 0
+    for planetName in Ephemeris.getSupportedPlanetNamesList():
+        for centricityType in ["geocentric", "topocentric", "heliocentric"]:
+            for zodiacType in ["tropical", "sidereal"]:
+                batchValues = \
+                    Ephemeris.getPlanetPositionsBatch(planetName,
+                                                      jds,
+                                                      centricityType,
+                                                      zodiacType,
+                                                      fieldNames)
+
+                for i in range(len(jds)):
+                    p = Ephemeris.getPlanetaryInfo(planetName, dts[i])
+                    fields = getattr(p, centricityType)[zodiacType]
+
+                    for fieldName in fieldNames:
+                        value = Ephemeris.getPlanetFieldValue(planetName,
+                                                              p.julianDay,
+                                                              centricityType,
+                                                              zodiacType,
+                                                              fieldName)
+                        batchValue = batchValues[fieldName][i]
+
+                        numValues += 1
+                        if value != fields[fieldName] or \
+                           batchValue != fields[fieldName]:
+
+                            numMismatches += 1
+                            print("  Mismatch: {} {} {} {}: ".\
+                                  format(planetName, centricityType,
+                                         zodiacType, fieldName) + \
+                                  "PlanetaryInfo={}, ".\
+                                  format(fields[fieldName]) + \
+                                  "getPlanetFieldValue()={}, ".\
+                                  format(value) + \
+                                  "getPlanetPositionsBatch()={}".\
+                                  format(batchValue))
+
+    print("  Compared {} values, number of mismatches: {}".\
+          format(numValues, numMismatches))
+
+def testGetPlanetPositionsBatch():
+    """Compares the speed and the results of getPlanetPositionsBatch()
+    against calling getPlanetaryInfo() for each timestamp.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    import time
+
+    startDt = datetime.datetime(1950, 1, 1, 0, 0, tzinfo=pytz.utc)
+    startJd = Ephemeris.datetimeToJulianDay(startDt)
+    numDays = 365 * 50
+
+    jds = array.array('d', [startJd + i for i in range(numDays)])
     
+    for planetName in ["Moon", "Mercury", "H1", "MeanOfFive", "MoSu"]:
+        startTime = time.time()
+        values = Ephemeris.getPlanetPositionsBatch(planetName,
+                                                   jds,
+                                                   "geocentric",
+                                                   "tropical",
+                                                   ["longitude",
+                                                    "longitude_speed"])
+        endTime = time.time()
+        print("  {}: getPlanetPositionsBatch() for {} days took: {} sec".\
+              format(planetName, numDays, endTime - startTime))
+
+        startTime = time.time()
+        maxDiff = 0.0
+        for i in range(0, numDays, 100):
+            dt = Ephemeris.julianDayToDatetime(jds[i])
+            p = Ephemeris.getPlanetaryInfo(planetName, dt)
+            diff = abs(p.geocentric['tropical']['longitude'] - \
+                       values['longitude'][i])
+            maxDiff = max(maxDiff, diff)
+        endTime = time.time()
+        print("  {}: getPlanetaryInfo() for {} days took: {} sec".\
+              format(planetName, numDays // 100, endTime - startTime))
+        print("  {}: max longitude difference: {}".\
+              format(planetName, maxDiff))
+
+def testEphemerisCache():
+    """Prints the speed and the statistics of Ephemeris.cache when the
+    same timestamps are requested repeatedly, like when a chart is
+    redrawn.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    import time
+
+    startDt = datetime.datetime(1994, 10, 20, 0, 0, tzinfo=pytz.utc)
+    dts = [startDt + datetime.timedelta(hours=i) for i in range(200)]
+    planetNames = ["Sun", "Moon", "Mars", "H1", "MoSu", "MeanOfFive"]
+
+    Ephemeris.cache.clear()
+    Ephemeris.cache.resetStats()
+
+    for i in range(3):
+        startTime = time.time()
+        for dt in dts:
+            for planetName in planetNames:
+                p = Ephemeris.getPlanetaryInfo(planetName, dt)
+                longitude = p.geocentric['tropical']['longitude']
+                Ephemeris.getAscmc(dt)
+        endTime = time.time()
+        print("  Pass {} took: {} sec".format(i, endTime - startTime))
+
+    print("  Cache stats: {}".format(Ephemeris.cache.getStats()))
+
 def testGetPlanetaryInfos():
     print("Running " + inspect.stack()[0][3] + "()")
 
@@ -6286,6 +8513,21 @@ def testHouseCusps():
         print("    House {}:    {}".format(i, cusps['sidereal'][i]))
     
     
+def testHouseSnapshot():
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    eastern = pytz.timezone('US/Eastern')
+    now = datetime.datetime.now(eastern)
+
+    snapshot = Ephemeris.getHouseSnapshot(now,
+                                          Ephemeris.HouseSys['Porphyry'],
+                                          calculateSpeeds=True)
+    for p in snapshot.getPlanetaryInfos():
+        print("  {}: longitude={}, longitude_speed={}".\
+              format(p.name,
+                     p.geocentric['tropical']['longitude'],
+                     p.geocentric['tropical']['longitude_speed']))
+
 def testAscmc():
     print("Running " + inspect.stack()[0][3] + "()")
 
@@ -6358,6 +8600,60 @@ def testDatetimeJulianPrecisionLoss():
     print("    jd to UTC datetime (implicit) is: {}".format(dt))
 
 
+def getMinMaxPlanetFieldValues(planetName,
+                               centricityType,
+                               fieldName,
+                               start,
+                               end,
+                               increment,
+                               minValue=0,
+                               maxValue=0):
+    """Helper function for the testMinMax*() functions.  Returns the
+    min and max tropical values of a planet field, sampled every
+    'increment' from 'start' up to but not including 'end'.  The
+    values are calculated with Ephemeris.getPlanetPositionsBatch(), in
+    chunks of Julian Days.
+
+    Arguments:
+    planetName     - str holding the name of the planet.
+    centricityType - str value holding either "geocentric",
+                     "topocentric", or "heliocentric".
+    fieldName      - str holding the name of the field, e.g.
+                     'longitude_speed'.
+    start          - datetime.datetime of the first sample.
+    end            - datetime.datetime of the end of the samples.
+    increment      - datetime.timedelta between samples.
+    minValue       - float value for the initial min value.
+    maxValue       - float value for the initial max value.
+
+    Returns:
+    tuple of (minValue, maxValue).
+    """
+
+    # Number of Julian Days in each call to getPlanetPositionsBatch().
+    chunkSize = 100000
+
+    numSamples = -((start - end) // increment)
+    startJd = Ephemeris.datetimeToJulianDay(start)
+    incrementDays = increment.total_seconds() / 86400.0
+
+    for chunkStart in range(0, numSamples, chunkSize):
+        chunkEnd = min(chunkStart + chunkSize, numSamples)
+        jds = array.array('d', (startJd + i * incrementDays
+                                for i in range(chunkStart, chunkEnd)))
+
+        values = Ephemeris.getPlanetPositionsBatch(planetName,
+                                                   jds,
+                                                   centricityType,
+                                                   "tropical",
+                                                   [fieldName])[fieldName]
+
+        maxValue = max(maxValue, max(values))
+        minValue = min(minValue, min(values))
+
+    return (minValue, maxValue)
+
+
 def testMinMaxPlanetLongitudeSpeeds():
     print("Running " + inspect.stack()[0][3] + "()")
     
@@ -6374,28 +8670,15 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 40
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getMoonPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getMoonPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
@@ -6408,55 +8691,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getMercuryPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getMercuryPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
 
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getMercuryPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getMercuryPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -6469,55 +8726,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getVenusPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getVenusPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getVenusPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getVenusPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -6530,55 +8761,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getMarsPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getMarsPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getMarsPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getMarsPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -6591,55 +8796,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 120
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getJupiterPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getJupiterPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getJupiterPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getJupiterPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -6652,55 +8831,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 240
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getSaturnPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getSaturnPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getSaturnPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getSaturnPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -6713,55 +8866,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 240
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getUranusPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getUranusPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getUranusPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getUranusPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -6774,55 +8901,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 480
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getNeptunePlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getNeptunePlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getNeptunePlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getNeptunePlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -6835,55 +8936,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 840
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getPlutoPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getPlutoPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getPlutoPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getPlutoPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -6896,28 +8971,15 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getMeanNorthNodePlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getMeanNorthNodePlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
@@ -6930,28 +8992,15 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getTrueNorthNodePlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getTrueNorthNodePlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
@@ -6964,28 +9013,15 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getMeanLunarApogeePlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getMeanLunarApogeePlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
@@ -6998,28 +9034,15 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getOsculatingLunarApogeePlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getOsculatingLunarApogeePlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
@@ -7032,28 +9055,15 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getInterpolatedLunarApogeePlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getInterpolatedLunarApogeePlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
@@ -7066,28 +9076,15 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getInterpolatedLunarPerigeePlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getInterpolatedLunarPerigeePlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
@@ -7100,55 +9097,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getEarthPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getEarthPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getEarthPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getEarthPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -7161,55 +9132,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getChironPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getChironPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getChironPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getChironPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -7222,55 +9167,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getPholusPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getPholusPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getPholusPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getPholusPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -7283,55 +9202,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getCeresPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getCeresPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getCeresPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getCeresPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -7344,55 +9237,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getPallasPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getPallasPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getPallasPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getPallasPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -7405,55 +9272,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getJunoPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getJunoPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getJunoPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getJunoPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -7466,55 +9307,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getVestaPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getVestaPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
 
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getVestaPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getVestaPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -7528,55 +9343,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 3000
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getIsisPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getIsisPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
         
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getIsisPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getIsisPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -7590,55 +9379,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 3000
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getNibiruPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getNibiruPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
 
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getNibiruPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getNibiruPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -7652,55 +9415,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 400
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getMeanOfFivePlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getMeanOfFivePlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
 
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getMeanOfFivePlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getMeanOfFivePlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -7714,55 +9451,29 @@ def testMinMaxPlanetLongitudeSpeeds():
         years = 400
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getCycleOfEightPlanetaryInfo(curr)
-            if p.geocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.geocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.geocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.geocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new geocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new geocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getCycleOfEightPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: geocentric   maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: geocentric   minSpeed of {} is: {}".\
               format(p.name, minSpeed))
 
-        curr = start
         maxSpeed = 0
         minSpeed = 0
-        while curr < end:
-            newMaxSpeedFlag = 0
-            newMinSpeedFlag = 0
-            p = Ephemeris.getCycleOfEightPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['longitude_speed'] > maxSpeed:
-                maxSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMaxSpeedFlag = 1
-            if p.heliocentric['tropical']['longitude_speed'] < minSpeed:
-                minSpeed = p.heliocentric['tropical']['longitude_speed']
-                newMinSpeedFlag = 1
-            #if newMaxSpeedFlag == 1 or newMinSpeedFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxSpeedFlag == 1:
-            #        print("    new heliocentric maxSpeed of {} is: ".\
-            #              format(p.name) + str(maxSpeed))
-            #    if newMinSpeedFlag == 1:
-            #        print("    new heliocentric minSpeed of {} is: ".\
-            #              format(p.name) + str(minSpeed))
-            curr += increment
+        p = Ephemeris.getCycleOfEightPlanetaryInfo(start)
+        (minSpeed, maxSpeed) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "longitude_speed",
+                                       start, end, increment,
+                                       minSpeed, maxSpeed)
         print("    FINAL: heliocentric maxSpeed of {} is: {}".\
               format(p.name, maxSpeed))
         print("    FINAL: heliocentric minSpeed of {} is: {}".\
@@ -7785,28 +9496,15 @@ def testMinMaxPlanetLatitude():
         years = 30
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getMoonPlanetaryInfo(curr)
-            if p.geocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.geocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.geocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.geocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getMoonPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxGeocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minGeocentricLatitude of {} is: {}".\
@@ -7819,28 +9517,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getMercuryPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getMercuryPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -7853,28 +9538,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getVenusPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getVenusPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -7887,28 +9559,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getMarsPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getMarsPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -7922,28 +9581,15 @@ def testMinMaxPlanetLatitude():
         years = 120
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getJupiterPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getJupiterPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -7957,28 +9603,15 @@ def testMinMaxPlanetLatitude():
         years = 240
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getSaturnPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getSaturnPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -7992,28 +9625,15 @@ def testMinMaxPlanetLatitude():
         years = 240
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getUranusPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getUranusPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8027,28 +9647,15 @@ def testMinMaxPlanetLatitude():
         years = 480
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getNeptunePlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getNeptunePlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8062,28 +9669,15 @@ def testMinMaxPlanetLatitude():
         years = 840
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getPlutoPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getPlutoPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8097,28 +9691,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getMeanNorthNodePlanetaryInfo(curr)
-            if p.geocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.geocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.geocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.geocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getMeanNorthNodePlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxGeocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minGeocentricLatitude of {} is: {}".\
@@ -8131,28 +9712,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getTrueNorthNodePlanetaryInfo(curr)
-            if p.geocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.geocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.geocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.geocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getTrueNorthNodePlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxGeocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minGeocentricLatitude of {} is: {}".\
@@ -8165,28 +9733,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getMeanLunarApogeePlanetaryInfo(curr)
-            if p.geocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.geocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.geocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.geocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getMeanLunarApogeePlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxGeocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minGeocentricLatitude of {} is: {}".\
@@ -8199,28 +9754,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getOsculatingLunarApogeePlanetaryInfo(curr)
-            if p.geocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.geocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.geocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.geocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getOsculatingLunarApogeePlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxGeocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minGeocentricLatitude of {} is: {}".\
@@ -8233,28 +9775,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getInterpolatedLunarApogeePlanetaryInfo(curr)
-            if p.geocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.geocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.geocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.geocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getInterpolatedLunarApogeePlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxGeocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minGeocentricLatitude of {} is: {}".\
@@ -8267,28 +9796,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getInterpolatedLunarPerigeePlanetaryInfo(curr)
-            if p.geocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.geocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.geocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.geocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minGeocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getInterpolatedLunarPerigeePlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxGeocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minGeocentricLatitude of {} is: {}".\
@@ -8301,28 +9817,15 @@ def testMinMaxPlanetLatitude():
         years = 120
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getEarthPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getEarthPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8335,28 +9838,15 @@ def testMinMaxPlanetLatitude():
         years = 90
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getChironPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getChironPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8369,28 +9859,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getPholusPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getPholusPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8403,28 +9880,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getCeresPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getCeresPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8437,28 +9901,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getPallasPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getPallasPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8471,28 +9922,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getJunoPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getJunoPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8505,28 +9943,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getVestaPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getVestaPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8540,28 +9965,15 @@ def testMinMaxPlanetLatitude():
         years = 3000
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getIsisPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getIsisPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8575,28 +9987,15 @@ def testMinMaxPlanetLatitude():
         years = 3000
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getNibiruPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getNibiruPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8609,28 +10008,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getMeanOfFivePlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getMeanOfFivePlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8643,28 +10029,15 @@ def testMinMaxPlanetLatitude():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxLatitude = 0
         minLatitude = 0
-        while curr < end:
-            newMaxLatitudeFlag = 0
-            newMinLatitudeFlag = 0
-            p = Ephemeris.getCycleOfEightPlanetaryInfo(curr)
-            if p.heliocentric['tropical']['latitude'] > maxLatitude:
-                maxLatitude = p.heliocentric['tropical']['latitude']
-                newMaxLatitudeFlag = 1
-            if p.heliocentric['tropical']['latitude'] < minLatitude:
-                minLatitude = p.heliocentric['tropical']['latitude']
-                newMinLatitudeFlag = 1
-            #if newMaxLatitudeFlag == 1 or newMinLatitudeFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxLatitudeFlag == 1:
-            #        print("    new maxHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(maxLatitude))
-            #    if newMinLatitudeFlag == 1:
-            #        print("    new minHeliocentricLatitude of {} is: ".\
-            #              format(p.name) + str(minLatitude))
-            curr += increment
+        p = Ephemeris.getCycleOfEightPlanetaryInfo(start)
+        (minLatitude, maxLatitude) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "heliocentric",
+                                       "latitude",
+                                       start, end, increment,
+                                       minLatitude, maxLatitude)
         print("    FINAL: maxHeliocentricLatitude of {} is: {}".\
               format(p.name, maxLatitude))
         print("    FINAL: minHeliocentricLatitude of {} is: {}".\
@@ -8687,28 +10060,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getMoonPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getMoonPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -8721,28 +10081,15 @@ def testMinMaxPlanetDeclination():
         years = 120
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getMercuryPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getMercuryPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -8755,28 +10102,15 @@ def testMinMaxPlanetDeclination():
         years = 120
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getVenusPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getVenusPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -8789,28 +10123,15 @@ def testMinMaxPlanetDeclination():
         years = 120
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getMarsPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getMarsPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -8823,28 +10144,15 @@ def testMinMaxPlanetDeclination():
         years = 120
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getJupiterPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getJupiterPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -8857,28 +10165,15 @@ def testMinMaxPlanetDeclination():
         years = 240
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getSaturnPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getSaturnPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -8891,28 +10186,15 @@ def testMinMaxPlanetDeclination():
         years = 240
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getUranusPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getUranusPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -8925,28 +10207,15 @@ def testMinMaxPlanetDeclination():
         years = 480
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getNeptunePlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getNeptunePlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -8959,28 +10228,15 @@ def testMinMaxPlanetDeclination():
         years = 840
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getPlutoPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getPlutoPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -8993,28 +10249,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getMeanNorthNodePlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getMeanNorthNodePlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9027,28 +10270,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getTrueNorthNodePlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getTrueNorthNodePlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9061,28 +10291,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getMeanLunarApogeePlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getMeanLunarApogeePlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9095,28 +10312,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getOsculatingLunarApogeePlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getOsculatingLunarApogeePlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9129,28 +10333,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getInterpolatedLunarApogeePlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getInterpolatedLunarApogeePlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9163,28 +10354,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getInterpolatedLunarPerigeePlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getInterpolatedLunarPerigeePlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9197,28 +10375,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getEarthPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getEarthPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9231,28 +10396,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getChironPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getChironPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9265,28 +10417,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getPholusPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getPholusPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9299,28 +10438,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getCeresPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getCeresPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9333,28 +10459,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getPallasPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getPallasPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9367,28 +10480,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getJunoPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getJunoPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9401,28 +10501,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getVestaPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getVestaPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9436,28 +10523,15 @@ def testMinMaxPlanetDeclination():
         years = 3000
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getIsisPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getIsisPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9471,28 +10545,15 @@ def testMinMaxPlanetDeclination():
         years = 3000
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getNibiruPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getNibiruPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9505,28 +10566,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getMeanOfFivePlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getMeanOfFivePlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9539,28 +10587,15 @@ def testMinMaxPlanetDeclination():
         years = 60
         finishDelta = datetime.timedelta(days=years*365)
         end = start + finishDelta
-        curr = start
         maxDeclination = 0
         minDeclination = 0
-        while curr < end:
-            newMaxDeclinationFlag = 0
-            newMinDeclinationFlag = 0
-            p = Ephemeris.getCycleOfEightPlanetaryInfo(curr)
-            if p.geocentric['tropical']['declination'] > maxDeclination:
-                maxDeclination = p.geocentric['tropical']['declination']
-                newMaxDeclinationFlag = 1
-            if p.geocentric['tropical']['declination'] < minDeclination:
-                minDeclination = p.geocentric['tropical']['declination']
-                newMinDeclinationFlag = 1
-            #if newMaxDeclinationFlag == 1 or newMinDeclinationFlag == 1:
-            #    print("    curr is: {}".format(curr))
-            #    if newMaxDeclinationFlag == 1:
-            #        print("    new maxDeclination of {} is: ".format(p.name) +
-            #              str(maxDeclination))
-            #    if newMinDeclinationFlag == 1:
-            #        print("    new minDeclination of {} is: ".format(p.name) +
-            #              str(minDeclination))
-            curr += increment
+        p = Ephemeris.getCycleOfEightPlanetaryInfo(start)
+        (minDeclination, maxDeclination) = \
+            getMinMaxPlanetFieldValues(p.name,
+                                       "geocentric",
+                                       "declination",
+                                       start, end, increment,
+                                       minDeclination, maxDeclination)
         print("    FINAL: maxDeclination of {} is: {}".\
               format(p.name, maxDeclination))
         print("    FINAL: minDeclination of {} is: {}".\
@@ -9606,11 +10641,22 @@ if __name__=="__main__":
 
     # Different tests that can be run:
     testTimezoneSpeed()
+
+    #testJulianDayConversionSpeed()
     #testGetPlanetaryInfos()
     #testHouseCusps()
     #testAscmc()
+    #testHouseSnapshot()
     #testPlanetTopicalLongitude()
     #testDatetimeJulianPrecisionLoss()
+    #testGetPlanetFieldValue()
+    #testGetPlanetPositionsBatch()
+
+    #testLazyPlanetaryInfoLocation()
+    #testDerivedPlanetEvaluator()
+    #testCompactPlanetaryInfo()
+    #testDebugLoggingModes()
+    #testEphemerisCache()
 
     # These tests will take a long time, so I've commented it out.
     #testMinMaxPlanetLongitudeSpeeds()
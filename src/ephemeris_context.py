@@ -0,0 +1,687 @@
+
+# For directory access.
+import os
+import sys
+import inspect
+
+# For timestamps.
+import datetime
+import pytz
+
+# For logging.
+import logging
+import logging.config
+
+# For the Swiss Ephemeris calls.
+import swisseph as swe
+
+# Import the Ephemeris classes.
+from ephemeris import Ephemeris
+from ephemeris import LazyCoordinateDict
+from ephemeris import DerivedPlanetEvaluator
+
+##############################################################################
+
+class EphemerisContext:
+    """Immutable set of the settings used for ephemeris calculations:
+    geographic location, centricity type, zodiac type, house system,
+    and Swiss Ephemeris flags.
+
+    The static Ephemeris class keeps these settings in global state
+    (Ephemeris.iflag, and the topo position and sidereal mode inside
+    the Swiss Ephemeris library), and every calculation modifies the
+    flags before calling into the library.  This means that two
+    threads that calculate with different settings (e.g. the lookback
+    calculations in PriceBarChartWidget, the astrology chart widgets,
+    and background workers) can corrupt each other's results, and so
+    those calculations had to be done in separate processes.
+
+    An EphemerisContext never modifies Ephemeris.iflag.  It computes
+    the flags for each call from its own settings, and the Swiss
+    Ephemeris calls that depend on library state (set_topo() and
+    set_sid_mode()) are serialized with Ephemeris.sweLock, and the
+    library state is restored before the lock is released.  The
+    Ephemeris holds the same lock for its own calls that depend on
+    that state.  Each thread can therefore use its own
+    EphemerisContext (or share one) within the same process.
+
+    Notes:
+
+      - Ephemeris.initialize() must still be called once, before any
+        calculations, to set the ephemeris data path.
+
+      - The Ephemeris static methods (e.g. Ephemeris.getPlanetaryInfo())
+        still use the global state, so they should only be used from
+        one thread.  Calculations done through a context do not use
+        Ephemeris.cache or the EphemerisStore, since those hold values
+        for the global settings.
+
+      - A context passes the same arguments to swe.set_topo() as
+        Ephemeris.setGeographicPosition() does for the same location
+        (see Ephemeris.getSweTopoArgs()), so topocentric values are
+        the same with and without a context.
+    """
+
+    # Logger object for this class.
+    log = logging.getLogger("ephemeris_context.EphemerisContext")
+
+    # Sidereal mode set by Ephemeris.setSiderealZodiac().  This is
+    # what the Swiss Ephemeris library is left with after a context
+    # with another sidereal mode does a calculation.
+    defaultSiderealMode = swe.SIDM_LAHIRI
+
+    # Base flags set by Ephemeris.initialize(): Swiss Ephemeris data
+    # files, speeds, and true planetary positions.
+    defaultFlags = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_TRUEPOS
+
+    # Names of the ascmc planets, in the order of the ascmc tuple
+    # returned by the Swiss Ephemeris.
+    ascmcPlanetNames = ["Ascendant",
+                        "MC",
+                        "ARMC",
+                        "Vertex",
+                        "EquatorialAscendant",
+                        "CoAscendant1",
+                        "CoAscendant2",
+                        "PolarAscendant"]
+
+    def __init__(self,
+                 geoLongitudeDeg,
+                 geoLatitudeDeg,
+                 altitudeMeters=0.0,
+                 centricityType="geocentric",
+                 zodiacType="tropical",
+                 houseSystem=Ephemeris.HouseSys['Porphyry'],
+                 flags=None,
+                 siderealMode=swe.SIDM_LAHIRI):
+        """Initializes the context.
+
+        Arguments:
+        geoLongitudeDeg - float value for the geographic longitude,
+                          in degrees.  West is negative.
+        geoLatitudeDeg  - float value for the geographic latitude,
+                          in degrees.  South is negative.
+        altitudeMeters  - float value for the altitude, in meters.
+        centricityType  - str value holding either "geocentric",
+                          "topocentric", or "heliocentric".  This is
+                          the default for calls that do not specify it.
+        zodiacType      - str value holding either "tropical" or
+                          "sidereal".  This is the default for calls
+                          that do not specify it.
+        houseSystem     - bytes value for the house system, as in
+                          Ephemeris.HouseSys.
+        flags           - int value for the base Swiss Ephemeris flags.
+                          The centricity, zodiac and coordinate system
+                          flags are added to these for each call.
+                          If None, EphemerisContext.defaultFlags is
+                          used, which matches Ephemeris.initialize().
+        siderealMode    - int value for the ayanamsa used for sidereal
+                          calculations, e.g. swe.SIDM_LAHIRI.
+        """
+
+        if centricityType not in ["geocentric", "topocentric",
+                                  "heliocentric"]:
+            raise ValueError("Invalid centricityType: {}".\
+                             format(centricityType))
+        if zodiacType not in ["tropical", "sidereal"]:
+            raise ValueError("Invalid zodiacType: {}".format(zodiacType))
+        if flags == None:
+            flags = EphemerisContext.defaultFlags
+
+        self.geoLongitudeDeg = float(geoLongitudeDeg)
+        self.geoLatitudeDeg = float(geoLatitudeDeg)
+        self.altitudeMeters = float(altitudeMeters)
+        self.centricityType = centricityType
+        self.zodiacType = zodiacType
+        self.houseSystem = houseSystem
+        self.flags = flags
+        self.siderealMode = siderealMode
+
+        # Arguments to swe.set_topo() for topocentric calculations.
+        self.sweTopoArgs = Ephemeris.getSweTopoArgs(self.geoLongitudeDeg,
+                                                    self.geoLatitudeDeg,
+                                                    self.altitudeMeters)
+
+    def __repr__(self):
+        return "EphemerisContext(" + \
+               "geoLongitudeDeg={}, ".format(self.geoLongitudeDeg) + \
+               "geoLatitudeDeg={}, ".format(self.geoLatitudeDeg) + \
+               "altitudeMeters={}, ".format(self.altitudeMeters) + \
+               "centricityType={}, ".format(self.centricityType) + \
+               "zodiacType={}, ".format(self.zodiacType) + \
+               "houseSystem={}, ".format(self.houseSystem) + \
+               "flags={}, ".format(self.flags) + \
+               "siderealMode={})".format(self.siderealMode)
+
+    @staticmethod
+    def fromEphemeris(centricityType="geocentric", zodiacType="tropical"):
+        """Returns a new EphemerisContext for the geographic position
+        currently set in the Ephemeris via setGeographicPosition().
+        """
+
+        return EphemerisContext(Ephemeris.geoLongitudeDeg,
+                                Ephemeris.geoLatitudeDeg,
+                                Ephemeris.geoAltitudeMeters,
+                                centricityType,
+                                zodiacType)
+
+    def replace(self, **kwargs):
+        """Returns a new EphemerisContext with the same settings as
+        this one, except for the ones given as keyword arguments
+        (e.g. zodiacType="sidereal").
+        """
+
+        settings = {"geoLongitudeDeg" : self.geoLongitudeDeg,
+                    "geoLatitudeDeg"  : self.geoLatitudeDeg,
+                    "altitudeMeters"  : self.altitudeMeters,
+                    "centricityType"  : self.centricityType,
+                    "zodiacType"      : self.zodiacType,
+                    "houseSystem"     : self.houseSystem,
+                    "flags"           : self.flags,
+                    "siderealMode"    : self.siderealMode}
+
+        for key in kwargs.keys():
+            if key not in settings:
+                raise TypeError("Invalid EphemerisContext setting: {}".\
+                                format(key))
+        settings.update(kwargs)
+
+        return EphemerisContext(**settings)
+
+    def getFlag(self,
+                centricityType=None,
+                zodiacType=None,
+                coordinateSystemType="ecliptical"):
+        """Returns the Swiss Ephemeris flag for a calculation with the
+        given settings.  Settings that are None are taken from this
+        context.
+
+        Arguments:
+        centricityType       - str value holding either "geocentric",
+                               "topocentric", or "heliocentric".
+        zodiacType           - str value holding either "tropical" or
+                               "sidereal".
+        coordinateSystemType - str value holding either "ecliptical",
+                               "equatorial", or "rectangular".
+
+        Returns:
+        int value for the flag.
+        """
+
+        if centricityType == None:
+            centricityType = self.centricityType
+        if zodiacType == None:
+            zodiacType = self.zodiacType
+
+        flag = self.flags & ~(swe.FLG_HELCTR | swe.FLG_TOPOCTR |
+                              swe.FLG_SIDEREAL | swe.FLG_EQUATORIAL |
+                              swe.FLG_XYZ | swe.FLG_RADIANS)
+
+        if centricityType == "geocentric":
+            pass
+        elif centricityType == "topocentric":
+            flag |= swe.FLG_TOPOCTR
+        elif centricityType == "heliocentric":
+            flag |= swe.FLG_HELCTR
+        else:
+            raise ValueError("Invalid centricityType: {}".\
+                             format(centricityType))
+
+        if zodiacType == "tropical":
+            pass
+        elif zodiacType == "sidereal":
+            flag |= swe.FLG_SIDEREAL
+        else:
+            raise ValueError("Invalid zodiacType: {}".format(zodiacType))
+
+        if coordinateSystemType == "ecliptical":
+            pass
+        elif coordinateSystemType == "equatorial":
+            flag |= swe.FLG_EQUATORIAL
+        elif coordinateSystemType == "rectangular":
+            flag |= swe.FLG_XYZ
+        else:
+            raise ValueError("Invalid coordinateSystemType: {}".\
+                             format(coordinateSystemType))
+
+        return flag
+
+    def calcPlanetCoordinates(self,
+                              jd,
+                              planetId,
+                              centricityType=None,
+                              zodiacType=None,
+                              coordinateSystemType="ecliptical"):
+        """Calls swe.calc_ut() for the planet with the settings of this
+        context.  This is the thread-safe equivalent of
+        Ephemeris.calcPlanetCoordinates().
+
+        Arguments:
+        jd                   - Float value for the Julian Day, UT.
+        planetId             - Integer value for the planet to do the
+                               calculation for.
+        centricityType       - str value holding either "geocentric",
+                               "topocentric", or "heliocentric".
+                               If None, the context's value is used.
+        zodiacType           - str value holding either "tropical" or
+                               "sidereal".  If None, the context's
+                               value is used.
+        coordinateSystemType - str value holding either "ecliptical",
+                               "equatorial", or "rectangular".
+
+        Returns:
+        Tuple of 6 floats, as returned by calc_ut().
+        """
+
+        if centricityType == None:
+            centricityType = self.centricityType
+        if zodiacType == None:
+            zodiacType = self.zodiacType
+
+        flag = self.getFlag(centricityType, zodiacType, coordinateSystemType)
+
+        if self.log.isEnabledFor(logging.DEBUG) == True:
+            self.log.debug("calcPlanetCoordinates(jd={}, planetId={}, ".\
+                           format(jd, planetId) + \
+                           "flag={}) for {}".format(flag, self))
+
+        isTopocentric = (centricityType == "topocentric")
+        isSidereal = (zodiacType == "sidereal")
+        isOtherSiderealMode = \
+            (isSidereal and
+             self.siderealMode != EphemerisContext.defaultSiderealMode)
+
+        with Ephemeris.sweLock:
+            if isTopocentric:
+                swe.set_topo(*self.sweTopoArgs)
+            if isSidereal:
+                # The mode is only passed to the library if it
+                # differs from the one currently set.
+                Ephemeris.setSweSiderealMode(self.siderealMode)
+
+            try:
+                result = swe.calc_ut(jd, planetId, flag)
+            finally:
+                # Restore the library state used by the Ephemeris.
+                if isTopocentric:
+                    swe.set_topo(*Ephemeris.sweTopoArgs)
+                if isOtherSiderealMode:
+                    Ephemeris.setSweSiderealMode(\
+                        EphemerisContext.defaultSiderealMode)
+
+        return result
+
+    def calculateHouses(self, jd, houseSystem=None, zodiacType=None):
+        """Calls swe.houses_ex() for the location of this context.
+
+        Arguments:
+        jd          - Float value for the Julian Day, UT.
+        houseSystem - bytes value for the house system.  If None, the
+                      context's value is used.
+        zodiacType  - str value holding either "tropical" or
+                      "sidereal".  If None, the context's value is used.
+
+        Returns:
+        Tuple of (cusps, ascmc), as returned by Ephemeris.swe_houses_ex().
+        """
+
+        if houseSystem == None:
+            houseSystem = self.houseSystem
+        if zodiacType == None:
+            zodiacType = self.zodiacType
+
+        flag = self.getFlag("geocentric", zodiacType, "ecliptical")
+
+        isSidereal = (zodiacType == "sidereal")
+        isOtherSiderealMode = \
+            (isSidereal and
+             self.siderealMode != EphemerisContext.defaultSiderealMode)
+
+        with Ephemeris.sweLock:
+            if isSidereal:
+                Ephemeris.setSweSiderealMode(self.siderealMode)
+
+            try:
+                result = swe.houses_ex(jd,
+                                       self.geoLatitudeDeg,
+                                       self.geoLongitudeDeg,
+                                       houseSystem,
+                                       flag)
+            finally:
+                if isOtherSiderealMode:
+                    Ephemeris.setSweSiderealMode(\
+                        EphemerisContext.defaultSiderealMode)
+
+        return result
+
+    def getPlanetFieldValue(self,
+                            planetName,
+                            jd,
+                            fieldName,
+                            centricityType=None,
+                            zodiacType=None):
+        """Returns a single field value of a planet at the given
+        Julian Day, calculated with the settings of this context.
+        This is the thread-safe equivalent of
+        Ephemeris.getPlanetFieldValue(), except that the house system
+        of the context is used for the house cusps and ascmc planets.
+
+        Arguments:
+        planetName     - str holding the name of the planet.
+        jd             - float value for the Julian Day, UT.
+        fieldName      - str holding the name of the field, e.g.
+                         'longitude'.
+        centricityType - str value holding either "geocentric",
+                         "topocentric", or "heliocentric".  If None,
+                         the context's value is used.
+        zodiacType     - str value holding either "tropical" or
+                         "sidereal".  If None, the context's value is
+                         used.
+
+        Returns:
+        float value for the field.  If the planet name is not supported,
+        then None is returned.
+        """
+
+        if fieldName not in LazyCoordinateDict.fieldCoordinateSystems:
+            raise ValueError("Invalid fieldName: {}".format(fieldName))
+
+        if centricityType == None:
+            centricityType = self.centricityType
+        if zodiacType == None:
+            zodiacType = self.zodiacType
+
+        planetId = Ephemeris.getPlanetIdForName(planetName)
+
+        if planetId != None:
+            coordinateSystemType = \
+                LazyCoordinateDict.fieldCoordinateSystems[fieldName]
+            values = self.calcPlanetCoordinates(jd,
+                                                planetId,
+                                                centricityType,
+                                                zodiacType,
+                                                coordinateSystemType)
+            return values[LazyCoordinateDict.fieldIndexes[fieldName]]
+
+        elif Ephemeris.isHouseCuspPlanetName(planetName) or \
+             planetName in EphemerisContext.ascmcPlanetNames:
+
+            # House cusps and ascmc planets only have values for
+            # geocentric longitude and longitude_speed.  Everything
+            # else is 0.0.
+            if centricityType != "geocentric":
+                return 0.0
+            elif fieldName == "longitude_speed":
+                return 360.0
+            elif fieldName != "longitude":
+                return 0.0
+
+            (cusps, ascmc) = self.calculateHouses(jd, zodiacType=zodiacType)
+
+            if Ephemeris.isHouseCuspPlanetName(planetName):
+                houseNumber = int(planetName[1:])
+                if houseNumber < 1 or houseNumber > 12:
+                    self.log.error("Unknown planetName given to " + \
+                        "getPlanetFieldValue(): {}".format(planetName))
+                    return None
+                return cusps[houseNumber - 1]
+            else:
+                return ascmc[EphemerisContext.ascmcPlanetNames.\
+                             index(planetName)]
+
+        else:
+            constituents = Ephemeris.getPlanetConstituents(planetName)
+            if len(constituents) == 0:
+                self.log.error("Unknown planetName given to " + \
+                               "getPlanetFieldValue(): {}".\
+                               format(planetName))
+                return None
+
+            if planetName in Ephemeris.averagedPlanetConstituents:
+                formula = "average"
+            elif planetName in Ephemeris.combinationPlanetConstituents:
+                formula = "combination"
+            else:
+                (constituents, formula) = \
+                    Ephemeris.derivedPlanetFormulas[planetName]
+
+            values = []
+            for constituent in constituents:
+                values.append(self.getPlanetFieldValue(constituent,
+                                                       jd,
+                                                       fieldName,
+                                                       centricityType,
+                                                       zodiacType))
+
+            return Ephemeris.applyDerivedPlanetFormula(formula,
+                                                       fieldName,
+                                                       values)
+
+    def getLongitudeAndSpeed(self,
+                             planetName,
+                             jd,
+                             centricityType=None,
+                             zodiacType=None):
+        """Returns the longitude and the longitude speed of a planet at
+        the given Julian Day, calculated with the settings of this
+        context.  This is the thread-safe equivalent of
+        Ephemeris.getLongitudeAndSpeed().  The speed is None for
+        house cusps, ascmc planets, and custom planets calculated
+        from them.
+
+        See getPlanetFieldValue() for details about the arguments.
+
+        Returns:
+        tuple (longitude, longitudeSpeed).
+        """
+
+        if centricityType == None:
+            centricityType = self.centricityType
+        if zodiacType == None:
+            zodiacType = self.zodiacType
+
+        planetId = Ephemeris.getPlanetIdForName(planetName)
+
+        if planetId != None:
+            values = self.calcPlanetCoordinates(jd,
+                                                planetId,
+                                                centricityType,
+                                                zodiacType,
+                                                "ecliptical")
+            return (values[0], values[3])
+
+        constituents = Ephemeris.getPlanetConstituents(planetName)
+
+        if len(constituents) == 0:
+            longitude = self.getPlanetFieldValue(planetName,
+                                                 jd,
+                                                 "longitude",
+                                                 centricityType,
+                                                 zodiacType)
+            return (longitude, None)
+
+        if planetName in Ephemeris.averagedPlanetConstituents:
+            formula = "average"
+        elif planetName in Ephemeris.combinationPlanetConstituents:
+            formula = "combination"
+        else:
+            (constituents, formula) = \
+                Ephemeris.derivedPlanetFormulas[planetName]
+
+        longitudes = []
+        longitudeSpeeds = []
+        for constituent in constituents:
+            (longitude, longitudeSpeed) = \
+                self.getLongitudeAndSpeed(constituent,
+                                          jd,
+                                          centricityType,
+                                          zodiacType)
+            longitudes.append(longitude)
+            longitudeSpeeds.append(longitudeSpeed)
+
+        longitude = Ephemeris.applyDerivedPlanetFormula(formula,
+                                                        "longitude",
+                                                        longitudes)
+        if None in longitudeSpeeds:
+            longitudeSpeed = None
+        else:
+            longitudeSpeed = \
+                Ephemeris.applyDerivedPlanetFormula(formula,
+                                                    "longitude_speed",
+                                                    longitudeSpeeds)
+
+        return (longitude, longitudeSpeed)
+
+    def getPlanetaryInfo(self, planetName, dt, jd=None):
+        """Returns a PlanetaryInfo for the planet at the given
+        timestamp, calculated with the settings of this context.
+        The values are calculated when they are first accessed.
+
+        Arguments:
+        planetName - str holding the name of the planet.
+        dt         - datetime.datetime object with a pytz tzinfo.
+        jd         - float value for the Julian Day of 'dt', if it is
+                     already known.
+
+        Returns:
+        PlanetaryInfo object, or None if the planet name is not
+        supported.
+        """
+
+        evaluator = DerivedPlanetEvaluator(dt, self.houseSystem, jd, self)
+
+        return evaluator.getPlanetaryInfo(planetName)
+
+    def getPlanetaryInfos(self, planetNames, dt, jd=None):
+        """Returns a list of PlanetaryInfo objects for the given planets
+        at the given timestamp, calculated with the settings of this
+        context, in the same order as 'planetNames'.
+
+        Arguments:
+        planetNames - list of str holding the names of the planets.
+        dt          - datetime.datetime object with a pytz tzinfo.
+        jd          - float value for the Julian Day of 'dt', if it is
+                      already known.
+
+        Returns:
+        list of PlanetaryInfo objects.  The items for planet names
+        that are not supported are None.
+        """
+
+        evaluator = DerivedPlanetEvaluator(dt, self.houseSystem, jd, self)
+
+        return evaluator.getPlanetaryInfos(planetNames)
+
+##############################################################################
+
+def testEphemerisContext():
+    """Calculates planet values with EphemerisContext objects from
+    several threads at once, and compares them to the values
+    calculated sequentially with the Ephemeris.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    import concurrent.futures
+
+    planetNames = ["Sun", "Moon", "Mars", "Jupiter", "Saturn", "H1",
+                   "Ascendant", "MoSu", "JuSa", "MeanOfFive"]
+    fieldNames = ["longitude", "latitude", "declination", "longitude_speed"]
+
+    startJd = Ephemeris.datetimeToJulianDay(\
+        datetime.datetime(1990, 1, 1, tzinfo=pytz.utc))
+    jds = [startJd + i * 0.73 for i in range(2000)]
+
+    # Expected values calculated with the global Ephemeris state.
+    expected = {}
+    for (centricityType, zodiacType) in [("geocentric", "tropical"),
+                                         ("geocentric", "sidereal"),
+                                         ("topocentric", "tropical")]:
+        for jd in jds:
+            for planetName in planetNames:
+                for fieldName in fieldNames:
+                    key = (centricityType, zodiacType, jd, planetName,
+                           fieldName)
+                    expected[key] = \
+                        Ephemeris.getPlanetFieldValue(planetName,
+                                                      jd,
+                                                      centricityType,
+                                                      zodiacType,
+                                                      fieldName)
+
+    def calculate(context, jdsToCalculate):
+        results = {}
+        for jd in jdsToCalculate:
+            for planetName in planetNames:
+                for fieldName in fieldNames:
+                    key = (context.centricityType, context.zodiacType,
+                           jd, planetName, fieldName)
+                    results[key] = context.getPlanetFieldValue(planetName,
+                                                               jd,
+                                                               fieldName)
+        return results
+
+    tropicalContext = EphemerisContext.fromEphemeris()
+    siderealContext = tropicalContext.replace(zodiacType="sidereal")
+    topocentricContext = tropicalContext.replace(centricityType="topocentric")
+
+    numThreads = 4
+    actual = {}
+    with concurrent.futures.ThreadPoolExecutor(numThreads) as executor:
+        futures = []
+        for i in range(numThreads):
+            jdsToCalculate = jds[i::numThreads]
+            futures.append(executor.submit(calculate, tropicalContext,
+                                           jdsToCalculate))
+            futures.append(executor.submit(calculate, siderealContext,
+                                           jdsToCalculate))
+            # Topocentric calculations change the Swiss Ephemeris
+            # topo position while the other threads are running.
+            futures.append(executor.submit(calculate, topocentricContext,
+                                           jdsToCalculate))
+        for future in futures:
+            actual.update(future.result())
+
+    numMismatches = 0
+    for key, value in expected.items():
+        if actual.get(key) != value:
+            numMismatches += 1
+    print("  Compared {} values, number of mismatches: {}".\
+          format(len(expected), numMismatches))
+
+    dt = datetime.datetime(2012, 6, 1, 12, 0, tzinfo=pytz.utc)
+    p1 = tropicalContext.getPlanetaryInfo("JuSa", dt)
+    p2 = Ephemeris.getPlanetaryInfo("JuSa", dt)
+    print("  JuSa geocentric tropical longitude: {} (Ephemeris: {})".\
+          format(p1.geocentric['tropical']['longitude'],
+                 p2.geocentric['tropical']['longitude']))
+
+##############################################################################
+
+# For debugging the module during development.
+if __name__=="__main__":
+    # Initialize logging.
+    LOG_CONFIG_FILE = os.path.join(sys.path[0], "../conf/logging.conf")
+    logging.config.fileConfig(LOG_CONFIG_FILE)
+    #logging.disable(logging.CRITICAL)
+
+    # Initialize the Ephemeris (required).
+    Ephemeris.initialize()
+
+    # New York City:
+    lon = -74.0064
+    lat = 40.7142
+
+    # Set a default location (required).
+    Ephemeris.setGeographicPosition(lon, lat)
+
+    testEphemerisContext()
+
+    # Close the Ephemeris so it can do necessary cleanups.
+    Ephemeris.closeEphemeris()
+
+    # Quit.
+    print("Exiting.")
+    sys.exit()
+
+##############################################################################
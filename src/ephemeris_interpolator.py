@@ -0,0 +1,516 @@
+
+# For directory access.
+import inspect
+
+# For math.cos(), math.floor(), etc.
+import math
+
+# For bisect.bisect_right().
+import bisect
+
+# For logging.
+import logging
+import logging.config
+
+# Import the Ephemeris classes.
+from ephemeris import Ephemeris
+
+##############################################################################
+
+class EphemerisInterpolator:
+    """Answers planet longitude, latitude and declination queries by
+    evaluating piecewise Chebyshev polynomials, instead of calling the
+    Swiss Ephemeris for every query.
+
+    The polynomial coefficients are calculated on demand, one time
+    segment at a time, for each (planet name, centricity type,
+    zodiac type, field name) combination that is queried.  Each
+    segment is verified against the Swiss Ephemeris at points between
+    the fitting nodes, and it is split in half until the error is
+    within the configured tolerance.  Segments that cannot reach the
+    tolerance are marked so that queries in them fall back to the
+    Swiss Ephemeris.  Queries outside of the coverage range
+    [startJd, endJd] also fall back to the Swiss Ephemeris.
+
+    Since the values are polynomials, the rate of change (degrees per
+    day) is also available analytically via getValueAndRate(), which
+    is useful for Newton-style refinement in root finding.
+
+    Example usage:
+
+        interpolator = EphemerisInterpolator(toleranceArcSeconds=0.5)
+        longitude = interpolator.getLongitude("Mars", jd,
+                                              "geocentric", "tropical")
+
+    Pre-requisites:
+    This class assumes that the user has initialized the Ephemeris via
+    Ephemeris.initialize() and has called
+    Ephemeris.setGeographicPosition() prior to using it.
+    The interpolator does not know about later changes to the
+    geographic position, so clear() should be called after changing
+    it.
+    """
+
+    # Logger object for this class.
+    log = logging.getLogger("ephemeris_interpolator.EphemerisInterpolator")
+
+    # Field names that can be interpolated.
+    supportedFieldNames = ['longitude', 'latitude', 'declination']
+
+    # Field names holding the rate of change of the supported
+    # field names.  These are used when falling back to the Swiss
+    # Ephemeris.
+    rateFieldNames = {'longitude'   : 'longitude_speed',
+                      'latitude'    : 'latitude_speed',
+                      'declination' : 'declination_speed'}
+
+    def __init__(self,
+                 startJd=None,
+                 endJd=None,
+                 toleranceArcSeconds=1.0,
+                 segmentDays=32.0,
+                 degree=13,
+                 maxSubdivisions=10):
+        """Initializes the EphemerisInterpolator.
+
+        Arguments:
+        startJd             - float value for the first Julian Day
+                              covered by interpolation.  If None, then
+                              there is no lower limit.
+        endJd               - float value for the last Julian Day
+                              covered by interpolation.  If None, then
+                              there is no upper limit.
+        toleranceArcSeconds - float value for the maximum error allowed
+                              between the interpolated value and the
+                              Swiss Ephemeris value, in arc seconds.
+        segmentDays         - float value for the length of a segment,
+                              in days, before any splitting.
+        degree              - int value for the degree of the Chebyshev
+                              polynomial for each segment.
+        maxSubdivisions     - int value for the number of times that a
+                              segment may be split in half to reach the
+                              tolerance.  If the tolerance is still not
+                              reached, the Swiss Ephemeris is used for
+                              queries in that segment.
+        """
+
+        self.startJd = startJd
+        self.endJd = endJd
+        self.toleranceDegrees = toleranceArcSeconds / 3600.0
+        self.segmentDays = float(segmentDays)
+        self.degree = degree
+        self.maxSubdivisions = maxSubdivisions
+
+        # Number of nodes used for fitting a polynomial.
+        self.numNodes = degree + 1
+
+        # Chebyshev nodes on [-1, 1].  These are in descending order.
+        self.nodes = \
+            [math.cos(math.pi * (j + 0.5) / self.numNodes) \
+             for j in range(self.numNodes)]
+
+        # Points half way between the nodes, used to verify the
+        # error of a fitted polynomial.
+        self.verificationPoints = \
+            [math.cos(math.pi * (j + 1.0) / self.numNodes) \
+             for j in range(self.numNodes - 1)]
+
+        # Dictionary holding the segments calculated so far.
+        #
+        # Key is the tuple:
+        #   (planetName, centricityType, zodiacType, fieldName)
+        # Value is a dict of int segment index (of the unsplit
+        # segment) to a list of segments covering it, sorted by
+        # start Julian Day.  Each segment in that list is a tuple:
+        #   (startJd, endJd, coefficients)
+        # where coefficients is None if the Swiss Ephemeris is to be
+        # used in that segment.
+        self.segments = {}
+
+        # Statistics.
+        self.numInterpolatedQueries = 0
+        self.numFallbackQueries = 0
+        self.numEphemerisCalls = 0
+
+    def clear(self):
+        """Removes all the calculated segments."""
+
+        self.segments = {}
+
+    def getNumSegments(self):
+        """Returns the number of segments calculated so far."""
+
+        rv = 0
+        for indexDict in self.segments.values():
+            for segmentList in indexDict.values():
+                rv += len(segmentList)
+        return rv
+
+    def isCovered(self, jd):
+        """Returns True if the given Julian Day is in the range covered
+        by interpolation.
+        """
+
+        if self.startJd != None and jd < self.startJd:
+            return False
+        if self.endJd != None and jd > self.endJd:
+            return False
+        return True
+
+    def getLongitude(self, planetName, jd, centricityType, zodiacType):
+        """Returns the longitude of a planet at the given Julian Day.
+        See getValue() for details.
+        """
+
+        return self.getValue(planetName, jd, centricityType, zodiacType,
+                             'longitude')
+
+    def getLatitude(self, planetName, jd, centricityType, zodiacType):
+        """Returns the latitude of a planet at the given Julian Day.
+        See getValue() for details.
+        """
+
+        return self.getValue(planetName, jd, centricityType, zodiacType,
+                             'latitude')
+
+    def getDeclination(self, planetName, jd, centricityType, zodiacType):
+        """Returns the declination of a planet at the given Julian Day.
+        See getValue() for details.
+        """
+
+        return self.getValue(planetName, jd, centricityType, zodiacType,
+                             'declination')
+
+    def getValue(self, planetName, jd, centricityType, zodiacType, fieldName):
+        """Returns the value of a field of a planet at the given Julian
+        Day.
+
+        Arguments:
+        planetName     - str holding the name of the planet.
+        jd             - float value for the Julian Day, UT.
+        centricityType - str value holding either "geocentric",
+                         "topocentric", or "heliocentric".
+        zodiacType     - str value holding either "tropical" or "sidereal".
+        fieldName      - str value holding one of the field names in
+                         EphemerisInterpolator.supportedFieldNames.
+
+        Returns:
+        float value for the field.  Longitude values are in the
+        range [0, 360).
+        """
+
+        (value, rate) = self.__evaluate(planetName, jd, centricityType,
+                                        zodiacType, fieldName, False)
+        return value
+
+    def getValueAndRate(self, planetName, jd, centricityType, zodiacType,
+                        fieldName):
+        """Returns the value of a field of a planet at the given Julian
+        Day, and the rate of change of that value.  The arguments are
+        the same as for getValue().
+
+        Returns:
+        Tuple of two floats: (value, rate).  The rate is in units of
+        the field per day (e.g. degrees per day).
+        """
+
+        return self.__evaluate(planetName, jd, centricityType, zodiacType,
+                               fieldName, True)
+
+    def __evaluate(self, planetName, jd, centricityType, zodiacType,
+                   fieldName, calculateRate):
+        """Helper function for getValue() and getValueAndRate().
+
+        Returns:
+        Tuple of two floats: (value, rate).  If 'calculateRate' is
+        False, then rate is None.
+        """
+
+        if fieldName not in EphemerisInterpolator.supportedFieldNames:
+            raise ValueError("Invalid fieldName: {}".format(fieldName))
+
+        segment = None
+        if self.isCovered(jd):
+            key = (planetName, centricityType, zodiacType, fieldName)
+            segment = self.__getSegment(key, jd)
+
+        if segment == None or segment[2] == None:
+            # Use the Swiss Ephemeris.
+            self.numFallbackQueries += 1
+
+            value = Ephemeris.getPlanetFieldValue(planetName, jd,
+                                                  centricityType,
+                                                  zodiacType,
+                                                  fieldName)
+            rate = None
+            if calculateRate:
+                rate = Ephemeris.getPlanetFieldValue(\
+                    planetName, jd, centricityType, zodiacType,
+                    EphemerisInterpolator.rateFieldNames[fieldName])
+            return (value, rate)
+
+        self.numInterpolatedQueries += 1
+
+        (startJd, endJd, coefficients) = segment
+        halfWidth = (endJd - startJd) / 2.0
+        x = (jd - startJd) / halfWidth - 1.0
+
+        value = EphemerisInterpolator.__chebyshevValue(coefficients, x)
+        if fieldName == 'longitude':
+            value = value % 360.0
+
+        rate = None
+        if calculateRate:
+            rate = EphemerisInterpolator.\
+                   __chebyshevDerivative(coefficients, x) / halfWidth
+
+        return (value, rate)
+
+    def __getSegment(self, key, jd):
+        """Returns the segment tuple (startJd, endJd, coefficients) for
+        the given key that covers the given Julian Day, calculating it
+        if needed.
+        """
+
+        index = int(math.floor(jd / self.segmentDays))
+
+        indexDict = self.segments.setdefault(key, {})
+        segmentList = indexDict.get(index, None)
+
+        if segmentList == None:
+            startJd = index * self.segmentDays
+            endJd = startJd + self.segmentDays
+
+            segmentList = []
+            self.__fitSegments(key, startJd, endJd, 0, segmentList)
+            indexDict[index] = segmentList
+
+            if EphemerisInterpolator.log.isEnabledFor(logging.DEBUG):
+                EphemerisInterpolator.log.debug(\
+                    "Calculated {} segment(s) for {} in [{}, {})".\
+                    format(len(segmentList), key, startJd, endJd))
+
+        # Find the segment in the list that holds the jd.
+        if len(segmentList) == 1:
+            return segmentList[0]
+        else:
+            starts = [segment[0] for segment in segmentList]
+            i = bisect.bisect_right(starts, jd) - 1
+            return segmentList[max(i, 0)]
+
+    def __fitSegments(self, key, startJd, endJd, level, segmentList):
+        """Fits a polynomial over [startJd, endJd] and appends it to
+        'segmentList'.  If the tolerance is not met, then the segment
+        is split in half and each half is fitted.
+        """
+
+        (planetName, centricityType, zodiacType, fieldName) = key
+
+        halfWidth = (endJd - startJd) / 2.0
+        midJd = startJd + halfWidth
+
+        # Get the values at the nodes and at the verification points
+        # in one batch.
+        jds = [midJd + halfWidth * x for x in self.nodes] + \
+              [midJd + halfWidth * x for x in self.verificationPoints]
+
+        values = Ephemeris.getPlanetPositionsBatch(planetName,
+                                                   jds,
+                                                   centricityType,
+                                                   zodiacType,
+                                                   [fieldName])
+        self.numEphemerisCalls += len(jds)
+
+        if values == None:
+            segmentList.append((startJd, endJd, None))
+            return
+
+        values = values[fieldName]
+        nodeValues = list(values[:self.numNodes])
+        verificationValues = list(values[self.numNodes:])
+
+        if fieldName == 'longitude':
+            # Unwrap the longitudes so that the values are
+            # continuous in time.  Nodes are in descending order of
+            # time, so unwrap from the end of the list.
+            for i in range(len(nodeValues) - 2, -1, -1):
+                diff = nodeValues[i] - nodeValues[i + 1]
+                nodeValues[i] -= 360.0 * round(diff / 360.0)
+
+        coefficients = EphemerisInterpolator.__chebyshevFit(nodeValues)
+
+        # Verify the error of the polynomial.
+        maxError = 0.0
+        for i in range(len(self.verificationPoints)):
+            value = EphemerisInterpolator.__chebyshevValue(\
+                coefficients, self.verificationPoints[i])
+            error = value - verificationValues[i]
+            if fieldName == 'longitude':
+                error = (error + 180.0) % 360.0 - 180.0
+            maxError = max(maxError, abs(error))
+
+        if maxError <= self.toleranceDegrees:
+            segmentList.append((startJd, endJd, coefficients))
+        elif level < self.maxSubdivisions:
+            self.__fitSegments(key, startJd, midJd, level + 1, segmentList)
+            self.__fitSegments(key, midJd, endJd, level + 1, segmentList)
+        else:
+            if EphemerisInterpolator.log.isEnabledFor(logging.DEBUG):
+                EphemerisInterpolator.log.debug(\
+                    "Tolerance not reached for {} in [{}, {}).  ".\
+                    format(key, startJd, endJd) + \
+                    "Max error was {} degrees.".format(maxError))
+            segmentList.append((startJd, endJd, None))
+
+    @staticmethod
+    def __chebyshevFit(nodeValues):
+        """Returns the list of Chebyshev coefficients for the values
+        at the Chebyshev nodes.  The first coefficient is already
+        halved, so that the polynomial is simply sum(c[k] * T_k(x)).
+        """
+
+        n = len(nodeValues)
+        coefficients = []
+        for k in range(n):
+            total = 0.0
+            for j in range(n):
+                total += nodeValues[j] * math.cos(math.pi * k * (j + 0.5) / n)
+            coefficients.append(2.0 * total / n)
+        coefficients[0] /= 2.0
+
+        return coefficients
+
+    @staticmethod
+    def __chebyshevValue(coefficients, x):
+        """Evaluates the Chebyshev series at x (in [-1, 1]), using
+        Clenshaw's recurrence.
+        """
+
+        b1 = 0.0
+        b2 = 0.0
+        twoX = 2.0 * x
+        for k in range(len(coefficients) - 1, 0, -1):
+            (b1, b2) = (twoX * b1 - b2 + coefficients[k], b1)
+
+        return x * b1 - b2 + coefficients[0]
+
+    @staticmethod
+    def __chebyshevDerivative(coefficients, x):
+        """Evaluates the derivative with respect to x of the Chebyshev
+        series at x (in [-1, 1]).
+        """
+
+        n = len(coefficients)
+        if n < 2:
+            return 0.0
+
+        # Coefficients of the derivative series, calculated with the
+        # recurrence d[k-1] = d[k+1] + 2 * k * c[k].
+        d = [0.0] * (n + 1)
+        for k in range(n - 1, 0, -1):
+            d[k - 1] = d[k + 1] + 2.0 * k * coefficients[k]
+        d[0] /= 2.0
+
+        return EphemerisInterpolator.__chebyshevValue(d[:n - 1], x)
+
+##############################################################################
+
+def testEphemerisInterpolator():
+    """Compares the values and the speed of EphemerisInterpolator
+    against the Swiss Ephemeris.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    # For timing the calculations.
+    import time
+
+    # For random query times.
+    import random
+
+    toleranceArcSeconds = 1.0
+    startJd = 2433282.5     # 1950-01-01
+    numDays = 365 * 20
+
+    interpolator = EphemerisInterpolator(\
+        toleranceArcSeconds=toleranceArcSeconds)
+
+    random.seed(0)
+    jds = [startJd + random.random() * numDays for i in range(20000)]
+
+    for (planetName, centricityType) in [("Moon", "geocentric"),
+                                         ("Mercury", "geocentric"),
+                                         ("Mars", "heliocentric"),
+                                         ("MoSu", "geocentric"),
+                                         ("JuSa", "heliocentric")]:
+        for fieldName in EphemerisInterpolator.supportedFieldNames:
+            startTime = time.time()
+            interpolatedValues = \
+                [interpolator.getValue(planetName, jd, centricityType,
+                                       "tropical", fieldName) \
+                 for jd in jds]
+            endTime = time.time()
+            interpolatedTime = endTime - startTime
+
+            startTime = time.time()
+            values = \
+                [Ephemeris.getPlanetFieldValue(planetName, jd,
+                                               centricityType,
+                                               "tropical", fieldName) \
+                 for jd in jds]
+            endTime = time.time()
+            ephemerisTime = endTime - startTime
+
+            maxError = 0.0
+            for i in range(len(jds)):
+                error = interpolatedValues[i] - values[i]
+                if fieldName == 'longitude':
+                    error = (error + 180.0) % 360.0 - 180.0
+                maxError = max(maxError, abs(error))
+
+            print("  {} {} {}: ".\
+                  format(centricityType, planetName, fieldName) + \
+                  "max error {:.4f} arcsec, ".format(maxError * 3600.0) + \
+                  "interpolated {:.3f} sec (including fitting), ".\
+                  format(interpolatedTime) + \
+                  "ephemeris {:.3f} sec".format(ephemerisTime))
+
+    print("  Number of segments: {}".format(interpolator.getNumSegments()))
+    print("  Number of ephemeris calls for fitting: {}".\
+          format(interpolator.numEphemerisCalls))
+    print("  Number of fallback queries: {}".\
+          format(interpolator.numFallbackQueries))
+
+##############################################################################
+
+# For debugging the module during development.
+if __name__=="__main__":
+    # For logging and for exiting.
+    import os
+    import sys
+
+    # Initialize logging.
+    LOG_CONFIG_FILE = os.path.join(sys.path[0], "../conf/logging.conf")
+    logging.config.fileConfig(LOG_CONFIG_FILE)
+    #logging.disable(logging.CRITICAL)
+
+    # Initialize the Ephemeris (required).
+    Ephemeris.initialize()
+
+    # New York City:
+    lon = -74.0064
+    lat = 40.7142
+
+    # Set a default location (required).
+    Ephemeris.setGeographicPosition(lon, lat)
+
+    testEphemerisInterpolator()
+
+    # Close the Ephemeris so it can do necessary cleanups.
+    Ephemeris.closeEphemeris()
+
+    # Quit.
+    print("Exiting.")
+    sys.exit()
+
+##############################################################################
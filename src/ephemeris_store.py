@@ -0,0 +1,616 @@
+
+# For directory access.
+import os
+import sys
+import inspect
+
+# For timestamps.
+import datetime
+import pytz
+
+# For reading and writing the file header.
+import json
+import struct
+
+# For memory-mapping the store file.
+import mmap
+
+# For array.array of floats.
+import array
+
+# For logging.
+import logging
+import logging.config
+
+# Import the Ephemeris classes.
+from ephemeris import Ephemeris
+
+##############################################################################
+
+class EphemerisStore:
+    """Read-only store of precomputed planet field values, sampled at a
+    fixed step in time (e.g. daily or hourly) over a time span
+    (e.g. 1800 to 2100).
+
+    The store is a binary file that is column-oriented: there is one
+    array of float64 values for each (planet name, centricity type,
+    zodiac type, field name) combination.  The file is opened with
+    mmap, so many processes (e.g. the LookbackMultipleParallel pool
+    processes and the distributed lookback workers) that open the same
+    file share the same pages of memory, and no process needs to
+    calculate or load the values itself.
+
+    File format:
+
+      - 8 bytes: EphemerisStore.MAGIC
+      - 4 bytes: unsigned int, little-endian, file format version.
+      - 4 bytes: unsigned int, little-endian, length of the header.
+      - Header: utf-8 JSON, padded with spaces so that the columns
+        start at a multiple of 8 bytes.
+      - Julian Days: float64 values, little-endian, 'numSamples'
+        values, holding the Julian Day of each sample.
+      - Columns: float64 values, little-endian, 'numSamples' values
+        per column, in the order listed in the header.
+
+    The JSON header holds: startJd, stepDays, numSamples, columns
+    (list of [planetName, centricityType, zodiacType, fieldName]),
+    and geoLongitudeDeg, geoLatitudeDeg, geoAltitudeMeters (the
+    geographic position used for the location-dependent columns).
+
+    Samples are taken at a fixed step in UTC.  The Julian Days of the
+    samples are the ones returned by Ephemeris.datetimeToJulianDay()
+    for those UTC timestamps, and since those are in UT1, they are not
+    exactly 'stepDays' apart.  This is why the Julian Days are stored
+    in the file, and why a sample is found by its stored Julian Day.
+
+    Files are created with EphemerisStore.generate(), or with the
+    script misc/EphemerisGeneration/createEphemerisStoreFile.py.
+
+    Ephemeris.getPlanetFieldValue() uses the store set via
+    Ephemeris.setEphemerisStore() for any Julian Day that falls on a
+    sample of the store, which is the case for the coarse steps of the
+    lookback calculations when the reference timestamps are on the
+    sample step (e.g. on the hour for an hourly store).  All other
+    Julian Days are calculated exactly by the Swiss Ephemeris.
+    """
+
+    # Logger object for this class.
+    log = logging.getLogger("ephemeris_store.EphemerisStore")
+
+    # Bytes at the start of every store file.
+    MAGIC = b"PCTEPHST"
+
+    # Version of the file format.
+    VERSION = 1
+
+    # Default location of the store file.
+    # LookbackMultipleUtils.initializeEphemeris() opens this file if
+    # it exists.
+    DEFAULT_STORE_FILENAME = \
+        os.path.abspath(os.path.join(sys.path[0],
+                                     "../data/ephemeris_store/ephemeris.pcs"))
+
+    # Maximum distance, in days, of a Julian Day from a sample for it
+    # to be considered to be on the sample.  This is about 1
+    # millisecond, which covers the rounding of Julian Days calculated
+    # from datetime.datetime objects.
+    jdTolerance = 1.0e-8
+
+    # Dict of filename to EphemerisStore objects opened via
+    # getStore().  This is so that each process only maps a file once.
+    openedStores = {}
+
+    def __init__(self, filename):
+        """Opens the store file given.
+
+        Arguments:
+        filename - str holding the path to the store file.
+
+        Raises:
+        IOError if the file could not be opened.
+        ValueError if the file is not a valid store file.
+        """
+
+        self.filename = filename
+
+        self.file = open(filename, "rb")
+        try:
+            self.mmap = mmap.mmap(self.file.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        except Exception:
+            self.file.close()
+            raise
+
+        prefixLength = len(EphemerisStore.MAGIC) + 8
+        if len(self.mmap) < prefixLength or \
+           self.mmap[:len(EphemerisStore.MAGIC)] != EphemerisStore.MAGIC:
+            self.close()
+            raise ValueError("Not an ephemeris store file: {}".\
+                             format(filename))
+
+        (version, headerLength) = \
+            struct.unpack("<II", self.mmap[len(EphemerisStore.MAGIC):
+                                           prefixLength])
+        if version != EphemerisStore.VERSION:
+            self.close()
+            raise ValueError("Unsupported ephemeris store file " + \
+                             "version {}: {}".format(version, filename))
+
+        header = json.loads(self.mmap[prefixLength:
+                                      prefixLength + headerLength].\
+                            decode('utf-8'))
+
+        self.startJd = header['startJd']
+        self.stepDays = header['stepDays']
+        self.numSamples = header['numSamples']
+        self.geoLongitudeDeg = header['geoLongitudeDeg']
+        self.geoLatitudeDeg = header['geoLatitudeDeg']
+        self.geoAltitudeMeters = header['geoAltitudeMeters']
+
+        # Dict of (planetName, centricityType, zodiacType, fieldName)
+        # to the offset of the column in the file.
+        self.columnOffsets = {}
+
+        offset = prefixLength + headerLength
+        if offset + (len(header['columns']) + 1) * self.numSamples * 8 > \
+               len(self.mmap):
+            self.close()
+            raise ValueError("Truncated ephemeris store file: {}".\
+                             format(filename))
+
+        # Julian Days of the samples.
+        self.jds = self.__getFloats(offset)
+        offset += self.numSamples * 8
+
+        for column in header['columns']:
+            self.columnOffsets[tuple(column)] = offset
+            offset += self.numSamples * 8
+
+        # Dict of column key to the memoryview (or array.array if the
+        # byte order had to be swapped) of the column values.
+        # Columns are added as they are first used.
+        self.columns = {}
+
+        # Julian Day of the last sample.
+        self.endJd = self.jds[self.numSamples - 1]
+
+        if EphemerisStore.log.isEnabledFor(logging.DEBUG):
+            EphemerisStore.log.debug(\
+                "Opened ephemeris store '{}' with {} columns, ".\
+                format(filename, len(self.columnOffsets)) + \
+                "{} samples from jd {} to jd {}".\
+                format(self.numSamples, self.startJd, self.endJd))
+
+    @staticmethod
+    def getStore(filename=None):
+        """Returns the EphemerisStore for the given file, opening it
+        if it is not already opened in this process.
+
+        Arguments:
+        filename - str holding the path to the store file.  If None,
+                   then EphemerisStore.DEFAULT_STORE_FILENAME is used.
+
+        Returns:
+        EphemerisStore object, or None if the file does not exist or
+        could not be opened.
+        """
+
+        if filename == None:
+            filename = EphemerisStore.DEFAULT_STORE_FILENAME
+
+        store = EphemerisStore.openedStores.get(filename, None)
+        if store != None:
+            return store
+
+        if not os.path.isfile(filename):
+            return None
+
+        try:
+            store = EphemerisStore(filename)
+        except (IOError, ValueError) as e:
+            EphemerisStore.log.error("Could not open ephemeris store " + \
+                                     "'{}': {}".format(filename, e))
+            return None
+
+        EphemerisStore.openedStores[filename] = store
+        return store
+
+    def close(self):
+        """Closes the store file.  The store must not be used after
+        calling this.
+        """
+
+        self.columns = {}
+        self.jds = None
+        if self.mmap != None:
+            try:
+                self.mmap.close()
+            except BufferError:
+                # Columns returned by getColumn() are still in use.
+                # The mapping is released when they are deleted.
+                pass
+            self.mmap = None
+        if self.file != None:
+            self.file.close()
+            self.file = None
+
+        if EphemerisStore.openedStores.get(self.filename, None) is self:
+            del EphemerisStore.openedStores[self.filename]
+
+    def hasColumn(self, planetName, centricityType, zodiacType, fieldName):
+        """Returns True if the store has values for the given planet
+        name, centricity type, zodiac type, and field name.
+        """
+
+        key = (planetName, centricityType, zodiacType, fieldName)
+        return key in self.columnOffsets
+
+    def getColumnKeys(self):
+        """Returns the list of tuples
+        (planetName, centricityType, zodiacType, fieldName)
+        that the store has values for.
+        """
+
+        return list(self.columnOffsets.keys())
+
+    def getColumn(self, planetName, centricityType, zodiacType, fieldName):
+        """Returns the values of a column.  The value at index i is
+        for the Julian Day returned by getJdAtIndex(i).
+
+        Returns:
+        memoryview of floats backed by the mapped file (or an
+        array.array of floats on big-endian machines), or None if
+        the store does not have the column.
+        """
+
+        key = (planetName, centricityType, zodiacType, fieldName)
+
+        column = self.columns.get(key, None)
+        if column != None:
+            return column
+
+        offset = self.columnOffsets.get(key, None)
+        if offset == None:
+            return None
+
+        column = self.__getFloats(offset)
+
+        self.columns[key] = column
+        return column
+
+    def __getFloats(self, offset):
+        """Returns the 'numSamples' floats at the given offset of the
+        file, as a memoryview of the mapped file (or an array.array
+        on big-endian machines).
+        """
+
+        view = memoryview(self.mmap)[offset:offset + self.numSamples * 8]
+        if sys.byteorder == 'little':
+            return view.cast('d')
+        else:
+            floats = array.array('d', view.tobytes())
+            floats.byteswap()
+            return floats
+
+    def getJdAtIndex(self, index):
+        """Returns the Julian Day of the sample at the given index."""
+
+        return self.jds[index]
+
+    def getSampleIndex(self, jd):
+        """Returns the index of the sample at the given Julian Day, or
+        None if the Julian Day is not on a sample of the store.
+        """
+
+        # The sample Julian Days are within a second of being
+        # 'stepDays' apart, so this finds the only possible sample.
+        index = int(round((jd - self.startJd) / self.stepDays))
+
+        if index < 0 or index >= self.numSamples:
+            return None
+
+        if abs(jd - self.jds[index]) > EphemerisStore.jdTolerance:
+            return None
+
+        return index
+
+    def isLocationMatching(self):
+        """Returns True if the geographic position currently set in the
+        Ephemeris is the one used for the location-dependent columns of
+        this store.
+        """
+
+        return Ephemeris.geoLongitudeDeg == self.geoLongitudeDeg and \
+               Ephemeris.geoLatitudeDeg == self.geoLatitudeDeg and \
+               Ephemeris.geoAltitudeMeters == self.geoAltitudeMeters
+
+    def getValue(self, planetName, jd, centricityType, zodiacType, fieldName):
+        """Returns the stored value of a planet field at the given
+        Julian Day.  The arguments are the same as for
+        Ephemeris.getPlanetFieldValue().
+
+        Returns:
+        float value, or None if the Julian Day is not on a sample of the
+        store, if the store does not have the column, or if the column
+        depends on the geographic position and the one currently set in
+        the Ephemeris is different from the one used for the store.
+        """
+
+        index = self.getSampleIndex(jd)
+        if index == None:
+            return None
+
+        column = self.getColumn(planetName, centricityType, zodiacType,
+                                fieldName)
+        if column == None:
+            return None
+
+        if EphemerisStore.isLocationDependent(planetName, centricityType) \
+               and not self.isLocationMatching():
+            return None
+
+        return column[index]
+
+    @staticmethod
+    def isLocationDependent(planetName, centricityType):
+        """Returns True if the field values of the planet depend on the
+        geographic position set in the Ephemeris.
+        """
+
+        if centricityType == "topocentric":
+            return True
+
+        if Ephemeris.isHouseCuspPlanetName(planetName) or \
+           Ephemeris.isAscmcPlanetName(planetName):
+            return True
+
+        constituents = \
+            Ephemeris.averagedPlanetConstituents.get(planetName, []) + \
+            Ephemeris.combinationPlanetConstituents.get(planetName, [])
+        for constituent in constituents:
+            if EphemerisStore.isLocationDependent(constituent,
+                                                  centricityType):
+                return True
+
+        return False
+
+    @staticmethod
+    def generate(filename,
+                 startDt,
+                 endDt,
+                 stepTd=datetime.timedelta(days=1),
+                 planetNames=None,
+                 centricityTypes=["geocentric", "heliocentric"],
+                 zodiacTypes=["tropical", "sidereal"],
+                 fieldNames=["longitude"],
+                 chunkSize=100000):
+        """Calculates the field values and writes them to a new store
+        file.
+
+        Pre-requisites:
+        This method assumes that the user has initialized the Ephemeris
+        via Ephemeris.initialize() and has called
+        Ephemeris.setGeographicPosition() prior to running this method.
+        The geographic position is saved in the store, and is used for
+        the house cusp, ascmc and topocentric values.
+
+        Arguments:
+        filename        - str holding the path of the file to write.
+                          Any existing file is replaced.
+        startDt         - datetime.datetime object for the timestamp of
+                          the first sample.
+        endDt           - datetime.datetime object for the last
+                          timestamp to cover.
+        stepTd          - datetime.timedelta object for the time
+                          between samples.
+        planetNames     - list of str planet names.  If None, then all
+                          the planets in
+                          Ephemeris.getSupportedPlanetNamesList()
+                          are used.
+        centricityTypes - list of str centricity types.
+        zodiacTypes     - list of str zodiac types.
+        fieldNames      - list of str field names.  See the class
+                          description of PlanetaryInfo for the field
+                          names available.
+        chunkSize       - int value for the number of samples calculated
+                          at a time.
+        """
+
+        if planetNames == None:
+            planetNames = Ephemeris.getSupportedPlanetNamesList()
+
+        if stepTd <= datetime.timedelta(0):
+            raise ValueError("Invalid stepTd: {}".format(stepTd))
+        if endDt < startDt:
+            raise ValueError("endDt cannot be before startDt")
+
+        numSamples = int((endDt - startDt) / stepTd) + 1
+        stepDays = stepTd.total_seconds() / 86400.0
+
+        # Julian Days of the samples, as calculated for the lookups.
+        startDt = startDt.astimezone(pytz.utc)
+        jds = array.array('d', [Ephemeris.datetimeToJulianDay(\
+                                    startDt + i * stepTd) \
+                                for i in range(numSamples)])
+        startJd = jds[0]
+
+        columns = []
+        for planetName in planetNames:
+            for centricityType in centricityTypes:
+                for zodiacType in zodiacTypes:
+                    for fieldName in fieldNames:
+                        columns.append([planetName, centricityType,
+                                        zodiacType, fieldName])
+
+        header = {'startJd'           : startJd,
+                  'stepDays'          : stepDays,
+                  'numSamples'        : numSamples,
+                  'geoLongitudeDeg'   : Ephemeris.geoLongitudeDeg,
+                  'geoLatitudeDeg'    : Ephemeris.geoLatitudeDeg,
+                  'geoAltitudeMeters' : Ephemeris.geoAltitudeMeters,
+                  'columns'           : columns}
+
+        headerBytes = json.dumps(header).encode('utf-8')
+        prefixLength = len(EphemerisStore.MAGIC) + 8
+        padding = (8 - (prefixLength + len(headerBytes)) % 8) % 8
+        headerBytes += b" " * padding
+
+        # Write to a temporary file first, so that processes reading an
+        # existing store never see a partially written file.
+        tempFilename = filename + ".tmp"
+
+        directory = os.path.dirname(os.path.abspath(filename))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(tempFilename, "wb") as f:
+            f.write(EphemerisStore.MAGIC)
+            f.write(struct.pack("<II", EphemerisStore.VERSION,
+                                len(headerBytes)))
+            f.write(headerBytes)
+
+            if sys.byteorder != 'little':
+                jds.byteswap()
+                jds.tofile(f)
+                jds.byteswap()
+            else:
+                jds.tofile(f)
+
+            for (planetName, centricityType, zodiacType, fieldName) in \
+                    columns:
+
+                if EphemerisStore.log.isEnabledFor(logging.INFO):
+                    EphemerisStore.log.info(\
+                        "Calculating {} {} {} {} ...".\
+                        format(planetName, centricityType,
+                               zodiacType, fieldName))
+
+                for chunkStart in range(0, numSamples, chunkSize):
+                    chunkEnd = min(chunkStart + chunkSize, numSamples)
+                    chunkJds = jds[chunkStart:chunkEnd]
+
+                    values = Ephemeris.getPlanetPositionsBatch(\
+                        planetName, chunkJds, centricityType, zodiacType,
+                        [fieldName])
+
+                    if values == None:
+                        # Unknown planet name.  Store NaNs.
+                        values = array.array('d',
+                                             [float('nan')] * len(chunkJds))
+                    else:
+                        values = values[fieldName]
+
+                    if sys.byteorder != 'little':
+                        values.byteswap()
+                    values.tofile(f)
+
+        os.replace(tempFilename, filename)
+
+        if EphemerisStore.log.isEnabledFor(logging.INFO):
+            EphemerisStore.log.info(\
+                "Wrote {} columns of {} samples to '{}'".\
+                format(len(columns), numSamples, filename))
+
+##############################################################################
+
+def testEphemerisStore():
+    """Generates a small store file and compares its values to the
+    ones calculated by the Ephemeris.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    # For the temporary store file.
+    import tempfile
+
+    # For timing the calculations.
+    import time
+
+    startDt = datetime.datetime(1950, 1, 1, tzinfo=pytz.utc)
+    endDt = datetime.datetime(1959, 12, 31, tzinfo=pytz.utc)
+    stepTd = datetime.timedelta(hours=1)
+
+    planetNames = ["Moon", "Mars", "H1", "MoSu", "JuSa"]
+
+    filename = os.path.join(tempfile.gettempdir(), "testEphemerisStore.pcs")
+
+    startTime = time.time()
+    EphemerisStore.generate(filename, startDt, endDt, stepTd,
+                            planetNames=planetNames,
+                            centricityTypes=["geocentric"],
+                            zodiacTypes=["tropical"])
+    endTime = time.time()
+    print("  Generation took {:.3f} sec, file size is {} bytes".\
+          format(endTime - startTime, os.path.getsize(filename)))
+
+    store = EphemerisStore(filename)
+
+    numMismatches = 0
+    for planetName in planetNames:
+        for i in range(0, store.numSamples, 997):
+            jd = store.getJdAtIndex(i)
+            value = store.getValue(planetName, jd, "geocentric",
+                                   "tropical", "longitude")
+            expected = Ephemeris.getPlanetFieldValue(planetName, jd,
+                                                     "geocentric",
+                                                     "tropical",
+                                                     "longitude")
+            if value != expected:
+                numMismatches += 1
+    print("  Number of mismatches: {}".format(numMismatches))
+
+    print("  Value between samples (expect None): {}".\
+          format(store.getValue("Mars", store.getJdAtIndex(0) + 0.5 / 24,
+                                "geocentric", "tropical", "longitude")))
+
+    Ephemeris.setEphemerisStore(store)
+    jds = [store.getJdAtIndex(i) for i in range(0, store.numSamples, 7)]
+    startTime = time.time()
+    for jd in jds:
+        Ephemeris.getPlanetFieldValue("JuSa", jd, "geocentric",
+                                      "tropical", "longitude")
+    endTime = time.time()
+    print("  {} lookups with the store took {:.3f} sec".\
+          format(len(jds), endTime - startTime))
+
+    Ephemeris.setEphemerisStore(None)
+    startTime = time.time()
+    for jd in jds:
+        Ephemeris.getPlanetFieldValue("JuSa", jd, "geocentric",
+                                      "tropical", "longitude")
+    endTime = time.time()
+    print("  {} lookups without the store took {:.3f} sec".\
+          format(len(jds), endTime - startTime))
+
+    store.close()
+    os.remove(filename)
+
+##############################################################################
+
+# For debugging the module during development.
+if __name__=="__main__":
+    # Initialize logging.
+    LOG_CONFIG_FILE = os.path.join(sys.path[0], "../conf/logging.conf")
+    logging.config.fileConfig(LOG_CONFIG_FILE)
+    #logging.disable(logging.CRITICAL)
+
+    # Initialize the Ephemeris (required).
+    Ephemeris.initialize()
+
+    # New York City:
+    lon = -74.0064
+    lat = 40.7142
+
+    # Set a default location (required).
+    Ephemeris.setGeographicPosition(lon, lat)
+
+    testEphemerisStore()
+
+    # Close the Ephemeris so it can do necessary cleanups.
+    Ephemeris.closeEphemeris()
+
+    # Quit.
+    print("Exiting.")
+    sys.exit()
+
+##############################################################################
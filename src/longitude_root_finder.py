@@ -0,0 +1,1261 @@
+# For directory access.
+import inspect
+
+# For bisect.bisect_left() and bisect.bisect_right().
+import bisect
+
+# For logging.
+import logging
+import logging.config
+
+# Import the Ephemeris classes.
+from ephemeris import Ephemeris
+
+##############################################################################
+
+class LongitudeDeltaRootFinder:
+    """Finds the moments in time when a planet has moved a desired
+    number of longitude degrees away from the longitude it had at a
+    reference Julian Day.
+
+    The search walks away from the reference Julian Day in the
+    direction of the search, keeping track of the total (unwrapped)
+    number of degrees moved.  Every time a step passes the desired
+    number of degrees, the bracket around that crossing is refined
+    to the exact moment with a safeguarded Newton iteration, which
+    uses the longitude speed that the Swiss Ephemeris calculates
+    along with the longitude.  When no speed is available (house
+    cusps and ascmc planets), a secant estimate through the bracket
+    is used instead.  Any estimate that falls outside of the bracket,
+    or that does not shrink fast enough, is replaced by a bisection
+    step, so the refinement always converges.  A crossing 1 day wide
+    takes about 3 to 5 evaluations, instead of the 16 of a bisection
+    down to 2 seconds.
+
+    The size of the steps is the fixed step size given, but when the
+    planet is far from the desired number of degrees and an upper
+    bound of its longitude speed is known, the step is made as long
+    as the planet could not reach the desired degrees (nor move more
+    than maxStepDegrees) within it.  With the fixed step size, a
+    retrograde loop could pass the desired degrees and come back
+    within one step.  To catch that, whenever the sign of the
+    longitude speed changes between two steps (the planet went
+    stationary in between), the station is located and the step is
+    split in two monotone halves, each of which is checked for a
+    crossing.
+
+    The longitude of averaged planets jumps by 360 degrees divided by
+    the number of constituents whenever one of the constituents
+    crosses 0 degrees.  A step that changes the longitude by more
+    than half of that is taken as a jump.  The jump is located, and
+    the step is split in two continuous halves, so that a crossing
+    next to the jump is still found.
+
+    The number of evaluations done are counted, both in total and
+    for the refinement of each result, so that callers can log or
+    compare the cost of the searches.
+
+    getPoint(), findStation() and refine() are public so that
+    LongitudeTimeline can refine the crossings it brackets from its
+    precomputed samples.
+
+    Example usage:
+
+        def evaluate(jd):
+            return Ephemeris.getLongitudeAndSpeed("Mars", jd,
+                                                  "geocentric",
+                                                  "tropical")
+
+        finder = LongitudeDeltaRootFinder(evaluate, stepDays=1.0,
+            maxSpeed=LongitudeDeltaRootFinder.\\
+                getMaxLongitudeSpeed("geocentric", "Mars"))
+        jds = finder.findJulianDays(referenceJd, 720.0, 1)
+    """
+
+    # Logger object for this class.
+    log = logging.getLogger("longitude_root_finder.LongitudeDeltaRootFinder")
+
+    # Upper bounds of the absolute longitude speed, in degrees per
+    # day, for each centricity type and planet name.  These are the
+    # maximums seen in the Swiss Ephemeris from 1800 to 2100, plus a
+    # margin of about 10 percent.  Planets not listed here (and
+    # topocentric positions, where the parallax of the Moon changes
+    # the speed a lot during the day) are stepped with the fixed step
+    # size only.
+    maxLongitudeSpeeds = {
+        "geocentric" : {
+            "Sun"           : 1.1,
+            "Moon"          : 16.5,
+            "Mercury"       : 2.4,
+            "Venus"         : 1.4,
+            "Mars"          : 0.9,
+            "Jupiter"       : 0.27,
+            "Saturn"        : 0.15,
+            "Uranus"        : 0.075,
+            "Neptune"       : 0.05,
+            "Pluto"         : 0.05,
+            "MeanNorthNode" : 0.06,
+            "TrueNorthNode" : 0.3,
+            "Chiron"        : 0.17,
+            "Ceres"         : 0.51,
+            "Pallas"        : 0.68,
+            "Juno"          : 0.66,
+            "Vesta"         : 0.6,
+            },
+        "heliocentric" : {
+            "Mercury"       : 7.0,
+            "Venus"         : 1.8,
+            "Earth"         : 1.1,
+            "Mars"          : 0.7,
+            "Jupiter"       : 0.1,
+            "Saturn"        : 0.042,
+            "Uranus"        : 0.015,
+            "Neptune"       : 0.007,
+            "Pluto"         : 0.008,
+            "Chiron"        : 0.053,
+            "Ceres"         : 0.29,
+            "Pallas"        : 0.46,
+            "Juno"          : 0.45,
+            "Vesta"         : 0.36,
+            },
+        }
+
+    # Maximum number of degrees that the planet may move in one step.
+    # The unwrapping of the longitude between two steps assumes that
+    # the planet moved less than 180 degrees.
+    maxStepDegrees = 120.0
+
+    # Maximum number of degrees between the longitude at a refined
+    # moment and the desired longitude.  Averaged planets jump when
+    # one of their constituents crosses 0 degrees.  A jump that is not
+    # split off from its step (see findJump()), e.g. when two jumps
+    # fall in one step, looks like a crossing.  Refining it converges
+    # on the jump, far away from the desired longitude, so it is
+    # rejected.  A real crossing is within the speed times
+    # maxErrorDays, a small fraction of a degree.
+    maxResidualDegrees = 1.0
+
+    # Maximum number of iterations when refining a crossing.  Bisection
+    # alone would reach 2 seconds in a bracket of 4200 days in 28
+    # iterations, so this is only a guard.
+    maxRefineIterations = 100
+
+    # Maximum number of iterations when locating a station.
+    maxStationIterations = 8
+
+    def __init__(self,
+                 evaluateFunc,
+                 stepDays,
+                 maxSpeed=None,
+                 isDirectOnly=False,
+                 maxErrorDays=(2.0 / 86400.0),
+                 jumpDegrees=None):
+        """Initializes the LongitudeDeltaRootFinder.
+
+        Arguments:
+        evaluateFunc - function taking a float Julian Day, and
+                       returning the tuple (longitude, longitudeSpeed)
+                       of the planet at that moment, e.g. a wrapper
+                       around Ephemeris.getLongitudeAndSpeed().
+                       longitudeSpeed is in degrees per day, and may
+                       be None if it is not available.
+        stepDays     - float value for the number of days to step,
+                       when looking for crossings.  This must be small
+                       enough that the planet cannot move more than
+                       maxStepDegrees, nor half of 'jumpDegrees', in
+                       one step.
+        maxSpeed     - float value for the upper bound of the absolute
+                       longitude speed of the planet, in degrees per
+                       day, or None if it is not known.  See
+                       getMaxLongitudeSpeed().
+        isDirectOnly - bool value for whether the planet never goes
+                       retrograde.  If True, the search stops at the
+                       first result.
+        maxErrorDays - float value holding the maximum time
+                       difference, in days, between the exact moment
+                       and the one calculated.  Default is 2 seconds.
+        jumpDegrees  - float value for the number of degrees that the
+                       longitude of the planet jumps by, or None if it
+                       does not jump.  See getLongitudeJumpDegrees().
+        """
+
+        self.evaluateFunc = evaluateFunc
+        self.stepDays = float(stepDays)
+        self.maxSpeed = maxSpeed
+        self.isDirectOnly = isDirectOnly
+        self.maxErrorDays = maxErrorDays
+        self.jumpDegrees = jumpDegrees
+        self.hasJumps = (jumpDegrees != None)
+
+        # Number of degrees that the longitude must change by in one
+        # step to be taken as a jump.
+        self.jumpThresholdDegrees = LongitudeDeltaRootFinder.maxStepDegrees
+        if jumpDegrees != None:
+            self.jumpThresholdDegrees = \
+                min(self.jumpThresholdDegrees, jumpDegrees / 2.0)
+
+        # Total number of evaluations done in the last search.
+        self.numEvaluations = 0
+
+        # Number of evaluations done to refine each of the results of
+        # the last search.
+        self.resultNumEvaluations = []
+
+    @staticmethod
+    def getMaxLongitudeSpeed(centricityType, planetName):
+        """Returns the upper bound of the absolute longitude speed of
+        the given planet, in degrees per day.  Combination planets
+        (e.g. "MoSu", or planets registered with the "combination"
+        formula) are bounded by the sum of the bounds of their
+        constituents.
+
+        Averaged planets do not have a bound, because their longitude
+        jumps by 360 divided by the number of constituents every time
+        one of the constituents crosses 0 degrees.  House cusps and
+        ascmc planets do not have a bound either.
+
+        Returns:
+        float value for the speed bound, or None if it is not known.
+        """
+
+        speeds = LongitudeDeltaRootFinder.maxLongitudeSpeeds.\
+                 get(centricityType, {})
+
+        if planetName in speeds:
+            return speeds[planetName]
+
+        if planetName in Ephemeris.combinationPlanetConstituents:
+            constituents = \
+                Ephemeris.combinationPlanetConstituents[planetName]
+        elif planetName in Ephemeris.derivedPlanetFormulas and \
+             Ephemeris.derivedPlanetFormulas[planetName][1] == \
+             "combination":
+            constituents = Ephemeris.derivedPlanetFormulas[planetName][0]
+        else:
+            return None
+
+        maxSpeed = 0.0
+        for constituent in constituents:
+            constituentMaxSpeed = \
+                LongitudeDeltaRootFinder.getMaxLongitudeSpeed(\
+                centricityType, constituent)
+
+            if constituentMaxSpeed == None:
+                return None
+
+            maxSpeed += constituentMaxSpeed
+
+        return maxSpeed
+
+    @staticmethod
+    def hasLongitudeSpeed(planetName):
+        """Returns True if the given planet has a real longitude
+        speed.  House cusps and ascmc planets (and custom planets
+        calculated from them) do not, since their PlanetaryInfo holds
+        a placeholder value of 360.0 for it.
+        """
+
+        if Ephemeris.getPlanetIdForName(planetName) != None:
+            return True
+
+        constituents = Ephemeris.getPlanetConstituents(planetName)
+        if len(constituents) == 0:
+            return False
+
+        for constituent in constituents:
+            if LongitudeDeltaRootFinder.hasLongitudeSpeed(constituent) == \
+               False:
+                return False
+
+        return True
+
+    @staticmethod
+    def hasLongitudeJumps(planetName):
+        """Returns True if the longitude of the given planet can jump,
+        instead of moving continuously.  See getLongitudeJumpDegrees().
+        """
+
+        return LongitudeDeltaRootFinder.getLongitudeJumpDegrees(planetName) \
+               != None
+
+    @staticmethod
+    def getLongitudeJumpDegrees(planetName):
+        """Returns the smallest number of degrees that the longitude of
+        the given planet jumps by.  Averaged planets (and custom
+        planets registered with the "average" formula) jump by 360
+        divided by the number of constituents every time one of the
+        constituents crosses 0 degrees, e.g. 72 degrees for
+        MeanOfFive and 45 degrees for CycleOfEight.  A jump of a
+        constituent is divided the same way.  Other custom planets
+        jump with their constituents.
+
+        Returns:
+        float value for the number of degrees, or None if the
+        longitude of the planet does not jump.
+        """
+
+        if planetName in Ephemeris.averagedPlanetConstituents:
+            isAverage = True
+        elif planetName in Ephemeris.derivedPlanetFormulas and \
+             Ephemeris.derivedPlanetFormulas[planetName][1] == "average":
+            isAverage = True
+        else:
+            isAverage = False
+
+        constituents = Ephemeris.getPlanetConstituents(planetName)
+
+        jumpDegrees = None
+        for constituent in constituents:
+            constituentJumpDegrees = \
+                LongitudeDeltaRootFinder.getLongitudeJumpDegrees(constituent)
+
+            # Every constituent of an average jumps at 0 degrees.
+            if isAverage == True:
+                if constituentJumpDegrees == None:
+                    constituentJumpDegrees = 360.0
+                constituentJumpDegrees /= len(constituents)
+
+            if constituentJumpDegrees != None and \
+               (jumpDegrees == None or constituentJumpDegrees < jumpDegrees):
+                jumpDegrees = constituentJumpDegrees
+
+        return jumpDegrees
+
+    @staticmethod
+    def toSignedAngle(angle):
+        """Returns the given angle normalized to the range
+        [-180, 180).
+        """
+
+        return ((angle + 180.0) % 360.0) - 180.0
+
+    def resetEvaluationCounts(self):
+        """Resets numEvaluations and resultNumEvaluations.  This is
+        done at the start of every search, and may be done by callers
+        that use getPoint(), findStation() and refine() directly.
+        """
+
+        self.numEvaluations = 0
+        self.resultNumEvaluations = []
+
+    def findJulianDays(self, referenceJd, desiredDeltaDegrees, direction=1):
+        """Returns a list of float Julian Days of the moments when the
+        planet is at 'desiredDeltaDegrees' longitude degrees relative
+        to the longitude at Julian Day 'referenceJd'.
+
+        The search stops at the first result for direct-only planets.
+        Otherwise it stops once the planet is more than 120 degrees
+        past 'desiredDeltaDegrees' in the direction of the search,
+        like the searches of LookbackMultipleUtils.
+
+        Arguments:
+        referenceJd         - float Julian Day for the reference time.
+                              The planet longitude at this moment is
+                              taken as the zero-point.
+        desiredDeltaDegrees - float value for the number of longitude
+                              degrees elapsed from the longitude at
+                              'referenceJd'.
+        direction           - int value.  Positive to search into
+                              the future, negative to search into
+                              the past.
+
+        Returns:
+        List of float Julian Days, ordered chronologically in the
+        direction of the search.
+        """
+
+        if self.log.isEnabledFor(logging.DEBUG) == True:
+            self.log.debug("Entered " + inspect.stack()[0][3] + "()")
+
+        # Return value.
+        rv = []
+
+        self.resetEvaluationCounts()
+
+        if direction >= 0:
+            sign = 1.0
+        else:
+            sign = -1.0
+
+        # Points are tuples: (jd, longitude, deltaDegrees, speed),
+        # where deltaDegrees is the unwrapped number of degrees moved
+        # since 'referenceJd'.
+        (longitude, speed) = self.__evaluate(referenceJd)
+        prevPoint = (referenceJd, longitude, 0.0, speed)
+
+        done = False
+        while not done:
+            stepDays = self.__getStepDays(prevPoint[2], desiredDeltaDegrees)
+
+            currJd = prevPoint[0] + (sign * stepDays)
+            currPoint = self.getPoint(currJd, prevPoint)
+
+            # The planet does not move this far in one step, so the
+            # longitude jumped.  Unwrap the jump like the searches of
+            # LookbackMultipleUtils did.
+            segments = [(prevPoint, currPoint)]
+            if abs(currPoint[2] - prevPoint[2]) > \
+               self.jumpThresholdDegrees:
+
+                currPoint = self.__unwrapJump(prevPoint, currPoint)
+
+                # Split the step at the jump, so that the delta is
+                # continuous in each segment, and the jump itself is
+                # not taken as a crossing.
+                if self.hasJumps == True:
+                    (beforePoint, afterPoint) = \
+                        self.findJump(prevPoint, currPoint)
+
+                    if self.log.isEnabledFor(logging.DEBUG) == True:
+                        self.log.debug("Jump at jd {}: ".\
+                                       format(afterPoint[0]) + \
+                                       "deltaDegrees {} -> {}".\
+                                       format(beforePoint[2],
+                                              afterPoint[2]))
+
+                    segments = [(prevPoint, beforePoint),
+                                (afterPoint, currPoint)]
+
+            if self.log.isEnabledFor(logging.DEBUG) == True:
+                self.log.debug("jd {}: deltaDegrees == {}".\
+                               format(currJd, currPoint[2]))
+
+            # Split the segments at a station, if there was one, so
+            # that the delta is monotone in each piece.
+            pieces = []
+            for (point1, point2) in segments:
+                if not self.__isStationToCheck(point1,
+                                               point2,
+                                               desiredDeltaDegrees,
+                                               abs(point2[0] - point1[0])):
+                    pieces.append((point1, point2))
+                    continue
+
+                stationPoint = self.findStation(point1, point2)
+
+                if self.log.isEnabledFor(logging.DEBUG) == True:
+                    self.log.debug("Station at jd {}: deltaDegrees == {}".\
+                                   format(stationPoint[0], stationPoint[2]))
+
+                pieces.append((point1, stationPoint))
+                pieces.append((stationPoint, point2))
+
+            for (point1, point2) in pieces:
+                offset1 = point1[2] - desiredDeltaDegrees
+                offset2 = point2[2] - desiredDeltaDegrees
+
+                if (offset1 < 0 and offset2 > 0) or \
+                   (offset1 > 0 and offset2 < 0):
+
+                    numEvaluations = self.numEvaluations
+                    jd = self.refine(point1, point2, desiredDeltaDegrees)
+                    if jd == None:
+                        continue
+
+                    rv.append(jd)
+                    self.resultNumEvaluations.append(\
+                        self.numEvaluations - numEvaluations)
+
+                    if self.log.isEnabledFor(logging.DEBUG) == True:
+                        self.log.debug("Found jd {} in {} evaluations.".\
+                                       format(jd,
+                                              self.resultNumEvaluations[-1]))
+
+            # Direct-only planets yield only 1 result.
+            if len(rv) >= 1 and self.isDirectOnly == True:
+                done = True
+
+            # Stop if the planet will never reach the desired degrees
+            # again if we continue.
+            if sign * (currPoint[2] - desiredDeltaDegrees) > 120:
+                done = True
+
+            prevPoint = currPoint
+
+        if self.log.isEnabledFor(logging.DEBUG) == True:
+            self.log.debug("Found {} results in {} evaluations.".\
+                           format(len(rv), self.numEvaluations))
+            self.log.debug("Exiting " + inspect.stack()[0][3] + "()")
+
+        return rv
+
+    def sweepJulianDays(self,
+                        referenceJds,
+                        desiredDeltaDegreesList,
+                        direction=1):
+        """Does the search of findJulianDays() for every combination
+        of the given reference Julian Days and desired delta degrees,
+        in a single pass through time.
+
+        The pass walks once over the span of time in the direction of
+        the search, keeping the unwrapped (cumulative) longitude of
+        the planet.  When the walk reaches a reference Julian Day, the
+        cumulative longitudes of all its desired deltas become active
+        targets, kept in a sorted list.  Each step then looks up the
+        targets between the cumulative longitudes at its two ends with
+        a binary search, and refines only those.  Targets are retired
+        by the same rules that stop findJulianDays(), and the steps
+        are lengthened by the distance to the nearest active target.
+        When there are no active targets, the walk jumps straight to
+        the next reference Julian Day.  The cost is about the span of
+        time walked plus the number of results, instead of the span
+        times the number of searches.
+
+        Arguments:
+        referenceJds            - list of float Julian Days for the
+                                  reference times.  These do not need
+                                  to be sorted.
+        desiredDeltaDegreesList - list of float values for the number
+                                  of longitude degrees elapsed from the
+                                  longitude at each reference time.
+        direction               - int value.  Positive to search into
+                                  the future, negative to search into
+                                  the past.
+
+        Returns:
+        List with one entry for each Julian Day in 'referenceJds', in
+        the same order.  Each entry is a list with one entry for each
+        value in 'desiredDeltaDegreesList', in the same order.  Each of
+        those is the list of float Julian Days that findJulianDays()
+        would return for that reference Julian Day and desired delta.
+        """
+
+        if self.log.isEnabledFor(logging.DEBUG) == True:
+            self.log.debug("Entered " + inspect.stack()[0][3] + "()")
+
+        # Return value.
+        rv = [[[] for desiredDeltaDegrees in desiredDeltaDegreesList] \
+              for referenceJd in referenceJds]
+
+        self.resetEvaluationCounts()
+
+        if len(referenceJds) == 0 or len(desiredDeltaDegreesList) == 0:
+            return rv
+
+        if self.hasJumps == True:
+            # The unwrapping of a jump depends on the longitude at the
+            # reference time (see __unwrapJump()), so there is no
+            # single cumulative longitude to walk.  Search for each of
+            # them instead.
+            numEvaluations = 0
+            resultNumEvaluations = []
+
+            for i in range(len(referenceJds)):
+                for j in range(len(desiredDeltaDegreesList)):
+                    rv[i][j] = self.findJulianDays(referenceJds[i],
+                                                   desiredDeltaDegreesList[j],
+                                                   direction)
+                    numEvaluations += self.numEvaluations
+                    resultNumEvaluations.extend(self.resultNumEvaluations)
+
+            self.numEvaluations = numEvaluations
+            self.resultNumEvaluations = resultNumEvaluations
+
+            return rv
+
+        if direction >= 0:
+            sign = 1.0
+        else:
+            sign = -1.0
+
+        # Indexes into referenceJds, in the order that the walk
+        # reaches them.
+        referenceOrder = sorted(range(len(referenceJds)),
+                                key=lambda i: sign * referenceJds[i])
+        nextReference = 0
+
+        # Active targets, sorted by the cumulative longitude.  Each
+        # target is the list [targetDegrees, referenceIndex,
+        # deltaIndex].  targetKeys holds the targetDegrees of each
+        # target, for the binary searches.
+        targets = []
+        targetKeys = []
+
+        prevPoint = None
+
+        while nextReference < len(referenceOrder) or len(targets) > 0:
+
+            if len(targets) == 0:
+                # Nothing to look for until the next reference time.
+                # The cumulative longitude can start over from there.
+                referenceJd = referenceJds[referenceOrder[nextReference]]
+                (longitude, speed) = self.__evaluate(referenceJd)
+                currPoint = (referenceJd, longitude, longitude, speed)
+                stepDays = 0.0
+
+            else:
+                stepDays = self.__getStepDays(\
+                    prevPoint[2],
+                    self.__getNearestTargetDegrees(targetKeys, prevPoint[2]))
+
+                currJd = prevPoint[0] + (sign * stepDays)
+
+                # Don't step past the next reference time.
+                if nextReference < len(referenceOrder):
+                    referenceJd = \
+                        referenceJds[referenceOrder[nextReference]]
+                    if sign * (currJd - referenceJd) > 0:
+                        currJd = referenceJd
+                        stepDays = abs(currJd - prevPoint[0])
+
+                currPoint = self.getPoint(currJd, prevPoint)
+
+                # Split the step at a station, if there was one, so
+                # that the cumulative longitude is monotone in each
+                # piece.
+                pieces = [(prevPoint, currPoint)]
+                if self.isDirectOnly == False and \
+                   prevPoint[3] != None and currPoint[3] != None and \
+                   (prevPoint[3] < 0) != (currPoint[3] < 0):
+
+                    stationPoint = self.findStation(prevPoint, currPoint)
+                    pieces = [(prevPoint, stationPoint),
+                              (stationPoint, currPoint)]
+
+                for (point1, point2) in pieces:
+                    self.__refineTargetsBetween(point1,
+                                                point2,
+                                                targets,
+                                                targetKeys,
+                                                rv)
+
+                # Retire the targets that the planet will not come back
+                # to, like the stopping rule of findJulianDays().
+                if sign > 0:
+                    count = bisect.bisect_left(targetKeys,
+                                               currPoint[2] - 120.0)
+                    del targets[:count]
+                    del targetKeys[:count]
+                else:
+                    count = bisect.bisect_right(targetKeys,
+                                                currPoint[2] + 120.0)
+                    del targets[count:]
+                    del targetKeys[count:]
+
+            # Activate the targets of all the reference times at this
+            # point.
+            while nextReference < len(referenceOrder) and \
+                  referenceJds[referenceOrder[nextReference]] == \
+                  currPoint[0]:
+
+                referenceIndex = referenceOrder[nextReference]
+                for deltaIndex in range(len(desiredDeltaDegreesList)):
+                    targetDegrees = currPoint[2] + \
+                        desiredDeltaDegreesList[deltaIndex]
+
+                    # Like findJulianDays(), a target that is already
+                    # more than 120 degrees behind is never looked for.
+                    if sign * (currPoint[2] - targetDegrees) > 120:
+                        continue
+
+                    index = bisect.bisect_right(targetKeys, targetDegrees)
+                    targetKeys.insert(index, targetDegrees)
+                    targets.insert(index,
+                                   [targetDegrees, referenceIndex, deltaIndex])
+
+                nextReference += 1
+
+            prevPoint = currPoint
+
+        if self.log.isEnabledFor(logging.DEBUG) == True:
+            self.log.debug("Found {} results in {} evaluations.".\
+                           format(len(self.resultNumEvaluations),
+                                  self.numEvaluations))
+            self.log.debug("Exiting " + inspect.stack()[0][3] + "()")
+
+        return rv
+
+    def __refineTargetsBetween(self,
+                               point1,
+                               point2,
+                               targets,
+                               targetKeys,
+                               results):
+        """Refines the moments of the targets whose cumulative
+        longitude is strictly between the ones of the two points, and
+        appends them to 'results'.  The cumulative longitude must be
+        monotone between the two points.  Targets of direct-only
+        planets are removed once they have their result.
+        """
+
+        lowDegrees = min(point1[2], point2[2])
+        highDegrees = max(point1[2], point2[2])
+
+        start = bisect.bisect_right(targetKeys, lowDegrees)
+        end = bisect.bisect_left(targetKeys, highDegrees)
+
+        for target in targets[start:end]:
+            (targetDegrees, referenceIndex, deltaIndex) = target
+
+            numEvaluations = self.numEvaluations
+            jd = self.refine(point1, point2, targetDegrees)
+            if jd == None:
+                continue
+
+            results[referenceIndex][deltaIndex].append(jd)
+            self.resultNumEvaluations.append(\
+                self.numEvaluations - numEvaluations)
+
+            if self.isDirectOnly == True:
+                target[0] = None
+
+        if self.isDirectOnly == True:
+            for i in reversed(range(start, end)):
+                if targets[i][0] == None:
+                    del targets[i]
+                    del targetKeys[i]
+
+    def __getNearestTargetDegrees(self, targetKeys, degrees):
+        """Returns the value in the sorted list 'targetKeys' that is
+        nearest to 'degrees'.
+        """
+
+        index = bisect.bisect_left(targetKeys, degrees)
+
+        if index == 0:
+            return targetKeys[0]
+        elif index == len(targetKeys):
+            return targetKeys[-1]
+        elif targetKeys[index] - degrees < degrees - targetKeys[index - 1]:
+            return targetKeys[index]
+        else:
+            return targetKeys[index - 1]
+
+    def __evaluate(self, jd):
+        """Returns the tuple (longitude, longitudeSpeed) at the given
+        Julian Day, and counts the evaluation.
+        """
+
+        self.numEvaluations += 1
+
+        return self.evaluateFunc(jd)
+
+    def getPoint(self, jd, anchorPoint):
+        """Evaluates the planet at the given Julian Day, and returns
+        the point tuple (jd, longitude, deltaDegrees, speed).
+        deltaDegrees is unwrapped relative to 'anchorPoint', which
+        must be less than 180 degrees of movement away.
+
+        The deltaDegrees of the points can be on any unwrapped scale
+        (e.g. the cumulative longitude of a LongitudeTimeline), as
+        long as all the points given to findStation() and refine()
+        are on the same scale.  The speed of a point is None if it is
+        not known.
+        """
+
+        (longitude, speed) = self.__evaluate(jd)
+
+        deltaDegrees = anchorPoint[2] + \
+            LongitudeDeltaRootFinder.toSignedAngle(longitude - anchorPoint[1])
+
+        return (jd, longitude, deltaDegrees, speed)
+
+    def __unwrapJump(self, prevPoint, currPoint):
+        """Returns 'currPoint' with its deltaDegrees unwrapped relative
+        to 'prevPoint' by the rules of the searches of
+        LookbackMultipleUtils, instead of by the shortest angle.  A
+        full circle is only counted when the angle from the reference
+        longitude goes from above 240 degrees to below 120 degrees,
+        or the other way around.  The deltaDegrees of the points must
+        be relative to the longitude at the reference time.
+        """
+
+        prevDiff = prevPoint[2] % 360.0
+        currDiff = (prevDiff + currPoint[2] - prevPoint[2]) % 360.0
+
+        deltaDegrees = prevPoint[2] + currDiff - prevDiff
+
+        if prevDiff > 240 and currDiff < 120:
+            deltaDegrees += 360.0
+        elif prevDiff < 120 and currDiff > 240:
+            deltaDegrees -= 360.0
+
+        return (currPoint[0], currPoint[1], deltaDegrees, currPoint[3])
+
+    def __getStepDays(self, deltaDegrees, desiredDeltaDegrees):
+        """Returns the number of days to step from a point that is
+        at 'deltaDegrees'.  This is the fixed step size, unless the
+        planet's speed bound guarantees that a longer step can
+        neither reach 'desiredDeltaDegrees' nor move more than
+        maxStepDegrees.
+        """
+
+        stepDays = self.stepDays
+
+        if self.maxSpeed != None and self.maxSpeed > 0.0:
+            degrees = min(abs(desiredDeltaDegrees - deltaDegrees),
+                          LongitudeDeltaRootFinder.maxStepDegrees)
+            safeStepDays = degrees / self.maxSpeed
+
+            if safeStepDays > stepDays:
+                stepDays = safeStepDays
+
+        return stepDays
+
+    def __isStationToCheck(self,
+                           point1,
+                           point2,
+                           desiredDeltaDegrees,
+                           stepDays):
+        """Returns True if the planet went stationary between the two
+        points, and that station could hide a crossing of
+        'desiredDeltaDegrees' (or more than one).
+        """
+
+        if self.isDirectOnly == True:
+            return False
+
+        speed1 = point1[3]
+        speed2 = point2[3]
+        if speed1 == None or speed2 == None or \
+           (speed1 < 0) == (speed2 < 0):
+            return False
+
+        offset1 = point1[2] - desiredDeltaDegrees
+        offset2 = point2[2] - desiredDeltaDegrees
+
+        if (offset1 < 0) != (offset2 < 0):
+            # There is a crossing anyways.  Splitting makes sure that
+            # all the crossings in the step are found.
+            return True
+
+        if self.maxSpeed == None:
+            return True
+
+        # The planet can only come back to the desired degrees if it
+        # is within reach during the step.
+        reachDegrees = self.maxSpeed * stepDays
+
+        return abs(offset1) < reachDegrees and abs(offset2) < reachDegrees
+
+    def findJump(self, point1, point2):
+        """Returns the tuple (beforePoint, afterPoint) of the points
+        right before and right after the jump of the longitude between
+        the two given points, within maxErrorDays of each other.  The
+        longitude is not continuous at the jump, so it is located with
+        bisection.  beforePoint is on the deltaDegrees scale of
+        'point1', and afterPoint on the one of 'point2'.
+        """
+
+        beforePoint = point1
+        afterPoint = point2
+
+        while abs(afterPoint[0] - beforePoint[0]) > self.maxErrorDays:
+            jd = (beforePoint[0] + afterPoint[0]) / 2.0
+            point = self.getPoint(jd, beforePoint)
+
+            if abs(point[2] - beforePoint[2]) > self.jumpThresholdDegrees:
+                deltaDegrees = afterPoint[2] + \
+                    LongitudeDeltaRootFinder.toSignedAngle(point[1] -
+                                                           afterPoint[1])
+                afterPoint = (point[0], point[1], deltaDegrees, point[3])
+            else:
+                beforePoint = point
+
+        return (beforePoint, afterPoint)
+
+    def findStation(self, point1, point2):
+        """Returns the point between the two given points where the
+        longitude speed is zero.  The speeds of the two points must
+        have opposite signs.  The location is found with the Illinois
+        variant of regula falsi, which is exact for a speed that
+        changes linearly.
+        """
+
+        lowPoint = point1
+        highPoint = point2
+        lowSpeed = point1[3]
+        highSpeed = point2[3]
+
+        point = point1
+        side = 0
+
+        for i in range(LongitudeDeltaRootFinder.maxStationIterations):
+            jd = lowPoint[0] - lowSpeed * \
+                 (highPoint[0] - lowPoint[0]) / (highSpeed - lowSpeed)
+
+            prevJd = point[0]
+            point = self.getPoint(jd, point1)
+
+            if point[3] == 0.0 or \
+               abs(point[0] - prevJd) <= self.maxErrorDays:
+                break
+
+            if (point[3] < 0) == (lowSpeed < 0):
+                lowPoint = point
+                lowSpeed = point[3]
+                if side == -1:
+                    highSpeed /= 2.0
+                side = -1
+            else:
+                highPoint = point
+                highSpeed = point[3]
+                if side == 1:
+                    lowSpeed /= 2.0
+                side = 1
+
+        return point
+
+    def refine(self, point1, point2, desiredDeltaDegrees):
+        """Returns the Julian Day between the two given points where
+        the planet is at 'desiredDeltaDegrees'.  The delta degrees of
+        the two points must be on opposite sides of
+        'desiredDeltaDegrees'.
+
+        The iteration is Newton's method on the longitude, with the
+        longitude speed as the derivative, safeguarded by the bracket
+        between the two points (like rtsafe() in Numerical Recipes).
+        When the speed is not available, the secant through the
+        bracket is used in place of the Newton step.
+
+        Returns:
+        float Julian Day of the crossing, or None if the two points
+        only look like they bracket a crossing because the longitude
+        jumped between them (see maxResidualDegrees).
+        """
+
+        # Keep the bracket so that the offset at jdLow is negative,
+        # and the offset at jdHigh is positive.
+        offset1 = point1[2] - desiredDeltaDegrees
+        offset2 = point2[2] - desiredDeltaDegrees
+        if offset1 < 0:
+            (jdLow, offsetLow) = (point1[0], offset1)
+            (jdHigh, offsetHigh) = (point2[0], offset2)
+        else:
+            (jdLow, offsetLow) = (point2[0], offset2)
+            (jdHigh, offsetHigh) = (point1[0], offset1)
+
+        # Start with the linear interpolation between the two points,
+        # which does not need an evaluation.
+        jd = jdLow - offsetLow * (jdHigh - jdLow) / (offsetHigh - offsetLow)
+        prevStepDays = abs(jdHigh - jdLow)
+
+        offset = None
+
+        for i in range(LongitudeDeltaRootFinder.maxRefineIterations):
+            point = self.getPoint(jd, point1)
+            offset = point[2] - desiredDeltaDegrees
+            speed = point[3]
+
+            if offset == 0.0:
+                break
+            elif offset < 0:
+                (jdLow, offsetLow) = (jd, offset)
+            else:
+                (jdHigh, offsetHigh) = (jd, offset)
+
+            if abs(jdHigh - jdLow) <= self.maxErrorDays:
+                break
+
+            nextJd = None
+            if speed != None and speed != 0.0:
+                # Newton step.
+                nextJd = jd - (offset / speed)
+            else:
+                # Secant step through the bracket.
+                nextJd = jdLow - offsetLow * \
+                         (jdHigh - jdLow) / (offsetHigh - offsetLow)
+
+            # Fall back to bisection if the estimate is outside of the
+            # bracket, or if it is not converging at least as fast as
+            # bisection would.  (An estimate on the bracket edge is
+            # fine, it happens when the step is below the float
+            # resolution of the Julian Day.)
+            if (nextJd - jdLow) * (nextJd - jdHigh) > 0 or \
+               abs(nextJd - jd) * 2.0 > prevStepDays:
+
+                nextJd = (jdLow + jdHigh) / 2.0
+
+            stepDays = abs(nextJd - jd)
+            prevStepDays = stepDays
+            jd = nextJd
+
+            if stepDays <= self.maxErrorDays:
+                break
+
+        # The last evaluated moment is within maxErrorDays of the
+        # returned one.
+        if offset != None and \
+           abs(offset) > LongitudeDeltaRootFinder.maxResidualDegrees:
+
+            if self.log.isEnabledFor(logging.DEBUG) == True:
+                self.log.debug("Rejected jd {}: ".format(jd) + \
+                               "{} degrees away from the desired degrees.".\
+                               format(offset))
+            return None
+
+        return jd
+
+##############################################################################
+
+def testLongitudeDeltaRootFinder():
+    """Compares LongitudeDeltaRootFinder against a fixed-step bisection
+    search, and prints the number of evaluations used by each.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    import time
+
+    referenceJd = Ephemeris.datetimeToJulianDay(\
+        Ephemeris.julianDayToDatetime(2449640.5))
+
+    maxErrorDays = 2.0 / 86400.0
+
+    tests = [("Mars", "geocentric", 1.0, 720.0),
+             ("Mercury", "geocentric", 1.0, -30.0),
+             ("Venus", "heliocentric", 30.0, 1080.0),
+             ("Moon", "geocentric", 5.0, 3600.0),
+             ("MoSu", "geocentric", 5.0, 3600.0),
+             ("H1", "geocentric", 5.0 / 24.0, 360.0)]
+
+    for (planetName, centricityType, stepDays, desiredDeltaDegrees) in tests:
+        numEvaluations = [0]
+
+        def evaluate(jd):
+            numEvaluations[0] += 1
+            return Ephemeris.getLongitudeAndSpeed(planetName,
+                                                  jd,
+                                                  centricityType,
+                                                  "tropical")
+
+        # Fixed-step bisection search, for comparison.
+        startTime = time.time()
+        referenceLongitude = evaluate(referenceJd)[0]
+        expectedJds = []
+        prevJd = referenceJd
+        prevDelta = 0.0
+        prevLongitude = referenceLongitude
+        while True:
+            currJd = prevJd + stepDays
+            currLongitude = evaluate(currJd)[0]
+            currDelta = prevDelta + LongitudeDeltaRootFinder.\
+                        toSignedAngle(currLongitude - prevLongitude)
+
+            if (prevDelta < desiredDeltaDegrees) != \
+               (currDelta < desiredDeltaDegrees):
+
+                (t1, t2) = (prevJd, currJd)
+                while abs(t2 - t1) > maxErrorDays:
+                    testJd = (t1 + t2) / 2.0
+                    testDelta = prevDelta + LongitudeDeltaRootFinder.\
+                        toSignedAngle(evaluate(testJd)[0] - prevLongitude)
+                    if (testDelta < desiredDeltaDegrees) == \
+                       (prevDelta < desiredDeltaDegrees):
+                        t1 = testJd
+                    else:
+                        t2 = testJd
+                expectedJds.append(t2)
+
+            if currDelta - desiredDeltaDegrees > 120:
+                break
+            (prevJd, prevDelta, prevLongitude) = \
+                (currJd, currDelta, currLongitude)
+        bisectionTime = time.time() - startTime
+        bisectionEvaluations = numEvaluations[0]
+
+        numEvaluations[0] = 0
+        startTime = time.time()
+        finder = LongitudeDeltaRootFinder(\
+            evaluate,
+            stepDays,
+            LongitudeDeltaRootFinder.getMaxLongitudeSpeed(centricityType,
+                                                          planetName),
+            False,
+            maxErrorDays)
+        jds = finder.findJulianDays(referenceJd, desiredDeltaDegrees, 1)
+        finderTime = time.time() - startTime
+
+        maxDiffSeconds = 0.0
+        for (jd, expectedJd) in zip(jds, expectedJds):
+            maxDiffSeconds = max(maxDiffSeconds,
+                                 abs(jd - expectedJd) * 86400.0)
+
+        print("  {} {} {} deg: ".\
+              format(centricityType, planetName, desiredDeltaDegrees) + \
+              "{} results (bisection {}), ".\
+              format(len(jds), len(expectedJds)) + \
+              "max diff {:.3f} sec".format(maxDiffSeconds))
+        print("    bisection: {} evaluations, {:.3f} sec".\
+              format(bisectionEvaluations, bisectionTime))
+        print("    root finder: {} evaluations, {:.3f} sec, ".\
+              format(finder.numEvaluations, finderTime) + \
+              "evaluations per result: {}".\
+              format(finder.resultNumEvaluations))
+
+def testLongitudeDeltaRootFinder_sweepJulianDays():
+    """Compares the results of sweepJulianDays() against
+    findJulianDays() for each reference Julian Day and desired delta,
+    and prints the number of evaluations used by each.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    import time
+
+    maxErrorDays = 2.0 / 86400.0
+
+    # Daily reference Julian Days over 200 days.
+    referenceJds = [2449640.5 + i for i in range(200)]
+
+    tests = [("Mars", "geocentric", 1.0, [90.0, 180.0, 360.0, 720.0]),
+             ("Mercury", "geocentric", 1.0, [-20.0, 30.0, 360.0]),
+             ("MoSu", "geocentric", 5.0, [360.0, 720.0, 1440.0]),
+             ("H1", "geocentric", 5.0 / 24.0, [90.0, 360.0])]
+
+    for (planetName, centricityType, stepDays, desiredDeltaDegreesList) \
+        in tests:
+
+        def evaluate(jd):
+            return Ephemeris.getLongitudeAndSpeed(planetName,
+                                                  jd,
+                                                  centricityType,
+                                                  "tropical")
+
+        finder = LongitudeDeltaRootFinder(\
+            evaluate,
+            stepDays,
+            LongitudeDeltaRootFinder.getMaxLongitudeSpeed(centricityType,
+                                                          planetName),
+            Ephemeris.isDirectOnlyPlanetName(centricityType, planetName),
+            maxErrorDays)
+
+        for direction in [1, -1]:
+            sign = direction
+            startTime = time.time()
+            numEvaluations = 0
+            expected = []
+            for referenceJd in referenceJds:
+                expected.append([])
+                for desiredDeltaDegrees in desiredDeltaDegreesList:
+                    expected[-1].append(\
+                        finder.findJulianDays(referenceJd,
+                                              sign * desiredDeltaDegrees,
+                                              direction))
+                    numEvaluations += finder.numEvaluations
+            findTime = time.time() - startTime
+
+            startTime = time.time()
+            results = finder.sweepJulianDays(\
+                referenceJds,
+                [sign * d for d in desiredDeltaDegreesList],
+                direction)
+            sweepTime = time.time() - startTime
+
+            numResults = 0
+            numMismatches = 0
+            maxDiffSeconds = 0.0
+            for i in range(len(referenceJds)):
+                for j in range(len(desiredDeltaDegreesList)):
+                    numResults += len(expected[i][j])
+                    if len(results[i][j]) != len(expected[i][j]):
+                        numMismatches += 1
+                        continue
+                    for (jd, expectedJd) in zip(results[i][j],
+                                                expected[i][j]):
+                        maxDiffSeconds = max(maxDiffSeconds,
+                            abs(jd - expectedJd) * 86400.0)
+
+            print("  {} {} direction {}: {} results, ".\
+                  format(centricityType, planetName, direction,
+                         numResults) + \
+                  "{} mismatched counts, max diff {:.3f} sec".\
+                  format(numMismatches, maxDiffSeconds))
+            print("    findJulianDays(): {} evaluations, {:.3f} sec".\
+                  format(numEvaluations, findTime))
+            print("    sweepJulianDays(): {} evaluations, {:.3f} sec".\
+                  format(finder.numEvaluations, sweepTime))
+
+def testLongitudeDeltaRootFinder_averagedPlanets():
+    """Checks that the results for averaged planets, whose longitude
+    jumps when a constituent crosses 0 degrees, are at the desired
+    longitude, and prints them.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    maxErrorDays = 2.0 / 86400.0
+
+    # The longitude of AvgJuSa jumps from 230.98 to 50.98 degrees in
+    # 1975, across the desired longitude of the first test.  The
+    # reference time is 1973-05-31 13:29:01 UTC.
+    tests = [("AvgJuSa", 2441834.061821076, 1.0, -10.0, 1),
+             ("AvgJuSa", 2441834.061821076, 1.0, -10.0, -1),
+             ("AvgJuSa", 2441834.061821076, 1.0, 30.0, 1),
+             ("MeanOfFive", 2449640.5, 1.0, -10.0, -1),
+             ("MeanOfFive", 2449640.5, 1.0, 5.0, -1)]
+
+    for (planetName, referenceJd, stepDays, desiredDeltaDegrees, direction) \
+        in tests:
+
+        def evaluate(jd):
+            return Ephemeris.getLongitudeAndSpeed(planetName,
+                                                  jd,
+                                                  "geocentric",
+                                                  "tropical")
+
+        finder = LongitudeDeltaRootFinder(\
+            evaluate,
+            stepDays,
+            None,
+            False,
+            maxErrorDays,
+            LongitudeDeltaRootFinder.getLongitudeJumpDegrees(planetName))
+
+        desiredDegree = (evaluate(referenceJd)[0] + desiredDeltaDegrees) % 360
+        jds = finder.findJulianDays(referenceJd,
+                                    desiredDeltaDegrees,
+                                    direction)
+
+        maxResidualDegrees = 0.0
+        for jd in jds:
+            residualDegrees = LongitudeDeltaRootFinder.toSignedAngle(\
+                evaluate(jd)[0] - desiredDegree)
+            maxResidualDegrees = max(maxResidualDegrees, abs(residualDegrees))
+
+        sweepJds = finder.sweepJulianDays([referenceJd],
+                                          [desiredDeltaDegrees],
+                                          direction)[0][0]
+
+        print("  {} {} deg direction {}: {} results, ".\
+              format(planetName, desiredDeltaDegrees, direction, len(jds)) + \
+              "max residual {:.6f} deg, sweep matches: {}".\
+              format(maxResidualDegrees, sweepJds == jds))
+        for jd in jds:
+            print("    {}".format(Ephemeris.julianDayToDatetime(jd)))
+
+##############################################################################
+
+# For debugging the module during development.
+if __name__=="__main__":
+    # For logging and for exiting.
+    import os
+    import sys
+
+    # Initialize logging.
+    LOG_CONFIG_FILE = os.path.join(sys.path[0], "../conf/logging.conf")
+    logging.config.fileConfig(LOG_CONFIG_FILE)
+    #logging.disable(logging.CRITICAL)
+
+    # Initialize the Ephemeris (required).
+    Ephemeris.initialize()
+
+    # New York City:
+    lon = -74.0064
+    lat = 40.7142
+
+    # Set a default location (required).
+    Ephemeris.setGeographicPosition(lon, lat)
+
+    testLongitudeDeltaRootFinder()
+    testLongitudeDeltaRootFinder_sweepJulianDays()
+    testLongitudeDeltaRootFinder_averagedPlanets()
+
+    # Close the Ephemeris so it can do necessary cleanups.
+    Ephemeris.closeEphemeris()
+
+    # Quit.
+    print("Exiting.")
+    sys.exit()
+
+##############################################################################
@@ -0,0 +1,878 @@
+
+# For directory access.
+import os
+import sys
+import inspect
+
+# For bisect.bisect_left() and bisect.bisect_right().
+import bisect
+
+# For reading and writing the file header.
+import json
+import struct
+
+# For array.array of floats and ints.
+import array
+
+# For logging.
+import logging
+import logging.config
+
+# Import the Ephemeris classes.
+from ephemeris import Ephemeris
+
+# For checking if a planet depends on the geographic position.
+from ephemeris_store import EphemerisStore
+
+# For refining the crossings.
+from longitude_root_finder import LongitudeDeltaRootFinder
+
+##############################################################################
+
+class LongitudeTimeline:
+    """Index of the unwrapped (cumulative) longitude of one planet, for
+    one centricity type and zodiac type, over a span of time.
+
+    The index is a sorted array of Julian Days, sampled at the step
+    size of a LongitudeDeltaRootFinder, with the cumulative longitude
+    of the planet at each of them.  The cumulative longitude has 360
+    degrees added every time the planet crosses 0 degrees going
+    direct, and 360 degrees removed every time it crosses 0 degrees
+    going retrograde, like the columns of
+    misc/EphemerisGeneration/cycleHuntingGeneric/
+    makeFilledMasterEphemeris_2p.py.
+
+    Because of retrograde motion, the cumulative longitude is not
+    monotone.  When the planet goes stationary between two samples,
+    the station is located and inserted as a sample, and a new
+    monotone run starts there.  (For planets without a longitude
+    speed, a run ends at the sample where the cumulative longitude
+    changes direction.)  Each run is sorted, so the question "when did
+    the planet move N degrees from time T" is a binary search of the
+    runs after (or before) T for the cumulative longitude at T plus N,
+    followed by the refinement of the bracketing samples with
+    LongitudeDeltaRootFinder.refine().  Only the reference time and
+    the refinement need ephemeris evaluations.
+
+    The searches give the same results as
+    LongitudeDeltaRootFinder.findJulianDays(), including its stopping
+    rules.  Searches that would go past the ends of the timeline are
+    handed to LongitudeDeltaRootFinder.findJulianDays().
+
+    A timeline can be saved to and loaded from a binary file, so that
+    it can be cached on disk per document (see getCacheFilename() and
+    loadOrBuild()).
+
+    File format:
+
+      - 8 bytes: LongitudeTimeline.MAGIC
+      - 4 bytes: unsigned int, little-endian, file format version.
+      - 4 bytes: unsigned int, little-endian, length of the header.
+      - Header: utf-8 JSON, padded with spaces so that the arrays
+        start at a multiple of 8 bytes.
+      - Julian Days: float64 values, little-endian, 'numSamples'
+        values.
+      - Cumulative longitudes: float64 values, little-endian,
+        'numSamples' values.
+      - Run starts: int64 values, little-endian, 'numRuns' values,
+        holding the index of the first sample of each run.
+
+    The JSON header holds: planetName, centricityType, zodiacType,
+    stepDays, numSamples, numRuns, and geoLongitudeDeg,
+    geoLatitudeDeg, geoAltitudeMeters (the geographic position the
+    timeline was built for).
+
+    Example usage:
+
+        finder = LookbackMultipleUtils.createLongitudeDeltaRootFinder(\\
+            "Mars", "geocentric", "tropical")
+        timeline = LongitudeTimeline.build(finder, "Mars", "geocentric",
+                                           "tropical", startJd, endJd)
+        jds = timeline.findJulianDays(finder, referenceJd, 720.0, 1)
+    """
+
+    # Logger object for this class.
+    log = logging.getLogger("longitude_timeline.LongitudeTimeline")
+
+    # Bytes at the start of every timeline file.
+    MAGIC = b"PCTLONTL"
+
+    # Version of the file format.
+    VERSION = 1
+
+    # File extension of the timeline files.
+    FILENAME_EXTENSION = ".pclt"
+
+    def __init__(self,
+                 planetName,
+                 centricityType,
+                 zodiacType,
+                 stepDays,
+                 jds,
+                 degrees,
+                 runStarts,
+                 geoLongitudeDeg,
+                 geoLatitudeDeg,
+                 geoAltitudeMeters):
+        """Initializes the LongitudeTimeline with the given samples.
+        Timelines are normally created with build() or load().
+
+        Arguments:
+        planetName        - str holding the name of the planet.
+        centricityType    - str value holding either "geocentric",
+                            "topocentric", or "heliocentric".
+        zodiacType        - str value holding either "tropical" or
+                            "sidereal".
+        stepDays          - float value for the step size, in days,
+                            that the samples were taken at.
+        jds               - array.array of floats, holding the sorted
+                            Julian Days of the samples.
+        degrees           - array.array of floats, holding the
+                            cumulative longitude at each sample.
+        runStarts         - array.array of ints, holding the index of
+                            the first sample of each monotone run.
+                            Each run ends at the first sample of the
+                            next run (or at the last sample).
+        geoLongitudeDeg   - float value for the geographic longitude
+                            the timeline was built for.
+        geoLatitudeDeg    - float value for the geographic latitude
+                            the timeline was built for.
+        geoAltitudeMeters - float value for the altitude the timeline
+                            was built for.
+        """
+
+        self.planetName = planetName
+        self.centricityType = centricityType
+        self.zodiacType = zodiacType
+        self.stepDays = stepDays
+        self.jds = jds
+        self.degrees = degrees
+        self.runStarts = runStarts
+        self.geoLongitudeDeg = geoLongitudeDeg
+        self.geoLatitudeDeg = geoLatitudeDeg
+        self.geoAltitudeMeters = geoAltitudeMeters
+
+        self.numSamples = len(jds)
+
+        # Julian Days of the first and last samples.
+        self.startJd = jds[0]
+        self.endJd = jds[self.numSamples - 1]
+
+    @staticmethod
+    def build(finder,
+              planetName,
+              centricityType,
+              zodiacType,
+              startJd,
+              endJd,
+              ephemerisContext=None):
+        """Builds the timeline of a planet by sampling it with the
+        given LongitudeDeltaRootFinder from 'startJd' to 'endJd'.
+
+        Arguments:
+        finder           - LongitudeDeltaRootFinder for the planet,
+                           centricity type and zodiac type, e.g. from
+                           LookbackMultipleUtils.\\
+                           createLongitudeDeltaRootFinder().  The
+                           samples are taken at its step size.
+        planetName       - str holding the name of the planet.
+        centricityType   - str value holding either "geocentric",
+                           "topocentric", or "heliocentric".
+        zodiacType       - str value holding either "tropical" or
+                           "sidereal".
+        startJd          - float Julian Day of the first sample.
+        endJd            - float Julian Day to sample up to.
+        ephemerisContext - EphemerisContext that 'finder' calculates
+                           the planet positions with, or None if it
+                           uses the Ephemeris settings.  This is only
+                           used for recording the geographic position.
+
+        Returns:
+        LongitudeTimeline object.
+        """
+
+        if LongitudeTimeline.log.isEnabledFor(logging.DEBUG) == True:
+            LongitudeTimeline.log.debug("Entered " + inspect.stack()[0][3] + "()")
+
+        if endJd <= startJd:
+            raise ValueError("endJd must be after startJd")
+
+        finder.resetEvaluationCounts()
+
+        jds = array.array('d')
+        degrees = array.array('d')
+        runStarts = array.array('q', [0])
+
+        # Anchoring the first point at a longitude and delta of 180
+        # degrees makes its cumulative longitude equal to its
+        # longitude, so that the longitude of every sample is its
+        # cumulative longitude modulo 360 (see getPoint()).
+        prevPoint = finder.getPoint(startJd, (startJd, 180.0, 180.0, None))
+        jds.append(prevPoint[0])
+        degrees.append(prevPoint[2])
+
+        # Direction of the cumulative longitude in the current run:
+        # 1.0, -1.0, or 0.0 if not known yet.
+        runSign = 0.0
+
+        while prevPoint[0] < endJd:
+            currJd = min(prevPoint[0] + finder.stepDays, endJd)
+            currPoint = finder.getPoint(currJd, prevPoint)
+
+            if finder.isDirectOnly == False and \
+               prevPoint[3] != None and currPoint[3] != None and \
+               (prevPoint[3] < 0) != (currPoint[3] < 0):
+
+                stationPoint = finder.findStation(prevPoint, currPoint)
+
+                if prevPoint[0] < stationPoint[0] < currPoint[0]:
+                    jds.append(stationPoint[0])
+                    degrees.append(stationPoint[2])
+                    runStarts.append(len(jds) - 1)
+                    runSign = 0.0
+                    prevPoint = stationPoint
+
+            deltaDegrees = currPoint[2] - prevPoint[2]
+            if deltaDegrees * runSign < 0.0:
+                # The direction changed without a station being
+                # found (e.g. no longitude speed), so the run ends at
+                # the previous sample.
+                runStarts.append(len(jds) - 1)
+                runSign = 0.0
+            if runSign == 0.0 and deltaDegrees != 0.0:
+                runSign = 1.0 if deltaDegrees > 0.0 else -1.0
+
+            jds.append(currPoint[0])
+            degrees.append(currPoint[2])
+            prevPoint = currPoint
+
+        if ephemerisContext != None:
+            geoPosition = (ephemerisContext.geoLongitudeDeg,
+                           ephemerisContext.geoLatitudeDeg,
+                           ephemerisContext.altitudeMeters)
+        else:
+            geoPosition = (Ephemeris.geoLongitudeDeg,
+                           Ephemeris.geoLatitudeDeg,
+                           Ephemeris.geoAltitudeMeters)
+
+        timeline = LongitudeTimeline(planetName,
+                                     centricityType,
+                                     zodiacType,
+                                     finder.stepDays,
+                                     jds,
+                                     degrees,
+                                     runStarts,
+                                     *geoPosition)
+
+        if LongitudeTimeline.log.isEnabledFor(logging.DEBUG) == True:
+            LongitudeTimeline.log.debug(\
+                "Built timeline of {} {} {} with {} samples ".\
+                format(centricityType, zodiacType, planetName,
+                       len(jds)) + \
+                "in {} runs, using {} evaluations.".\
+                format(len(runStarts), finder.numEvaluations))
+            LongitudeTimeline.log.debug("Exiting " + inspect.stack()[0][3] + "()")
+
+        return timeline
+
+    @staticmethod
+    def getCacheFilename(documentFilename,
+                         planetName,
+                         centricityType,
+                         zodiacType):
+        """Returns the path of the file that caches the timeline of
+        the given planet for a document.  The timelines of a document
+        are kept in a directory next to the document file.
+
+        Arguments:
+        documentFilename - str holding the path of the document file.
+        planetName       - str holding the name of the planet.
+        centricityType   - str holding the centricity type.
+        zodiacType       - str holding the zodiac type.
+
+        Returns:
+        str holding the path of the timeline file.
+        """
+
+        return os.path.join(documentFilename + ".timelines",
+                            "{}_{}_{}{}".format(planetName,
+                                                centricityType,
+                                                zodiacType,
+                                                LongitudeTimeline.\
+                                                FILENAME_EXTENSION))
+
+    @staticmethod
+    def loadOrBuild(finder,
+                    planetName,
+                    centricityType,
+                    zodiacType,
+                    startJd,
+                    endJd,
+                    cacheFilename=None,
+                    ephemerisContext=None):
+        """Returns the timeline saved in 'cacheFilename' if it is for
+        the given planet, covers 'startJd' to 'endJd', was sampled at
+        the step size of 'finder', and was built for the current
+        geographic position (if the planet depends on it).  Otherwise
+        the timeline is built with build(), and saved to
+        'cacheFilename'.
+
+        Arguments:
+        cacheFilename - str holding the path of the cache file, or
+                        None to always build the timeline without
+                        saving it.  See getCacheFilename().
+        The other arguments are the same as for build().
+
+        Returns:
+        LongitudeTimeline object.
+        """
+
+        if cacheFilename != None:
+            timeline = LongitudeTimeline.loadMatching(cacheFilename,
+                                                      planetName,
+                                                      centricityType,
+                                                      zodiacType,
+                                                      finder.stepDays,
+                                                      ephemerisContext)
+
+            if timeline != None and \
+               timeline.startJd <= startJd and \
+               timeline.endJd >= endJd:
+
+                return timeline
+
+        timeline = LongitudeTimeline.build(finder,
+                                           planetName,
+                                           centricityType,
+                                           zodiacType,
+                                           startJd,
+                                           endJd,
+                                           ephemerisContext)
+
+        if cacheFilename != None:
+            try:
+                timeline.save(cacheFilename)
+            except (IOError, OSError) as e:
+                LongitudeTimeline.log.warning(\
+                    "Could not save longitude timeline '{}': {}".\
+                    format(cacheFilename, e))
+
+        return timeline
+
+    @staticmethod
+    def loadMatching(filename,
+                     planetName,
+                     centricityType,
+                     zodiacType,
+                     stepDays,
+                     ephemerisContext=None):
+        """Returns the timeline saved in 'filename' if the file exists,
+        and the timeline is for the given planet, was sampled at
+        'stepDays', and was built for the geographic position of
+        'ephemerisContext' (or of the Ephemeris, if it is None), if
+        the planet depends on it.  Otherwise None is returned.
+        """
+
+        if not os.path.isfile(filename):
+            return None
+
+        try:
+            timeline = LongitudeTimeline.load(filename)
+        except (IOError, ValueError) as e:
+            LongitudeTimeline.log.warning(\
+                "Could not load longitude timeline '{}': {}".\
+                format(filename, e))
+            return None
+
+        if timeline.planetName == planetName and \
+           timeline.centricityType == centricityType and \
+           timeline.zodiacType == zodiacType and \
+           timeline.stepDays == stepDays and \
+           timeline.isLocationMatching(ephemerisContext):
+
+            return timeline
+
+        return None
+
+    @staticmethod
+    def load(filename):
+        """Loads a timeline from a file written by save().
+
+        Raises:
+        IOError if the file could not be read.
+        ValueError if the file is not a valid timeline file.
+        """
+
+        with open(filename, "rb") as f:
+            prefix = f.read(len(LongitudeTimeline.MAGIC) + 8)
+            if len(prefix) < len(LongitudeTimeline.MAGIC) + 8 or \
+               prefix[:len(LongitudeTimeline.MAGIC)] != \
+               LongitudeTimeline.MAGIC:
+                raise ValueError("Not a longitude timeline file: {}".\
+                                 format(filename))
+
+            (version, headerLength) = \
+                struct.unpack("<II", prefix[len(LongitudeTimeline.MAGIC):])
+            if version != LongitudeTimeline.VERSION:
+                raise ValueError("Unsupported longitude timeline file " + \
+                                 "version {}: {}".format(version, filename))
+
+            header = json.loads(f.read(headerLength).decode('utf-8'))
+
+            try:
+                jds = array.array('d')
+                jds.fromfile(f, header['numSamples'])
+                degrees = array.array('d')
+                degrees.fromfile(f, header['numSamples'])
+                runStarts = array.array('q')
+                runStarts.fromfile(f, header['numRuns'])
+            except EOFError:
+                raise ValueError("Truncated longitude timeline file: {}".\
+                                 format(filename))
+
+        if sys.byteorder != 'little':
+            jds.byteswap()
+            degrees.byteswap()
+            runStarts.byteswap()
+
+        return LongitudeTimeline(header['planetName'],
+                                 header['centricityType'],
+                                 header['zodiacType'],
+                                 header['stepDays'],
+                                 jds,
+                                 degrees,
+                                 runStarts,
+                                 header['geoLongitudeDeg'],
+                                 header['geoLatitudeDeg'],
+                                 header['geoAltitudeMeters'])
+
+    def save(self, filename):
+        """Writes the timeline to a file, which can be read with
+        load().  Any existing file is replaced.
+        """
+
+        header = {'planetName'        : self.planetName,
+                  'centricityType'    : self.centricityType,
+                  'zodiacType'        : self.zodiacType,
+                  'stepDays'          : self.stepDays,
+                  'numSamples'        : self.numSamples,
+                  'numRuns'           : len(self.runStarts),
+                  'geoLongitudeDeg'   : self.geoLongitudeDeg,
+                  'geoLatitudeDeg'    : self.geoLatitudeDeg,
+                  'geoAltitudeMeters' : self.geoAltitudeMeters}
+
+        headerBytes = json.dumps(header).encode('utf-8')
+        prefixLength = len(LongitudeTimeline.MAGIC) + 8
+        padding = (8 - (prefixLength + len(headerBytes)) % 8) % 8
+        headerBytes += b" " * padding
+
+        # Write to a temporary file first, so that readers never see
+        # a partially written file.
+        tempFilename = filename + ".tmp"
+
+        directory = os.path.dirname(os.path.abspath(filename))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(tempFilename, "wb") as f:
+            f.write(LongitudeTimeline.MAGIC)
+            f.write(struct.pack("<II", LongitudeTimeline.VERSION,
+                                len(headerBytes)))
+            f.write(headerBytes)
+
+            for values in [self.jds, self.degrees, self.runStarts]:
+                if sys.byteorder != 'little':
+                    values = array.array(values.typecode, values)
+                    values.byteswap()
+                values.tofile(f)
+
+        os.replace(tempFilename, filename)
+
+    def covers(self, jd):
+        """Returns True if the given Julian Day is within the span of
+        the timeline.
+        """
+
+        return self.startJd <= jd <= self.endJd
+
+    def isLocationMatching(self, ephemerisContext=None):
+        """Returns True if the timeline can be used with the
+        geographic position of 'ephemerisContext' (or of the
+        Ephemeris, if it is None).  This is always the case for
+        planets that do not depend on the geographic position.
+        """
+
+        if not EphemerisStore.isLocationDependent(self.planetName,
+                                                  self.centricityType):
+            return True
+
+        if ephemerisContext != None:
+            geoPosition = (ephemerisContext.geoLongitudeDeg,
+                           ephemerisContext.geoLatitudeDeg,
+                           ephemerisContext.altitudeMeters)
+        else:
+            geoPosition = (Ephemeris.geoLongitudeDeg,
+                           Ephemeris.geoLatitudeDeg,
+                           Ephemeris.geoAltitudeMeters)
+
+        return geoPosition == (self.geoLongitudeDeg,
+                               self.geoLatitudeDeg,
+                               self.geoAltitudeMeters)
+
+    def findJulianDays(self,
+                       finder,
+                       referenceJd,
+                       desiredDeltaDegrees,
+                       direction=1):
+        """Returns what finder.findJulianDays() returns for the given
+        arguments, looking up the crossings in the timeline.
+
+        Arguments:
+        finder              - LongitudeDeltaRootFinder for the planet
+                              of this timeline.  It is used to evaluate
+                              the planet at 'referenceJd', and to refine
+                              the crossings.  Its evaluation counts are
+                              set like for its own searches.
+        referenceJd         - float Julian Day for the reference time.
+        desiredDeltaDegrees - float value for the number of longitude
+                              degrees elapsed from the longitude at
+                              'referenceJd'.
+        direction           - int value.  Positive to search into
+                              the future, negative to search into
+                              the past.
+
+        Returns:
+        List of float Julian Days, ordered chronologically in the
+        direction of the search.
+        """
+
+        if finder.hasJumps == True:
+            # The cumulative longitude of the timeline is unwrapped
+            # across the jumps by the shortest angle, which is not
+            # what the searches do.
+            return finder.findJulianDays(referenceJd,
+                                         desiredDeltaDegrees,
+                                         direction)
+
+        finder.resetEvaluationCounts()
+
+        rv = self.__findJulianDays(finder,
+                                   referenceJd,
+                                   desiredDeltaDegrees,
+                                   direction)
+        if rv == None:
+            if self.log.isEnabledFor(logging.DEBUG) == True:
+                self.log.debug("Search from jd {} ".format(referenceJd) + \
+                               "goes past the timeline.  Walking instead.")
+
+            rv = finder.findJulianDays(referenceJd,
+                                       desiredDeltaDegrees,
+                                       direction)
+
+        return rv
+
+    def sweepJulianDays(self,
+                        finder,
+                        referenceJds,
+                        desiredDeltaDegreesList,
+                        direction=1):
+        """Returns what finder.sweepJulianDays() returns for the given
+        arguments, looking up the crossings in the timeline.  The
+        evaluation counts of 'finder' are set for the whole sweep.
+        See findJulianDays() and
+        LongitudeDeltaRootFinder.sweepJulianDays() for details about
+        the arguments and the return value.
+        """
+
+        rv = []
+
+        numEvaluations = 0
+        resultNumEvaluations = []
+
+        for referenceJd in referenceJds:
+            rv.append([])
+            for desiredDeltaDegrees in desiredDeltaDegreesList:
+                rv[-1].append(self.findJulianDays(finder,
+                                                  referenceJd,
+                                                  desiredDeltaDegrees,
+                                                  direction))
+                numEvaluations += finder.numEvaluations
+                resultNumEvaluations.extend(finder.resultNumEvaluations)
+
+        finder.numEvaluations = numEvaluations
+        finder.resultNumEvaluations = resultNumEvaluations
+
+        return rv
+
+    def getPoint(self, index):
+        """Returns the point tuple (jd, longitude, deltaDegrees, speed)
+        of the sample at the given index, as used by
+        LongitudeDeltaRootFinder.  deltaDegrees is the cumulative
+        longitude, and the speed is None.
+        """
+
+        degrees = self.degrees[index]
+
+        return (self.jds[index], degrees % 360.0, degrees, None)
+
+    def __findJulianDays(self,
+                         finder,
+                         referenceJd,
+                         desiredDeltaDegrees,
+                         direction):
+        """Helper function for findJulianDays().  Returns None if the
+        search goes past the ends of the timeline.
+        """
+
+        if not self.covers(referenceJd):
+            return None
+
+        rv = []
+
+        if direction >= 0:
+            sign = 1.0
+            step = 1
+            # First sample after the reference Julian Day.
+            index = bisect.bisect_right(self.jds, referenceJd)
+        else:
+            sign = -1.0
+            step = -1
+            # Last sample before the reference Julian Day.
+            index = bisect.bisect_left(self.jds, referenceJd) - 1
+
+        if index < 0 or index >= self.numSamples:
+            return None
+
+        # The sample is at most one step (or station) away, so the
+        # unwrapping relative to it is valid.
+        samplePoint = self.getPoint(index)
+        referencePoint = finder.getPoint(referenceJd, samplePoint)
+        targetDegrees = referencePoint[2] + desiredDeltaDegrees
+
+        def isPastStop(degrees):
+            return sign * (degrees - targetDegrees) > 120
+
+        # The part from the reference Julian Day to the first sample
+        # is monotone, since stations are samples.
+        self.__refineCrossing(finder, referencePoint, samplePoint,
+                              targetDegrees, rv)
+        if (len(rv) >= 1 and finder.isDirectOnly == True) or \
+           isPastStop(samplePoint[2]):
+            return rv
+
+        # Go through the monotone runs in the direction of the
+        # search, from the sample of the current index.
+        while True:
+            if step > 0:
+                if index == self.numSamples - 1:
+                    return None
+                runIndex = bisect.bisect_right(self.runStarts, index) - 1
+                if runIndex + 1 < len(self.runStarts):
+                    endIndex = self.runStarts[runIndex + 1]
+                else:
+                    endIndex = self.numSamples - 1
+            else:
+                if index == 0:
+                    return None
+                runIndex = bisect.bisect_right(self.runStarts, index - 1) - 1
+                endIndex = self.runStarts[runIndex]
+
+            stopIndex = self.__search(index + step, endIndex, isPastStop)
+            if stopIndex != None:
+                endIndex = stopIndex
+
+            startOffset = self.degrees[index] - targetDegrees
+            endOffset = self.degrees[endIndex] - targetDegrees
+            if (startOffset < 0 and endOffset > 0) or \
+               (startOffset > 0 and endOffset < 0):
+
+                crossingIndex = self.__search(\
+                    index + step,
+                    endIndex,
+                    lambda degrees: \
+                        (degrees - targetDegrees) * endOffset > 0)
+
+                self.__refineCrossing(finder,
+                                      self.getPoint(crossingIndex - step),
+                                      self.getPoint(crossingIndex),
+                                      targetDegrees,
+                                      rv)
+
+            if (len(rv) >= 1 and finder.isDirectOnly == True) or \
+               stopIndex != None:
+                return rv
+
+            index = endIndex
+
+    def __search(self, startIndex, endIndex, predicate):
+        """Returns the first index, going from 'startIndex' to
+        'endIndex' (inclusive, in either direction), where
+        'predicate' returns True for the cumulative longitude.  Once
+        'predicate' is True, it must stay True for the rest of the
+        indexes, which is the case for comparisons within a monotone
+        run.  Returns None if 'predicate' is never True.
+        """
+
+        step = 1 if endIndex >= startIndex else -1
+        count = abs(endIndex - startIndex) + 1
+
+        low = 0
+        high = count
+        while low < high:
+            middle = (low + high) // 2
+            if predicate(self.degrees[startIndex + step * middle]):
+                high = middle
+            else:
+                low = middle + 1
+
+        if low == count:
+            return None
+
+        return startIndex + step * low
+
+    def __refineCrossing(self, finder, point1, point2, targetDegrees, rv):
+        """Refines the crossing of 'targetDegrees' between the two
+        given points, if there is one, and appends its Julian Day to
+        'rv'.  Crossings rejected by finder.refine() are not appended.
+        """
+
+        offset1 = point1[2] - targetDegrees
+        offset2 = point2[2] - targetDegrees
+
+        if (offset1 < 0 and offset2 > 0) or (offset1 > 0 and offset2 < 0):
+            numEvaluations = finder.numEvaluations
+            jd = finder.refine(point1, point2, targetDegrees)
+            if jd == None:
+                return
+
+            rv.append(jd)
+            finder.resultNumEvaluations.append(\
+                finder.numEvaluations - numEvaluations)
+
+##############################################################################
+
+def testLongitudeTimeline():
+    """Compares the results of LongitudeTimeline.findJulianDays()
+    against LongitudeDeltaRootFinder.findJulianDays(), and prints the
+    time taken by each.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    # For the temporary timeline file.
+    import tempfile
+
+    # For timing the calculations.
+    import time
+
+    maxErrorDays = 2.0 / 86400.0
+
+    startJd = 2433282.5
+    endJd = 2469807.5
+
+    # Reference Julian Days every 10 days over 20 years.
+    referenceJds = [2447892.5 + i * 10.0 for i in range(730)]
+
+    tests = [("Mars", "geocentric", 1.0, [-90.0, 180.0, 720.0]),
+             ("Mercury", "geocentric", 1.0, [-20.0, 30.0, 360.0]),
+             ("MoSu", "geocentric", 5.0, [360.0, 1440.0])]
+
+    for (planetName, centricityType, stepDays, desiredDeltaDegreesList) \
+        in tests:
+
+        def evaluate(jd):
+            return Ephemeris.getLongitudeAndSpeed(planetName,
+                                                  jd,
+                                                  centricityType,
+                                                  "tropical")
+
+        finder = LongitudeDeltaRootFinder(\
+            evaluate,
+            stepDays,
+            LongitudeDeltaRootFinder.getMaxLongitudeSpeed(centricityType,
+                                                          planetName),
+            Ephemeris.isDirectOnlyPlanetName(centricityType, planetName),
+            maxErrorDays)
+
+        startTime = time.time()
+        timeline = LongitudeTimeline.build(finder, planetName,
+                                           centricityType, "tropical",
+                                           startJd, endJd)
+        print("  {} {}: built {} samples in {} runs in {:.3f} sec".\
+              format(centricityType, planetName, timeline.numSamples,
+                     len(timeline.runStarts), time.time() - startTime))
+
+        filename = os.path.join(tempfile.gettempdir(),
+                                "testLongitudeTimeline" + \
+                                LongitudeTimeline.FILENAME_EXTENSION)
+        timeline.save(filename)
+        timeline = LongitudeTimeline.load(filename)
+        os.remove(filename)
+
+        for direction in [1, -1]:
+            numResults = 0
+            numMismatches = 0
+            maxDiffSeconds = 0.0
+            findTime = 0.0
+            timelineTime = 0.0
+            for referenceJd in referenceJds:
+                for desiredDeltaDegrees in desiredDeltaDegreesList:
+                    desiredDeltaDegrees *= direction
+
+                    startTime = time.time()
+                    expectedJds = finder.findJulianDays(referenceJd,
+                                                        desiredDeltaDegrees,
+                                                        direction)
+                    findTime += time.time() - startTime
+
+                    startTime = time.time()
+                    jds = timeline.findJulianDays(finder,
+                                                  referenceJd,
+                                                  desiredDeltaDegrees,
+                                                  direction)
+                    timelineTime += time.time() - startTime
+
+                    numResults += len(expectedJds)
+                    if len(jds) != len(expectedJds):
+                        numMismatches += 1
+                        continue
+                    for (jd, expectedJd) in zip(jds, expectedJds):
+                        maxDiffSeconds = max(maxDiffSeconds,
+                            abs(jd - expectedJd) * 86400.0)
+
+            print("    direction {}: {} results, ".\
+                  format(direction, numResults) + \
+                  "{} mismatched counts, max diff {:.3f} sec".\
+                  format(numMismatches, maxDiffSeconds))
+            print("    findJulianDays(): {:.3f} sec, ".format(findTime) + \
+                  "timeline: {:.3f} sec".format(timelineTime))
+
+##############################################################################
+
+# For debugging the module during development.
+if __name__=="__main__":
+    # Initialize logging.
+    LOG_CONFIG_FILE = os.path.join(sys.path[0], "../conf/logging.conf")
+    logging.config.fileConfig(LOG_CONFIG_FILE)
+    #logging.disable(logging.CRITICAL)
+
+    # Initialize the Ephemeris (required).
+    Ephemeris.initialize()
+
+    # New York City:
+    lon = -74.0064
+    lat = 40.7142
+
+    # Set a default location (required).
+    Ephemeris.setGeographicPosition(lon, lat)
+
+    testLongitudeTimeline()
+
+    # Close the Ephemeris so it can do necessary cleanups.
+    Ephemeris.closeEphemeris()
+
+    # Quit.
+    print("Exiting.")
+    sys.exit()
+
+##############################################################################
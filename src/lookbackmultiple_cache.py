@@ -0,0 +1,554 @@
+
+# For directory access.
+import os
+import sys
+import inspect
+
+# For the cache database.
+import sqlite3
+
+# For the content-addressed keys.
+import hashlib
+
+# For packing the result timestamps.
+import array
+
+# For timestamps.
+import datetime
+import pytz
+
+# For logging.
+import logging
+import logging.config
+
+# For the definitions of the planets.
+from ephemeris import Ephemeris
+
+##############################################################################
+
+class LookbackMultipleResultCache:
+    """Persistent cache of the results of LookbackMultiple
+    calculations, stored in an SQLite database file.
+
+    The result of a LookbackMultiple calculation only depends on the
+    planet, centricity type, longitude type, reference timestamp,
+    desired delta degrees, maximum error, location, and whether the
+    calculation is into the future or into the past.  It also depends
+    on how the Ephemeris calculates the planet, so the key includes
+    Ephemeris.calculationVersion, and for planets added via
+    Ephemeris.registerDerivedPlanet(), their definition.  Each result
+    is stored under a key that is a hash of those values, so the cache
+    can be shared by everything that does the same calculations
+    (PriceBarChartWidget, and the distributed client workers).  The
+    cache of a PriceChartDocument is kept in a file next to the
+    document file (see getCacheFilename()).
+
+    Results are given and returned with the argument tuples used
+    throughout the LookbackMultiple code, which hold:
+
+      (planetName, centricityType, longitudeType, referenceDt,
+       desiredDeltaDegrees, maxErrorTd, locationLongitudeDegrees,
+       locationLatitudeDegrees, locationElevationMeters)
+
+    The result timestamps are stored as integer microseconds since the
+    epoch, so they are returned exactly as they were given, in the
+    timezone of the reference timestamp.
+
+    The same calculation can be done in ways that give slightly
+    different results, e.g. by
+    LookbackMultipleUtils.getDatetimesOfLongitudeDeltaDegreesInFuture()
+    in the processes of the LookbackMultipleParallel pool, and by
+    LookbackMultipleUtils.sweepJulianDaysOfLongitudeDeltaDegreesInFuture()
+    on the distributed client workers.  Each result is within the
+    maximum error of the exact timestamp, so they are stored under the
+    same key, and the cache keeps the one that was put first.
+
+    The number of results is limited to 'maxEntries'.  When a put goes
+    over the limit, the least recently used results are removed, down
+    to LookbackMultipleResultCache.evictionFraction of the limit.
+
+    A LookbackMultipleResultCache object must only be used from the
+    thread that created it.  Many processes can use the same file.
+    """
+
+    # Extension of the cache files.
+    FILENAME_EXTENSION = ".lookbackcache"
+
+    # Version of what is stored.  This is part of every key, so that
+    # changing it makes all the results of earlier versions misses.
+    VERSION = 1
+
+    # Default maximum number of results in the cache.
+    DEFAULT_MAX_ENTRIES = 1000000
+
+    # Fraction of 'maxEntries' that the cache is reduced to when it
+    # goes over the limit.
+    evictionFraction = 0.9
+
+    # Maximum number of keys in one SQL statement.
+    sqlBatchSize = 500
+
+    # Epoch of the stored result timestamps.
+    epochDt = datetime.datetime(1970, 1, 1, tzinfo=pytz.utc)
+
+    # Logger object for this class.
+    log = logging.getLogger("lookbackmultiple_cache.LookbackMultipleResultCache")
+
+    def __init__(self, filename, maxEntries=DEFAULT_MAX_ENTRIES):
+        """Opens the cache in the given file, creating the file if it
+        does not exist.
+
+        Arguments:
+        filename   - str holding the path of the cache file.
+        maxEntries - int value for the maximum number of results
+                     kept in the cache.
+
+        Raises:
+        sqlite3.Error if the file cannot be opened as a cache.
+        """
+
+        self.filename = filename
+        self.maxEntries = maxEntries
+
+        # str naming how the results given to put() were calculated,
+        # if not in the usual way.  It is part of every key, so that
+        # results calculated in different ways are kept apart.  For
+        # example, "interpolated" for the results of calculations
+        # that used an EphemerisInterpolator.
+        self.variant = ""
+
+        # Statistics.
+        self.numHits = 0
+        self.numMisses = 0
+        self.numPuts = 0
+        self.numEvictions = 0
+
+        self.conn = sqlite3.connect(filename, timeout=30.0)
+
+        # Write-ahead logging lets readers in other processes
+        # continue while results are added.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self.conn:
+            self.conn.execute(\
+                "CREATE TABLE IF NOT EXISTS results (" + \
+                "key BLOB PRIMARY KEY, " + \
+                "value BLOB NOT NULL, " + \
+                "lastUsed INTEGER NOT NULL) WITHOUT ROWID")
+            self.conn.execute(\
+                "CREATE INDEX IF NOT EXISTS resultsLastUsed " + \
+                "ON results (lastUsed)")
+
+        # Counter of uses of the results, for the LRU eviction.
+        row = self.conn.execute("SELECT MAX(lastUsed) FROM results").\
+            fetchone()
+        self.useCounter = row[0] if row[0] != None else 0
+
+        # Number of results, as far as this object knows.  Other
+        # processes can add results too, so this is checked against
+        # the database before evicting.
+        self.numEntries = \
+            self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+        if self.log.isEnabledFor(logging.DEBUG) == True:
+            self.log.debug("Opened cache '{}' with {} results.".\
+                           format(filename, self.numEntries))
+
+    @staticmethod
+    def getCacheFilename(documentFilename):
+        """Returns the path of the cache file for a document.
+
+        Arguments:
+        documentFilename - str holding the path of the document file.
+
+        Returns:
+        str holding the path of the cache file.
+        """
+
+        return documentFilename + LookbackMultipleResultCache.FILENAME_EXTENSION
+
+    @staticmethod
+    def getKey(argsTuple, direction, variant=""):
+        """Returns the key of the result of a calculation.
+
+        Arguments:
+        argsTuple - tuple of the arguments of the calculation, as
+                    described in the class documentation.
+        direction - int value.  1 for calculations into the future,
+                    -1 for calculations into the past.
+        variant   - str naming how the result was calculated, as
+                    described for the 'variant' attribute.
+
+        Returns:
+        bytes holding the key.
+        """
+
+        (planetName,
+         centricityType,
+         longitudeType,
+         referenceDt,
+         desiredDeltaDegrees,
+         maxErrorTd,
+         locationLongitudeDegrees,
+         locationLatitudeDegrees,
+         locationElevationMeters) = argsTuple
+
+        # repr() gives the shortest str that converts back to the
+        # same float, so equal values give equal keys.
+        keyStr = "|".join([\
+            str(LookbackMultipleResultCache.VERSION),
+            str(Ephemeris.calculationVersion),
+            variant,
+            "future" if direction > 0 else "past",
+            planetName,
+            Ephemeris.getDerivedPlanetDefinition(planetName),
+            centricityType,
+            longitudeType,
+            str(LookbackMultipleResultCache._datetimeToMicroseconds(\
+                referenceDt)),
+            repr(float(desiredDeltaDegrees)),
+            repr(maxErrorTd.total_seconds()),
+            repr(float(locationLongitudeDegrees)),
+            repr(float(locationLatitudeDegrees)),
+            repr(float(locationElevationMeters))])
+
+        return hashlib.sha1(keyStr.encode("utf-8")).digest()
+
+    def get(self, argsTuple, direction):
+        """Returns the cached result of a calculation, or None if it is
+        not in the cache.  See getMany().
+        """
+
+        return self.getMany([argsTuple], direction)[0]
+
+    def getMany(self, argsTupleList, direction):
+        """Returns the cached results of calculations.
+
+        Arguments:
+        argsTupleList - List of tuples of the arguments of the
+                        calculations, as described in the class
+                        documentation.
+        direction     - int value.  1 for calculations into the
+                        future, -1 for calculations into the past.
+
+        Returns:
+        List with an entry for each tuple in 'argsTupleList'.  The
+        entry is the list of datetime.datetime objects of the result,
+        in the timezone of the reference timestamp of the tuple, or
+        None if the result is not in the cache.
+        """
+
+        rv = [None] * len(argsTupleList)
+
+        keys = [LookbackMultipleResultCache.getKey(argsTuple, direction,
+                                                   self.variant) \
+                for argsTuple in argsTupleList]
+
+        values = {}
+        batchSize = LookbackMultipleResultCache.sqlBatchSize
+        for i in range(0, len(keys), batchSize):
+            batchKeys = keys[i:i + batchSize]
+            sql = "SELECT key, value FROM results WHERE key IN ({})".\
+                  format(",".join(["?"] * len(batchKeys)))
+            for (key, value) in self.conn.execute(sql, batchKeys):
+                values[bytes(key)] = value
+
+        hitKeys = []
+        for i in range(len(keys)):
+            value = values.get(keys[i], None)
+            if value != None:
+                tzInfo = argsTupleList[i][3].tzinfo
+                rv[i] = LookbackMultipleResultCache.\
+                    _valueToDatetimes(value, tzInfo)
+                hitKeys.append(keys[i])
+
+        self.numHits += len(hitKeys)
+        self.numMisses += len(keys) - len(hitKeys)
+
+        # Mark the results as recently used.
+        if len(hitKeys) > 0:
+            self.useCounter += 1
+            with self.conn:
+                self.conn.executemany(\
+                    "UPDATE results SET lastUsed = ? WHERE key = ?",
+                    [(self.useCounter, key) for key in hitKeys])
+
+        return rv
+
+    def put(self, argsTuple, direction, resultDts):
+        """Adds the result of a calculation to the cache.  See
+        putMany().
+        """
+
+        self.putMany([argsTuple], direction, [resultDts])
+
+    def putMany(self, argsTupleList, direction, resultsList):
+        """Adds the results of calculations to the cache, and removes
+        the least recently used results if the cache is over its size
+        limit.
+
+        Arguments:
+        argsTupleList - List of tuples of the arguments of the
+                        calculations, as described in the class
+                        documentation.
+        direction     - int value.  1 for calculations into the
+                        future, -1 for calculations into the past.
+        resultsList   - List with an entry for each tuple in
+                        'argsTupleList'.  Each entry is the list of
+                        datetime.datetime objects of the result.
+        """
+
+        if len(argsTupleList) == 0:
+            return
+
+        self.useCounter += 1
+
+        rows = []
+        for i in range(len(argsTupleList)):
+            key = LookbackMultipleResultCache.getKey(argsTupleList[i],
+                                                     direction,
+                                                     self.variant)
+            value = LookbackMultipleResultCache.\
+                _datetimesToValue(resultsList[i])
+            rows.append((key, value, self.useCounter))
+
+        with self.conn:
+            cursor = self.conn.executemany(\
+                "INSERT OR IGNORE INTO results (key, value, lastUsed) " + \
+                "VALUES (?, ?, ?)", rows)
+            numInserted = cursor.rowcount
+
+        self.numPuts += len(rows)
+        self.numEntries += max(numInserted, 0)
+
+        if self.numEntries > self.maxEntries:
+            self._evict()
+
+    def setMaxEntries(self, maxEntries):
+        """Sets the maximum number of results kept in the cache, and
+        removes the least recently used results if the cache is over
+        the new limit.
+        """
+
+        self.maxEntries = maxEntries
+
+        if self.numEntries > self.maxEntries:
+            self._evict()
+
+    def clear(self):
+        """Removes all the results from the cache."""
+
+        with self.conn:
+            self.conn.execute("DELETE FROM results")
+
+        self.numEntries = 0
+
+    def getStatistics(self):
+        """Returns a dict with the statistics of the cache since it was
+        opened: "hits", "misses", "puts", "evictions", and the current
+        "entries" and "fileSizeBytes".
+        """
+
+        fileSizeBytes = 0
+        if os.path.exists(self.filename):
+            fileSizeBytes = os.path.getsize(self.filename)
+
+        return {"hits" : self.numHits,
+                "misses" : self.numMisses,
+                "puts" : self.numPuts,
+                "evictions" : self.numEvictions,
+                "entries" : self.numEntries,
+                "fileSizeBytes" : fileSizeBytes}
+
+    def getStatisticsStr(self):
+        """Returns a str holding the statistics of the cache, for
+        logging.
+        """
+
+        stats = self.getStatistics()
+
+        numLookups = stats["hits"] + stats["misses"]
+        hitRate = 0.0
+        if numLookups > 0:
+            hitRate = 100.0 * stats["hits"] / numLookups
+
+        return "LookbackMultipleResultCache(" + \
+               "filename={}, ".format(self.filename) + \
+               "hits={}, misses={}, hitRate={:.1f}%, ".\
+               format(stats["hits"], stats["misses"], hitRate) + \
+               "puts={}, evictions={}, ".\
+               format(stats["puts"], stats["evictions"]) + \
+               "entries={}, maxEntries={}, fileSizeBytes={})".\
+               format(stats["entries"], self.maxEntries,
+                      stats["fileSizeBytes"])
+
+    def close(self):
+        """Closes the cache file.  The object cannot be used after
+        this.
+        """
+
+        if self.conn != None:
+            if self.log.isEnabledFor(logging.INFO) == True:
+                self.log.info("Closing " + self.getStatisticsStr())
+
+            self.conn.close()
+            self.conn = None
+
+    def _evict(self):
+        """Removes the least recently used results, down to
+        LookbackMultipleResultCache.evictionFraction of 'maxEntries'.
+        """
+
+        # Other processes can have added or removed results.
+        self.numEntries = \
+            self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+        if self.numEntries <= self.maxEntries:
+            return
+
+        numToRemove = self.numEntries - \
+            int(self.maxEntries * LookbackMultipleResultCache.evictionFraction)
+
+        with self.conn:
+            cursor = self.conn.execute(\
+                "DELETE FROM results WHERE key IN " + \
+                "(SELECT key FROM results ORDER BY lastUsed LIMIT ?)",
+                (numToRemove,))
+            numRemoved = cursor.rowcount
+
+        self.numEntries -= numRemoved
+        self.numEvictions += numRemoved
+
+        if self.log.isEnabledFor(logging.DEBUG) == True:
+            self.log.debug("Evicted {} results from cache '{}'.".\
+                           format(numRemoved, self.filename))
+
+    @staticmethod
+    def _datetimeToMicroseconds(dt):
+        """Returns the int number of microseconds from the epoch to the
+        given timezone-aware datetime.datetime.
+        """
+
+        return (dt - LookbackMultipleResultCache.epochDt) // \
+               datetime.timedelta(microseconds=1)
+
+    @staticmethod
+    def _datetimesToValue(dts):
+        """Returns the bytes stored for a list of datetime.datetime
+        objects.
+        """
+
+        values = array.array('q',
+            [LookbackMultipleResultCache._datetimeToMicroseconds(dt) \
+             for dt in dts])
+
+        return values.tobytes()
+
+    @staticmethod
+    def _valueToDatetimes(value, tzInfo):
+        """Returns the list of datetime.datetime objects, in timezone
+        'tzInfo', from the bytes stored for them.
+        """
+
+        values = array.array('q')
+        values.frombytes(value)
+
+        epochDt = LookbackMultipleResultCache.epochDt
+
+        return [(epochDt + datetime.timedelta(microseconds=us)).\
+                astimezone(tzInfo) for us in values]
+
+##############################################################################
+
+def testLookbackMultipleResultCache():
+    """Tests that results come back exactly as they were put, that
+    other arguments and changed derived planet definitions miss, and
+    that the least recently used results are evicted.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    import tempfile
+
+    eastern = pytz.timezone('US/Eastern')
+    maxErrorTd = datetime.timedelta(minutes=60)
+
+    def makeArgs(i):
+        referenceDt = eastern.localize(datetime.datetime(1994, 10, 20, 0, 0)) + \
+                      datetime.timedelta(days=i)
+        return ("Mars", "geocentric", "tropical", referenceDt,
+                360, maxErrorTd, -74.0064, 40.7142, 0)
+
+    def makeResult(i):
+        return [eastern.localize(datetime.datetime(1996, 1, 1, 12, 34, 56, i)),
+                eastern.localize(datetime.datetime(1997, 2, 3, 4, 5, 6, 7))]
+
+    with tempfile.TemporaryDirectory() as tmpDir:
+        filename = LookbackMultipleResultCache.\
+            getCacheFilename(os.path.join(tmpDir, "test.pcd"))
+
+        cache = LookbackMultipleResultCache(filename, maxEntries=10)
+
+        argsTupleList = [makeArgs(i) for i in range(8)]
+        cache.putMany(argsTupleList, 1, [makeResult(i) for i in range(8)])
+
+        results = cache.getMany(argsTupleList, 1)
+        print("  Results equal: {}".\
+              format(results == [makeResult(i) for i in range(8)]))
+        print("  Result timezone: {}".format(results[0][0].tzinfo))
+        print("  Past lookups miss: {}".\
+              format(cache.getMany(argsTupleList, -1) == [None] * 8))
+
+        # Use the first results, then go over the limit.
+        cache.getMany(argsTupleList[0:2], 1)
+        cache.putMany([makeArgs(i) for i in range(8, 12)], 1,
+                      [makeResult(i) for i in range(8, 12)])
+        results = cache.getMany(argsTupleList, 1)
+        print("  Recently used kept: {}".\
+              format(results[0] != None and results[1] != None))
+        print("  Least recently used evicted: {}".\
+              format([i for i in range(8) if results[i] == None]))
+        print("  " + cache.getStatisticsStr())
+        cache.close()
+
+        # Reopen.
+        cache = LookbackMultipleResultCache(filename, maxEntries=10)
+        print("  Results after reopening: {}".\
+              format(cache.get(makeArgs(11), 1) == makeResult(11)))
+
+        # Results of a derived planet miss after its definition changes.
+        derivedArgs = ("TestDerived",) + makeArgs(0)[1:]
+        Ephemeris.registerDerivedPlanet("TestDerived",
+                                        ["Mars", "Jupiter"], "average")
+        cache.put(derivedArgs, 1, makeResult(0))
+        print("  Derived planet hit: {}".\
+              format(cache.get(derivedArgs, 1) == makeResult(0)))
+        Ephemeris.registerDerivedPlanet("TestDerived",
+                                        ["Mars", "Saturn"], "average")
+        print("  Derived planet miss after new constituents: {}".\
+              format(cache.get(derivedArgs, 1) == None))
+        Ephemeris.registerDerivedPlanet("TestDerived",
+                                        ["Mars", "Saturn"],
+                                        lambda fieldName, values: values[0])
+        print("  Derived planet miss after new formula: {}".\
+              format(cache.get(derivedArgs, 1) == None))
+        Ephemeris.unregisterDerivedPlanet("TestDerived")
+        cache.close()
+
+##############################################################################
+
+# For debugging the module during development.
+if __name__=="__main__":
+    # Initialize logging.
+    LOG_CONFIG_FILE = os.path.join(sys.path[0], "../conf/logging.conf")
+    logging.config.fileConfig(LOG_CONFIG_FILE)
+    #logging.disable(logging.CRITICAL)
+
+    testLookbackMultipleResultCache()
+
+    # Quit.
+    print("Exiting.")
+    sys.exit()
+
+##############################################################################
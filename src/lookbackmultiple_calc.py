@@ -2,9 +2,6 @@
 # For directory access.
 import inspect
 
-# For collections.deque.
-import collections
-
 # For timestamps and timezone information.
 import datetime
 import pytz
@@ -17,8 +14,17 @@ import logging.config
 from ephemeris import PlanetaryInfo
 from ephemeris import Ephemeris
 
-# For generic utility helper methods.
-from util import Util
+# For interpolated planet longitudes.
+from ephemeris_interpolator import EphemerisInterpolator
+
+# For precomputed ephemeris values shared between processes.
+from ephemeris_store import EphemerisStore
+
+# For finding the moments of the longitude deltas.
+from longitude_root_finder import LongitudeDeltaRootFinder
+
+# For looking up the longitude deltas in precomputed timelines.
+from longitude_timeline import LongitudeTimeline
 
 ##############################################################################
 
@@ -29,8 +35,26 @@ class LookbackMultipleUtils:
     Note:
     This class has the following methods for public use:
       initializeEphemeris()
+      setEphemerisInterpolatorEnabled()
       getDatetimesOfLongitudeDeltaDegreesInFuture()
       getDatetimesOfLongitudeDeltaDegreesInPast()
+      getJulianDaysOfLongitudeDeltaDegreesInFuture()
+      getJulianDaysOfLongitudeDeltaDegreesInPast()
+      sweepDatetimesOfLongitudeDeltaDegreesInFuture()
+      sweepDatetimesOfLongitudeDeltaDegreesInPast()
+      sweepJulianDaysOfLongitudeDeltaDegreesInFuture()
+      sweepJulianDaysOfLongitudeDeltaDegreesInPast()
+      createLongitudeDeltaRootFinder()
+      createLongitudeTimeline()
+      loadLongitudeTimeline()
+      extendLongitudeTimeline()
+
+    The searches are done by a LongitudeDeltaRootFinder, which refines
+    each crossing with Newton steps on the longitude speed instead of
+    bisecting the step.  If a LongitudeTimeline was set for the planet
+    via createLongitudeTimeline(), loadLongitudeTimeline() or
+    extendLongitudeTimeline(), the crossings are looked up in it
+    instead of walking through time.
 
     The reason why we don't have a generic method for this (without the
     words 'future' or 'past' in the method name) is because we need a
@@ -47,12 +71,101 @@ class LookbackMultipleUtils:
     # Logger object for this class.
     log = logging.getLogger("lookbackmultiple_calc.LookbackMultipleUtils")
 
+    # EphemerisInterpolator object used for getting planet longitudes
+    # instead of calling the Swiss Ephemeris directly.  If None, then
+    # the Swiss Ephemeris is called for every longitude.  This can be
+    # set via setEphemerisInterpolator() or
+    # setEphemerisInterpolatorEnabled().
+    ephemerisInterpolator = None
+
+    # Dict of (planetName, centricityType, longitudeType) to the
+    # LongitudeTimeline used for the lookback calculations of that
+    # planet.  These are set via setLongitudeTimeline() or
+    # createLongitudeTimeline().
+    longitudeTimelines = {}
+
+    @staticmethod
+    def setEphemerisInterpolator(ephemerisInterpolator):
+        """Sets the EphemerisInterpolator to use for getting planet
+        longitudes in the lookback calculations.
+
+        Arguments:
+        ephemerisInterpolator - EphemerisInterpolator object, or None
+                                to call the Swiss Ephemeris directly.
+        """
+
+        LookbackMultipleUtils.ephemerisInterpolator = ephemerisInterpolator
+
+    @staticmethod
+    def setEphemerisInterpolatorEnabled(enabled):
+        """Sets whether the lookback calculations get the planet
+        longitudes from an EphemerisInterpolator.  If enabled and no
+        EphemerisInterpolator is set yet, one with the default
+        settings is created.  The segments that it calculated are kept
+        while it stays enabled.
+
+        Arguments:
+        enabled - bool value.  True to use an EphemerisInterpolator,
+                  False to call the Swiss Ephemeris directly.
+        """
+
+        if enabled == True:
+            if LookbackMultipleUtils.ephemerisInterpolator == None:
+                LookbackMultipleUtils.ephemerisInterpolator = \
+                    EphemerisInterpolator()
+        else:
+            LookbackMultipleUtils.ephemerisInterpolator = None
+
+    @staticmethod
+    def setLongitudeTimeline(timeline):
+        """Sets the LongitudeTimeline to use for the lookback
+        calculations of its planet, centricity type and zodiac type,
+        replacing any timeline set for them before.
+        """
+
+        key = (timeline.planetName,
+               timeline.centricityType,
+               timeline.zodiacType)
+
+        LookbackMultipleUtils.longitudeTimelines[key] = timeline
+
+    @staticmethod
+    def clearLongitudeTimelines():
+        """Removes all the LongitudeTimelines set, so that the
+        lookback calculations walk through time again.
+        """
+
+        LookbackMultipleUtils.longitudeTimelines = {}
+
+    @staticmethod
+    def getLongitudeTimeline(planetName,
+                             centricityType,
+                             longitudeType,
+                             ephemerisContext=None):
+        """Returns the LongitudeTimeline set for the given planet,
+        centricity type and longitude type, or None if there is none
+        or if it was built for a different geographic position than
+        the one of 'ephemerisContext' (or of the Ephemeris).
+        """
+
+        timeline = LookbackMultipleUtils.longitudeTimelines.get(\
+            (planetName, centricityType, longitudeType), None)
+
+        if timeline != None and \
+           not timeline.isLocationMatching(ephemerisContext):
+            timeline = None
+
+        return timeline
+
     @staticmethod
     def initializeEphemeris(locationLongitudeDegrees=-74.0064,
                             locationLatitudeDegrees=40.7142,
                             locationElevationMeters=0):
         """Initializes or re-initializes the Ephemeris with the location
         given as parameters.
+
+        If the file EphemerisStore.DEFAULT_STORE_FILENAME exists, then
+        it is set as the Ephemeris' store of precomputed values.
         
         Arguments:
         geoLongitudeDeg - Longitude in degrees.  
@@ -75,6 +188,15 @@ class LookbackMultipleUtils:
         Ephemeris.setGeographicPosition(locationLongitudeDegrees, 
                                         locationLatitudeDegrees,
                                         locationElevationMeters)
+
+        # Use the precomputed ephemeris store file, if it exists.
+        # The file is only opened once per process, and it is shared
+        # (memory-mapped) between processes.
+        Ephemeris.setEphemerisStore(EphemerisStore.getStore())
+
+        # Segments calculated for the previous location are invalid now.
+        if LookbackMultipleUtils.ephemerisInterpolator != None:
+            LookbackMultipleUtils.ephemerisInterpolator.clear()
     
     @staticmethod
     def getDatetimesOfLongitudeDeltaDegreesInFuture(\
@@ -83,7 +205,8 @@ class LookbackMultipleUtils:
         longitudeType,
         referenceDt,
         desiredDeltaDegrees,
-        maxErrorTd=datetime.timedelta(seconds=2)):
+        maxErrorTd=datetime.timedelta(seconds=2),
+        ephemerisContext=None):
         """Returns a list of datetime.datetime objects that hold the
         timestamps when the given planet is at 'desiredDeltaDegrees'
         longitude degrees relative to the longitude degrees calculated at
@@ -119,462 +242,48 @@ class LookbackMultipleUtils:
                      combination timestamp, and the one calculated.
                      This would define the accuracy of the
                      calculations.  
+        ephemerisContext - EphemerisContext to calculate the planet
+                           positions with, or None to use the
+                           Ephemeris settings.  A context lets
+                           several threads run lookback calculations
+                           in the same process.
 
         Returns:
         List of datetime.datetime objects.  The datetime.datetime
         objects in this list are the timestamps where the planet is at
         the elapsed number of degrees away from the longitude at
-        'referenceDt'.
+        'referenceDt'.  The timestamps are in the timezone of the
+        tzinfo of 'referenceDt'.
+
+        The search is done with float Julian Days via
+        getJulianDaysOfLongitudeDeltaDegreesInFuture(), and only the
+        results are converted to datetime.datetime objects.
         """
         
         if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
             LookbackMultipleUtils.log.debug("Entered " + inspect.stack()[0][3] + "()")
 
-        # Return value.
-        rv = []
-
-        # Verify inputs.
-        centricityTypeOrig = centricityType
-        centricityType = centricityType.lower()
-        if centricityType != "geocentric" and \
-           centricityType != "topocentric" and \
-           centricityType != "heliocentric":
-
-            errMsg = "Invalid input: centricityType is invalid.  " + \
-                      "Value given was: {}".format(centricityTypeOrig)
-            LookbackMultipleUtils.log.error(errMsg)
-            raise ValueError(errMsg)
-
-        longitudeTypeOrig = longitudeType
-        longitudeType = longitudeType.lower()
-        if longitudeType != "tropical" and \
-           longitudeType != "sidereal":
-
-            errMsg = "Invalid input: longitudeType is invalid.  " + \
-                      "Value given was: {}".format(longitudeTypeOrig)
-            LookbackMultipleUtils.log.error(errMsg)
-            raise ValueError(errMsg)
-
-        # Field name we are getting.
-        fieldName = "longitude"
-
-        # Step size timedelta.  
-        stepSizeTd = \
-            LookbackMultipleUtils._getOptimalStepSizeTd(centricityType, 
-                                                        planetName)
-        
-        # Running count of number of full 360-degree circles.
-        numFullCircles = 0
-        
-        # Desired degree.
-        desiredDegree = None
-        
-        # Longitude of the planet at datetime referenceDt.
-        planetReferenceLongitude = None
-
-        # Iterate through, creating artfacts and adding them as we go.
-        steps = collections.deque(maxlen=2)
-        steps.append(referenceDt)
-        steps.append(referenceDt)
-
-        longitudesP1 = collections.deque(maxlen=2)
-        longitudesP1.append(None)
-        longitudesP1.append(None)
-        
-        def getFieldValue(planetaryInfo, fieldName):
-            pi = planetaryInfo
-            fieldValue = None
-            
-            if centricityType == "geocentric":
-                fieldValue = pi.geocentric[longitudeType][fieldName]
-            elif centricityType.lower() == "topocentric":
-                fieldValue = pi.topocentric[longitudeType][fieldName]
-            elif centricityType.lower() == "heliocentric":
-                fieldValue = pi.heliocentric[longitudeType][fieldName]
-            else:
-                LookbackMultipleUtils.log.error("Unknown centricity type.")
-                fieldValue = None
-
-            return fieldValue
-            
-        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-            LookbackMultipleUtils.log.debug("Stepping through timestamps from {} ...".\
-                  format(Ephemeris.datetimeToStr(referenceDt)))
-
-        currDiff = None
-        prevDiff = None
-
-        # Current and previous number of degrees distance relative that we are
-        # away from the longitude at referenceDt.
-        currDeltaDegrees = None
-        prevDeltaDegrees = None
+        referenceJd = Ephemeris.datetimeToJulianDay(referenceDt)
+        maxErrorDays = maxErrorTd.total_seconds() / 86400.0
         
-        done = False
-        while not done:
-        
-            currDt = steps[-1]
-            prevDt = steps[-2]
-            
-            if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                LookbackMultipleUtils.log.debug("Looking at currDt == {} ...".\
-                      format(Ephemeris.datetimeToStr(currDt)))
-
-            p1 = Ephemeris.getPlanetaryInfo(planetName, currDt)
-
-            if planetReferenceLongitude == None:
-                planetReferenceLongitude = getFieldValue(p1, fieldName)
-
-                if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                    LookbackMultipleUtils.log.debug("planetReferenceLongitude == {}".\
-                                                format(planetReferenceLongitude))
-            
-            longitudesP1[-1] = getFieldValue(p1, fieldName)
-            
-            if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                LookbackMultipleUtils.log.debug("{} {} {} {} is: {}".\
-                      format(p1.name, centricityType, longitudeType, fieldName,
-                             getFieldValue(p1, fieldName)))
-            
-            # Calculate the difference in planet longitudes between the current
-            # datetime and the referenceDt.  
-            # (This value will be in the range [0, 360) ).
-            #
-            currDiff = Util.toNormalizedAngle(\
-                longitudesP1[-1] - planetReferenceLongitude)
-            
-            if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                LookbackMultipleUtils.log.debug("prevDiff == {}".\
-                                                format(prevDiff))
-                LookbackMultipleUtils.log.debug("currDiff == {}".\
-                                                format(currDiff))
-            
-            # If this is not the first iteration of the loop 
-            # (i.e. we have both a prevDiff and 
-            # a currDiff to compare).
-            if prevDiff != None and longitudesP1[-2] != None:
-                
-                if prevDiff > 240 and currDiff < 120:
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        LookbackMultipleUtils.log.debug("Crossed over planet reference longitude {} ".\
-                              format(planetReferenceLongitude) + \
-                              "from below to above!")
-
-                    # This is the upper-bound of the error timedelta.
-                    t1 = prevDt
-                    t2 = currDt
-                    currErrorTd = Util.absTd(t2 - t1)
-                    
-                    # Refine the timestamp until it is less than the threshold.
-                    while currErrorTd > maxErrorTd:
-                        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                            LookbackMultipleUtils.log.debug("Refining between {} and {}".\
-                                  format(Ephemeris.datetimeToStr(t1),
-                                         Ephemeris.datetimeToStr(t2)))
-
-                        # Check the timestamp between.
-                        timeWindowTd = t2 - t1
-                        halfTimeWindowTd = \
-                            datetime.\
-                            timedelta(days=(timeWindowTd.days / 2.0),
-                                seconds=(timeWindowTd.seconds / 2.0),
-                                microseconds=(timeWindowTd.microseconds / 2.0))
-                        testDt = t1 + halfTimeWindowTd
-
-                        p1 = Ephemeris.getPlanetaryInfo(planetName, testDt)
-
-                        testValueP1 = getFieldValue(p1, fieldName)
-
-                        testDiff = Util.toNormalizedAngle(\
-                            testValueP1 - planetReferenceLongitude)
-
-                        if testDiff < 120:
-                            t2 = testDt
-                            
-                            # Update the curr values.
-                            currDt = t2
-                            currDiff = testDiff
-                        else:
-                            t1 = testDt
-
-                            # Update the prev values.
-                            prevDt = t1
-
-                        currErrorTd = Util.absTd(t2 - t1)
-
-                    # Update our deque.
-                    steps[-1] = currDt
-                    steps[-2] = prevDt
-
-                    # Increment the number of 360-degree circles traversed.
-                    numFullCircles += 1
-
-                    # Calculate the total number of degrees of distance currently.
-                    currDeltaDegrees = (numFullCircles * 360.0) + currDiff
-                
-                elif prevDiff < 120 and currDiff > 240:
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        LookbackMultipleUtils.log.debug("Crossed over planet reference longitude {} ".\
-                              format(planetReferenceLongitude) + \
-                              "from above to below!")
-
-                    # This is the upper-bound of the error timedelta.
-                    t1 = prevDt
-                    t2 = currDt
-                    currErrorTd = Util.absTd(t2 - t1)
-
-                    # Refine the timestamp until it is less than the threshold.
-                    while currErrorTd > maxErrorTd:
-                        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                            LookbackMultipleUtils.log.debug("Refining between {} and {}".\
-                                  format(Ephemeris.datetimeToStr(t1),
-                                         Ephemeris.datetimeToStr(t2)))
-
-                        # Check the timestamp between.
-                        timeWindowTd = t2 - t1
-                        halfTimeWindowTd = \
-                            datetime.\
-                            timedelta(days=(timeWindowTd.days / 2.0),
-                                seconds=(timeWindowTd.seconds / 2.0),
-                                microseconds=(timeWindowTd.microseconds / 2.0))
-                        testDt = t1 + halfTimeWindowTd
-
-                        p1 = Ephemeris.getPlanetaryInfo(planetName, testDt)
-
-                        testValueP1 = getFieldValue(p1, fieldName)
-
-                        testDiff = Util.toNormalizedAngle(\
-                            testValueP1 - planetReferenceLongitude)
-
-                        if testDiff < 120:
-                            t1 = testDt
-
-                            # Update the prev values.
-                            prevDt = t1
-                        else:
-                            t2 = testDt
-                            
-                            # Update the curr values.
-                            currDt = t2
-                            currDiff = testDiff
-
-                        currErrorTd = Util.absTd(t2 - t1)
-
-                    # Update our deque.
-                    steps[-1] = currDt
-                    steps[-2] = prevDt
-
-                    # Decrement the number of 360-degree circles traversed.
-                    numFullCircles -= 1
-
-                    # Calculate the total number of degrees of distance currently.
-                    currDeltaDegrees = (numFullCircles * 360.0) + currDiff
-
-                else:
-                    # Planet reference longitude not crossed.
-                    
-                    # Calculate the total number of degrees of distance currently.
-                    currDeltaDegrees = (numFullCircles * 360.0) + currDiff
-                
-                # If prevDeltaDegrees is not set, then that means this is the first
-                # time in this section of code.  Initialize the prevDeltaDegrees.
-                if prevDeltaDegrees == None:
-                    # Two steps of stepSizeTd never goes more than 360 degrees,
-                    # so we can safely use the prevDiff as the
-                    # previous delta, without having to worry if we need to
-                    # account for multiple full circle revolutions in between.
-                    prevDeltaDegrees = prevDiff
-                
-                
-                if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                    LookbackMultipleUtils.log.debug("prevDiff == {}".format(prevDiff))
-                    LookbackMultipleUtils.log.debug("currDiff == {}".format(currDiff))
-                    LookbackMultipleUtils.log.debug("currDeltaDegrees == {}".format(currDeltaDegrees))
-                    LookbackMultipleUtils.log.debug("prevDeltaDegrees == {}".format(prevDeltaDegrees))
-                    LookbackMultipleUtils.log.debug("desiredDeltaDegrees == {}".format(desiredDeltaDegrees))
-                
-                if prevDeltaDegrees < desiredDeltaDegrees and \
-                      currDeltaDegrees > desiredDeltaDegrees:
-                    # We pased the number of degrees past that we were
-                    # looking for.  Now we have to calculate the exact
-                    # timestamp and find out if there are other
-                    # moments in time where the planet is elapsed this
-                    # many degrees (in the event that the planet goes
-                    # retrograde).
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        LookbackMultipleUtils.log.debug("Passed the desired number of " + \
-                              "delta degrees from below to above.  " + \
-                              "Narrowing down to the exact moment in time ...")
-                    
-                    # Actual degree we are looking for.
-                    desiredDegree = \
-                        Util.toNormalizedAngle(\
-                        planetReferenceLongitude + 
-                        (desiredDeltaDegrees % 360.0))
-
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        LookbackMultipleUtils.log.debug("desiredDegree == {}".format(desiredDegree))
-                    
-                    # Check starting from steps[-2] to steps[-1] to
-                    # see exactly when it passes this desiredDegree.
-
-                    # This is the upper-bound of the error timedelta.
-                    t1 = steps[-2]
-                    t2 = steps[-1]
-                    currErrorTd = Util.absTd(t2 - t1)
-                    
-                    # Refine the timestamp until it is less than the threshold.
-                    while currErrorTd > maxErrorTd:
-                        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                            LookbackMultipleUtils.log.debug("Refining between {} and {}".\
-                                  format(Ephemeris.datetimeToStr(t1),
-                                         Ephemeris.datetimeToStr(t2)))
-
-                        # Check the timestamp between.
-                        timeWindowTd = t2 - t1
-                        halfTimeWindowTd = \
-                            datetime.\
-                            timedelta(days=(timeWindowTd.days / 2.0),
-                                seconds=(timeWindowTd.seconds / 2.0),
-                                microseconds=(timeWindowTd.microseconds / 2.0))
-                        testDt = t1 + halfTimeWindowTd
-
-                        p1 = Ephemeris.getPlanetaryInfo(planetName, testDt)
-                        
-                        testValueP1 = getFieldValue(p1, fieldName)
-
-                        testDiff = Util.toNormalizedAngle(\
-                            testValueP1 - desiredDegree)
-                        
-                        if testDiff < 120:
-                            t2 = testDt
-                        else:
-                            t1 = testDt
-
-                        currErrorTd = Util.absTd(t2 - t1)
-
-                    # t2 holds the moment in time.
-                    rv.append(t2)
-
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        p1 = Ephemeris.getPlanetaryInfo(planetName, t2)
-                        LookbackMultipleUtils.log.debug(\
-                            "Found moment time: {}, with longitudeDegree == {}".\
-                            format(Ephemeris.datetimeToStr(t2), 
-                                   getFieldValue(p1, fieldName)))
-
-                elif prevDeltaDegrees > desiredDeltaDegrees and \
-                      currDeltaDegrees < desiredDeltaDegrees:
-                    # We pased the number of degrees past that we were
-                    # looking for.  Now we have to calculate the exact
-                    # timestamp and find out if there are other
-                    # moments in time where the planet is elapsed this
-                    # many degrees (in the event that the planet goes
-                    # retrograde).
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        LookbackMultipleUtils.log.debug("Passed the desired number of " + \
-                              "delta degrees from above to below.  " + \
-                              "Narrowing down to the exact moment in time ...")
-                    
-                    # Actual degree we are looking for.
-                    desiredDegree = \
-                        Util.toNormalizedAngle(\
-                        planetReferenceLongitude + 
-                        (desiredDeltaDegrees % 360.0))
-
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        LookbackMultipleUtils.log.debug("desiredDegree == {}".format(desiredDegree))
-                    
-                    # Check starting from steps[-2] to steps[-1] to
-                    # see exactly when it passes this desiredDegree.
-
-                    # This is the upper-bound of the error timedelta.
-                    t1 = steps[-2]
-                    t2 = steps[-1]
-                    currErrorTd = Util.absTd(t2 - t1)
-                    
-                    # Refine the timestamp until it is less than the threshold.
-                    while currErrorTd > maxErrorTd:
-                        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                            LookbackMultipleUtils.log.debug("Refining between {} and {}".\
-                                  format(Ephemeris.datetimeToStr(t1),
-                                         Ephemeris.datetimeToStr(t2)))
-
-                        # Check the timestamp between.
-                        timeWindowTd = t2 - t1
-                        halfTimeWindowTd = \
-                            datetime.\
-                            timedelta(days=(timeWindowTd.days / 2.0),
-                                seconds=(timeWindowTd.seconds / 2.0),
-                                microseconds=(timeWindowTd.microseconds / 2.0))
-                        testDt = t1 + halfTimeWindowTd
-
-                        p1 = Ephemeris.getPlanetaryInfo(planetName, testDt)
-                        
-                        testValueP1 = getFieldValue(p1, fieldName)
-
-                        testDiff = Util.toNormalizedAngle(\
-                            testValueP1 - desiredDegree)
-                        
-                        if testDiff > 240:
-                            t2 = testDt
-                        else:
-                            t1 = testDt
-
-                        currErrorTd = Util.absTd(t2 - t1)
-
-                    # t2 holds the moment in time.
-                    rv.append(t2)
-
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        p1 = Ephemeris.getPlanetaryInfo(planetName, t2)
-                        LookbackMultipleUtils.log.debug(\
-                            "Found moment time: {}, with longitudeDegree == {}".\
-                            format(Ephemeris.datetimeToStr(t2), 
-                                   getFieldValue(p1, fieldName)))
-
-
-                # If we have at least one timestamp found, there is only need
-                # to continue looking for more potential timestamps if the
-                # planet can go retrograde.  Direct-only planets will yield
-                # only 1 timestamp, and we have found it already.
-                if len(rv) >= 1:    
-                    if Ephemeris.isDirectOnlyPlanetName(centricityType, planetName):
-                         
-                        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                            LookbackMultipleUtils.log.debug(\
-                            "No need to look for anymore timestamps " + \
-                            "because this planet doesn't go retrograde.")
-
-                        # Set the done flag, which will stop us from looking
-                        # for more timestamps.
-                        done = True
-
-                # Test base case to test if the planet will never reach the
-                # 'desiredDeltaDegrees' relative to the reference
-                # 'planetReferenceLongitude' longitude.
-                if currDeltaDegrees - desiredDeltaDegrees > 120:
-                        
-                    LookbackMultipleUtils.log.debug("Realizing we won't ever reach " + \
-                                                    "'desiredDeltaDegrees' if we continue, " + \
-                                                    "so setting done = True.")
-                    done = True
-
-            # Prepare for the next iteration.
-            steps.append(steps[-1] + stepSizeTd)
-            longitudesP1.append(None)
-
-            # Update prevDiff with the currDiff.
-            prevDiff = currDiff
-
-            # Update prevDeltaDegrees with the currDeltaDegrees.
-            prevDeltaDegrees = currDeltaDegrees
+        jds = LookbackMultipleUtils.\
+              getJulianDaysOfLongitudeDeltaDegreesInFuture(planetName, 
+                                                           centricityType,
+                                                           longitudeType,
+                                                           referenceJd,
+                                                           desiredDeltaDegrees,
+                                                           maxErrorDays,
+                                                           ephemerisContext)
+
+        # Convert only the final results.
+        tzInfo = referenceDt.tzinfo
+        rv = [Ephemeris.julianDayToDatetime(jd, tzInfo) for jd in jds]
 
         if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
             LookbackMultipleUtils.log.debug("Exiting " + inspect.stack()[0][3] + "()")
 
         return rv
 
-        
     @staticmethod
     def getDatetimesOfLongitudeDeltaDegreesInPast(\
         planetName, 
@@ -582,7 +291,8 @@ class LookbackMultipleUtils:
         longitudeType,
         referenceDt,
         desiredDeltaDegrees,
-        maxErrorTd=datetime.timedelta(seconds=2)):
+        maxErrorTd=datetime.timedelta(seconds=2),
+        ephemerisContext=None):
         """Returns a list of datetime.datetime objects that hold the
         timestamps when the given planet is at 'desiredDeltaDegrees'
         longitude degrees relative to the longitude degrees calculated at
@@ -618,19 +328,110 @@ class LookbackMultipleUtils:
                      combination timestamp, and the one calculated.
                      This would define the accuracy of the
                      calculations.  
+        ephemerisContext - EphemerisContext to calculate the planet
+                           positions with, or None to use the
+                           Ephemeris settings.  A context lets
+                           several threads run lookback calculations
+                           in the same process.
         
         Returns:
         List of datetime.datetime objects.  The datetime.datetime
         objects in this list are the timestamps where the planet is at
         the elapsed number of degrees away from the longitude at
-        'referenceDt'.
+        'referenceDt'.  The timestamps are in the timezone of the
+        tzinfo of 'referenceDt'.
+
+        The search is done with float Julian Days via
+        getJulianDaysOfLongitudeDeltaDegreesInPast(), and only the
+        results are converted to datetime.datetime objects.
         """
         
         if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
             LookbackMultipleUtils.log.debug("Entered " + inspect.stack()[0][3] + "()")
 
-        # Return value.
-        rv = []
+        referenceJd = Ephemeris.datetimeToJulianDay(referenceDt)
+        maxErrorDays = maxErrorTd.total_seconds() / 86400.0
+        
+        jds = LookbackMultipleUtils.\
+              getJulianDaysOfLongitudeDeltaDegreesInPast(planetName, 
+                                                           centricityType,
+                                                           longitudeType,
+                                                           referenceJd,
+                                                           desiredDeltaDegrees,
+                                                           maxErrorDays,
+                                                           ephemerisContext)
+
+        # Convert only the final results.
+        tzInfo = referenceDt.tzinfo
+        rv = [Ephemeris.julianDayToDatetime(jd, tzInfo) for jd in jds]
+
+        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
+            LookbackMultipleUtils.log.debug("Exiting " + inspect.stack()[0][3] + "()")
+
+        return rv
+
+    @staticmethod
+    def getJulianDaysOfLongitudeDeltaDegreesInFuture(\
+        planetName, 
+        centricityType,
+        longitudeType,
+        referenceJd,
+        desiredDeltaDegrees,
+        maxErrorDays=(2.0 / 86400.0),
+        ephemerisContext=None):
+        """Returns a list of float Julian Days of the timestamps when
+        the given planet is at 'desiredDeltaDegrees' longitude degrees
+        relative to the longitude degrees calculated at Julian Day
+        'referenceJd', while stepping into the future in time.
+
+        This is the same search as
+        getDatetimesOfLongitudeDeltaDegreesInFuture(), but all the
+        stepping and refining is done with float Julian Days, so no
+        datetime.datetime objects are created or converted while
+        searching.  Callers doing many searches can keep working with
+        the Julian Days, and only convert the final results via
+        Ephemeris.julianDayToDatetime().
+        
+        Pre-requisites:
+        This method assumes that the user has initialized the Ephemeris 
+        via Ephemeris.initialize() and has called 
+        Ephemeris.setGeographicPosition() prior to running this method.  
+        Calling the LookbackMultipleUtils.initializeEphemeris() 
+        method would work as a substitute for this.
+
+        Arguments:
+        planetName - str holding the name of the planet to do the
+                     calculations for.
+        centricityType - str value holding either "geocentric",
+                         "topocentric", or "heliocentric".
+        longitudeType - str value holding either "tropical" or "sidereal".
+        referenceJd - float Julian Day for the reference time, as
+                      returned by Ephemeris.datetimeToJulianDay().
+                      The planet longitude at this moment is taken as
+                      the zero-point.  Increments or decrements in time 
+                      are started from this moment in time.
+        desiredDeltaDegrees - float value for the number of longitude degrees
+                        elapsed from the longitude at 'referenceJd'.
+        maxErrorDays - float value holding the maximum time
+                       difference, in days, between the exact
+                       planetary combination timestamp, and the one
+                       calculated.  This would define the accuracy of
+                       the calculations.  Default is 2 seconds.
+        ephemerisContext - EphemerisContext to calculate the planet
+                           positions with, or None to use the
+                           Ephemeris settings.  With a context, the
+                           ephemeris interpolator is not used, since
+                           it holds values for the Ephemeris settings.
+
+        Returns:
+        List of float Julian Days, ordered chronologically in the
+        direction of the search.  These are the timestamps where the
+        planet is at the elapsed number of degrees away from the
+        longitude at 'referenceJd'.
+        """
+        
+        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
+            LookbackMultipleUtils.log.debug("Entered " + inspect.stack()[0][3] + "()")
 
         # Verify inputs.
         centricityTypeOrig = centricityType
@@ -654,427 +455,667 @@ class LookbackMultipleUtils:
             LookbackMultipleUtils.log.error(errMsg)
             raise ValueError(errMsg)
 
-        # Field name we are getting.
-        fieldName = "longitude"
+        finder = LookbackMultipleUtils.createLongitudeDeltaRootFinder(\
+            planetName,
+            centricityType,
+            longitudeType,
+            maxErrorDays,
+            ephemerisContext)
+
+        timeline = LookbackMultipleUtils.getLongitudeTimeline(\
+            planetName,
+            centricityType,
+            longitudeType,
+            ephemerisContext)
+
+        if timeline != None:
+            rv = timeline.findJulianDays(finder,
+                                         referenceJd,
+                                         desiredDeltaDegrees,
+                                         1)
+        else:
+            rv = finder.findJulianDays(referenceJd, desiredDeltaDegrees, 1)
 
-        # Step size timedelta.  
-        stepSizeTd = \
-            LookbackMultipleUtils._getOptimalStepSizeTd(centricityType, 
-                                                        planetName)
-        stepSizeTd = stepSizeTd * -1
-        
-        # Running count of number of full 360-degree circles.
-        numFullCircles = 0
-        
-        # Desired degree.
-        desiredDegree = None
+        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
+            LookbackMultipleUtils.log.debug(\
+                "Found {} results in {} ephemeris evaluations.  ".\
+                format(len(rv), finder.numEvaluations) + \
+                "Evaluations for refining each result: {}".\
+                format(finder.resultNumEvaluations))
+            LookbackMultipleUtils.log.debug("Exiting " + inspect.stack()[0][3] + "()")
+
+        return rv
+
+    @staticmethod
+    def getJulianDaysOfLongitudeDeltaDegreesInPast(\
+        planetName, 
+        centricityType,
+        longitudeType,
+        referenceJd,
+        desiredDeltaDegrees,
+        maxErrorDays=(2.0 / 86400.0),
+        ephemerisContext=None):
+        """Returns a list of float Julian Days of the timestamps when
+        the given planet is at 'desiredDeltaDegrees' longitude degrees
+        relative to the longitude degrees calculated at Julian Day
+        'referenceJd', while stepping into the past in time.
+
+        This is the same search as
+        getDatetimesOfLongitudeDeltaDegreesInPast(), but all the
+        stepping and refining is done with float Julian Days, so no
+        datetime.datetime objects are created or converted while
+        searching.  Callers doing many searches can keep working with
+        the Julian Days, and only convert the final results via
+        Ephemeris.julianDayToDatetime().
         
-        # Longitude of the planet at datetime referenceDt.
-        planetReferenceLongitude = None
+        Pre-requisites:
+        This method assumes that the user has initialized the Ephemeris 
+        via Ephemeris.initialize() and has called 
+        Ephemeris.setGeographicPosition() prior to running this method.  
+        Calling the LookbackMultipleUtils.initializeEphemeris() 
+        method would work as a substitute for this.
 
-        # Iterate through, creating artfacts and adding them as we go.
-        steps = collections.deque(maxlen=2)
-        steps.append(referenceDt)
-        steps.append(referenceDt)
+        Arguments:
+        planetName - str holding the name of the planet to do the
+                     calculations for.
+        centricityType - str value holding either "geocentric",
+                         "topocentric", or "heliocentric".
+        longitudeType - str value holding either "tropical" or "sidereal".
+        referenceJd - float Julian Day for the reference time, as
+                      returned by Ephemeris.datetimeToJulianDay().
+                      The planet longitude at this moment is taken as
+                      the zero-point.  Increments or decrements in time 
+                      are started from this moment in time.
+        desiredDeltaDegrees - float value for the number of longitude degrees
+                        elapsed from the longitude at 'referenceJd'.
+        maxErrorDays - float value holding the maximum time
+                       difference, in days, between the exact
+                       planetary combination timestamp, and the one
+                       calculated.  This would define the accuracy of
+                       the calculations.  Default is 2 seconds.
+        ephemerisContext - EphemerisContext to calculate the planet
+                           positions with, or None to use the
+                           Ephemeris settings.  With a context, the
+                           ephemeris interpolator is not used, since
+                           it holds values for the Ephemeris settings.
 
-        longitudesP1 = collections.deque(maxlen=2)
-        longitudesP1.append(None)
-        longitudesP1.append(None)
+        Returns:
+        List of float Julian Days, ordered chronologically in the
+        direction of the search.  These are the timestamps where the
+        planet is at the elapsed number of degrees away from the
+        longitude at 'referenceJd'.
+        """
         
-        def getFieldValue(planetaryInfo, fieldName):
-            pi = planetaryInfo
-            fieldValue = None
-            
-            if centricityType == "geocentric":
-                fieldValue = pi.geocentric[longitudeType][fieldName]
-            elif centricityType.lower() == "topocentric":
-                fieldValue = pi.topocentric[longitudeType][fieldName]
-            elif centricityType.lower() == "heliocentric":
-                fieldValue = pi.heliocentric[longitudeType][fieldName]
-            else:
-                LookbackMultipleUtils.log.error("Unknown centricity type.")
-                fieldValue = None
-
-            return fieldValue
-            
         if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-            LookbackMultipleUtils.log.debug("Stepping through timestamps from {} ...".\
-                  format(Ephemeris.datetimeToStr(referenceDt)))
+            LookbackMultipleUtils.log.debug("Entered " + inspect.stack()[0][3] + "()")
 
-        currDiff = None
-        prevDiff = None
+        # Verify inputs.
+        centricityTypeOrig = centricityType
+        centricityType = centricityType.lower()
+        if centricityType != "geocentric" and \
+           centricityType != "topocentric" and \
+           centricityType != "heliocentric":
 
-        # Current and previous number of degrees distance relative that we are
-        # away from the longitude at referenceDt.
-        currDeltaDegrees = None
-        prevDeltaDegrees = None
-        
-        done = False
-        while not done:
-        
-            currDt = steps[-1]
-            prevDt = steps[-2]
-            
-            if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                LookbackMultipleUtils.log.debug("Looking at currDt == {} ...".\
-                      format(Ephemeris.datetimeToStr(currDt)))
-
-            p1 = Ephemeris.getPlanetaryInfo(planetName, currDt)
-
-            if planetReferenceLongitude == None:
-                planetReferenceLongitude = getFieldValue(p1, fieldName)
-
-                if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                    LookbackMultipleUtils.log.debug("planetReferenceLongitude == {}".\
-                                                format(planetReferenceLongitude))
-            
-            longitudesP1[-1] = getFieldValue(p1, fieldName)
-            
-            if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                LookbackMultipleUtils.log.debug("{} {} {} {} is: {}".\
-                      format(p1.name, centricityType, longitudeType, fieldName,
-                             getFieldValue(p1, fieldName)))
-            
-            # Calculate the difference in planet longitudes between the current
-            # datetime and the referenceDt.  
-            # (This value will be in the range [0, 360) ).
-            #
-            currDiff = Util.toNormalizedAngle(\
-                longitudesP1[-1] - planetReferenceLongitude)
-            
-            if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                LookbackMultipleUtils.log.debug("prevDiff == {}".\
-                                                format(prevDiff))
-                LookbackMultipleUtils.log.debug("currDiff == {}".\
-                                                format(currDiff))
-            
-            # If this is not the first iteration of the loop 
-            # (i.e. we have both a prevDiff and 
-            # a currDiff to compare).
-            if prevDiff != None and longitudesP1[-2] != None:
-                
-                if prevDiff > 240 and currDiff < 120:
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        LookbackMultipleUtils.log.debug("Crossed over planet reference longitude {} ".\
-                              format(planetReferenceLongitude) + \
-                              "from below to above!")
-
-                    # This is the upper-bound of the error timedelta.
-                    t1 = prevDt
-                    t2 = currDt
-                    currErrorTd = Util.absTd(t2 - t1)
-                    
-                    # Refine the timestamp until it is less than the threshold.
-                    while currErrorTd > maxErrorTd:
-                        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                            LookbackMultipleUtils.log.debug("Refining between {} and {}".\
-                                  format(Ephemeris.datetimeToStr(t1),
-                                         Ephemeris.datetimeToStr(t2)))
-
-                        # Check the timestamp between.
-                        timeWindowTd = t2 - t1
-                        halfTimeWindowTd = \
-                            datetime.\
-                            timedelta(days=(timeWindowTd.days / 2.0),
-                                seconds=(timeWindowTd.seconds / 2.0),
-                                microseconds=(timeWindowTd.microseconds / 2.0))
-                        testDt = t1 + halfTimeWindowTd
-
-                        p1 = Ephemeris.getPlanetaryInfo(planetName, testDt)
-
-                        testValueP1 = getFieldValue(p1, fieldName)
-
-                        testDiff = Util.toNormalizedAngle(\
-                            testValueP1 - planetReferenceLongitude)
-
-                        if testDiff < 120:
-                            t2 = testDt
-                            
-                            # Update the curr values.
-                            currDt = t2
-                            currDiff = testDiff
-                        else:
-                            t1 = testDt
-
-                            # Update the prev values.
-                            prevDt = t1
-
-                        currErrorTd = Util.absTd(t2 - t1)
-
-                    # Update our deque.
-                    steps[-1] = currDt
-                    steps[-2] = prevDt
-
-                    # Increment the number of 360-degree circles traversed.
-                    numFullCircles += 1
-
-                    # Calculate the total number of degrees of distance currently.
-                    currDeltaDegrees = (numFullCircles * 360.0) + currDiff
-                
-                elif prevDiff < 120 and currDiff > 240:
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        LookbackMultipleUtils.log.debug("Crossed over planet reference longitude {} ".\
-                              format(planetReferenceLongitude) + \
-                              "from above to below!")
-
-                    # This is the upper-bound of the error timedelta.
-                    t1 = prevDt
-                    t2 = currDt
-                    currErrorTd = Util.absTd(t2 - t1)
-
-                    # Refine the timestamp until it is less than the threshold.
-                    while currErrorTd > maxErrorTd:
-                        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                            LookbackMultipleUtils.log.debug("Refining between {} and {}".\
-                                  format(Ephemeris.datetimeToStr(t1),
-                                         Ephemeris.datetimeToStr(t2)))
-
-                        # Check the timestamp between.
-                        timeWindowTd = t2 - t1
-                        halfTimeWindowTd = \
-                            datetime.\
-                            timedelta(days=(timeWindowTd.days / 2.0),
-                                seconds=(timeWindowTd.seconds / 2.0),
-                                microseconds=(timeWindowTd.microseconds / 2.0))
-                        testDt = t1 + halfTimeWindowTd
-
-                        p1 = Ephemeris.getPlanetaryInfo(planetName, testDt)
-
-                        testValueP1 = getFieldValue(p1, fieldName)
-
-                        testDiff = Util.toNormalizedAngle(\
-                            testValueP1 - planetReferenceLongitude)
-
-                        if testDiff < 120:
-                            t1 = testDt
-
-                            # Update the prev values.
-                            prevDt = t1
-                        else:
-                            t2 = testDt
-                            
-                            # Update the curr values.
-                            currDt = t2
-                            currDiff = testDiff
-
-                        currErrorTd = Util.absTd(t2 - t1)
-
-                    # Update our deque.
-                    steps[-1] = currDt
-                    steps[-2] = prevDt
-
-                    # Decrement the number of 360-degree circles traversed.
-                    numFullCircles -= 1
-
-                    # Calculate the total number of degrees of distance currently.
-                    currDeltaDegrees = (numFullCircles * 360.0) + currDiff
-
-                else:
-                    # Planet reference longitude not crossed.
-                    
-                    # Calculate the total number of degrees of distance currently.
-                    currDeltaDegrees = (numFullCircles * 360.0) + currDiff
-                
-                # If prevDeltaDegrees is not set, then that means this is the first
-                # time in this section of code.  Initialize the prevDeltaDegrees.
-                if prevDeltaDegrees == None:
-                    # Two steps of stepSizeTd never goes more than 360 degrees,
-                    # so we can safely use the prevDiff as the
-                    # previous delta, without having to worry if we need to
-                    # account for multiple full circle revolutions in between.
-                    prevDeltaDegrees = prevDiff
-                
-                
-                if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                    LookbackMultipleUtils.log.debug("prevDiff == {}".format(prevDiff))
-                    LookbackMultipleUtils.log.debug("currDiff == {}".format(currDiff))
-                    LookbackMultipleUtils.log.debug("currDeltaDegrees == {}".format(currDeltaDegrees))
-                    LookbackMultipleUtils.log.debug("prevDeltaDegrees == {}".format(prevDeltaDegrees))
-                    LookbackMultipleUtils.log.debug("desiredDeltaDegrees == {}".format(desiredDeltaDegrees))
-                
-                if prevDeltaDegrees < desiredDeltaDegrees and \
-                      currDeltaDegrees > desiredDeltaDegrees:
-                    # We pased the number of degrees past that we were
-                    # looking for.  Now we have to calculate the exact
-                    # timestamp and find out if there are other
-                    # moments in time where the planet is elapsed this
-                    # many degrees (in the event that the planet goes
-                    # retrograde).
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        LookbackMultipleUtils.log.debug("Passed the desired number of " + \
-                              "delta degrees from below to above.  " + \
-                              "Narrowing down to the exact moment in time ...")
-                    
-                    # Actual degree we are looking for.
-                    desiredDegree = \
-                        Util.toNormalizedAngle(\
-                        planetReferenceLongitude + 
-                        (desiredDeltaDegrees % 360.0))
-
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        LookbackMultipleUtils.log.debug("desiredDegree == {}".format(desiredDegree))
-                    
-                    # Check starting from steps[-2] to steps[-1] to
-                    # see exactly when it passes this desiredDegree.
-
-                    # This is the upper-bound of the error timedelta.
-                    t1 = steps[-2]
-                    t2 = steps[-1]
-                    currErrorTd = Util.absTd(t2 - t1)
-                    
-                    # Refine the timestamp until it is less than the threshold.
-                    while currErrorTd > maxErrorTd:
-                        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                            LookbackMultipleUtils.log.debug("Refining between {} and {}".\
-                                  format(Ephemeris.datetimeToStr(t1),
-                                         Ephemeris.datetimeToStr(t2)))
-
-                        # Check the timestamp between.
-                        timeWindowTd = t2 - t1
-                        halfTimeWindowTd = \
-                            datetime.\
-                            timedelta(days=(timeWindowTd.days / 2.0),
-                                seconds=(timeWindowTd.seconds / 2.0),
-                                microseconds=(timeWindowTd.microseconds / 2.0))
-                        testDt = t1 + halfTimeWindowTd
-
-                        p1 = Ephemeris.getPlanetaryInfo(planetName, testDt)
-                        
-                        testValueP1 = getFieldValue(p1, fieldName)
-
-                        testDiff = Util.toNormalizedAngle(\
-                            testValueP1 - desiredDegree)
-                        
-                        if testDiff < 120:
-                            t2 = testDt
-                        else:
-                            t1 = testDt
-
-                        currErrorTd = Util.absTd(t2 - t1)
-
-                    # t2 holds the moment in time.
-                    rv.append(t2)
-
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        p1 = Ephemeris.getPlanetaryInfo(planetName, t2)
-                        LookbackMultipleUtils.log.debug(\
-                            "Found moment time: {}, with longitudeDegree == {}".\
-                            format(Ephemeris.datetimeToStr(t2), 
-                                   getFieldValue(p1, fieldName)))
-
-                elif prevDeltaDegrees > desiredDeltaDegrees and \
-                      currDeltaDegrees < desiredDeltaDegrees:
-                    # We pased the number of degrees past that we were
-                    # looking for.  Now we have to calculate the exact
-                    # timestamp and find out if there are other
-                    # moments in time where the planet is elapsed this
-                    # many degrees (in the event that the planet goes
-                    # retrograde).
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        LookbackMultipleUtils.log.debug("Passed the desired number of " + \
-                              "delta degrees from above to below.  " + \
-                              "Narrowing down to the exact moment in time ...")
-                    
-                    # Actual degree we are looking for.
-                    desiredDegree = \
-                        Util.toNormalizedAngle(\
-                        planetReferenceLongitude + 
-                        (desiredDeltaDegrees % 360.0))
-
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        LookbackMultipleUtils.log.debug("desiredDegree == {}".format(desiredDegree))
-                    
-                    # Check starting from steps[-2] to steps[-1] to
-                    # see exactly when it passes this desiredDegree.
-
-                    # This is the upper-bound of the error timedelta.
-                    t1 = steps[-2]
-                    t2 = steps[-1]
-                    currErrorTd = Util.absTd(t2 - t1)
-                    
-                    # Refine the timestamp until it is less than the threshold.
-                    while currErrorTd > maxErrorTd:
-                        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                            LookbackMultipleUtils.log.debug("Refining between {} and {}".\
-                                  format(Ephemeris.datetimeToStr(t1),
-                                         Ephemeris.datetimeToStr(t2)))
-
-                        # Check the timestamp between.
-                        timeWindowTd = t2 - t1
-                        halfTimeWindowTd = \
-                            datetime.\
-                            timedelta(days=(timeWindowTd.days / 2.0),
-                                seconds=(timeWindowTd.seconds / 2.0),
-                                microseconds=(timeWindowTd.microseconds / 2.0))
-                        testDt = t1 + halfTimeWindowTd
-
-                        p1 = Ephemeris.getPlanetaryInfo(planetName, testDt)
-                        
-                        testValueP1 = getFieldValue(p1, fieldName)
-
-                        testDiff = Util.toNormalizedAngle(\
-                            testValueP1 - desiredDegree)
-                        
-                        if testDiff > 240:
-                            t2 = testDt
-                        else:
-                            t1 = testDt
-
-                        currErrorTd = Util.absTd(t2 - t1)
-
-                    # t2 holds the moment in time.
-                    rv.append(t2)
-
-                    if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                        p1 = Ephemeris.getPlanetaryInfo(planetName, t2)
-                        LookbackMultipleUtils.log.debug(\
-                            "Found moment time: {}, with longitudeDegree == {}".\
-                            format(Ephemeris.datetimeToStr(t2), 
-                                   getFieldValue(p1, fieldName)))
-
-
-                # If we have at least one timestamp found, there is only need
-                # to continue looking for more potential timestamps if the
-                # planet can go retrograde.  Direct-only planets will yield
-                # only 1 timestamp, and we have found it already.
-                if len(rv) >= 1:    
-                    if Ephemeris.isDirectOnlyPlanetName(centricityType, planetName):
-                        
-                        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
-                            LookbackMultipleUtils.log.debug(\
-                            "No need to look for anymore timestamps " + \
-                            "because this planet doesn't go retrograde.")
-
-                        # Set the done flag, which will stop us from looking
-                        # for more timestamps.
-                        done = True
-                    
-                # Test base case to test if the planet will never reach the
-                # 'desiredDeltaDegrees' relative to the reference
-                # 'planetReferenceLongitude' longitude.
-                if currDeltaDegrees - desiredDeltaDegrees < -120:
-                        
-                    LookbackMultipleUtils.log.debug("Realizing we won't ever reach " + \
-                                                    "'desiredDeltaDegrees' if we continue, " + \
-                                                    "so setting done = True.")
-                    done = True
-                
-            # Prepare for the next iteration.
-            steps.append(steps[-1] + stepSizeTd)
-            longitudesP1.append(None)
-
-            # Update prevDiff with the currDiff.
-            prevDiff = currDiff
-
-            # Update prevDeltaDegrees with the currDeltaDegrees.
-            prevDeltaDegrees = currDeltaDegrees
+            errMsg = "Invalid input: centricityType is invalid.  " + \
+                      "Value given was: {}".format(centricityTypeOrig)
+            LookbackMultipleUtils.log.error(errMsg)
+            raise ValueError(errMsg)
+
+        longitudeTypeOrig = longitudeType
+        longitudeType = longitudeType.lower()
+        if longitudeType != "tropical" and \
+           longitudeType != "sidereal":
+
+            errMsg = "Invalid input: longitudeType is invalid.  " + \
+                      "Value given was: {}".format(longitudeTypeOrig)
+            LookbackMultipleUtils.log.error(errMsg)
+            raise ValueError(errMsg)
+
+        finder = LookbackMultipleUtils.createLongitudeDeltaRootFinder(\
+            planetName,
+            centricityType,
+            longitudeType,
+            maxErrorDays,
+            ephemerisContext)
+
+        timeline = LookbackMultipleUtils.getLongitudeTimeline(\
+            planetName,
+            centricityType,
+            longitudeType,
+            ephemerisContext)
+
+        if timeline != None:
+            rv = timeline.findJulianDays(finder,
+                                         referenceJd,
+                                         desiredDeltaDegrees,
+                                         -1)
+        else:
+            rv = finder.findJulianDays(referenceJd, desiredDeltaDegrees, -1)
 
         if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
+            LookbackMultipleUtils.log.debug(\
+                "Found {} results in {} ephemeris evaluations.  ".\
+                format(len(rv), finder.numEvaluations) + \
+                "Evaluations for refining each result: {}".\
+                format(finder.resultNumEvaluations))
             LookbackMultipleUtils.log.debug("Exiting " + inspect.stack()[0][3] + "()")
 
         return rv
 
         
+
+    @staticmethod
+    def sweepDatetimesOfLongitudeDeltaDegreesInFuture(\
+        planetName,
+        centricityType,
+        longitudeType,
+        referenceDts,
+        desiredDeltaDegreesList,
+        maxErrorTd=datetime.timedelta(seconds=2),
+        ephemerisContext=None):
+        """Does what getDatetimesOfLongitudeDeltaDegreesInFuture()
+        does, for every combination of the given reference timestamps
+        and desired delta degrees, in a single pass through time.
+        See sweepJulianDaysOfLongitudeDeltaDegreesInFuture().
+
+        Arguments:
+        planetName - str holding the name of the planet to do the
+                     calculations for.
+        centricityType - str value holding either "geocentric",
+                         "topocentric", or "heliocentric".
+        longitudeType - str value holding either "tropical" or "sidereal".
+        referenceDts - list of datetime.datetime objects for the
+                       reference times.
+        desiredDeltaDegreesList - list of float values for the number
+                       of longitude degrees elapsed from the longitude
+                       at each reference time.
+        maxErrorTd - datetime.timedelta object holding the maximum
+                     time difference between the exact planetary
+                     combination timestamp, and the one calculated.
+        ephemerisContext - EphemerisContext to calculate the planet
+                           positions with, or None to use the
+                           Ephemeris settings.
+
+        Returns:
+        List with one entry for each timestamp in 'referenceDts'.
+        Each entry is a list with one entry for each value in
+        'desiredDeltaDegreesList'.  Each of those is the list of
+        datetime.datetime objects that
+        getDatetimesOfLongitudeDeltaDegreesInFuture() returns for that
+        reference timestamp and desired delta, in the timezone of the
+        reference timestamp.
+        """
+
+        return LookbackMultipleUtils._sweepDatetimesOfLongitudeDeltaDegrees(\
+            planetName,
+            centricityType,
+            longitudeType,
+            referenceDts,
+            desiredDeltaDegreesList,
+            maxErrorTd,
+            ephemerisContext,
+            1)
+
+    @staticmethod
+    def sweepDatetimesOfLongitudeDeltaDegreesInPast(\
+        planetName,
+        centricityType,
+        longitudeType,
+        referenceDts,
+        desiredDeltaDegreesList,
+        maxErrorTd=datetime.timedelta(seconds=2),
+        ephemerisContext=None):
+        """Does what getDatetimesOfLongitudeDeltaDegreesInPast()
+        does, for every combination of the given reference timestamps
+        and desired delta degrees, in a single pass through time.
+        See sweepDatetimesOfLongitudeDeltaDegreesInFuture() for
+        details about the arguments and the return value.
+        """
+
+        return LookbackMultipleUtils._sweepDatetimesOfLongitudeDeltaDegrees(\
+            planetName,
+            centricityType,
+            longitudeType,
+            referenceDts,
+            desiredDeltaDegreesList,
+            maxErrorTd,
+            ephemerisContext,
+            -1)
+
+    @staticmethod
+    def sweepJulianDaysOfLongitudeDeltaDegreesInFuture(\
+        planetName,
+        centricityType,
+        longitudeType,
+        referenceJds,
+        desiredDeltaDegreesList,
+        maxErrorDays=(2.0 / 86400.0),
+        ephemerisContext=None):
+        """Does what getJulianDaysOfLongitudeDeltaDegreesInFuture()
+        does, for every combination of the given reference Julian Days
+        and desired delta degrees.
+
+        Instead of one walk through time per reference Julian Day and
+        per desired delta, a single walk is made over the whole span,
+        and every crossing of every desired delta is found along the
+        way (see LongitudeDeltaRootFinder.sweepJulianDays()).  This is
+        much faster when there are many reference times close to each
+        other, e.g. the PriceBars of a chart, or many multiples of the
+        same planet.
+
+        Arguments:
+        planetName - str holding the name of the planet to do the
+                     calculations for.
+        centricityType - str value holding either "geocentric",
+                         "topocentric", or "heliocentric".
+        longitudeType - str value holding either "tropical" or "sidereal".
+        referenceJds - list of float Julian Days for the reference
+                       times.  These do not need to be sorted.
+        desiredDeltaDegreesList - list of float values for the number
+                       of longitude degrees elapsed from the longitude
+                       at each reference time.
+        maxErrorDays - float value holding the maximum time
+                       difference, in days, between the exact
+                       planetary combination timestamp, and the one
+                       calculated.  Default is 2 seconds.
+        ephemerisContext - EphemerisContext to calculate the planet
+                           positions with, or None to use the
+                           Ephemeris settings.
+
+        Returns:
+        List with one entry for each Julian Day in 'referenceJds', in
+        the same order.  Each entry is a list with one entry for each
+        value in 'desiredDeltaDegreesList', in the same order.  Each of
+        those is the list of float Julian Days that
+        getJulianDaysOfLongitudeDeltaDegreesInFuture() returns for that
+        reference Julian Day and desired delta.
+        """
+
+        return LookbackMultipleUtils._sweepJulianDaysOfLongitudeDeltaDegrees(\
+            planetName,
+            centricityType,
+            longitudeType,
+            referenceJds,
+            desiredDeltaDegreesList,
+            maxErrorDays,
+            ephemerisContext,
+            1)
+
+    @staticmethod
+    def sweepJulianDaysOfLongitudeDeltaDegreesInPast(\
+        planetName,
+        centricityType,
+        longitudeType,
+        referenceJds,
+        desiredDeltaDegreesList,
+        maxErrorDays=(2.0 / 86400.0),
+        ephemerisContext=None):
+        """Does what getJulianDaysOfLongitudeDeltaDegreesInPast()
+        does, for every combination of the given reference Julian Days
+        and desired delta degrees, in a single pass through time.
+        See sweepJulianDaysOfLongitudeDeltaDegreesInFuture() for
+        details about the arguments and the return value.
+        """
+
+        return LookbackMultipleUtils._sweepJulianDaysOfLongitudeDeltaDegrees(\
+            planetName,
+            centricityType,
+            longitudeType,
+            referenceJds,
+            desiredDeltaDegreesList,
+            maxErrorDays,
+            ephemerisContext,
+            -1)
+
+    @staticmethod
+    def _sweepDatetimesOfLongitudeDeltaDegrees(planetName,
+                                               centricityType,
+                                               longitudeType,
+                                               referenceDts,
+                                               desiredDeltaDegreesList,
+                                               maxErrorTd,
+                                               ephemerisContext,
+                                               direction):
+        """Helper function for
+        sweepDatetimesOfLongitudeDeltaDegreesInFuture() and
+        sweepDatetimesOfLongitudeDeltaDegreesInPast().  The sweep is
+        done with float Julian Days, and only the results are
+        converted to datetime.datetime objects.
+        """
+
+        referenceJds = \
+            [Ephemeris.datetimeToJulianDay(dt) for dt in referenceDts]
+        maxErrorDays = maxErrorTd.total_seconds() / 86400.0
+
+        results = LookbackMultipleUtils.\
+            _sweepJulianDaysOfLongitudeDeltaDegrees(planetName,
+                                                    centricityType,
+                                                    longitudeType,
+                                                    referenceJds,
+                                                    desiredDeltaDegreesList,
+                                                    maxErrorDays,
+                                                    ephemerisContext,
+                                                    direction)
+
+        # Convert only the final results.
+        rv = []
+        for i in range(len(referenceDts)):
+            tzInfo = referenceDts[i].tzinfo
+            rv.append([[Ephemeris.julianDayToDatetime(jd, tzInfo) \
+                        for jd in jds] for jds in results[i]])
+
+        return rv
+
+    @staticmethod
+    def _sweepJulianDaysOfLongitudeDeltaDegrees(planetName,
+                                                centricityType,
+                                                longitudeType,
+                                                referenceJds,
+                                                desiredDeltaDegreesList,
+                                                maxErrorDays,
+                                                ephemerisContext,
+                                                direction):
+        """Helper function for
+        sweepJulianDaysOfLongitudeDeltaDegreesInFuture() and
+        sweepJulianDaysOfLongitudeDeltaDegreesInPast().  'direction'
+        is 1 for the future and -1 for the past.
+        """
+
+        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
+            LookbackMultipleUtils.log.debug("Entered " + inspect.stack()[0][3] + "()")
+
+        # Verify inputs.
+        centricityTypeOrig = centricityType
+        centricityType = centricityType.lower()
+        if centricityType != "geocentric" and \
+           centricityType != "topocentric" and \
+           centricityType != "heliocentric":
+
+            errMsg = "Invalid input: centricityType is invalid.  " + \
+                      "Value given was: {}".format(centricityTypeOrig)
+            LookbackMultipleUtils.log.error(errMsg)
+            raise ValueError(errMsg)
+
+        longitudeTypeOrig = longitudeType
+        longitudeType = longitudeType.lower()
+        if longitudeType != "tropical" and \
+           longitudeType != "sidereal":
+
+            errMsg = "Invalid input: longitudeType is invalid.  " + \
+                      "Value given was: {}".format(longitudeTypeOrig)
+            LookbackMultipleUtils.log.error(errMsg)
+            raise ValueError(errMsg)
+
+        finder = LookbackMultipleUtils.createLongitudeDeltaRootFinder(\
+            planetName,
+            centricityType,
+            longitudeType,
+            maxErrorDays,
+            ephemerisContext)
+
+        timeline = LookbackMultipleUtils.getLongitudeTimeline(\
+            planetName,
+            centricityType,
+            longitudeType,
+            ephemerisContext)
+
+        if timeline != None:
+            rv = timeline.sweepJulianDays(finder,
+                                          referenceJds,
+                                          desiredDeltaDegreesList,
+                                          direction)
+        else:
+            rv = finder.sweepJulianDays(referenceJds,
+                                        desiredDeltaDegreesList,
+                                        direction)
+
+        if LookbackMultipleUtils.log.isEnabledFor(logging.DEBUG) == True:
+            LookbackMultipleUtils.log.debug(\
+                "Swept {} reference times and {} deltas, ".\
+                format(len(referenceJds), len(desiredDeltaDegreesList)) + \
+                "finding {} results in {} ephemeris evaluations.".\
+                format(len(finder.resultNumEvaluations),
+                       finder.numEvaluations))
+            LookbackMultipleUtils.log.debug("Exiting " + inspect.stack()[0][3] + "()")
+
+        return rv
+
+    @staticmethod
+    def createLongitudeDeltaRootFinder(planetName,
+                                       centricityType,
+                                       longitudeType,
+                                       maxErrorDays=(2.0 / 86400.0),
+                                       ephemerisContext=None):
+        """Returns a LongitudeDeltaRootFinder set up to search for the
+        longitude deltas of the given planet, the same way as
+        getJulianDaysOfLongitudeDeltaDegreesInFuture() and
+        getJulianDaysOfLongitudeDeltaDegreesInPast() do.  This is
+        useful for callers that want the number of ephemeris
+        evaluations done by the searches.
+
+        The planet positions are calculated with 'ephemerisContext'
+        if it is not None, otherwise with the ephemeris interpolator
+        if one is set, otherwise with the Ephemeris.
+
+        Arguments:
+        planetName - str holding the name of the planet.
+        centricityType - str value holding either "geocentric",
+                         "topocentric", or "heliocentric".
+        longitudeType - str value holding either "tropical" or "sidereal".
+        maxErrorDays - float value holding the maximum time
+                       difference, in days, between the exact
+                       timestamp, and the one calculated.
+        ephemerisContext - EphemerisContext to calculate the planet
+                           positions with, or None.
+
+        Returns:
+        LongitudeDeltaRootFinder object.
+        """
+
+        # House cusps and ascmc planets only have a placeholder value
+        # for the longitude speed.
+        hasLongitudeSpeed = \
+            LongitudeDeltaRootFinder.hasLongitudeSpeed(planetName)
+
+        interpolator = LookbackMultipleUtils.ephemerisInterpolator
+
+        def evaluate(jd):
+            if ephemerisContext != None:
+                return ephemerisContext.getLongitudeAndSpeed(planetName,
+                                                             jd,
+                                                             centricityType,
+                                                             longitudeType)
+
+            if interpolator != None:
+                (longitude, longitudeSpeed) = \
+                    interpolator.getValueAndRate(planetName,
+                                                 jd,
+                                                 centricityType,
+                                                 longitudeType,
+                                                 "longitude")
+                if hasLongitudeSpeed == False:
+                    longitudeSpeed = None
+                return (longitude, longitudeSpeed)
+
+            return Ephemeris.getLongitudeAndSpeed(planetName,
+                                                  jd,
+                                                  centricityType,
+                                                  longitudeType)
+
+        # Step size in days.
+        stepSizeTd = \
+            LookbackMultipleUtils._getOptimalStepSizeTd(centricityType, 
+                                                        planetName)
+        stepSizeDays = stepSizeTd.total_seconds() / 86400.0
+
+        maxSpeed = \
+            LongitudeDeltaRootFinder.getMaxLongitudeSpeed(centricityType,
+                                                          planetName)
+
+        isDirectOnly = \
+            Ephemeris.isDirectOnlyPlanetName(centricityType, planetName)
+
+        jumpDegrees = \
+            LongitudeDeltaRootFinder.getLongitudeJumpDegrees(planetName)
+
+        return LongitudeDeltaRootFinder(evaluate,
+                                        stepSizeDays,
+                                        maxSpeed,
+                                        isDirectOnly,
+                                        maxErrorDays,
+                                        jumpDegrees)
+
+    @staticmethod
+    def createLongitudeTimeline(planetName,
+                                centricityType,
+                                longitudeType,
+                                startJd,
+                                endJd,
+                                cacheFilename=None,
+                                ephemerisContext=None):
+        """Creates a LongitudeTimeline for the given planet over
+        'startJd' to 'endJd', and sets it to be used by the lookback
+        calculations of the planet.  Searches from reference times
+        within the span of the timeline then only evaluate the planet
+        at the reference time and to refine the results.
+
+        Arguments:
+        planetName - str holding the name of the planet.
+        centricityType - str value holding either "geocentric",
+                         "topocentric", or "heliocentric".
+        longitudeType - str value holding either "tropical" or "sidereal".
+        startJd - float Julian Day for the start of the timeline.
+        endJd - float Julian Day for the end of the timeline.
+        cacheFilename - str holding the path of the file to load the
+                        timeline from, and to save it to if it has to
+                        be built, or None.  See
+                        LongitudeTimeline.getCacheFilename() for the
+                        per-document cache files.
+        ephemerisContext - EphemerisContext to calculate the planet
+                           positions with, or None to use the
+                           Ephemeris settings.
+
+        Returns:
+        LongitudeTimeline object.
+        """
+
+        centricityType = centricityType.lower()
+        longitudeType = longitudeType.lower()
+
+        finder = LookbackMultipleUtils.createLongitudeDeltaRootFinder(\
+            planetName,
+            centricityType,
+            longitudeType,
+            ephemerisContext=ephemerisContext)
+
+        timeline = LongitudeTimeline.loadOrBuild(finder,
+                                                 planetName,
+                                                 centricityType,
+                                                 longitudeType,
+                                                 startJd,
+                                                 endJd,
+                                                 cacheFilename,
+                                                 ephemerisContext)
+
+        LookbackMultipleUtils.setLongitudeTimeline(timeline)
+
+        return timeline
+
+    @staticmethod
+    def loadLongitudeTimeline(planetName,
+                              centricityType,
+                              longitudeType,
+                              cacheFilename,
+                              ephemerisContext=None):
+        """Sets the LongitudeTimeline saved in 'cacheFilename' to be
+        used by the lookback calculations of the given planet, if
+        there is no usable timeline set for it yet.  The saved
+        timeline is only used if it is for the planet, was sampled at
+        the step size of the searches, and was built for the
+        geographic position of 'ephemerisContext' (or of the
+        Ephemeris, if it is None).
+
+        Arguments:
+        planetName - str holding the name of the planet.
+        centricityType - str value holding either "geocentric",
+                         "topocentric", or "heliocentric".
+        longitudeType - str value holding either "tropical" or "sidereal".
+        cacheFilename - str holding the path of the timeline file.
+                        See LongitudeTimeline.getCacheFilename().
+        ephemerisContext - EphemerisContext that the lookback
+                           calculations are done with, or None.
+
+        Returns:
+        LongitudeTimeline object that is set for the planet, or None
+        if there is none.
+        """
+
+        centricityType = centricityType.lower()
+        longitudeType = longitudeType.lower()
+
+        timeline = LookbackMultipleUtils.getLongitudeTimeline(\
+            planetName, centricityType, longitudeType, ephemerisContext)
+
+        if timeline == None:
+            stepSizeTd = \
+                LookbackMultipleUtils._getOptimalStepSizeTd(centricityType,
+                                                            planetName)
+
+            timeline = LongitudeTimeline.loadMatching(\
+                cacheFilename,
+                planetName,
+                centricityType,
+                longitudeType,
+                stepSizeTd.total_seconds() / 86400.0,
+                ephemerisContext)
+
+            if timeline != None:
+                LookbackMultipleUtils.setLongitudeTimeline(timeline)
+
+        return timeline
+
+    @staticmethod
+    def extendLongitudeTimeline(planetName,
+                                centricityType,
+                                longitudeType,
+                                startJd,
+                                endJd,
+                                cacheFilename=None,
+                                ephemerisContext=None):
+        """Makes sure that the LongitudeTimeline set for the given
+        planet covers 'startJd' to 'endJd'.  If there is no usable
+        timeline set for the planet, or it does not cover them, a
+        timeline over both its span and 'startJd' to 'endJd' is
+        created with createLongitudeTimeline().
+
+        The arguments are the same as for createLongitudeTimeline().
+
+        Returns:
+        LongitudeTimeline object that is set for the planet.
+        """
+
+        centricityType = centricityType.lower()
+        longitudeType = longitudeType.lower()
+
+        timeline = LookbackMultipleUtils.getLongitudeTimeline(\
+            planetName, centricityType, longitudeType, ephemerisContext)
+
+        if timeline != None:
+            if timeline.covers(startJd) and timeline.covers(endJd):
+                return timeline
+
+            startJd = min(startJd, timeline.startJd)
+            endJd = max(endJd, timeline.endJd)
+
+        return LookbackMultipleUtils.createLongitudeTimeline(\
+            planetName,
+            centricityType,
+            longitudeType,
+            startJd,
+            endJd,
+            cacheFilename,
+            ephemerisContext)
+
     @staticmethod
     def _getOptimalStepSizeTd(centricityType, planetName):
         """Helper function that will try to determine a better step size
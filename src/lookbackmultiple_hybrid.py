@@ -0,0 +1,589 @@
+
+# For directory access.
+import os
+import sys
+import inspect
+
+# For timing the calculations and measuring the latencies.
+import time
+
+# For the queues of task indexes.
+import collections
+
+# For receiving the results of the local pool.
+import queue
+
+# For timestamps.
+import datetime
+import pytz
+
+# For logging.
+import logging
+import logging.config
+
+# For the errors of connecting to the server.
+from multiprocessing import AuthenticationError
+
+# For local parallel LookbackMultiple calculations.
+from lookbackmultiple_parallel import LookbackMultipleParallel
+from lookbackmultiple_parallel import getIndexedDatetimesOfLongitudeDeltaDegrees
+
+##############################################################################
+
+class LookbackMultipleHybridScheduler:
+    """Runs LookbackMultiple calculations in the local
+    LookbackMultipleParallel pool, and offloads the overflow to the
+    distributed client workers of a LookbackMultiple server through a
+    LookbackMultipleRemoteClient.
+
+    The local pool is always kept busy, with up to
+    LookbackMultipleHybridScheduler.localTasksInFlightPerProcess
+    tasks per process.  Local tasks are taken from the front of the
+    list of pending tasks, and remote tasks from the back, so the two
+    meet in the middle.  How many tasks are given to the server
+    depends on the measured rates and per-task latencies:
+
+      - Before the first remote result arrives, only
+        LookbackMultipleHybridScheduler.remoteInitialTasks tasks are
+        given to the server.
+
+      - After that, the server is given enough tasks to keep its
+        workers busy for LookbackMultipleHybridScheduler.remoteQueueSec
+        seconds at their measured rate.
+
+      - No more tasks are given to the server once the local pool
+        would finish the pending tasks at its measured rate sooner
+        than the measured latency of a remote task.
+
+    When no tasks are pending, idle local processes also calculate
+    the oldest tasks that are still on the server.  Whichever result
+    arrives first is used, so slow or lost remote tasks do not hold
+    up the calculation.
+
+    If the server cannot be reached, the connection is lost, the
+    server closes the job, or no remote result arrives within the
+    timeout of the LookbackMultipleRemoteClient, the tasks on the
+    server are calculated locally instead.  After a failed
+    connection, the server is not tried again for
+    LookbackMultipleHybridScheduler.reconnectIntervalSec seconds.
+
+    A scheduler must only be used by one thread at a time.
+    """
+
+    # Number of tasks given to each process of the local pool at a
+    # time.  Tasks given to the pool cannot be taken back, so this
+    # bounds the work that is done after the calculation is
+    # cancelled.
+    localTasksInFlightPerProcess = 2
+
+    # Number of tasks given to the server before its rate and latency
+    # are measured.
+    remoteInitialTasks = 16
+
+    # Number of seconds of work, at the measured remote rate, that is
+    # kept on the server.
+    remoteQueueSec = 2.0
+
+    # Weight of the latest latency of a remote task in the moving
+    # average of the latencies.
+    remoteLatencySmoothing = 0.2
+
+    # Maximum number of seconds to wait for a result at a time.
+    # Cancellation is checked this often.
+    pollIntervalSec = 0.5
+
+    # Number of seconds to wait for local results, while the server
+    # has tasks to be polled for.
+    localPollIntervalSec = 0.05
+
+    # Number of seconds after a failed connection that a server is not
+    # tried again.
+    reconnectIntervalSec = 60.0
+
+    # Times of the last failed connections, keyed by the tuple
+    # (serverAddress, serverPort).
+    connectFailureTimes = {}
+
+    # Logger object for this class.
+    log = logging.getLogger("lookbackmultiple_hybrid.LookbackMultipleHybridScheduler")
+
+    def __init__(self, remoteClient=None):
+        """Initializes the scheduler.
+
+        Arguments:
+        remoteClient - LookbackMultipleRemoteClient for the server to
+                       offload tasks to.  It is connected when it is
+                       first needed, if it is not connected already.
+                       If None, all the tasks are calculated locally.
+        """
+
+        self.remoteClient = remoteClient
+
+        # Numbers of results of the last calculation that were
+        # calculated locally, remotely, or not obtained because they
+        # failed.
+        self.numResultsLocal = 0
+        self.numResultsRemote = 0
+        self.numResultsMissing = 0
+
+        # Moving average of the number of seconds from giving a task
+        # to the server until its result arrives, or None if not
+        # measured yet.  This is kept across calculations.
+        self.remoteLatencySec = None
+
+    def imapDatetimesOfLongitudeDeltaDegrees(self,
+                                             argsTupleList,
+                                             direction,
+                                             cancelledFunc=None):
+        """Makes LookbackMultiple calculations, and returns an
+        iterator over the results in the order that they complete.
+
+        The iteration stops when all the results are obtained, or
+        when 'cancelledFunc' returns True.  Afterwards,
+        self.numResultsLocal, self.numResultsRemote and
+        self.numResultsMissing hold where the results came from.
+        Closing the iterator early closes the job on the server.
+
+        Arguments:
+        argsTupleList - List of tuple objects, as described in
+                        PriceBarChartWidget._getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture().
+        direction     - int value.  1 for calculations into the
+                        future, -1 for calculations into the past.
+        cancelledFunc - Function taking no arguments that returns True
+                        if the calculations should be given up on, or
+                        None.
+
+        Returns:
+        Iterator of tuples (index, list of datetime.datetime objects),
+        where 'index' is the index into 'argsTupleList' of the
+        argument tuple that the result is for.
+        """
+
+        self.numResultsLocal = 0
+        self.numResultsRemote = 0
+        self.numResultsMissing = 0
+
+        numTasks = len(argsTupleList)
+        if numTasks == 0:
+            return
+
+        startTime = time.time()
+
+        # Indexes of the tasks not given out yet.  Local processes
+        # take from the left, the server from the right.
+        pendingIndexes = collections.deque(range(numTasks))
+
+        # Indexes of the tasks that failed on the workers, or that
+        # were taken back from the server.  Local processes take these
+        # first, and they are not given to the server again.
+        localOnlyIndexes = collections.deque()
+
+        # Whether the result of each task was obtained.
+        doneFlags = [False] * numTasks
+        numDone = 0
+
+        # Indexes of the tasks in the local pool.
+        localIndexes = set()
+
+        # Times that the tasks on the server were given to it, keyed
+        # by index.  Dicts keep the order of insertion, so the oldest
+        # tasks come first.
+        remoteSubmitTimes = {}
+
+        # Results of the local pool, put by the thread of the pool
+        # that handles the results.  Each is a tuple (index, list of
+        # datetime.datetime objects or an Exception).
+        localResults = queue.Queue()
+
+        # The pool is given back in the finally clause below.
+        pool = LookbackMultipleParallel.acquirePool(argsTupleList)
+        localCapacity = LookbackMultipleParallel.getPoolSize() * \
+            LookbackMultipleHybridScheduler.localTasksInFlightPerProcess
+
+        remoteStartTime = None
+        lastRemoteResultTime = None
+
+        def submitLocal(index):
+            def handleError(e):
+                localResults.put((index, e))
+
+            pool.apply_async(getIndexedDatetimesOfLongitudeDeltaDegrees,
+                             ((index, direction, argsTupleList[index]),),
+                             callback=localResults.put,
+                             error_callback=handleError)
+            localIndexes.add(index)
+
+        def takeLocalIndex():
+            # Returns the index of the next task for the local pool,
+            # or None if there is none.
+            for indexes in (localOnlyIndexes, pendingIndexes):
+                while len(indexes) > 0:
+                    index = indexes.popleft()
+                    if doneFlags[index] == False and \
+                       index not in localIndexes:
+                        return index
+
+            # Duplicate the oldest task on the server.
+            for index in remoteSubmitTimes:
+                if index not in localIndexes:
+                    return index
+
+            return None
+
+        jobId = None
+
+        try:
+            # The local pool is started before connecting, since
+            # connecting to an unreachable server can take a while.
+            while len(localIndexes) < localCapacity:
+                index = takeLocalIndex()
+                if index == None:
+                    break
+                submitLocal(index)
+            localStartTime = time.time()
+
+            jobId = self._createRemoteJob()
+
+            while numDone < numTasks:
+                if cancelledFunc != None and cancelledFunc() == True:
+                    self.log.debug("Calculations were cancelled.")
+                    return
+
+                # Give the server its share of the pending tasks.
+                if jobId != None and len(pendingIndexes) > 0:
+                    numRemoteTasks = \
+                        self._getNumRemoteTasksWanted(\
+                            len(pendingIndexes),
+                            len(remoteSubmitTimes),
+                            self.numResultsLocal,
+                            time.time() - localStartTime,
+                            self.numResultsRemote,
+                            None if remoteStartTime == None else \
+                                time.time() - remoteStartTime)
+
+                    indexes = []
+                    while len(indexes) < numRemoteTasks and \
+                          len(pendingIndexes) > 0:
+                        index = pendingIndexes.pop()
+                        if doneFlags[index] == False:
+                            indexes.append(index)
+
+                    if len(indexes) > 0:
+                        try:
+                            self.remoteClient.putTasks(jobId,
+                                                       argsTupleList,
+                                                       indexes,
+                                                       direction)
+                        except (OSError, EOFError) as e:
+                            self.log.warning("Lost the connection to the " + \
+                                             "LookbackMultiple server: {}.  ".\
+                                             format(e) + \
+                                             "Calculating locally instead.")
+                            localOnlyIndexes.extend(indexes)
+                            jobId = None
+                        else:
+                            now = time.time()
+                            if remoteStartTime == None:
+                                remoteStartTime = now
+                            if len(remoteSubmitTimes) == 0:
+                                lastRemoteResultTime = now
+                            for index in indexes:
+                                remoteSubmitTimes[index] = now
+
+                # Keep the local pool busy.
+                while len(localIndexes) < localCapacity:
+                    index = takeLocalIndex()
+                    if index == None:
+                        break
+                    submitLocal(index)
+
+                # Take the results of the server.
+                results = []
+                if jobId != None and len(remoteSubmitTimes) > 0:
+                    if len(localIndexes) > 0:
+                        waitSec = 0
+                    else:
+                        waitSec = LookbackMultipleHybridScheduler.pollIntervalSec
+
+                    try:
+                        results = self.remoteClient.getResults(jobId,
+                                                               argsTupleList,
+                                                               waitSec)
+                    except (OSError, EOFError) as e:
+                        self.log.warning("Lost the connection to the " + \
+                                         "LookbackMultiple server: {}.  ".\
+                                         format(e) + \
+                                         "Calculating locally instead.")
+                        results = None
+
+                    now = time.time()
+
+                    if results != None and len(results) == 0 and \
+                       self.remoteClient.timeoutSec != None and \
+                       now - lastRemoteResultTime >= \
+                           self.remoteClient.timeoutSec:
+
+                        self.log.warning("No LookbackMultiple results " + \
+                                         "arrived from the server for " + \
+                                         "{} sec.  ".\
+                                         format(self.remoteClient.timeoutSec) + \
+                                         "Calculating locally instead.")
+                        self.remoteClient.closeJob(jobId)
+                        results = None
+
+                    if results == None:
+                        # Take back the tasks on the server.
+                        localOnlyIndexes.extend(remoteSubmitTimes.keys())
+                        remoteSubmitTimes.clear()
+                        results = []
+                        jobId = None
+
+                for (index, resultDts) in results:
+                    submitTime = remoteSubmitTimes.pop(index, None)
+                    if submitTime == None:
+                        continue
+
+                    latencySec = time.time() - submitTime
+                    lastRemoteResultTime = time.time()
+
+                    if self.remoteLatencySec == None:
+                        self.remoteLatencySec = latencySec
+                    else:
+                        weight = LookbackMultipleHybridScheduler.\
+                            remoteLatencySmoothing
+                        self.remoteLatencySec = \
+                            (1 - weight) * self.remoteLatencySec + \
+                            weight * latencySec
+
+                    if doneFlags[index] == True:
+                        continue
+
+                    if resultDts == None:
+                        self.log.debug("Task {} failed on the workers.  ".\
+                                       format(index) + \
+                                       "Calculating it locally.")
+                        localOnlyIndexes.append(index)
+                        continue
+
+                    doneFlags[index] = True
+                    numDone += 1
+                    self.numResultsRemote += 1
+
+                    yield (index, resultDts)
+
+                # Take the results of the local pool.
+                if len(localIndexes) == 0:
+                    continue
+
+                if jobId != None and len(remoteSubmitTimes) > 0:
+                    waitSec = LookbackMultipleHybridScheduler.localPollIntervalSec
+                else:
+                    waitSec = LookbackMultipleHybridScheduler.pollIntervalSec
+
+                results = []
+                try:
+                    results.append(localResults.get(timeout=waitSec))
+                    while True:
+                        results.append(localResults.get_nowait())
+                except queue.Empty:
+                    pass
+
+                for (index, resultDts) in results:
+                    localIndexes.discard(index)
+
+                    if doneFlags[index] == True:
+                        continue
+
+                    # The result of the server is not needed anymore.
+                    remoteSubmitTimes.pop(index, None)
+
+                    doneFlags[index] = True
+                    numDone += 1
+
+                    if isinstance(resultDts, Exception):
+                        self.log.warning("LookbackMultiple calculation " + \
+                                         "failed: {}: {}".\
+                                         format(argsTupleList[index],
+                                                resultDts))
+                        self.numResultsMissing += 1
+                        continue
+
+                    self.numResultsLocal += 1
+
+                    yield (index, resultDts)
+
+        finally:
+            if jobId != None:
+                self.remoteClient.closeJob(jobId)
+
+            LookbackMultipleParallel.releasePool(pool)
+
+            if self.log.isEnabledFor(logging.INFO) == True:
+                self.log.info("{} LookbackMultiple calculations took {} sec: ".\
+                              format(numTasks, time.time() - startTime) + \
+                              "{} local, {} remote, {} failed.".\
+                              format(self.numResultsLocal,
+                                     self.numResultsRemote,
+                                     self.numResultsMissing))
+
+    def getDatetimesOfLongitudeDeltaDegrees(self,
+                                            argsTupleList,
+                                            direction):
+        """Makes LookbackMultiple calculations, and waits for the
+        results.
+
+        Arguments:
+        argsTupleList - List of tuple objects, as described in
+                        PriceBarChartWidget._getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture().
+        direction     - int value.  1 for calculations into the
+                        future, -1 for calculations into the past.
+
+        Returns:
+        List of list of datetime.datetime objects.  Each list within
+        the list corresponds to the respective tuple within
+        argsTupleList.  Results of calculations that failed are None.
+        """
+
+        rv = [None] * len(argsTupleList)
+
+        for (index, resultDts) in \
+                self.imapDatetimesOfLongitudeDeltaDegrees(argsTupleList,
+                                                          direction):
+            rv[index] = resultDts
+
+        return rv
+
+    def _createRemoteJob(self):
+        """Connects self.remoteClient to the server if needed, and
+        creates a job on it.  Errors are logged, not raised.
+
+        Returns:
+        int id of the job, or None if the server is not used.
+        """
+
+        if self.remoteClient == None:
+            return None
+
+        serverKey = (self.remoteClient.serverAddress,
+                     self.remoteClient.serverPort)
+
+        try:
+            if self.remoteClient.broker == None:
+                failureTime = LookbackMultipleHybridScheduler.\
+                    connectFailureTimes.get(serverKey)
+                if failureTime != None and \
+                   time.time() - failureTime < \
+                       LookbackMultipleHybridScheduler.reconnectIntervalSec:
+                    return None
+
+                self.remoteClient.connect()
+
+            return self.remoteClient.createJob()
+
+        except (OSError, EOFError, AuthenticationError) as e:
+            self.log.warning("Could not use LookbackMultiple server " + \
+                             "{} port {}: {}.  ".\
+                             format(serverKey[0], serverKey[1], e) + \
+                             "Calculating locally instead.")
+
+            LookbackMultipleHybridScheduler.\
+                connectFailureTimes[serverKey] = time.time()
+            self.remoteClient.broker = None
+
+            return None
+
+    def _getNumRemoteTasksWanted(self,
+                                 numPendingTasks,
+                                 numRemoteTasks,
+                                 numLocalResults,
+                                 localElapsedSec,
+                                 numRemoteResults,
+                                 remoteElapsedSec):
+        """Returns how many more of the pending tasks to give to the
+        server, as described in the documentation of this class.
+
+        Arguments:
+        numPendingTasks  - int number of tasks not given out yet.
+        numRemoteTasks   - int number of tasks on the server.
+        numLocalResults  - int number of results of the local pool.
+        localElapsedSec  - float number of seconds since the local
+                           pool was given tasks.
+        numRemoteResults - int number of results of the server.
+        remoteElapsedSec - float number of seconds since the server
+                           was given tasks, or None if it was not.
+
+        Returns:
+        int number of tasks.
+        """
+
+        if numRemoteResults == 0:
+            return LookbackMultipleHybridScheduler.remoteInitialTasks - \
+                   numRemoteTasks
+
+        if numLocalResults > 0 and self.remoteLatencySec != None:
+            localRate = numLocalResults / localElapsedSec
+            if numPendingTasks / localRate <= self.remoteLatencySec:
+                return 0
+
+        remoteRate = numRemoteResults / remoteElapsedSec
+        wantedRemoteTasks = \
+            max(LookbackMultipleHybridScheduler.remoteInitialTasks,
+                int(remoteRate * LookbackMultipleHybridScheduler.remoteQueueSec))
+
+        return wantedRemoteTasks - numRemoteTasks
+
+##############################################################################
+
+def testLookbackMultipleHybridScheduler_unreachableServer():
+    """Tests that the calculations are done locally when the server
+    cannot be reached.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    from lookbackmultiple_remote import LookbackMultipleRemoteClient
+
+    maxErrorTd = datetime.timedelta(minutes=60)
+
+    argsTupleList = []
+    for i in range(16):
+        referenceDt = datetime.datetime(1994, 10, 20, 0, 0, tzinfo=pytz.utc) + \
+                      datetime.timedelta(days=i)
+        args = ("Mars", "geocentric", "tropical", referenceDt,
+                360, maxErrorTd,
+                -74.0064, 40.7142, 0)
+        argsTupleList.append(args)
+
+    # Nothing listens on this port.
+    remoteClient = LookbackMultipleRemoteClient("localhost", 1, b"password", 5)
+    scheduler = LookbackMultipleHybridScheduler(remoteClient)
+
+    resultsList = \
+        scheduler.getDatetimesOfLongitudeDeltaDegrees(argsTupleList, 1)
+
+    for i in range(len(resultsList)):
+        print("  argsTupleList[{}] -> {}".format(i, resultsList[i]))
+
+    print("  {} local, {} remote, {} failed".\
+          format(scheduler.numResultsLocal,
+                 scheduler.numResultsRemote,
+                 scheduler.numResultsMissing))
+
+##############################################################################
+
+# For debugging the module during development.
+if __name__=="__main__":
+    # Initialize logging.
+    LOG_CONFIG_FILE = os.path.join(sys.path[0], "../conf/logging.conf")
+    logging.config.fileConfig(LOG_CONFIG_FILE)
+    #logging.disable(logging.CRITICAL)
+
+    testLookbackMultipleHybridScheduler_unreachableServer()
+
+    LookbackMultipleParallel.shutdown()
+
+    # Quit.
+    print("Exiting.")
+    sys.exit()
+
+##############################################################################
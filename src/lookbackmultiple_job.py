@@ -0,0 +1,580 @@
+
+# For directory access.
+import os
+import sys
+import inspect
+
+# For timing how long the calculations take.
+import time
+
+# For timestamps.
+import datetime
+import pytz
+
+# For logging.
+import logging
+import logging.config
+
+# For the thread and signals.
+from PyQt5 import QtCore
+
+# For the calculation models.
+from data_objects import LookbackMultipleCalcModel
+
+# For converting timestamps to Julian Days.
+from ephemeris import Ephemeris
+
+# For thread-safe ephemeris calculations.
+from ephemeris_context import EphemerisContext
+
+# For the indexes of the planet longitudes kept next to the document.
+from longitude_timeline import LongitudeTimeline
+
+# For LookbackMultiple calculations.
+from lookbackmultiple_calc import LookbackMultipleUtils
+from lookbackmultiple_parallel import LookbackMultipleParallel
+from lookbackmultiple_hybrid import LookbackMultipleHybridScheduler
+
+##############################################################################
+
+class LookbackMultipleCalcJob(QtCore.QThread):
+    """QThread that makes LookbackMultiple calculations in the
+    background, and emits the results as they complete.
+
+    A job is given a list of argument tuples, as described in
+    PriceBarChartWidget._getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture(),
+    and calculates them either in this process (local serial), in
+    the processes of the LookbackMultipleParallel pool (local
+    parallel), on the distributed client workers through a
+    LookbackMultipleRemoteClient (remote parallel), or on both with a
+    LookbackMultipleHybridScheduler (hybrid parallel).  The results
+    are emitted in batches with the resultsReady signal.  Since the
+    receiver lives in the GUI thread, the signal is queued, and the
+    GUI stays responsive while the calculations are done.
+
+    A job can be cancelled at any time with cancel().  The job then
+    stops at the next chunk of work, and emits no more results.
+
+    Local serial calculations are done with an EphemerisContext, so
+    they do not modify the global Ephemeris settings used by the GUI
+    thread.  Remote parallel results are emitted as the workers
+    complete them.  If the server gives up on some of them, or they
+    time out, the job stops with the results it has.
+
+    If a document filename is given, local serial calculations use
+    the LongitudeTimelines of the planets saved next to the document
+    (see LongitudeTimeline.getCacheFilename()).  Once the
+    calculations complete, the timelines are extended to cover the
+    reference timestamps and the results, and saved, so that the
+    next calculations (e.g. after the view is scrolled) look the
+    results up in them.
+    """
+
+    # Signal emitted with a batch of results.  The arguments are the
+    # job id, and a list of tuples of (index, list of
+    # datetime.datetime objects), where index is the index of the
+    # argument tuple the result is for.
+    resultsReady = QtCore.pyqtSignal(int, list)
+
+    # Signal emitted when the job stops.  The arguments are the job
+    # id, and a bool that is True if all the results were emitted, or
+    # False if the job was cancelled or had an error.
+    calculationsFinished = QtCore.pyqtSignal(int, bool)
+
+    # Number of argument tuples calculated together in one pass
+    # through time, for local serial calculations.
+    serialChunkSize = 64
+
+    # Number of argument tuples given to the pool at a time, per
+    # process of the pool, for local parallel calculations.  Tasks
+    # given to the pool cannot be taken back, so this bounds the work
+    # that is still done after the job is cancelled.
+    parallelSliceSizePerProcess = 8
+
+    # Minimum time in seconds between emissions of resultsReady.
+    resultsIntervalSec = 0.1
+
+    # Logger object for this class.
+    log = logging.getLogger("lookbackmultiple_job.LookbackMultipleCalcJob")
+
+    def __init__(self, jobId, calcModel, argsTupleList, direction,
+                 remoteClient=None, timelineDocumentFilename=None,
+                 parent=None):
+        """Initializes the job.  The calculations start when start()
+        is called.
+
+        Arguments:
+        jobId         - int value that identifies this job in the
+                        emitted signals.
+        calcModel     - str value of the LookbackMultipleCalcModel to
+                        use, as stored in QSettings.
+        argsTupleList - List of tuple objects, as described in
+                        PriceBarChartWidget._getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture().
+        direction     - int value.  1 for calculations into the
+                        future, -1 for calculations into the past.
+        remoteClient  - LookbackMultipleRemoteClient that is connected
+                        to the server, for the remote parallel
+                        calculation model.  For the hybrid parallel
+                        calculation model, it may be unconnected, or
+                        None to calculate locally.
+        timelineDocumentFilename - str holding the path of the
+                        PriceChartDocument file that the
+                        LongitudeTimelines are kept next to, for
+                        local serial calculations, or None to not use
+                        LongitudeTimelines.
+        parent        - QObject parent.
+        """
+
+        super().__init__(parent)
+
+        self.jobId = jobId
+        self.calcModel = calcModel
+        self.argsTupleList = argsTupleList
+        self.direction = direction
+        self.remoteClient = remoteClient
+        self.timelineDocumentFilename = timelineDocumentFilename
+
+        # Flag that is set by cancel().  It is only ever set to True,
+        # so no lock is needed to read it from the job's thread.
+        self.cancelledFlag = False
+
+        # Results that are not emitted yet, and when results were
+        # emitted last.
+        self.pendingResults = []
+        self.lastEmitTime = None
+
+        # Number of results obtained.
+        self.numResults = 0
+
+    def cancel(self):
+        """Causes the job to stop at the next chunk of work.  No
+        results are emitted after this is called.
+        """
+
+        self.cancelledFlag = True
+
+    def isCancelled(self):
+        """Returns True if cancel() was called on this job."""
+
+        return self.cancelledFlag
+
+    def run(self):
+        """Does the calculations.  This is run in the thread of the
+        job, after start() is called.
+        """
+
+        self.log.debug("Entered run()")
+
+        startTime = time.time()
+        self.lastEmitTime = startTime
+
+        completedFlag = False
+
+        try:
+            if self.calcModel == str(LookbackMultipleCalcModel.local_serial):
+                self._runLocalSerial()
+            elif self.calcModel == \
+                 str(LookbackMultipleCalcModel.local_parallel):
+                self._runLocalParallel()
+            elif self.calcModel == \
+                 str(LookbackMultipleCalcModel.remote_parallel) and \
+                 self.remoteClient != None:
+                self._runRemoteParallel()
+            elif self.calcModel == \
+                 str(LookbackMultipleCalcModel.hybrid_parallel):
+                self._runHybridParallel()
+            else:
+                errStr = "Unsupported LookbackMultiple calculation " + \
+                         "model for a background job: {}".\
+                         format(self.calcModel)
+                raise ValueError(errStr)
+
+            if self.cancelledFlag == False:
+                self._emitPendingResults()
+                completedFlag = \
+                    (self.numResults == len(self.argsTupleList))
+
+        except Exception as e:
+            # There is no one to raise to in this thread.
+            self.log.exception("LookbackMultiple job {} failed: {}".\
+                               format(self.jobId, e))
+
+        endTime = time.time()
+
+        if self.log.isEnabledFor(logging.INFO) == True:
+            self.log.info("LookbackMultiple job {} ".format(self.jobId) + \
+                          "({}, {} calculations) {} after {} sec".\
+                          format(self.calcModel,
+                                 len(self.argsTupleList),
+                                 "completed" if completedFlag else "stopped",
+                                 endTime - startTime))
+
+        self.calculationsFinished.emit(self.jobId, completedFlag)
+
+        self.log.debug("Exiting run()")
+
+    def _addResult(self, index, resultDts):
+        """Queues the result for the argument tuple at 'index' for
+        emission, and emits the queued results if enough time passed
+        since the last emission.
+        """
+
+        self.pendingResults.append((index, resultDts))
+        self.numResults += 1
+
+        if time.time() - self.lastEmitTime >= \
+           LookbackMultipleCalcJob.resultsIntervalSec:
+
+            self._emitPendingResults()
+
+    def _emitPendingResults(self):
+        """Emits the queued results, if any."""
+
+        if len(self.pendingResults) > 0 and self.cancelledFlag == False:
+            self.resultsReady.emit(self.jobId, self.pendingResults)
+            self.pendingResults = []
+
+        self.lastEmitTime = time.time()
+
+    def _runLocalSerial(self):
+        """Does the calculations in this thread.
+
+        The argument tuples are taken in chunks of
+        LookbackMultipleCalcJob.serialChunkSize, in order.  Within a
+        chunk, the tuples are grouped like in
+        PriceBarChartWidget._sweepLookbackMultipleDatetimesLocalSerial(),
+        and each group is calculated in a single pass through time.
+        """
+
+        chunkSize = LookbackMultipleCalcJob.serialChunkSize
+
+        # Dictionary holding the span of Julian Days that the
+        # LongitudeTimeline of each planet needs to cover, for the
+        # reference timestamps and results calculated.
+        #
+        # Key is the tuple:
+        #   (planetName, centricityType, longitudeType,
+        #    locationLongitudeDegrees, locationLatitudeDegrees,
+        #    locationElevationMeters)
+        # Value is a list:
+        #   [timelineFilename, ephemerisContext, startJd, endJd]
+        timelineSpans = {}
+
+        for chunkStart in range(0, len(self.argsTupleList), chunkSize):
+
+            if self.cancelledFlag == True:
+                return
+
+            indexes = list(range(chunkStart,
+                                 min(chunkStart + chunkSize,
+                                     len(self.argsTupleList))))
+
+            # Dictionary holding the indexes into argsTupleList for
+            # each group.
+            #
+            # Key is the tuple:
+            #   (planetName, centricityType, longitudeType, maxErrorTd,
+            #    locationLongitudeDegrees, locationLatitudeDegrees,
+            #    locationElevationMeters)
+            groups = {}
+            for i in indexes:
+                argsTuple = self.argsTupleList[i]
+                key = argsTuple[0:3] + argsTuple[5:9]
+                groups.setdefault(key, []).append(i)
+
+            for (key, groupIndexes) in groups.items():
+
+                if self.cancelledFlag == True:
+                    return
+
+                # Extract variable values from the key.
+                planetName = key[0]
+                centricityType = key[1]
+                longitudeType = key[2]
+                maxErrorTd = key[3]
+                locationLongitudeDegrees = key[4]
+                locationLatitudeDegrees = key[5]
+                locationElevationMeters = key[6]
+
+                referenceDts = \
+                    [self.argsTupleList[i][3] for i in groupIndexes]
+                desiredDeltaDegreesList = \
+                    sorted(set([self.argsTupleList[i][4] \
+                                for i in groupIndexes]))
+
+                ephemerisContext = \
+                    EphemerisContext(locationLongitudeDegrees,
+                                     locationLatitudeDegrees,
+                                     locationElevationMeters,
+                                     centricityType,
+                                     longitudeType)
+
+                # Use the LongitudeTimeline saved for the planet, if
+                # there is one.
+                timelineKey = key[0:3] + key[4:7]
+                if self.timelineDocumentFilename != None and \
+                   timelineKey not in timelineSpans:
+
+                    timelineFilename = LongitudeTimeline.getCacheFilename(\
+                        self.timelineDocumentFilename,
+                        planetName,
+                        centricityType.lower(),
+                        longitudeType.lower())
+
+                    LookbackMultipleUtils.loadLongitudeTimeline(\
+                        planetName,
+                        centricityType,
+                        longitudeType,
+                        timelineFilename,
+                        ephemerisContext)
+
+                    timelineSpans[timelineKey] = \
+                        [timelineFilename, ephemerisContext, None, None]
+
+                # Do LookbackMultiple calculations.
+                if self.direction > 0:
+                    results = \
+                        LookbackMultipleUtils.\
+                        sweepDatetimesOfLongitudeDeltaDegreesInFuture(\
+                            planetName,
+                            centricityType,
+                            longitudeType,
+                            referenceDts,
+                            desiredDeltaDegreesList,
+                            maxErrorTd,
+                            ephemerisContext)
+                else:
+                    results = \
+                        LookbackMultipleUtils.\
+                        sweepDatetimesOfLongitudeDeltaDegreesInPast(\
+                            planetName,
+                            centricityType,
+                            longitudeType,
+                            referenceDts,
+                            desiredDeltaDegreesList,
+                            maxErrorTd,
+                            ephemerisContext)
+
+                for j in range(len(groupIndexes)):
+                    i = groupIndexes[j]
+                    deltaIndex = desiredDeltaDegreesList.\
+                        index(self.argsTupleList[i][4])
+                    self._addResult(i, results[j][deltaIndex])
+
+                if timelineKey in timelineSpans:
+                    jds = [Ephemeris.datetimeToJulianDay(dt) \
+                           for dt in referenceDts]
+                    for resultDtsList in results:
+                        for resultDts in resultDtsList:
+                            jds.extend([Ephemeris.datetimeToJulianDay(dt) \
+                                        for dt in resultDts])
+
+                    span = timelineSpans[timelineKey]
+                    if span[2] == None:
+                        span[2] = min(jds)
+                        span[3] = max(jds)
+                    else:
+                        span[2] = min(span[2], min(jds))
+                        span[3] = max(span[3], max(jds))
+
+        # Extend the LongitudeTimelines to what was calculated, and
+        # save them for the next calculations.  The results are
+        # emitted first, so that they do not wait for this.
+        self._emitPendingResults()
+
+        for (timelineKey, span) in timelineSpans.items():
+            (timelineFilename, ephemerisContext, startJd, endJd) = span
+
+            if self.cancelledFlag == True:
+                return
+
+            if startJd == None:
+                continue
+
+            try:
+                LookbackMultipleUtils.extendLongitudeTimeline(\
+                    timelineKey[0],
+                    timelineKey[1],
+                    timelineKey[2],
+                    startJd,
+                    endJd,
+                    timelineFilename,
+                    ephemerisContext)
+            except Exception as e:
+                self.log.warning("Could not extend the longitude " + \
+                                 "timeline '{}': {}".\
+                                 format(timelineFilename, e))
+
+    def _runLocalParallel(self):
+        """Does the calculations in the processes of the
+        LookbackMultipleParallel pool, and takes the results in the
+        order they complete.
+
+        The argument tuples are given to the pool in slices, so that
+        after the job is cancelled, the pool is only kept busy with
+        the rest of the current slice.
+        """
+
+        sliceSize = LookbackMultipleParallel.getPoolSize() * \
+                    LookbackMultipleCalcJob.parallelSliceSizePerProcess
+
+        for sliceStart in range(0, len(self.argsTupleList), sliceSize):
+
+            if self.cancelledFlag == True:
+                return
+
+            sliceArgsTupleList = \
+                self.argsTupleList[sliceStart:sliceStart + sliceSize]
+
+            results = LookbackMultipleParallel.\
+                imapDatetimesOfLongitudeDeltaDegreesParallel(\
+                    sliceArgsTupleList, self.direction)
+
+            try:
+                for (index, resultDts) in results:
+                    if self.cancelledFlag == True:
+                        return
+
+                    self._addResult(sliceStart + index, resultDts)
+            finally:
+                # Gives the pool back.
+                results.close()
+
+    def _runRemoteParallel(self):
+        """Does the calculations on the distributed client workers, and
+        takes the results in the order they complete.  Results that
+        are not obtained before self.remoteClient times out are not
+        emitted.
+        """
+
+        results = self.remoteClient.\
+            imapDatetimesOfLongitudeDeltaDegrees(self.argsTupleList,
+                                                 self.direction,
+                                                 self.isCancelled)
+
+        try:
+            for (index, resultDts) in results:
+                if self.cancelledFlag == True:
+                    return
+
+                self._addResult(index, resultDts)
+        finally:
+            # Cancels the tasks still on the server.
+            results.close()
+
+        if self.remoteClient.numResultsMissing > 0:
+            self.log.warning("{} of {} LookbackMultiple results were ".\
+                             format(self.remoteClient.numResultsMissing,
+                                    len(self.argsTupleList)) + \
+                             "not obtained from the server.")
+
+    def _runHybridParallel(self):
+        """Does the calculations in the processes of the
+        LookbackMultipleParallel pool, and on the distributed client
+        workers through self.remoteClient, with a
+        LookbackMultipleHybridScheduler.  The results are taken in the
+        order they complete.  Connecting to the server is done here,
+        so that an unreachable server does not hold up the GUI
+        thread.
+        """
+
+        scheduler = LookbackMultipleHybridScheduler(self.remoteClient)
+
+        results = scheduler.\
+            imapDatetimesOfLongitudeDeltaDegrees(self.argsTupleList,
+                                                 self.direction,
+                                                 self.isCancelled)
+
+        try:
+            for (index, resultDts) in results:
+                if self.cancelledFlag == True:
+                    return
+
+                self._addResult(index, resultDts)
+        finally:
+            # Cancels the tasks still on the server.
+            results.close()
+
+##############################################################################
+
+def testLookbackMultipleCalcJob():
+    """Runs a small job with each of the supported calculation models,
+    and prints the results as they are emitted.
+    """
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    maxErrorTd = datetime.timedelta(minutes=60)
+    locationLongitudeDegrees = -74.0064
+    locationLatitudeDegrees = 40.7142
+    locationElevationMeters = 0
+
+    argsTupleList = []
+    for i in range(16):
+        referenceDt = datetime.datetime(1994, 10, 20, 0, 0, tzinfo=pytz.utc) + \
+                      datetime.timedelta(days=i)
+        args = ("Mars", "geocentric", "tropical", referenceDt,
+                360, maxErrorTd,
+                locationLongitudeDegrees,
+                locationLatitudeDegrees,
+                locationElevationMeters)
+        argsTupleList.append(args)
+
+    def handleResultsReady(jobId, results):
+        for (index, resultDts) in results:
+            print("  job {}: argsTupleList[{}] -> {}".\
+                  format(jobId, index, resultDts))
+
+    def handleCalculationsFinished(jobId, completedFlag):
+        print("  job {}: completedFlag == {}".format(jobId, completedFlag))
+
+    calcModels = [str(LookbackMultipleCalcModel.local_serial),
+                  str(LookbackMultipleCalcModel.local_parallel),
+                  str(LookbackMultipleCalcModel.hybrid_parallel)]
+
+    for jobId in range(len(calcModels)):
+        job = LookbackMultipleCalcJob(jobId, calcModels[jobId],
+                                      argsTupleList, 1)
+        job.resultsReady.connect(handleResultsReady,
+                                 QtCore.Qt.DirectConnection)
+        job.calculationsFinished.connect(handleCalculationsFinished,
+                                         QtCore.Qt.DirectConnection)
+        job.start()
+        job.wait()
+
+##############################################################################
+
+# For debugging the module during development.
+if __name__=="__main__":
+    # Initialize logging.
+    LOG_CONFIG_FILE = os.path.join(sys.path[0], "../conf/logging.conf")
+    logging.config.fileConfig(LOG_CONFIG_FILE)
+    #logging.disable(logging.CRITICAL)
+
+    # Import the Ephemeris classes.
+    from ephemeris import Ephemeris
+
+    # Initialize the Ephemeris (required).
+    Ephemeris.initialize()
+
+    # New York City:
+    lon = -74.0064
+    lat = 40.7142
+
+    # Set a default location (required).
+    Ephemeris.setGeographicPosition(lon, lat)
+
+    # The signals are connected directly, so no event loop is needed,
+    # but Qt needs an application object for the threads.
+    app = QtCore.QCoreApplication(sys.argv)
+
+    testLookbackMultipleCalcJob()
+
+    # Close the Ephemeris so it can do necessary cleanups.
+    Ephemeris.closeEphemeris()
+
+    # Quit.
+    print("Exiting.")
+    sys.exit()
+
+##############################################################################
@@ -3,9 +3,75 @@
 # Pool of processes for calculating LookbackMultiples.
 from multiprocessing import Pool
 
+# For the lock around creating and shutting down the pool.
+import threading
+
 import os
     
 
+# Location (locationLongitudeDegrees, locationLatitudeDegrees,
+# locationElevationMeters) that the Ephemeris of this process was
+# initialized with by _initializeEphemerisForLocation(), or None.
+_ephemerisLocation = None
+
+# Whether the calculations of this process get the planet longitudes
+# from an EphemerisInterpolator.  This is set by initializeWorker().
+_ephemerisInterpolatorEnabled = False
+
+
+def _initializeEphemerisForLocation(locationLongitudeDegrees,
+                                    locationLatitudeDegrees,
+                                    locationElevationMeters):
+    """Initializes the Ephemeris of this process with
+    LookbackMultipleUtils.initializeEphemeris(), unless it was already
+    initialized for the same location.
+    """
+
+    global _ephemerisLocation
+
+    location = (locationLongitudeDegrees,
+                locationLatitudeDegrees,
+                locationElevationMeters)
+
+    if _ephemerisLocation != location:
+        from lookbackmultiple_calc import LookbackMultipleUtils
+
+        LookbackMultipleUtils.initializeEphemeris(locationLongitudeDegrees, 
+                                                  locationLatitudeDegrees,
+                                                  locationElevationMeters)
+        LookbackMultipleUtils.\
+            setEphemerisInterpolatorEnabled(_ephemerisInterpolatorEnabled)
+        _ephemerisLocation = location
+
+
+def initializeWorker(locationLongitudeDegrees,
+                     locationLatitudeDegrees,
+                     locationElevationMeters,
+                     ephemerisInterpolatorEnabled=False):
+    """Initializer of the processes of the LookbackMultipleParallel
+    pool.  Imports the calculation modules and initializes the
+    Ephemeris for the given location once, when the process starts,
+    instead of for every task.  'ephemerisInterpolatorEnabled' is
+    whether the calculations of the process get the planet longitudes
+    from an EphemerisInterpolator.
+
+    Errors are not raised here, because the pool would keep
+    replacing the process.  The initialization is then tried again
+    by the first task, which reports the error.
+    """
+
+    global _ephemerisInterpolatorEnabled
+
+    _ephemerisInterpolatorEnabled = ephemerisInterpolatorEnabled
+
+    try:
+        _initializeEphemerisForLocation(locationLongitudeDegrees,
+                                        locationLatitudeDegrees,
+                                        locationElevationMeters)
+    except Exception:
+        pass
+    
+
 def getDatetimesOfLongitudeDeltaDegreesInFuture(argsTuple):
     """Method that is distrubted to dispy's nodes ('dispynode') for
     remote execution.  Module dependencies are imported within the
@@ -32,9 +98,11 @@ def getDatetimesOfLongitudeDeltaDegreesInFuture(argsTuple):
     locationLatitudeDegrees = argsTuple[7]
     locationElevationMeters = argsTuple[8]
 
-    LookbackMultipleUtils.initializeEphemeris(locationLongitudeDegrees, 
-                                              locationLatitudeDegrees,
-                                              locationElevationMeters)
+    # This is a no-op in the processes of the
+    # LookbackMultipleParallel pool, unless the location changed.
+    _initializeEphemerisForLocation(locationLongitudeDegrees, 
+                                    locationLatitudeDegrees,
+                                    locationElevationMeters)
     
     return LookbackMultipleUtils.getDatetimesOfLongitudeDeltaDegreesInFuture(\
         planetName, 
@@ -70,9 +138,11 @@ def getDatetimesOfLongitudeDeltaDegreesInPast(argsTuple):
     locationLatitudeDegrees = argsTuple[7]
     locationElevationMeters = argsTuple[8]
 
-    LookbackMultipleUtils.initializeEphemeris(locationLongitudeDegrees, 
-                                              locationLatitudeDegrees,
-                                              locationElevationMeters)
+    # This is a no-op in the processes of the
+    # LookbackMultipleParallel pool, unless the location changed.
+    _initializeEphemerisForLocation(locationLongitudeDegrees, 
+                                    locationLatitudeDegrees,
+                                    locationElevationMeters)
     
     return LookbackMultipleUtils.getDatetimesOfLongitudeDeltaDegreesInPast(\
         planetName, 
@@ -83,11 +153,226 @@ def getDatetimesOfLongitudeDeltaDegreesInPast(argsTuple):
         maxErrorTd)
     
 
-class LookbackMultipleParallel:
-    
-    poolSize = os.cpu_count()
+def getIndexedDatetimesOfLongitudeDeltaDegrees(indexedArgsTuple):
+    """Method that is run in the processes of the
+    LookbackMultipleParallel pool by
+    LookbackMultipleParallel.imapDatetimesOfLongitudeDeltaDegreesParallel().
+
+    Arguments:
+    indexedArgsTuple - tuple of (index, direction, argsTuple).
+                       'index' is returned along with the result, so
+                       that results that come back in any order can
+                       be matched to their tasks.  'direction' is 1
+                       to run getDatetimesOfLongitudeDeltaDegreesInFuture(),
+                       and -1 to run getDatetimesOfLongitudeDeltaDegreesInPast()
+                       with 'argsTuple'.
+
+    Returns:
+    Tuple of (index, list of datetime.datetime objects).
+    """
+
+    (index, direction, argsTuple) = indexedArgsTuple
+
+    if direction > 0:
+        resultDts = getDatetimesOfLongitudeDeltaDegreesInFuture(argsTuple)
+    else:
+        resultDts = getDatetimesOfLongitudeDeltaDegreesInPast(argsTuple)
+
+    return (index, resultDts)
     
-    pool = Pool(poolSize)
+
+class LookbackMultipleParallel:
+    """Runs LookbackMultiple calculations in a pool of processes.
+
+    The pool is created when it is first used, not when this module
+    is imported, and it is kept for later calculations, so the
+    processes stay warm (the Ephemeris and the calculation modules
+    are initialized once per process by initializeWorker()).  The
+    number of processes is set with setPoolSize(), and whether the
+    processes use an EphemerisInterpolator with
+    setEphemerisInterpolatorEnabled().  shutdown() should be called
+    when the application exits.
+
+    Calculations that use the pool over time take it with
+    acquirePool() and give it back with releasePool().  If the pool
+    is replaced while calculations use it (e.g. because the settings
+    changed), it is only shut down after the last of them gave it
+    back.
+    """
+
+    # Number of processes in the pool.  If this is None or 0, the
+    # number of CPUs is used.
+    poolSize = None
+
+    # Whether the processes of the pool get the planet longitudes
+    # from an EphemerisInterpolator.
+    ephemerisInterpolatorEnabled = False
+
+    # Pool of processes, or None if it is not created yet.
+    pool = None
+
+    # Number of calculations using each pool, keyed by the pool.
+    # Pools without calculations using them are not in here.
+    poolUsers = {}
+
+    # Lock around creating and shutting down the pool, since
+    # calculations are started from background threads.
+    poolLock = threading.Lock()
+
+    # Number of chunks that each process gets of the tasks of a
+    # calculation, when the chunk size is not specified.  More
+    # chunks balance the load better, fewer chunks have less
+    # overhead.
+    chunksPerProcess = 4
+
+    @staticmethod
+    def setPoolSize(poolSize):
+        """Sets the number of processes of the pool.  If the pool
+        exists with another number of processes, it is shut down once
+        the calculations using it are done, and created again with the
+        new size when it is next used.
+
+        Arguments:
+        poolSize - int value for the number of processes.  If this is
+                   None or 0, the number of CPUs is used.
+        """
+
+        if poolSize == 0:
+            poolSize = None
+
+        with LookbackMultipleParallel.poolLock:
+            if poolSize == LookbackMultipleParallel.poolSize:
+                return
+
+            LookbackMultipleParallel.poolSize = poolSize
+            LookbackMultipleParallel._shutdownPool()
+
+    @staticmethod
+    def setEphemerisInterpolatorEnabled(enabled):
+        """Sets whether the processes of the pool get the planet
+        longitudes from an EphemerisInterpolator.  If the pool exists
+        with the other setting, it is shut down once the calculations
+        using it are done, and created again with the new setting when
+        it is next used.
+
+        Arguments:
+        enabled - bool value.
+        """
+
+        with LookbackMultipleParallel.poolLock:
+            if LookbackMultipleParallel.ephemerisInterpolatorEnabled == \
+                   enabled:
+                return
+
+            LookbackMultipleParallel.ephemerisInterpolatorEnabled = enabled
+            LookbackMultipleParallel._shutdownPool()
+
+    @staticmethod
+    def getPoolSize():
+        """Returns the number of processes that the pool has, or will
+        have when it is created.
+        """
+
+        poolSize = LookbackMultipleParallel.poolSize
+        if poolSize == None:
+            poolSize = os.cpu_count() or 1
+
+        return poolSize
+
+    @staticmethod
+    def getPool(listOfTuples=None):
+        """Returns the pool of processes, creating it if it does not
+        exist yet.  Calculations that use the pool after this returns
+        should use acquirePool() instead, so that the pool is not shut
+        down under them.
+
+        Arguments:
+        listOfTuples - List of tuple objects, as described in
+                       getDatetimesOfLongitudeDeltaDegreesInFutureParallel().
+                       If the pool is created, its processes are
+                       initialized for the location of the first
+                       tuple.  If None or empty, the default location
+                       of LookbackMultipleUtils.initializeEphemeris()
+                       is used.
+        """
+
+        with LookbackMultipleParallel.poolLock:
+            return LookbackMultipleParallel._getPool(listOfTuples)
+
+    @staticmethod
+    def acquirePool(listOfTuples=None):
+        """Returns the pool of processes like getPool() does, and
+        counts the caller as using it.  The pool is not shut down
+        until the caller gives it back with releasePool().
+
+        Arguments:
+        listOfTuples - List of tuple objects, as described in getPool().
+        """
+
+        with LookbackMultipleParallel.poolLock:
+            pool = LookbackMultipleParallel._getPool(listOfTuples)
+
+            LookbackMultipleParallel.poolUsers[pool] = \
+                LookbackMultipleParallel.poolUsers.get(pool, 0) + 1
+
+            return pool
+
+    @staticmethod
+    def releasePool(pool):
+        """Gives back a pool returned by acquirePool().  If the pool
+        was replaced in the meantime and this was the last calculation
+        using it, it is shut down.
+
+        Arguments:
+        pool - multiprocessing.pool.Pool object returned by acquirePool().
+        """
+
+        with LookbackMultipleParallel.poolLock:
+            numUsers = LookbackMultipleParallel.poolUsers[pool] - 1
+            if numUsers > 0:
+                LookbackMultipleParallel.poolUsers[pool] = numUsers
+                return
+
+            del LookbackMultipleParallel.poolUsers[pool]
+
+            if pool is LookbackMultipleParallel.pool:
+                return
+
+        pool.close()
+        pool.join()
+
+    @staticmethod
+    def _getPool(listOfTuples):
+        """Returns the pool of processes, creating it if it does not
+        exist yet.  The caller must hold
+        LookbackMultipleParallel.poolLock.
+        """
+
+        if LookbackMultipleParallel.pool == None:
+            if listOfTuples != None and len(listOfTuples) > 0:
+                initargs = tuple(listOfTuples[0][6:9])
+            else:
+                initargs = (-74.0064, 40.7142, 0)
+            initargs += \
+                (LookbackMultipleParallel.ephemerisInterpolatorEnabled,)
+
+            LookbackMultipleParallel.pool = \
+                Pool(LookbackMultipleParallel.getPoolSize(),
+                     initializer=initializeWorker,
+                     initargs=initargs)
+
+        return LookbackMultipleParallel.pool
+
+    @staticmethod
+    def getChunkSize(numTasks):
+        """Returns the number of tasks to send to a process of the
+        pool at a time, for a calculation with 'numTasks' tasks.
+        """
+
+        numChunks = LookbackMultipleParallel.getPoolSize() * \
+                    LookbackMultipleParallel.chunksPerProcess
+
+        return max(1, -(-numTasks // numChunks))
     
     @staticmethod
     def getDatetimesOfLongitudeDeltaDegreesInFutureParallel(listOfTuples):
@@ -135,9 +420,16 @@ class LookbackMultipleParallel:
         degrees away from the longitude at 'referenceDt'.
         """
 
-        listOfResults = \
-            LookbackMultipleParallel.pool.map(
-                getDatetimesOfLongitudeDeltaDegreesInFuture, listOfTuples)
+        pool = LookbackMultipleParallel.acquirePool(listOfTuples)
+
+        try:
+            listOfResults = \
+                pool.map(getDatetimesOfLongitudeDeltaDegreesInFuture,
+                         listOfTuples,
+                         LookbackMultipleParallel.\
+                             getChunkSize(len(listOfTuples)))
+        finally:
+            LookbackMultipleParallel.releasePool(pool)
             
         return listOfResults
 
@@ -187,15 +479,90 @@ class LookbackMultipleParallel:
         degrees away from the longitude at 'referenceDt'.
         """
         
-        listOfResults = \
-            LookbackMultipleParallel.pool.map(\
-                getDatetimesOfLongitudeDeltaDegreesInPast, listOfTuples)
+        pool = LookbackMultipleParallel.acquirePool(listOfTuples)
+
+        try:
+            listOfResults = \
+                pool.map(getDatetimesOfLongitudeDeltaDegreesInPast,
+                         listOfTuples,
+                         LookbackMultipleParallel.\
+                             getChunkSize(len(listOfTuples)))
+        finally:
+            LookbackMultipleParallel.releasePool(pool)
             
         return listOfResults
 
+    @staticmethod
+    def imapDatetimesOfLongitudeDeltaDegreesParallel(listOfTuples,
+                                                     direction,
+                                                     chunksize=None):
+        """Does the calculations of
+        getDatetimesOfLongitudeDeltaDegreesInFutureParallel() or
+        getDatetimesOfLongitudeDeltaDegreesInPastParallel(), but
+        returns the results as they complete, instead of all of them
+        at the end.
+
+        Arguments:
+        listOfTuples - List of tuple objects, as described in
+                       getDatetimesOfLongitudeDeltaDegreesInFutureParallel().
+        direction    - int value.  1 for calculations into the
+                       future, -1 for calculations into the past.
+        chunksize    - int value for the number of tuples sent to a
+                       process of the pool at a time.  If None,
+                       getChunkSize() is used.
+
+        Returns:
+        Iterator of tuples of (index, list of datetime.datetime
+        objects), in the order that the calculations complete.
+        'index' is the index of the respective tuple within
+        listOfTuples.  The iterator uses the pool until it is
+        exhausted or closed.  It can be closed at any time; tasks
+        already sent to the pool still run, but their results are
+        dropped.
+        """
+
+        indexedArgsTuples = \
+            [(i, direction, listOfTuples[i]) for i in range(len(listOfTuples))]
+
+        if chunksize == None:
+            chunksize = LookbackMultipleParallel.getChunkSize(len(listOfTuples))
+
+        pool = LookbackMultipleParallel.acquirePool(listOfTuples)
+
+        try:
+            yield from \
+                pool.imap_unordered(getIndexedDatetimesOfLongitudeDeltaDegrees,
+                                    indexedArgsTuples,
+                                    chunksize)
+        finally:
+            LookbackMultipleParallel.releasePool(pool)
+
     @staticmethod
     def shutdown():
-        LookbackMultipleParallel.pool.close()
+        """Shuts down the pool of processes, after the tasks given to
+        it are done.  If calculations are using the pool, it is shut
+        down when the last of them gives it back with releasePool().
+        The pool is created again if it is used after this.
+        """
+
+        with LookbackMultipleParallel.poolLock:
+            LookbackMultipleParallel._shutdownPool()
+
+    @staticmethod
+    def _shutdownPool():
+        """Shuts down the pool of processes, if it exists.  If
+        calculations are using it, it is only taken out of use here,
+        and shut down by releasePool().  The caller must hold
+        LookbackMultipleParallel.poolLock.
+        """
+
+        pool = LookbackMultipleParallel.pool
+        if pool != None:
+            LookbackMultipleParallel.pool = None
+
+            if pool not in LookbackMultipleParallel.poolUsers:
+                pool.close()
+                pool.join()
             
             
 ##############################################################################
@@ -386,6 +753,7 @@ if __name__=="__main__":
 
     #startTime = time.time()
     runTests()
+    LookbackMultipleParallel.shutdown()
     #endTime = time.time()
 
     #print("")
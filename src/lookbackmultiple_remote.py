@@ -0,0 +1,512 @@
+
+# For directory access.
+import os
+import sys
+import inspect
+
+# For timing the waits for results.
+import time
+
+# For the description of the client.
+import socket
+
+# For packing the result timestamps.
+import array
+
+# For timestamps.
+import datetime
+import pytz
+
+# For logging.
+import logging
+import logging.config
+
+# For connecting to the server.
+from multiprocessing.managers import BaseManager
+
+##############################################################################
+
+# Julian Day of the epoch 1970-01-01 00:00:00 UTC.
+JULIAN_DAY_OF_EPOCH = 2440587.5
+
+# Epoch used for converting between Julian Days and datetimes.
+epochDt = datetime.datetime(1970, 1, 1, tzinfo=pytz.utc)
+
+def datetimeToJulianDay(dt):
+    """Returns the Julian Day, as a float, of the given timezone-aware
+    datetime.datetime.
+
+    This gives the same value as Ephemeris.datetimeToJulianDay(), but
+    does not need the Swiss Ephemeris, so it can be used by the
+    server.  A float Julian Day is exact to about 0.05 milliseconds
+    for current dates.
+    """
+
+    return JULIAN_DAY_OF_EPOCH + \
+           (dt - epochDt) / datetime.timedelta(days=1)
+
+def julianDayToDatetime(jd, tzInfo=pytz.utc):
+    """Returns the datetime.datetime, in timezone 'tzInfo', of the
+    given Julian Day.  The timestamp is rounded to the microsecond.
+    """
+
+    microseconds = round((jd - JULIAN_DAY_OF_EPOCH) * 86400 * 1000000)
+
+    return (epochDt + datetime.timedelta(microseconds=microseconds)).\
+           astimezone(tzInfo)
+
+def encodeTask(taskId, direction, argsTuple):
+    """Returns the tuple sent to the server for a LookbackMultiple
+    calculation.  Timestamps are sent as float Julian Days and
+    durations as float seconds, so that a batch of tasks pickles to a
+    fraction of the size of the datetime objects.
+
+    Arguments:
+    taskId    - Picklable value that identifies the task in its result.
+    direction - int value.  1 for calculations into the future, -1 for
+                calculations into the past.
+    argsTuple - tuple, as described in
+                PriceBarChartWidget._getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture().
+
+    Returns:
+    tuple of (taskId, direction, planetName, centricityType,
+    longitudeType, referenceJd, desiredDeltaDegrees, maxErrorSec,
+    locationLongitudeDegrees, locationLatitudeDegrees,
+    locationElevationMeters).
+    """
+
+    return (taskId,
+            direction,
+            argsTuple[0],
+            argsTuple[1],
+            argsTuple[2],
+            datetimeToJulianDay(argsTuple[3]),
+            argsTuple[4],
+            argsTuple[5].total_seconds(),
+            argsTuple[6],
+            argsTuple[7],
+            argsTuple[8])
+
+def decodeTask(task):
+    """Returns the tuple (taskId, direction, argsTuple) of a task
+    encoded with encodeTask().  The reference timestamp of 'argsTuple'
+    is in UTC.
+    """
+
+    argsTuple = (task[2],
+                 task[3],
+                 task[4],
+                 julianDayToDatetime(task[5]),
+                 task[6],
+                 datetime.timedelta(seconds=task[7]),
+                 task[8],
+                 task[9],
+                 task[10])
+
+    return (task[0], task[1], argsTuple)
+
+def encodeResultJulianDays(resultJds):
+    """Returns the bytes sent to the server for the result of a
+    LookbackMultiple calculation: the float Julian Days of the result
+    timestamps, packed.  None is returned for a failed calculation.
+    """
+
+    if resultJds == None:
+        return None
+
+    return array.array('d', resultJds).tobytes()
+
+def encodeResultDts(resultDts):
+    """Returns what encodeResultJulianDays() returns, for a result of
+    datetime.datetime objects.
+    """
+
+    if resultDts == None:
+        return None
+
+    return encodeResultJulianDays([datetimeToJulianDay(dt) \
+                                   for dt in resultDts])
+
+def decodeResultDts(value, tzInfo=pytz.utc):
+    """Returns the list of datetime.datetime objects, in timezone
+    'tzInfo', of a result encoded with encodeResultDts().
+    """
+
+    jds = array.array('d')
+    jds.frombytes(value)
+
+    return [julianDayToDatetime(jd, tzInfo) for jd in jds]
+
+##############################################################################
+
+class LookbackMultipleRemoteClient:
+    """Client of the task broker of the LookbackMultiple server
+    (misc/LookbackMultipleDistributedParallel/lookbackmultiple_server.py),
+    for submitting LookbackMultiple calculations to the distributed
+    client workers.
+
+    Each calculation is a job on the server, with its own results, so
+    many clients can share the server.  Tasks of jobs with a higher
+    priority are calculated first, e.g.
+    LookbackMultipleRemoteClient.PRIORITY_INTERACTIVE for redraws of a
+    chart, ahead of LookbackMultipleRemoteClient.PRIORITY_BATCH for
+    scripts.
+
+    Tasks are submitted in batches of
+    LookbackMultipleRemoteClient.submitBatchSize, and results are
+    taken in batches of up to LookbackMultipleRemoteClient.resultBatchSize
+    as soon as the workers complete them, so a calculation only costs
+    a few round trips to the server.  The server hands out the tasks
+    to the workers under time-limited leases, so the tasks of a worker
+    that dies are calculated again by another worker.
+
+    The connection to the server can be used from any thread, but a
+    client must only be used by one thread at a time.
+    """
+
+    # Priority of jobs that a user waits for.
+    PRIORITY_INTERACTIVE = 10
+
+    # Priority of jobs of scripts.
+    PRIORITY_BATCH = 0
+
+    # Number of tasks submitted to the server per message.
+    submitBatchSize = 500
+
+    # Maximum number of results taken from the server per message.
+    resultBatchSize = 500
+
+    # Maximum number of seconds that the server holds a request for
+    # results while none are available.  Cancellation is checked this
+    # often.
+    pollIntervalSec = 0.5
+
+    # Logger object for this class.
+    log = logging.getLogger("lookbackmultiple_remote.LookbackMultipleRemoteClient")
+
+    def __init__(self, serverAddress, serverPort, serverAuthKey,
+                 timeoutSec=None, priority=PRIORITY_BATCH,
+                 description=None):
+        """Initializes the client.  The connection is made with
+        connect().
+
+        Arguments:
+        serverAddress - str holding the server hostname or IP address.
+        serverPort    - int value for the server port.
+        serverAuthKey - bytes holding the server auth key.
+        timeoutSec    - float number of seconds that no result arrives
+                        after which the remaining results are given up
+                        on, or None to wait forever.
+        priority      - int priority of the jobs of this client.
+        description   - str describing this client in the logs of the
+                        server, or None for the host and process id.
+        """
+
+        self.serverAddress = serverAddress
+        self.serverPort = serverPort
+        self.serverAuthKey = serverAuthKey
+        self.timeoutSec = timeoutSec
+        self.priority = priority
+
+        if description == None:
+            description = "{}:{}".format(socket.gethostname(), os.getpid())
+        self.description = description
+
+        # Proxy of the task broker on the server.
+        self.broker = None
+
+        # Number of results of the last calculation that were not
+        # obtained, because they timed out or failed on the workers.
+        self.numResultsMissing = 0
+
+    def connect(self):
+        """Connects to the server.
+
+        Raises:
+        ConnectionRefusedError, or another OSError, if the server
+        cannot be reached.  multiprocessing.context.AuthenticationError
+        if the auth key is wrong.
+        """
+
+        class QueueManager(BaseManager):
+            pass
+
+        QueueManager.register("getTaskBroker")
+
+        manager = QueueManager(address=(self.serverAddress, self.serverPort),
+                               authkey=self.serverAuthKey)
+        manager.connect()
+
+        self.broker = manager.getTaskBroker()
+
+        self.log.debug("Connected to LookbackMultiple server {} port {}.".\
+                       format(self.serverAddress, self.serverPort))
+
+    def imapDatetimesOfLongitudeDeltaDegrees(self,
+                                             argsTupleList,
+                                             direction,
+                                             cancelledFunc=None):
+        """Submits LookbackMultiple calculations to the server, and
+        returns an iterator over the results in the order that the
+        workers complete them.
+
+        The iteration stops when all the results are obtained, when
+        no result arrives for self.timeoutSec seconds, or when
+        'cancelledFunc' returns True.  The job on the server is then
+        closed, which cancels the calculations still on it, and
+        self.numResultsMissing holds how many results were not
+        obtained.  Closing the iterator early also closes the job.
+
+        Arguments:
+        argsTupleList - List of tuple objects, as described in
+                        PriceBarChartWidget._getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture().
+        direction     - int value.  1 for calculations into the
+                        future, -1 for calculations into the past.
+        cancelledFunc - Function taking no arguments that returns True
+                        if the calculations should be given up on, or
+                        None.
+
+        Returns:
+        Iterator of tuples (index, list of datetime.datetime objects),
+        where 'index' is the index into 'argsTupleList' of the
+        argument tuple that the result is for.  The datetimes are in
+        the timezone of the reference timestamp of the argument tuple.
+        """
+
+        pendingIndexes = set(range(len(argsTupleList)))
+        self.numResultsMissing = len(pendingIndexes)
+
+        jobId = self.createJob()
+
+        try:
+            self.putTasks(jobId, argsTupleList, range(len(argsTupleList)),
+                          direction)
+
+            self.log.debug("Submitted {} tasks in job {}.".\
+                           format(len(argsTupleList), jobId))
+
+            lastResultTime = time.time()
+
+            while len(pendingIndexes) > 0:
+                if cancelledFunc != None and cancelledFunc() == True:
+                    self.log.debug("Calculations were cancelled.")
+                    return
+
+                results = self.getResults(\
+                    jobId,
+                    argsTupleList,
+                    LookbackMultipleRemoteClient.pollIntervalSec)
+
+                if results == None:
+                    self.log.warning("The server closed LookbackMultiple " + \
+                                     "job {}.  ".format(jobId) + \
+                                     "Giving up on {} of {} results.".\
+                                     format(len(pendingIndexes),
+                                            len(argsTupleList)))
+                    return
+
+                if len(results) == 0:
+                    if self.timeoutSec != None and \
+                       time.time() - lastResultTime >= self.timeoutSec:
+
+                        self.log.warning("No LookbackMultiple results " + \
+                                         "arrived for {} sec.  ".\
+                                         format(self.timeoutSec) + \
+                                         "Giving up on {} of {} results.".\
+                                         format(len(pendingIndexes),
+                                                len(argsTupleList)))
+                        return
+                    continue
+
+                lastResultTime = time.time()
+
+                for (index, resultDts) in results:
+                    if index not in pendingIndexes:
+                        continue
+
+                    pendingIndexes.remove(index)
+
+                    if resultDts == None:
+                        self.log.warning("LookbackMultiple calculation " + \
+                                         "failed on the workers: {}".\
+                                         format(argsTupleList[index]))
+                        continue
+
+                    self.numResultsMissing -= 1
+
+                    yield (index, resultDts)
+
+        finally:
+            self.closeJob(jobId)
+
+    def createJob(self):
+        """Creates a job on the server, with the priority and the
+        description of this client.  The job must be closed with
+        closeJob() when its results are no longer needed.
+
+        Returns:
+        int id of the job.
+        """
+
+        return self.broker.createJob(self.priority, self.description)
+
+    def putTasks(self, jobId, argsTupleList, indexes, direction):
+        """Submits LookbackMultiple calculations to a job on the server,
+        in batches of LookbackMultipleRemoteClient.submitBatchSize.
+
+        Arguments:
+        jobId         - int id of the job, as returned by createJob().
+        argsTupleList - List of tuple objects, as described in
+                        PriceBarChartWidget._getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture().
+        indexes       - Iterable of the indexes into 'argsTupleList' of
+                        the argument tuples to submit.  The results
+                        are returned by getResults() with these
+                        indexes.
+        direction     - int value.  1 for calculations into the
+                        future, -1 for calculations into the past.
+        """
+
+        batchSize = LookbackMultipleRemoteClient.submitBatchSize
+
+        tasks = []
+        for i in indexes:
+            tasks.append(encodeTask(i, direction, argsTupleList[i]))
+
+            if len(tasks) == batchSize:
+                self.broker.putTasks(jobId, tasks)
+                tasks = []
+
+        if len(tasks) > 0:
+            self.broker.putTasks(jobId, tasks)
+
+    def getResults(self, jobId, argsTupleList, waitSec):
+        """Returns the results of a job that the workers completed
+        since the last call, waiting up to 'waitSec' seconds for at
+        least one of them.
+
+        Arguments:
+        jobId         - int id of the job, as returned by createJob().
+        argsTupleList - List of tuple objects given to putTasks().
+        waitSec       - float number of seconds to wait for a result.
+
+        Returns:
+        List of up to LookbackMultipleRemoteClient.resultBatchSize
+        tuples (index, list of datetime.datetime objects), where
+        'index' is the index given to putTasks().  The list of
+        datetimes is None for a calculation that failed on the
+        workers.  The datetimes are in the timezone of the reference
+        timestamp of the argument tuple.  None is returned instead of
+        the list if the server closed the job.
+        """
+
+        results = self.broker.getResults(\
+            jobId,
+            LookbackMultipleRemoteClient.resultBatchSize,
+            waitSec)
+
+        if results == None:
+            return None
+
+        rv = []
+        for (index, value) in results:
+            if value == None:
+                rv.append((index, None))
+            else:
+                rv.append((index,
+                           decodeResultDts(value,
+                                           argsTupleList[index][3].tzinfo)))
+
+        return rv
+
+    def closeJob(self, jobId):
+        """Closes a job on the server, which cancels the calculations
+        of the job that are still on it.  Errors are logged, not
+        raised, since the server drops jobs that are not polled
+        anyway.
+        """
+
+        try:
+            self.broker.closeJob(jobId)
+        except (OSError, EOFError) as e:
+            self.log.warning("Could not close LookbackMultiple " + \
+                             "job {} on the server: {}".format(jobId, e))
+
+    def getDatetimesOfLongitudeDeltaDegrees(self,
+                                            argsTupleList,
+                                            direction):
+        """Submits LookbackMultiple calculations to the server, and
+        waits for the results.
+
+        Arguments:
+        argsTupleList - List of tuple objects, as described in
+                        PriceBarChartWidget._getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture().
+        direction     - int value.  1 for calculations into the
+                        future, -1 for calculations into the past.
+
+        Returns:
+        List of list of datetime.datetime objects.  Each list within
+        the list corresponds to the respective tuple within
+        argsTupleList.  Results that were not obtained (see
+        imapDatetimesOfLongitudeDeltaDegrees()) are None.
+        """
+
+        rv = [None] * len(argsTupleList)
+
+        for (index, resultDts) in \
+                self.imapDatetimesOfLongitudeDeltaDegrees(argsTupleList,
+                                                          direction):
+            rv[index] = resultDts
+
+        return rv
+
+    def getStatistics(self):
+        """Returns the dict of statistics of the server, as described
+        in LookbackMultipleTaskBroker.getStatistics() of the server.
+        """
+
+        return self.broker.getStatistics()
+
+##############################################################################
+
+def testEncoding():
+    """Tests that tasks and results survive the encoding."""
+
+    print("Running " + inspect.stack()[0][3] + "()")
+
+    eastern = pytz.timezone('US/Eastern')
+
+    referenceDt = eastern.localize(datetime.datetime(1994, 10, 20, 9, 30))
+    argsTuple = ("Mars", "geocentric", "tropical", referenceDt,
+                 -360, datetime.timedelta(minutes=60),
+                 -74.0064, 40.7142, 0)
+
+    (taskId, direction, decodedArgsTuple) = \
+        decodeTask(encodeTask(("run", 7), -1, argsTuple))
+    print("  taskId == {}, direction == {}".format(taskId, direction))
+    print("  Arguments equal: {}".format(decodedArgsTuple == argsTuple))
+
+    resultDts = [eastern.localize(datetime.datetime(1996, 1, 1, 12, 34, 56)),
+                 eastern.localize(datetime.datetime(2012, 7, 4, 0, 0, 1))]
+    value = encodeResultDts(resultDts)
+    decodedResultDts = decodeResultDts(value, eastern)
+    print("  Result is {} bytes".format(len(value)))
+    print("  Result errors: {}".format(\
+        [decodedResultDts[i] - resultDts[i] for i in range(len(resultDts))]))
+    print("  Result timezone: {}".format(decodedResultDts[0].tzinfo))
+
+##############################################################################
+
+# For debugging the module during development.
+if __name__=="__main__":
+    # Initialize logging.
+    LOG_CONFIG_FILE = os.path.join(sys.path[0], "../conf/logging.conf")
+    logging.config.fileConfig(LOG_CONFIG_FILE)
+    #logging.disable(logging.CRITICAL)
+
+    testEncoding()
+
+    # Quit.
+    print("Exiting.")
+    sys.exit()
+
+##############################################################################
@@ -24,6 +24,9 @@ from ui import MainWindow
 # To initialize and shutdown the Ephemeris.
 from ephemeris import *
 
+# To shutdown the pool of processes for LookbackMultiple calculations.
+from lookbackmultiple_parallel import LookbackMultipleParallel
+
 # Import resources for the icon image.
 import resources
 
@@ -133,6 +136,7 @@ def main():
     mainWindow.show()
 
     # Cleanup and close the application when the last window is closed.
+    app.lastWindowClosed.connect(LookbackMultipleParallel.shutdown)
     app.lastWindowClosed.connect(Ephemeris.closeEphemeris)
     app.lastWindowClosed.connect(logging.shutdown)
     app.lastWindowClosed.connect(app.quit)
@@ -22,6 +22,12 @@ import types
 # For calculating square roots and other calculations.
 import math
 
+# For looking up PriceBars by scene X position.
+import bisect
+
+# For storing the prices of PriceBars compactly.
+import array
+
 # For timing how long LookbackMultiple calculations take.
 import time
 
@@ -29,9 +35,10 @@ import time
 import datetime
 import pytz
 
-# For multiprocessing features with LookbackMultiple calculations.
-from multiprocessing.managers import BaseManager
-from multiprocessing import JoinableQueue
+# For catching errors of the LookbackMultiple result cache.
+import sqlite3
+
+# For catching errors connecting to the LookbackMultiple server.
 from multiprocessing.context import AuthenticationError
 
 # For PyQt UI classes.
@@ -56,6 +63,10 @@ from ephemeris import Ephemeris
 # to support LookbackMultiple.
 from lookbackmultiple_parallel import LookbackMultipleParallel
 from lookbackmultiple_calc import LookbackMultipleUtils
+from lookbackmultiple_job import LookbackMultipleCalcJob
+from lookbackmultiple_cache import LookbackMultipleResultCache
+from lookbackmultiple_remote import LookbackMultipleRemoteClient
+from lookbackmultiple_hybrid import LookbackMultipleHybridScheduler
 
 # For generic utility helper methods.
 from util import Util
@@ -618,7 +629,10 @@ class PriceBarGraphicsItem(QGraphicsItem):
 
         scene = self.scene()
         if scene != None:
-            scene.removeItem(self)
+            # The PriceBar is also drawn by the PriceBarLayerGraphicsItem.
+            scene.removePriceBar(self.priceBar)
+            if self.scene() != None:
+                scene.removeItem(self)
             scene.priceBarChartChanged.emit()
 
     def _handleInfoAction(self):
@@ -661,6 +675,10 @@ class PriceBarGraphicsItem(QGraphicsItem):
 
             # Flag that a redraw of this QGraphicsItem is required.
             self.prepareGeometryChange()
+
+            # The timestamp may have changed, so the
+            # PriceBarLayerGraphicsItem needs to sort the PriceBar again.
+            self.scene().updatePriceBar(self.priceBar)
             
             # Emit that the PriceBarChart has changed so that the
             # dirty flag can be set.
@@ -710,6 +728,714 @@ class PriceBarGraphicsItem(QGraphicsItem):
         self.scene().openAstrolog(self.scenePos().x())
         
 
+class PriceBarLayerGraphicsItem(QGraphicsItem):
+    """QGraphicsItem that visualizes all the PriceBar objects of the
+    chart, drawn the same way as PriceBarGraphicsItem.
+
+    Creating a QGraphicsItem per PriceBar is slow for charts with tens
+    of thousands of PriceBars.  This item instead keeps the scene X
+    position and the open, high, low and close prices of the
+    PriceBars in arrays sorted by X, and paints only the PriceBars
+    within the exposed rectangle, with one QPainter.drawLines() call
+    per color.  PriceBars are looked up by index with bisection on X.
+
+    This item does not take mouse events, and is not selectable.
+    PriceBars that need interaction (selection, context menus, tags)
+    get their own PriceBarGraphicsItem from the
+    PriceBarChartGraphicsScene, and are then excluded from the
+    painting of this item.
+
+    The item must be in a PriceBarChartGraphicsScene before
+    setPriceBars() is called, since the scene converts the timestamps
+    to X positions.
+    """
+    
+    def __init__(self, parent=None):
+
+        # Logger
+        self.log = logging.getLogger("pricebarchart.PriceBarLayerGraphicsItem")
+        self.log.debug("Entered __init__().")
+
+        super().__init__(parent)
+
+        # Pen width for PriceBars.
+        self.penWidth = \
+            PriceBarChartSettings.defaultPriceBarGraphicsItemPenWidth
+
+        # Width of the left extension drawn that represents the open price.
+        self.leftExtensionWidth = \
+            PriceBarChartSettings.\
+                defaultPriceBarGraphicsItemLeftExtensionWidth 
+
+        # Width of the right extension drawn that represents the close price.
+        self.rightExtensionWidth = \
+            PriceBarChartSettings.\
+                defaultPriceBarGraphicsItemRightExtensionWidth 
+
+        # PriceBarChartSettings last loaded, for creating
+        # PriceBarGraphicsItems drawn like this item.
+        self.priceBarChartSettings = None
+
+        # Color setting for a PriceBar that has a higher close than open.
+        self.higherPriceBarColor = \
+            SettingsKeys.higherPriceBarColorSettingsDefValue
+
+        # Color setting for a PriceBar that has a lower close than open.
+        self.lowerPriceBarColor = \
+            SettingsKeys.lowerPriceBarColorSettingsDefValue
+
+        # Pens used to paint the PriceBars with a higher close than
+        # open, and with a lower close than open.
+        self.higherPen = QPen()
+        self.lowerPen = QPen()
+
+        # PriceBars, sorted by scene X position.
+        self.priceBars = []
+
+        # Scene X positions and prices of the PriceBars, by index
+        # into self.priceBars.
+        self.xs = array.array('d')
+        self.opens = array.array('d')
+        self.highs = array.array('d')
+        self.lows = array.array('d')
+        self.closes = array.array('d')
+
+        # Indexes into self.priceBars, keyed by the id() of the PriceBar.
+        self.indexesByPriceBarId = {}
+
+        # Indexes of the PriceBars that are not painted by this item.
+        self.excludedIndexes = set()
+
+        # Levels of detail, for painting when many PriceBars fall on
+        # one pixel column.  Level k aggregates 2**k consecutive
+        # PriceBars, and is stored at index k - 1.  See
+        # _buildLevelsOfDetail().
+        self.levelsOfDetail = []
+
+        # Level of detail painted.  Level 0 paints every PriceBar.
+        self.levelOfDetail = 0
+
+        # Bounding rectangle of all the PriceBars.
+        self.rect = QRectF()
+
+        # Only the exposed rectangle is painted.
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+
+        # Read the QSettings preferences for the various parameters of
+        # the price bars.
+        self.loadSettingsFromAppPreferences()
+
+    def loadSettingsFromPriceBarChartSettings(self, priceBarChartSettings):
+        """Reads some of the parameters/settings of this
+        PriceBarLayerGraphicsItem from the given PriceBarChartSettings
+        object.
+        """
+
+        self.priceBarChartSettings = priceBarChartSettings
+
+        # priceBarGraphicsItemPenWidth (float).
+        self.penWidth = priceBarChartSettings.priceBarGraphicsItemPenWidth
+
+        # priceBarGraphicsItemLeftExtensionWidth (float).
+        self.leftExtensionWidth = \
+            priceBarChartSettings.priceBarGraphicsItemLeftExtensionWidth
+
+        # priceBarGraphicsItemRightExtensionWidth (float).
+        self.rightExtensionWidth = \
+            priceBarChartSettings.priceBarGraphicsItemRightExtensionWidth
+
+        # Update the pens.
+        self.higherPen.setWidthF(self.penWidth)
+        self.lowerPen.setWidthF(self.penWidth)
+
+        # Schedule an update.
+        self._updateBoundingRect()
+        self.update()
+
+    def getPriceBarChartSettings(self):
+        """Returns the PriceBarChartSettings last loaded, or the
+        default PriceBarChartSettings if none were loaded.
+        """
+
+        if self.priceBarChartSettings == None:
+            self.priceBarChartSettings = PriceBarChartSettings()
+
+        return self.priceBarChartSettings
+
+    def loadSettingsFromAppPreferences(self):
+        """Reads some of the parameters/settings of this
+        GraphicsItem from the QSettings object. 
+        """
+
+        settings = QSettings()
+
+        # higherPriceBarColor
+        key = SettingsKeys.higherPriceBarColorSettingsKey
+        defaultValue = \
+            SettingsKeys.higherPriceBarColorSettingsDefValue
+        self.higherPriceBarColor = \
+            settings.value(key, defaultValue, type=QColor)
+
+        # lowerPriceBarColor
+        key = SettingsKeys.lowerPriceBarColorSettingsKey
+        defaultValue = \
+            SettingsKeys.lowerPriceBarColorSettingsDefValue
+        self.lowerPriceBarColor = \
+            settings.value(key, defaultValue, type=QColor)
+
+        self.higherPen = QPen(self.higherPriceBarColor)
+        self.higherPen.setWidthF(self.penWidth)
+        self.lowerPen = QPen(self.lowerPriceBarColor)
+        self.lowerPen.setWidthF(self.penWidth)
+
+        self.update()
+
+    def setPriceBars(self, priceBars):
+        """Sets the PriceBars drawn by this item.  Indexes of PriceBars
+        obtained before this call are no longer valid, and no PriceBar
+        is excluded from the painting afterwards.
+
+        Arguments:
+        priceBars - list of PriceBar objects, in any order.
+        """
+
+        self.log.debug("Entered setPriceBars({} pricebars)".\
+                       format(len(priceBars)))
+
+        scene = self.scene()
+
+        xsAndPriceBars = \
+            [(scene.datetimeToSceneXPos(pb.timestamp), pb) for pb in priceBars]
+        xsAndPriceBars.sort(key=lambda x: x[0])
+
+        self.priceBars = [pb for (x, pb) in xsAndPriceBars]
+
+        self.xs = array.array('d', [x for (x, pb) in xsAndPriceBars])
+        self.opens = array.array('d', [pb.open for pb in self.priceBars])
+        self.highs = array.array('d', [pb.high for pb in self.priceBars])
+        self.lows = array.array('d', [pb.low for pb in self.priceBars])
+        self.closes = array.array('d', [pb.close for pb in self.priceBars])
+
+        self.indexesByPriceBarId = {}
+        self._updateIndexesByPriceBarId(0, len(self.priceBars))
+
+        self.excludedIndexes = set()
+
+        self.levelsOfDetail = []
+        self._buildLevelsOfDetail()
+
+        self._updateBoundingRect()
+        self.update()
+
+        self.log.debug("Leaving setPriceBars()")
+
+    def getPriceBars(self):
+        """Returns the list of PriceBars drawn by this item, sorted by
+        timestamp.  The list must not be modified.
+        """
+
+        return self.priceBars
+
+    def getNumPriceBars(self):
+        """Returns the number of PriceBars drawn by this item."""
+
+        return len(self.priceBars)
+
+    def getPriceBar(self, index):
+        """Returns the PriceBar at the given index."""
+
+        return self.priceBars[index]
+
+    def getIndexOfPriceBar(self, priceBar):
+        """Returns the index of the given PriceBar object, or None if
+        it is not drawn by this item.
+        """
+
+        return self.indexesByPriceBarId.get(id(priceBar))
+
+    def removePriceBar(self, index):
+        """Removes the PriceBar at the given index.  The indexes of the
+        PriceBars after it decrease by one.
+        """
+
+        self.update(self._getPriceBarRect(index))
+
+        priceBar = self.priceBars.pop(index)
+        for values in (self.xs, self.opens, self.highs, self.lows,
+                       self.closes):
+            del values[index]
+
+        del self.indexesByPriceBarId[id(priceBar)]
+        self._updateIndexesByPriceBarId(index, len(self.priceBars))
+
+        self.excludedIndexes = \
+            set((i if i < index else i - 1) \
+                for i in self.excludedIndexes if i != index)
+
+        self._buildLevelsOfDetail(index)
+
+        self._updateBoundingRect()
+
+    def updatePriceBar(self, index):
+        """Updates the scene X position and the prices of the PriceBar
+        at the given index, after they were modified.  The PriceBar is
+        moved to the index that keeps the PriceBars sorted by X, so the
+        indexes of the PriceBars between its old and new index change
+        by one.
+
+        Returns:
+        int value for the new index of the PriceBar.
+        """
+
+        self.update(self._getPriceBarRect(index))
+
+        priceBar = self.priceBars[index]
+        x = self.scene().datetimeToSceneXPos(priceBar.timestamp)
+
+        if (index > 0 and self.xs[index - 1] > x) or \
+           (index < len(self.xs) - 1 and self.xs[index + 1] < x):
+
+            del self.priceBars[index]
+            for values in (self.xs, self.opens, self.highs, self.lows,
+                           self.closes):
+                del values[index]
+
+            newIndex = bisect.bisect_right(self.xs, x)
+
+            self.priceBars.insert(newIndex, priceBar)
+            for values in (self.xs, self.opens, self.highs, self.lows,
+                           self.closes):
+                values.insert(newIndex, 0.0)
+        else:
+            newIndex = index
+
+        self.xs[newIndex] = x
+        self.opens[newIndex] = priceBar.open
+        self.highs[newIndex] = priceBar.high
+        self.lows[newIndex] = priceBar.low
+        self.closes[newIndex] = priceBar.close
+
+        startIndex = min(index, newIndex)
+        endIndex = max(index, newIndex) + 1
+
+        self._updateIndexesByPriceBarId(startIndex, endIndex)
+
+        if newIndex != index:
+            shift = 1 if newIndex < index else -1
+            excludedIndexes = set()
+            for i in self.excludedIndexes:
+                if i == index:
+                    i = newIndex
+                elif startIndex <= i < endIndex:
+                    i += shift
+                excludedIndexes.add(i)
+            self.excludedIndexes = excludedIndexes
+
+        self._buildLevelsOfDetail(startIndex, endIndex)
+
+        self._updateBoundingRect()
+        self.update(self._getPriceBarRect(newIndex))
+
+        return newIndex
+
+    def _updateIndexesByPriceBarId(self, startIndex, endIndex):
+        """Sets the entries of self.indexesByPriceBarId for the
+        PriceBars from 'startIndex' up to, but not including,
+        'endIndex'.
+        """
+
+        for i in range(startIndex, endIndex):
+            self.indexesByPriceBarId[id(self.priceBars[i])] = i
+
+    def getIndexRange(self, startX, endX):
+        """Returns the range of indexes of the PriceBars with a scene
+        X position between 'startX' and 'endX', inclusive.
+
+        Returns:
+        tuple (startIndex, endIndex), where endIndex is one past the
+        index of the last PriceBar in the range.
+        """
+
+        return (bisect.bisect_left(self.xs, startX),
+                bisect.bisect_right(self.xs, endX))
+
+    def getPriceBarIndexAt(self, pointF):
+        """Returns the index of the PriceBar that is drawn at the given
+        point, or None if there is none.  If more than one PriceBar is
+        drawn at the point, the one closest in X is returned.
+
+        Arguments:
+        pointF - QPointF in scene coordinates.
+        """
+
+        halfPenWidth = self.penWidth * 0.5
+        x = pointF.x()
+        y = pointF.y()
+
+        # The open tick extends to the left of the bar, and the close
+        # tick to the right.
+        (startIndex, endIndex) = \
+            self.getIndexRange(x - self.rightExtensionWidth - halfPenWidth,
+                               x + self.leftExtensionWidth + halfPenWidth)
+
+        rv = None
+        smallestDistance = None
+
+        for i in range(startIndex, endIndex):
+            if -1.0 * self.highs[i] - halfPenWidth <= y <= \
+               -1.0 * self.lows[i] + halfPenWidth:
+
+                distance = abs(x - self.xs[i])
+                if smallestDistance == None or distance < smallestDistance:
+                    rv = i
+                    smallestDistance = distance
+
+        return rv
+
+    def getPriceBarIndexesInRect(self, rectF):
+        """Returns the list of indexes of the PriceBars that are drawn
+        within or across the given rectangle.
+
+        Arguments:
+        rectF - QRectF in scene coordinates.
+        """
+
+        halfPenWidth = self.penWidth * 0.5
+        rectF = rectF.normalized()
+
+        (startIndex, endIndex) = \
+            self.getIndexRange(\
+                rectF.left() - self.rightExtensionWidth - halfPenWidth,
+                rectF.right() + self.leftExtensionWidth + halfPenWidth)
+
+        return [i for i in range(startIndex, endIndex) \
+                if -1.0 * self.highs[i] - halfPenWidth <= rectF.bottom() and \
+                   -1.0 * self.lows[i] + halfPenWidth >= rectF.top()]
+
+    def getPriceBarOpenScenePoint(self, index):
+        """Returns the QPointF in scene coordinates of the open of the
+        PriceBar at the given index.
+        """
+
+        return QPointF(self.xs[index], -1.0 * self.opens[index])
+
+    def getPriceBarHighScenePoint(self, index):
+        """Returns the QPointF in scene coordinates of the high of the
+        PriceBar at the given index.
+        """
+
+        return QPointF(self.xs[index], -1.0 * self.highs[index])
+
+    def getPriceBarLowScenePoint(self, index):
+        """Returns the QPointF in scene coordinates of the low of the
+        PriceBar at the given index.
+        """
+
+        return QPointF(self.xs[index], -1.0 * self.lows[index])
+
+    def getPriceBarCloseScenePoint(self, index):
+        """Returns the QPointF in scene coordinates of the close of the
+        PriceBar at the given index.
+        """
+
+        return QPointF(self.xs[index], -1.0 * self.closes[index])
+
+    def setPriceBarExcluded(self, index, excludedFlag):
+        """Sets whether the PriceBar at the given index is painted by
+        this item.  PriceBars that have their own PriceBarGraphicsItem
+        are excluded.
+        """
+
+        if excludedFlag == True:
+            self.excludedIndexes.add(index)
+        else:
+            self.excludedIndexes.discard(index)
+
+        self.update(self._getPriceBarRect(index))
+
+    def _getPriceBarRect(self, index):
+        """Returns the QRectF in scene coordinates that the PriceBar at
+        the given index is painted within.
+        """
+
+        halfPenWidth = self.penWidth * 0.5
+        x = self.xs[index]
+
+        return QRectF(QPointF(x - self.leftExtensionWidth - halfPenWidth,
+                              -1.0 * self.highs[index] - halfPenWidth),
+                      QPointF(x + self.rightExtensionWidth + halfPenWidth,
+                              -1.0 * self.lows[index] + halfPenWidth))
+
+    def _buildLevelsOfDetail(self, startIndex=0, endIndex=None):
+        """Builds self.levelsOfDetail from the PriceBar arrays.
+
+        Each level pairs up the buckets of the level below it.  A
+        bucket holds the scene X positions of its first and last
+        PriceBar, the open of the first PriceBar, the highest high,
+        the lowest low, and the close of the last PriceBar.  Levels
+        are built until a level has a single bucket.
+
+        Only the buckets that hold the PriceBars from 'startIndex' up
+        to, but not including, 'endIndex' are rebuilt, and the other
+        buckets are kept.  If 'endIndex' is None, the buckets of all
+        the PriceBars from 'startIndex' on are rebuilt, and the number
+        of PriceBars may have changed since the last build.  Otherwise
+        it must not have.
+        """
+
+        firstXs = self.xs
+        lastXs = self.xs
+        opens = self.opens
+        highs = self.highs
+        lows = self.lows
+        closes = self.closes
+
+        levelIndex = 0
+
+        while len(firstXs) > 1:
+            # Range of the buckets of this level that are rebuilt.
+            if levelIndex < len(self.levelsOfDetail):
+                startIndex //= 2
+                if endIndex != None:
+                    endIndex = (endIndex + 1) // 2
+            else:
+                startIndex = 0
+                endIndex = None
+
+            # Range of the buckets of the level below that they hold.
+            start = 2 * startIndex
+            if endIndex == None:
+                end = len(firstXs)
+            else:
+                end = min(2 * endIndex, len(firstXs))
+
+            # The last bucket holds a single bucket of the level below
+            # if there is an odd number of them.
+            oddFlag = ((end - start) % 2 == 1)
+
+            buckets = {}
+            buckets["firstXs"] = firstXs[start:end:2]
+            buckets["lastXs"] = lastXs[start + 1:end:2]
+            buckets["opens"] = opens[start:end:2]
+            buckets["highs"] = \
+                array.array('d', map(max,
+                                     highs[start:end:2],
+                                     highs[start + 1:end:2]))
+            buckets["lows"] = \
+                array.array('d', map(min,
+                                     lows[start:end:2],
+                                     lows[start + 1:end:2]))
+            buckets["closes"] = closes[start + 1:end:2]
+
+            if oddFlag == True:
+                buckets["lastXs"].append(lastXs[end - 1])
+                buckets["highs"].append(highs[end - 1])
+                buckets["lows"].append(lows[end - 1])
+                buckets["closes"].append(closes[end - 1])
+
+            if levelIndex < len(self.levelsOfDetail):
+                level = self.levelsOfDetail[levelIndex]
+                for (key, values) in buckets.items():
+                    if endIndex == None:
+                        del level[key][startIndex:]
+                        level[key].extend(values)
+                    else:
+                        level[key][startIndex:endIndex] = values
+            else:
+                level = buckets
+                self.levelsOfDetail.append(level)
+
+            firstXs = level["firstXs"]
+            lastXs = level["lastXs"]
+            opens = level["opens"]
+            highs = level["highs"]
+            lows = level["lows"]
+            closes = level["closes"]
+
+            levelIndex += 1
+
+        del self.levelsOfDetail[levelIndex:]
+
+        self.levelOfDetail = min(self.levelOfDetail, len(self.levelsOfDetail))
+
+    def getNumLevelsOfDetail(self):
+        """Returns the number of levels of detail that can be painted,
+        including level 0, which paints every PriceBar.
+        """
+
+        return len(self.levelsOfDetail) + 1
+
+    def getLevelOfDetailForSceneWidthPerPixel(self, sceneWidthPerPixel):
+        """Returns the level of detail whose buckets are at most one
+        pixel wide on average, when a pixel column is
+        'sceneWidthPerPixel' wide in scene coordinates.  Level 0 is
+        returned if fewer than 2 PriceBars fall on a pixel column.
+        """
+
+        numPriceBars = len(self.priceBars)
+        if numPriceBars < 2:
+            return 0
+
+        # Average scene distance between PriceBars.
+        priceBarSpacing = (self.xs[-1] - self.xs[0]) / (numPriceBars - 1)
+        if priceBarSpacing <= 0.0:
+            return 0
+
+        numPriceBarsPerPixel = sceneWidthPerPixel / priceBarSpacing
+        if numPriceBarsPerPixel < 2.0:
+            return 0
+
+        return min(int(math.log(numPriceBarsPerPixel, 2)),
+                   len(self.levelsOfDetail))
+
+    def setLevelOfDetail(self, levelOfDetail):
+        """Sets the level of detail painted.  Level 0 paints every
+        PriceBar with its open and close ticks.  Level k paints a
+        stem from the lowest low to the highest high of every 2**k
+        consecutive PriceBars.
+        """
+
+        levelOfDetail = max(0, min(levelOfDetail, len(self.levelsOfDetail)))
+
+        if self.levelOfDetail != levelOfDetail:
+            self.log.debug("Level of detail changed from {} to {}.".\
+                           format(self.levelOfDetail, levelOfDetail))
+            
+            self.levelOfDetail = levelOfDetail
+            self.update()
+
+    def getLevelOfDetail(self):
+        """Returns the level of detail painted."""
+
+        return self.levelOfDetail
+
+    def _updateBoundingRect(self):
+        """Recalculates the bounding rectangle of all the PriceBars."""
+
+        self.prepareGeometryChange()
+
+        if len(self.priceBars) == 0:
+            self.rect = QRectF()
+            return
+
+        halfPenWidth = self.penWidth * 0.5
+
+        x1 = self.xs[0] - self.leftExtensionWidth - halfPenWidth
+        x2 = self.xs[-1] + self.rightExtensionWidth + halfPenWidth
+        y1 = -1.0 * max(self.highs) - halfPenWidth
+        y2 = -1.0 * min(self.lows) + halfPenWidth
+
+        self.rect = QRectF(QPointF(x1, y1), QPointF(x2, y2))
+
+    def boundingRect(self):
+        """Returns the bounding rectangle for this graphicsitem."""
+
+        return self.rect
+
+    def paint(self, painter, option, widget):
+        """Paints the PriceBars within the exposed rectangle.  At level
+        of detail 0, they are painted like PriceBarGraphicsItem.paint()
+        would paint each of them.  At higher levels, only the stem of
+        each bucket of PriceBars is painted.
+        """
+
+        exposedRect = option.exposedRect
+
+        # QGraphicsView.render() exposes the whole item, so also limit
+        # the painting to what lands on the paint device.
+        device = painter.device()
+        (inverseTransform, invertible) = painter.deviceTransform().inverted()
+        if device != None and invertible == True:
+            deviceRect = QRectF(0, 0, device.width(), device.height())
+            exposedRect = \
+                exposedRect.intersected(inverseTransform.mapRect(deviceRect))
+
+        halfPenWidth = self.penWidth * 0.5
+
+        startX = exposedRect.left() - self.rightExtensionWidth - halfPenWidth
+        endX = exposedRect.right() + self.leftExtensionWidth + halfPenWidth
+
+        higherLines = []
+        lowerLines = []
+
+        if self.levelOfDetail == 0:
+            self._appendPriceBarLines(startX, endX, higherLines, lowerLines)
+        else:
+            self._appendBucketLines(startX, endX, higherLines, lowerLines)
+
+        if len(higherLines) > 0:
+            painter.setPen(self.higherPen)
+            painter.drawLines(higherLines)
+
+        if len(lowerLines) > 0:
+            painter.setPen(self.lowerPen)
+            painter.drawLines(lowerLines)
+
+    def _appendPriceBarLines(self, startX, endX, higherLines, lowerLines):
+        """Appends the QLineFs of the PriceBars with a scene X position
+        between 'startX' and 'endX' to 'higherLines' or 'lowerLines',
+        depending on their color.
+        """
+
+        (startIndex, endIndex) = self.getIndexRange(startX, endX)
+
+        leftExtensionWidth = self.leftExtensionWidth
+        rightExtensionWidth = self.rightExtensionWidth
+        excludedIndexes = self.excludedIndexes
+
+        for i in range(startIndex, endIndex):
+            if i in excludedIndexes:
+                continue
+
+            x = self.xs[i]
+            yOpen = -1.0 * self.opens[i]
+            yClose = -1.0 * self.closes[i]
+
+            if self.opens[i] <= self.closes[i]:
+                lines = higherLines
+            else:
+                lines = lowerLines
+
+            # Stem, left extension (open price), and right extension
+            # (close price).
+            lines.append(QLineF(x, -1.0 * self.lows[i],
+                                x, -1.0 * self.highs[i]))
+            lines.append(QLineF(x, yOpen, x - leftExtensionWidth, yOpen))
+            lines.append(QLineF(x, yClose, x + rightExtensionWidth, yClose))
+
+    def _appendBucketLines(self, startX, endX, higherLines, lowerLines):
+        """Appends the QLineFs of the stems of the buckets of the
+        current level of detail that overlap the scene X positions
+        between 'startX' and 'endX' to 'higherLines' or 'lowerLines',
+        depending on their color.
+
+        PriceBars with their own PriceBarGraphicsItem are not excluded
+        here, since they are aggregated with the PriceBars next to them.
+        """
+
+        level = self.levelsOfDetail[self.levelOfDetail - 1]
+
+        firstXs = level["firstXs"]
+        lastXs = level["lastXs"]
+        opens = level["opens"]
+        highs = level["highs"]
+        lows = level["lows"]
+        closes = level["closes"]
+
+        startIndex = bisect.bisect_left(lastXs, startX)
+        endIndex = bisect.bisect_right(firstXs, endX)
+
+        for i in range(startIndex, endIndex):
+            if opens[i] <= closes[i]:
+                lines = higherLines
+            else:
+                lines = lowerLines
+
+            x = (firstXs[i] + lastXs[i]) * 0.5
+            lines.append(QLineF(x, -1.0 * lows[i], x, -1.0 * highs[i]))
+        
+
 class LookbackMultiplePriceBarGraphicsItem(QGraphicsItem):
     """QGraphicsItem that visualizes a LookbackMultiplePriceBar object.
 
@@ -1169,6 +1895,7 @@ class LookbackMultiplePriceBarGraphicsItem(QGraphicsItem):
         scene = self.scene()
         if scene != None:
             scene.removeItem(self)
+            scene.clearCachedLookbackMultiplePriceBarIndex()
             scene.priceBarChartChanged.emit()
 
     def _handleInfoAction(self):
@@ -2225,9 +2952,6 @@ class BarCountGraphicsItem(PriceBarChartArtifactGraphicsItem):
         if scene == None:
             self.barCount = 0
         else:
-            # Get all the QGraphicsItems.
-            graphicsItems = scene.items()
-
             # Reset the bar count.
             self.barCount = 0
 
@@ -2235,21 +2959,12 @@ class BarCountGraphicsItem(PriceBarChartArtifactGraphicsItem):
             if self.startPointF.x() == self.endPointF.x():
                 self.barCount = 0
             else:
-                # Go through the PriceBarGraphicsItems and count the ones in
-                # between self.startPointF and self.endPointF.
-                for item in graphicsItems:
-                    if isinstance(item, PriceBarGraphicsItem):
-
-                        x = item.getPriceBarHighScenePoint().x()
-
-                        # Here we check for the bar being in between
-                        # the self.startPointF and the self.endPointF.
-                        # This handles the case when the start and end
-                        # points are reversed also.
-                        if (self.startPointF.x() < x <= self.endPointF.x()) or \
-                           (self.endPointF.x() < x <= self.startPointF.x()):
-                            
-                            self.barCount += 1
+                # Count the PriceBars in between self.startPointF and
+                # self.endPointF.  This handles the case when the
+                # start and end points are reversed also.
+                self.barCount = \
+                    scene.getNumPriceBarsInSceneXRange(self.startPointF.x(),
+                                                       self.endPointF.x())
                             
 
         # Update the text of the self.barCountText.
@@ -3723,24 +4438,12 @@ class TimeMeasurementGraphicsItem(PriceBarChartArtifactGraphicsItem):
         self.numSqrdSama = 0.0
         
         if scene != None:
-            # Get all the QGraphicsItems.
-            graphicsItems = scene.items()
-
-            # Go through the PriceBarGraphicsItems and count the bars in
-            # between self.startPointF and self.endPointF.
-            for item in graphicsItems:
-                if isinstance(item, PriceBarGraphicsItem):
-
-                    x = item.getPriceBarHighScenePoint().x()
-
-                    # Here we check for the bar being in between
-                    # the self.startPointF and the self.endPointF.
-                    # This handles the case when the start and end
-                    # points are reversed also.
-                    if (self.startPointF.x() < x <= self.endPointF.x()) or \
-                       (self.endPointF.x() < x <= self.startPointF.x()):
-
-                        self.numPriceBars += 1
+            # Count the bars in between self.startPointF and
+            # self.endPointF.  This handles the case when the start
+            # and end points are reversed also.
+            self.numPriceBars = \
+                scene.getNumPriceBarsInSceneXRange(self.startPointF.x(),
+                                                   self.endPointF.x())
         
             # Calculate the number of (calendar) days.
             startTimestamp = \
@@ -41187,6 +41890,14 @@ class PriceBarChartWidget(QWidget):
                 "HorizontalLineSegmentTool": 33,
                 }
 
+    # Time in milliseconds after the last scroll or zoom of the view,
+    # before the LookbackMultiplePriceBars are redrawn.
+    lookbackMultipleRedrawDelayMsec = 300
+
+    # LookbackMultipleCalcJobs whose threads may still be running.
+    # References are kept here until the threads finish, even if the
+    # PriceBarChartWidget that started them is destroyed first.
+    lookbackMultipleCalcJobsRunning = []
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -41333,6 +42044,75 @@ class PriceBarChartWidget(QWidget):
             connect(self.jhoraLaunch)
         self.graphicsScene.astrologLaunch.\
             connect(self.astrologLaunch)
+
+        # LookbackMultiples last given to drawLookbackMultiplePriceBars(),
+        # for redrawing them when the view is scrolled or zoomed.  This
+        # is None when there are no LookbackMultiplePriceBars drawn.
+        self.lookbackMultiplesToRedraw = None
+
+        # Dict of id(LookbackMultiple) to the dict holding what is
+        # drawn for that LookbackMultiple.  See
+        # drawLookbackMultiplePriceBars().
+        self.lookbackMultipleDrawStates = {}
+
+        # Timer for redrawing the LookbackMultiplePriceBars once the
+        # view stops being scrolled or zoomed.
+        self.lookbackMultipleRedrawTimer = QTimer(self)
+        self.lookbackMultipleRedrawTimer.setSingleShot(True)
+        self.lookbackMultipleRedrawTimer.\
+            setInterval(PriceBarChartWidget.lookbackMultipleRedrawDelayMsec)
+        self.lookbackMultipleRedrawTimer.timeout.\
+            connect(self._handleLookbackMultipleRedrawTimerTimeout)
+
+        # LookbackMultipleCalcJob calculating the
+        # LookbackMultiplePriceBars of the last call to
+        # drawLookbackMultiplePriceBars(), or None.  Its results are
+        # drawn as they arrive.
+        self.lookbackMultipleCalcJob = None
+
+        # Id of the last LookbackMultipleCalcJob started.  Results of
+        # other jobs are ignored.
+        self.lookbackMultipleCalcJobId = 0
+
+        # List with an entry for each argument tuple of
+        # self.lookbackMultipleCalcJob.  Each entry is the tuple
+        # (drawState, PriceBar) to draw the result for.
+        self.lookbackMultipleCalcJobTargets = []
+
+        # List of tuples (drawState, startDt, endDt) of the ranges
+        # that are drawn once self.lookbackMultipleCalcJob completes.
+        self.lookbackMultipleCalcJobRanges = []
+
+        # Argument tuples of self.lookbackMultipleCalcJob, for
+        # caching its results.
+        self.lookbackMultipleCalcJobArgsTupleList = []
+
+        # LookbackMultipleResultCache variant of the results of
+        # self.lookbackMultipleCalcJob.
+        self.lookbackMultipleCalcJobCacheVariant = ""
+
+        # Path of the file of the LookbackMultipleResultCache, or None
+        # if results are not cached.  See
+        # setLookbackMultipleResultCacheFilename().
+        self.lookbackMultipleResultCacheFilename = None
+
+        # LookbackMultipleResultCache opened for
+        # self.lookbackMultipleResultCacheFilename, or None if it is
+        # not opened yet.
+        self.lookbackMultipleResultCache = None
+
+        # Path of the PriceChartDocument file that the
+        # LongitudeTimelines of the planets are kept next to, or None.
+        # See setLongitudeTimelineDocumentFilename().
+        self.longitudeTimelineDocumentFilename = None
+
+        # Zooming changes the ranges of the scroll bars.
+        for scrollBar in [self.graphicsView.horizontalScrollBar(),
+                          self.graphicsView.verticalScrollBar()]:
+            scrollBar.valueChanged.\
+                connect(self._handleGraphicsViewScrolledOrZoomed)
+            scrollBar.rangeChanged.\
+                connect(self._handleGraphicsViewScrolledOrZoomed)
         
         self.log.debug("Leaving __init__()")
 
@@ -41499,35 +42279,17 @@ class PriceBarChartWidget(QWidget):
 
 
     def loadPriceBars(self, priceBars):
-        """Loads the given PriceBars list into this widget as
-        PriceBarGraphicsItems.
+        """Loads the given PriceBars list into this widget.  The
+        PriceBars are drawn by the PriceBarLayerGraphicsItem of the
+        scene, and PriceBarGraphicsItems are only created for the
+        PriceBars the user interacts with.
         """
         
         self.log.debug("Entered loadPriceBars({} pricebars)".\
                        format(len(priceBars)))
 
-        for priceBar in priceBars:
-
-            # Create the QGraphicsItem
-            item = PriceBarGraphicsItem()
-            item.loadSettingsFromPriceBarChartSettings(\
-                self.priceBarChartSettings)
-            item.setPriceBar(priceBar)
-
-            # Add the item.
-            self.graphicsScene.addItem(item)
-
-            # Make sure the proper flags are set for the mode we're in.
-            self.graphicsView.setGraphicsItemFlagsPerCurrToolMode(item)
-
-            # X location based on the timestamp.
-            x = self.graphicsScene.datetimeToSceneXPos(priceBar.timestamp)
-
-            # Y location based on the mid price (average of high and low).
-            y = self.graphicsScene.priceToSceneYPos(priceBar.midPrice())
-
-            # Set the position, in parent coordinates.
-            item.setPos(QPointF(x, y))
+        self.graphicsScene.loadPriceBars(priceBars,
+                                         self.priceBarChartSettings)
 
         # Set the labels for the timestamps of the first and 
         # last pricebars.
@@ -41553,14 +42315,7 @@ class PriceBarChartWidget(QWidget):
         """Clears all the PriceBar QGraphicsItems from the 
         QGraphicsScene."""
 
-        # Get all the QGraphicsItems.
-        graphicsItems = self.graphicsScene.items()
-
-        # Only remove the PriceBarGraphicsItem items.
-        for item in graphicsItems:
-            if isinstance(item, PriceBarGraphicsItem):
-                if item.scene() != None:
-                    self.graphicsScene.removeItem(item)
+        self.graphicsScene.clearPriceBars()
 
         # Update the labels describing the pricebarchart.
         self.updateFirstPriceBarTimestampLabel(None)
@@ -42260,6 +43015,28 @@ class PriceBarChartWidget(QWidget):
         These are only drawn for the currently visible area of the 
         QGraphicsScene.
 
+        The drawing is incremental.  For each LookbackMultiple, the
+        range of historic PriceBar timestamps that already have their
+        LookbackMultiplePriceBarGraphicsItems in the QGraphicsScene is
+        tracked.  Only the historic PriceBars in the part of the range
+        needed for the current view that is not drawn yet are
+        calculated, and the LookbackMultiplePriceBarGraphicsItems of
+        historic PriceBars far outside of the needed range are
+        removed.  Calling clearAllLookbackMultiplePriceBars() first
+        causes a full redraw.
+
+        The calculations for the historic PriceBars are done in the
+        background by a LookbackMultipleCalcJob (except for the
+        remote parallel calculation model), and the
+        LookbackMultiplePriceBarGraphicsItems are added as the results
+        arrive.  Calling this method again, or calling
+        clearAllLookbackMultiplePriceBars(), cancels the calculations
+        still in progress.  The results that already arrived are kept.
+
+        If enabled in QSettings, this method is called again with the
+        same 'lookbackMultiples' after the QGraphicsView is scrolled
+        or zoomed, until clearAllLookbackMultiplePriceBars() is called.
+
         Note: This drawing does not cause a priceBarChartChanged signal
         to be emitted.  That is because LookbackMultiplePriceBars are
         transient and are not persisted.  They get redrawn frequently, 
@@ -42272,6 +43049,31 @@ class PriceBarChartWidget(QWidget):
         # Maximum error for calculation of LookbackMultiple results.
         maxErrorTd = datetime.timedelta(minutes=60)
         
+        # Remember the LookbackMultiples, for redrawing them when the
+        # view is scrolled or zoomed.
+        self.lookbackMultiplesToRedraw = lookbackMultiples
+
+        # What is still being calculated is for the previous view.
+        self._cancelLookbackMultipleCalcJob()
+
+        # Argument tuples for calculating the historic PriceBars of
+        # all the LookbackMultiples, and what to do with the results.
+        # See self.lookbackMultipleCalcJobTargets and
+        # self.lookbackMultipleCalcJobRanges.
+        jobArgsTupleList = []
+        jobTargets = []
+        jobRanges = []
+
+        # Remove the LookbackMultiplePriceBars of LookbackMultiples
+        # that are not drawn anymore.
+        enabledIds = [id(lookbackMultiple) \
+                      for lookbackMultiple in lookbackMultiples \
+                      if lookbackMultiple.getEnabled() == True]
+        for key in list(self.lookbackMultipleDrawStates.keys()):
+            if key not in enabledIds:
+                self._removeLookbackMultiplePriceBarsOutside(\
+                    self.lookbackMultipleDrawStates[key], None, None)
+                del self.lookbackMultipleDrawStates[key]
         
         # Set the birth location in the Ephemeris.
         #
@@ -42327,6 +43129,32 @@ class PriceBarChartWidget(QWidget):
                     self.log.debug("Processing LookbackMultiple: {}".\
                                    format(lookbackMultiple.toString()))
 
+            # Get what is already drawn for this LookbackMultiple.
+            # The state holds a reference to the LookbackMultiple, so
+            # its id cannot be reused by another object.
+            drawState = \
+                self.lookbackMultipleDrawStates.get(id(lookbackMultiple),
+                                                    None)
+            if drawState == None:
+                drawState = {
+                    # LookbackMultiple that is drawn.
+                    "lookbackMultiple" : lookbackMultiple,
+                    # Range of timestamps of the historic PriceBars
+                    # that are calculated and drawn, or None.
+                    "startDt" : None,
+                    "endDt" : None,
+                    # Dict of historic PriceBar timestamp to the list
+                    # of LookbackMultiplePriceBarGraphicsItems drawn
+                    # for that PriceBar.
+                    "items" : {},
+                    # Tuple of the arguments to
+                    # _scaleLookbackMultiplePriceBarPrice() that the
+                    # drawn items were scaled with.
+                    "scaling" : None,
+                    }
+                self.lookbackMultipleDrawStates[id(lookbackMultiple)] = \
+                    drawState
+
             # Extract needed information from the LookbackMultiple.
             planetName = lookbackMultiple.getPlanetName()
 
@@ -42387,8 +43215,10 @@ class PriceBarChartWidget(QWidget):
 
             # Compute results.
             resultsList = \
-                self._getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInPast(\
-                    argsTupleList)
+                self._getLookbackMultipleDatetimesUsingCache(\
+                    argsTupleList,
+                    -1,
+                    self._getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInPast)
             
             if len(resultsList) == 0:
                 # No results were returned.  This means an error happened
@@ -42431,27 +43261,36 @@ class PriceBarChartWidget(QWidget):
                 self.log.debug("endPriceBarSearchDt == {}".\
                     format(Ephemeris.datetimeToDayStr(endPriceBarSearchDt)))
 
+            # Remove the LookbackMultiplePriceBars of historic PriceBars
+            # that are more than one search range away from the
+            # search range.  If what is left is not next to the search
+            # range, then remove it all, so that the drawn range stays
+            # contiguous.
+            marginTd = endPriceBarSearchDt - startPriceBarSearchDt
+            self._removeLookbackMultiplePriceBarsOutside(\
+                drawState,
+                startPriceBarSearchDt - marginTd,
+                endPriceBarSearchDt + marginTd)
+            if drawState["startDt"] != None and \
+               (drawState["endDt"] < startPriceBarSearchDt or \
+                drawState["startDt"] > endPriceBarSearchDt):
+
+                self._removeLookbackMultiplePriceBarsOutside(drawState,
+                                                             None, None)
+
             # Get the PriceBars in time between startPriceBarSearchDt and
             # endPriceBarSearchDt.  Store these in list 'pbs'.
-            pbs = []
-
-            graphicsItems = self.graphicsScene.items()
-            for item in graphicsItems:
-                if isinstance(item, PriceBarGraphicsItem):
-                    pb = item.getPriceBar()
-                    dt = pb.timestamp
-                    if startPriceBarSearchDt <= dt <= endPriceBarSearchDt:
-                        # Found a PriceBar within our historic time range.
-                        pbs.append(pb)
-
-                        if self.log.isEnabledFor(logging.DEBUG) == True:
-                            debugStr = "Found a pricebar within " + \
-                                "our historic time range: {}".\
-                                format(Ephemeris.datetimeToDayStr(dt))
-                            self.log.debug(debugStr)
-
-            # Sort the PriceBars by ascending timestamp (earlier to later).
-            pbs.sort(key=lambda x: x.timestamp)
+            # These are sorted by ascending timestamp (earlier to later).
+            pbs = self.graphicsScene.\
+                getPriceBarsInDatetimeRange(startPriceBarSearchDt,
+                                            endPriceBarSearchDt)
+
+            if self.log.isEnabledFor(logging.DEBUG) == True:
+                for pb in pbs:
+                    debugStr = "Found a pricebar within " + \
+                        "our historic time range: {}".\
+                        format(Ephemeris.datetimeToDayStr(pb.timestamp))
+                    self.log.debug(debugStr)
             
             # Working variables that will be used later for scaling the
             # LookbackMultiplePriceBars to fit within the visible portion of
@@ -42475,6 +43314,46 @@ class PriceBarChartWidget(QWidget):
                                format(highestPriceBarPrice))
                 self.log.debug("lowestPriceBarPrice == {}".\
                                format(lowestPriceBarPrice))
+
+            if highestPriceBarPrice == None:
+                # No historic PriceBars to draw.
+                continue
+
+            scaling = (highestViewPrice,
+                       lowestViewPrice,
+                       highestPriceBarPrice,
+                       lowestPriceBarPrice)
+
+            # Rescale the LookbackMultiplePriceBars already drawn, if
+            # the visible price range or the price range of the
+            # historic PriceBars changed.
+            if drawState["scaling"] != scaling:
+                for items in drawState["items"].values():
+                    for item in items:
+                        self._scaleLookbackMultiplePriceBarGraphicsItem(\
+                            item, item.getLookbackMultiplePriceBar(), scaling)
+                drawState["scaling"] = scaling
+
+            # Only calculate the historic PriceBars that are not drawn
+            # yet.  Historic PriceBars outside of the drawn range can
+            # still have results from a cancelled calculation.
+            if drawState["startDt"] != None:
+                pbs = [pb for pb in pbs \
+                       if pb.timestamp < drawState["startDt"] or \
+                          pb.timestamp > drawState["endDt"]]
+
+                if self.log.isEnabledFor(logging.DEBUG) == True:
+                    self.log.debug("Already drawn: startDt={}, endDt={}".\
+                        format(Ephemeris.datetimeToDayStr(drawState["startDt"]),
+                               Ephemeris.datetimeToDayStr(drawState["endDt"])))
+
+            pbs = [pb for pb in pbs if pb.timestamp not in drawState["items"]]
+
+            if len(pbs) == 0:
+                self._extendLookbackMultipleDrawnRange(drawState,
+                                                       startPriceBarSearchDt,
+                                                       endPriceBarSearchDt)
+                continue
             
             # Calculate LookbackMultiple datetimes for each PriceBar's
             # timestamp.
@@ -42503,99 +43382,653 @@ class PriceBarChartWidget(QWidget):
                     "in the future for {} historic PriceBars ".\
                     format(len(pbs)) + \
                     "(startDt={}, endDt={}) ...".\
-                    format(Ephemeris.datetimeToDayStr(startPriceBarSearchDt),
-                           Ephemeris.datetimeToDayStr(endPriceBarSearchDt))
+                    format(Ephemeris.datetimeToDayStr(pbs[0].timestamp),
+                           Ephemeris.datetimeToDayStr(pbs[-1].timestamp))
                 self.log.info(infoMsg)
-            
-            # Compute results.
-            resultsList = \
-                self._getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture(\
-                    argsTupleList)
-    
-            if len(resultsList) == 0:
-                # No results were returned.  This means an error happened
-                # during calculation that was already logged.  Return without
-                # drawing any LookbackMultiplePriceBars.
-                return
-                
-            # Create the LookbackMultiplePriceBars for these historic
-            # PriceBars and store them in a list.
-            lmpbs = []
-            for i in range(len(pbs)):
-                
-                # Current PriceBar and it's LookbackMultiple datetimes 
-                # in the future.
-                pb = pbs[i]
-                resultDts = resultsList[i]
-                
-                # Create the LookbackMultiplePriceBar for each timestamp.
-                # The prices used in the LookbackMultiplePriceBars are 
-                # the underlying PriceBar's values scaled.
-                for dt in resultDts:
-                    lmpb = LookbackMultiplePriceBar(lookbackMultiple, pb)
-                    lmpb.timestamp = dt
-                    lmpb.open = \
-                        self._scaleLookbackMultiplePriceBarPrice(\
-                            highestViewPrice,
-                            lowestViewPrice,
-                            highestPriceBarPrice,
-                            lowestPriceBarPrice,
-                            priceBarPriceToScale=pb.open)
-                    lmpb.high = \
-                        self._scaleLookbackMultiplePriceBarPrice(\
-                            highestViewPrice,
-                            lowestViewPrice,
-                            highestPriceBarPrice,
-                            lowestPriceBarPrice,
-                            priceBarPriceToScale=pb.high)
-                    lmpb.low = \
-                        self._scaleLookbackMultiplePriceBarPrice(\
-                            highestViewPrice,
-                            lowestViewPrice,
-                            highestPriceBarPrice,
-                            lowestPriceBarPrice,
-                            priceBarPriceToScale=pb.low)
-                    lmpb.close = \
-                        self._scaleLookbackMultiplePriceBarPrice(\
-                            highestViewPrice,
-                            lowestViewPrice,
-                            highestPriceBarPrice,
-                            lowestPriceBarPrice,
-                            priceBarPriceToScale=pb.close)
-                    lmpb.oi = pb.oi
-                    lmpb.vol = pb.vol
-                    lmpb.tags = copy.deepcopy(pb.tags)
-
-                    # Append to our list of LookbackMultiplePriceBars.
-                    lmpbs.append(lmpb)
-
-            # Create and draw the LookbackMultiplePriceBarGraphicsItems for
-            # each of the LookbackMultiplePriceBars.
-            for lmpb in lmpbs:
-                # Create the QGraphicsItem.
-                item = LookbackMultiplePriceBarGraphicsItem()
-                item.loadSettingsFromPriceBarChartSettings(\
-                    self.priceBarChartSettings)
-                item.setLookbackMultiplePriceBar(lmpb)
 
-                # Add the item.
-                self.graphicsScene.addItem(item)
+            jobArgsTupleList.extend(argsTupleList)
+            jobTargets.extend([(drawState, pb) for pb in pbs])
+            jobRanges.append((drawState,
+                              startPriceBarSearchDt,
+                              endPriceBarSearchDt))
 
-                # Make sure the proper flags are set for the mode we're in.
-                self.graphicsView.setGraphicsItemFlagsPerCurrToolMode(item)
-    
-                # X location based on the timestamp.
-                x = self.graphicsScene.datetimeToSceneXPos(lmpb.timestamp)
-    
-                # Y location based on the mid price (average of high and low).
-                y = self.graphicsScene.priceToSceneYPos(lmpb.midPrice())
-    
-                # Set the position, in parent coordinates.
-                item.setPos(QPointF(x, y))
-        
+        if len(jobArgsTupleList) > 0:
+            # Compute results.  The LookbackMultiplePriceBars are
+            # drawn as the results arrive.
+            self._startLookbackMultipleCalcJob(jobArgsTupleList,
+                                               jobTargets,
+                                               jobRanges)
         
         self.log.debug("Exiting drawLookbackMultiplePriceBars()")
 
+    def _extendLookbackMultipleDrawnRange(self, drawState, startDt, endDt):
+        """Extends the range of historic PriceBar timestamps that are
+        calculated and drawn for the given draw state (see
+        drawLookbackMultiplePriceBars()) to include 'startDt' to
+        'endDt'.
+        """
+
+        if drawState["startDt"] == None:
+            drawState["startDt"] = startDt
+            drawState["endDt"] = endDt
+        else:
+            drawState["startDt"] = min(drawState["startDt"], startDt)
+            drawState["endDt"] = max(drawState["endDt"], endDt)
+
+    def _addLookbackMultiplePriceBarGraphicsItems(self,
+                                                  drawState,
+                                                  pb,
+                                                  resultDts):
+        """Creates and adds a LookbackMultiplePriceBarGraphicsItem for
+        each of the LookbackMultiple datetimes of a historic PriceBar,
+        scaled with the current scaling of the draw state (see
+        drawLookbackMultiplePriceBars()).
+
+        Arguments:
+        drawState - dict holding what is drawn for the LookbackMultiple.
+        pb        - historic PriceBar.
+        resultDts - list of datetime.datetime objects of the
+                    LookbackMultiple datetimes in the future of 'pb'.
+        """
+
+        lookbackMultiple = drawState["lookbackMultiple"]
+
+        items = []
+        
+        # Create the LookbackMultiplePriceBar for each timestamp.
+        # The prices used in the LookbackMultiplePriceBars are 
+        # the underlying PriceBar's values scaled.
+        for dt in resultDts:
+            lmpb = LookbackMultiplePriceBar(lookbackMultiple, pb)
+            lmpb.timestamp = dt
+            lmpb.oi = pb.oi
+            lmpb.vol = pb.vol
+            lmpb.tags = copy.deepcopy(pb.tags)
+
+            # Create the QGraphicsItem.
+            item = LookbackMultiplePriceBarGraphicsItem()
+            item.loadSettingsFromPriceBarChartSettings(\
+                self.priceBarChartSettings)
+
+            # Set the scaled prices, and the position.
+            self._scaleLookbackMultiplePriceBarGraphicsItem(item,
+                                                            lmpb,
+                                                            drawState["scaling"])
+
+            # Add the item.
+            self.graphicsScene.addItem(item)
+            self.graphicsScene.clearCachedLookbackMultiplePriceBarIndex()
+
+            # Make sure the proper flags are set for the mode we're in.
+            self.graphicsView.setGraphicsItemFlagsPerCurrToolMode(item)
+
+            items.append(item)
+
+        # An entry is made even if there are no items, so that the
+        # historic PriceBar is not calculated again.
+        drawState["items"].setdefault(pb.timestamp, []).extend(items)
+
+    def _startLookbackMultipleCalcJob(self,
+                                      argsTupleList,
+                                      targets,
+                                      ranges):
+        """Starts the calculations of the LookbackMultiple datetimes in
+        the future for historic PriceBars, for
+        drawLookbackMultiplePriceBars().
+
+        A LookbackMultipleCalcJob is started, and the results are
+        drawn as they arrive.  For the remote parallel calculation
+        model, the connection to the server is made first, in this
+        thread.
+
+        Arguments:
+        argsTupleList - List of tuple objects, as described in
+                        _getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture().
+        targets       - List of tuples (drawState, PriceBar), one
+                        for each tuple in 'argsTupleList'.
+        ranges        - List of tuples (drawState, startDt, endDt) of
+                        the ranges to mark as drawn once all the
+                        results are drawn.
+        """
+
+        # Obtain the QSettings value for the LookbackMultiple
+        # calculation model/architecture to use.
+        settings = QSettings()
+        key = SettingsKeys.lookbackMultipleCalcModelKey
+        calcModel = settings.value(key, \
+            SettingsKeys.lookbackMultipleCalcModelDefValue,
+            type=str)
+
+        self.lookbackMultipleCalcJobId += 1
+        jobId = self.lookbackMultipleCalcJobId
+
+        self._applyLookbackMultipleEphemerisInterpolatorEnabled(calcModel)
+        self.lookbackMultipleCalcJobCacheVariant = \
+            self._getLookbackMultipleResultCacheVariant(calcModel)
+
+        # Draw the results that are cached right away, and only
+        # calculate the others.
+        cache = self._getLookbackMultipleResultCache()
+        if cache != None:
+            cache.variant = self.lookbackMultipleCalcJobCacheVariant
+            cachedResultsList = cache.getMany(argsTupleList, 1)
+
+            missIndexes = []
+            for i in range(len(argsTupleList)):
+                if cachedResultsList[i] == None:
+                    missIndexes.append(i)
+                else:
+                    (drawState, pb) = targets[i]
+                    self._addLookbackMultiplePriceBarGraphicsItems(\
+                        drawState, pb, cachedResultsList[i])
+
+            if self.log.isEnabledFor(logging.DEBUG) == True:
+                self.log.debug("{} of {} results were cached.".\
+                    format(len(argsTupleList) - len(missIndexes),
+                           len(argsTupleList)))
+
+            argsTupleList = [argsTupleList[i] for i in missIndexes]
+            targets = [targets[i] for i in missIndexes]
+
+        self.lookbackMultipleCalcJobArgsTupleList = argsTupleList
+        self.lookbackMultipleCalcJobTargets = targets
+        self.lookbackMultipleCalcJobRanges = ranges
+
+        if len(argsTupleList) == 0:
+            self._handleLookbackMultipleCalcJobCalculationsFinished(\
+                jobId, True)
+            return
+
+        remoteClient = None
+        if calcModel == str(LookbackMultipleCalcModel.remote_parallel):
+            remoteClient = self._connectLookbackMultipleRemoteClient()
+
+            if remoteClient == None:
+                # The connection failed.  The error was already
+                # logged and shown.
+                self.lookbackMultipleCalcJobArgsTupleList = []
+                self.lookbackMultipleCalcJobTargets = []
+                self.lookbackMultipleCalcJobRanges = []
+                return
+
+        elif calcModel == str(LookbackMultipleCalcModel.hybrid_parallel):
+            # The job connects, so that an unreachable server does not
+            # hold up this thread.
+            remoteClient = self._createLookbackMultipleRemoteClient()
+
+        if calcModel == str(LookbackMultipleCalcModel.local_parallel) or \
+           calcModel == str(LookbackMultipleCalcModel.hybrid_parallel):
+            self._applyLookbackMultipleCalcNumProcesses()
+
+        job = LookbackMultipleCalcJob(\
+            self.lookbackMultipleCalcJobId,
+            calcModel,
+            argsTupleList,
+            1,
+            remoteClient,
+            self._getLongitudeTimelineDocumentFilename())
+        job.resultsReady.\
+            connect(self._handleLookbackMultipleCalcJobResultsReady)
+        job.calculationsFinished.\
+            connect(self._handleLookbackMultipleCalcJobCalculationsFinished)
+        job.finished.\
+            connect(self._handleLookbackMultipleCalcJobThreadFinished)
+
+        self.lookbackMultipleCalcJob = job
+        PriceBarChartWidget.lookbackMultipleCalcJobsRunning.append(job)
+
+        job.start()
+
+    def _applyLookbackMultipleCalcNumProcesses(self):
+        """Sets the number of processes of the LookbackMultipleParallel
+        pool to what is configured in QSettings.  The pool is only
+        restarted if the number changed.
+        """
+
+        settings = QSettings()
+        key = SettingsKeys.lookbackMultipleCalcNumProcessesKey
+        value = settings.value(key, \
+            SettingsKeys.lookbackMultipleCalcNumProcessesDefValue,
+            type=int)
+
+        LookbackMultipleParallel.setPoolSize(value)
+
+    def _isLookbackMultipleEphemerisInterpolatorEnabled(self, calcModel):
+        """Returns True if the LookbackMultiple calculations of the
+        given calculation model (LookbackMultipleCalcModel, expressed
+        as a str) get the planet longitudes from an
+        EphemerisInterpolator, as configured in QSettings.  Remote
+        calculations always call the Swiss Ephemeris.
+        """
+
+        if calcModel == str(LookbackMultipleCalcModel.remote_parallel):
+            return False
+
+        settings = QSettings()
+        key = SettingsKeys.lookbackMultipleEphemerisInterpolatorEnabledKey
+        return settings.value(key, \
+            SettingsKeys.lookbackMultipleEphemerisInterpolatorEnabledDefValue,
+            type=bool)
+
+    def _applyLookbackMultipleEphemerisInterpolatorEnabled(self, calcModel):
+        """Sets whether the local LookbackMultiple calculations get the
+        planet longitudes from an EphemerisInterpolator, to what is
+        configured in QSettings.  For the calculation models that use
+        the LookbackMultipleParallel pool, the pool is only restarted
+        if the setting changed.
+
+        Arguments:
+        calcModel - LookbackMultipleCalcModel of the calculations,
+                    expressed as a str.
+        """
+
+        enabled = \
+            self._isLookbackMultipleEphemerisInterpolatorEnabled(calcModel)
+
+        LookbackMultipleUtils.setEphemerisInterpolatorEnabled(enabled)
+
+        if calcModel == str(LookbackMultipleCalcModel.local_parallel) or \
+           calcModel == str(LookbackMultipleCalcModel.hybrid_parallel):
+            LookbackMultipleParallel.setEphemerisInterpolatorEnabled(enabled)
+
+    def _getLookbackMultipleResultCacheVariant(self, calcModel):
+        """Returns the LookbackMultipleResultCache variant of the
+        results of LookbackMultiple calculations with the given
+        calculation model (LookbackMultipleCalcModel, expressed as a
+        str): "interpolated" if they get the planet longitudes from an
+        EphemerisInterpolator, otherwise "".
+        """
+
+        if self._isLookbackMultipleEphemerisInterpolatorEnabled(calcModel):
+            return "interpolated"
+        else:
+            return ""
+
+    def _cancelLookbackMultipleCalcJob(self):
+        """Cancels the LookbackMultipleCalcJob in progress, if any.
+        Its results that are already drawn are kept.
+        """
+
+        if self.lookbackMultipleCalcJob != None:
+            self.log.debug("Cancelling LookbackMultipleCalcJob {}".\
+                           format(self.lookbackMultipleCalcJob.jobId))
+            self.lookbackMultipleCalcJob.cancel()
+            self.lookbackMultipleCalcJob = None
+
+        self.lookbackMultipleCalcJobArgsTupleList = []
+        self.lookbackMultipleCalcJobTargets = []
+        self.lookbackMultipleCalcJobRanges = []
+
+    def setLookbackMultipleResultCacheFilename(self, filename):
+        """Sets the file that the results of LookbackMultiple
+        calculations are cached in.  The file is opened when it is
+        first needed, if the cache is enabled in QSettings.
+
+        Arguments:
+        filename - str holding the path of the cache file (see
+                   LookbackMultipleResultCache.getCacheFilename()),
+                   or None to not cache the results.
+        """
+
+        if filename == self.lookbackMultipleResultCacheFilename:
+            return
+
+        if self.lookbackMultipleResultCache != None:
+            self.lookbackMultipleResultCache.close()
+            self.lookbackMultipleResultCache = None
+
+        self.lookbackMultipleResultCacheFilename = filename
+
+    def setLongitudeTimelineDocumentFilename(self, documentFilename):
+        """Sets the PriceChartDocument file that the LongitudeTimelines
+        of the planets are kept next to, for the local serial
+        LookbackMultiple calculations.
+
+        Arguments:
+        documentFilename - str holding the path of the
+                           PriceChartDocument file, or None to not
+                           use LongitudeTimelines.
+        """
+
+        self.longitudeTimelineDocumentFilename = documentFilename
+
+    def _getLongitudeTimelineDocumentFilename(self):
+        """Returns the path of the PriceChartDocument file that the
+        LongitudeTimelines are kept next to, or None if they are not
+        used, as configured in QSettings.
+        """
+
+        settings = QSettings()
+
+        key = SettingsKeys.lookbackMultipleLongitudeTimelinesEnabledKey
+        enabled = settings.value(key, \
+            SettingsKeys.lookbackMultipleLongitudeTimelinesEnabledDefValue,
+            type=bool)
+
+        if enabled == False:
+            return None
+
+        return self.longitudeTimelineDocumentFilename
+
+    def _getLookbackMultipleResultCache(self):
+        """Returns the LookbackMultipleResultCache to use, opening it if
+        needed, or None if results are not cached.
+        """
+
+        settings = QSettings()
+
+        key = SettingsKeys.lookbackMultipleResultCacheEnabledKey
+        enabled = settings.value(key, \
+            SettingsKeys.lookbackMultipleResultCacheEnabledDefValue,
+            type=bool)
+
+        if enabled == False or \
+           self.lookbackMultipleResultCacheFilename == None:
+
+            if self.lookbackMultipleResultCache != None:
+                self.lookbackMultipleResultCache.close()
+                self.lookbackMultipleResultCache = None
+            return None
+
+        key = SettingsKeys.lookbackMultipleResultCacheMaxEntriesKey
+        maxEntries = settings.value(key, \
+            SettingsKeys.lookbackMultipleResultCacheMaxEntriesDefValue,
+            type=int)
+
+        if self.lookbackMultipleResultCache == None:
+            try:
+                self.lookbackMultipleResultCache = \
+                    LookbackMultipleResultCache(\
+                        self.lookbackMultipleResultCacheFilename,
+                        maxEntries)
+            except (sqlite3.Error, OSError) as e:
+                self.log.warning("Could not open the LookbackMultiple " + \
+                                 "result cache '{}': {}.  ".\
+                                 format(self.lookbackMultipleResultCacheFilename,
+                                        e) + \
+                                 "Results will not be cached.")
+
+                # Don't try again for this file.
+                self.lookbackMultipleResultCacheFilename = None
+                return None
+
+        elif self.lookbackMultipleResultCache.maxEntries != maxEntries:
+            self.lookbackMultipleResultCache.setMaxEntries(maxEntries)
+
+        return self.lookbackMultipleResultCache
+
+    def _getLookbackMultipleDatetimesUsingCache(self,
+                                                argsTupleList,
+                                                direction,
+                                                calculateFunc):
+        """Returns the results of LookbackMultiple calculations, taking
+        the ones that are in the LookbackMultipleResultCache from
+        there, and calculating the others with 'calculateFunc'.  The
+        calculated results are added to the cache.
+
+        Arguments:
+        argsTupleList - List of tuple objects, as described in
+                        _getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture().
+        direction     - int value.  1 for calculations into the
+                        future, -1 for calculations into the past.
+        calculateFunc - Method that does the calculations, e.g.
+                        _getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInPast.
+
+        Returns:
+        List of list of datetime.datetime objects, as returned by
+        'calculateFunc'.  This is an empty list if the calculation
+        had an error.
+        """
+
+        cache = self._getLookbackMultipleResultCache()
+        if cache == None:
+            return calculateFunc(argsTupleList)
+
+        settings = QSettings()
+        key = SettingsKeys.lookbackMultipleCalcModelKey
+        calcModel = settings.value(key, \
+            SettingsKeys.lookbackMultipleCalcModelDefValue,
+            type=str)
+        cache.variant = self._getLookbackMultipleResultCacheVariant(calcModel)
+
+        rv = cache.getMany(argsTupleList, direction)
+
+        missIndexes = [i for i in range(len(rv)) if rv[i] == None]
+        if len(missIndexes) > 0:
+            missArgsTupleList = [argsTupleList[i] for i in missIndexes]
+
+            resultsList = calculateFunc(missArgsTupleList)
+            if len(resultsList) == 0:
+                return []
+
+            cache.putMany(missArgsTupleList, direction, resultsList)
+
+            for j in range(len(missIndexes)):
+                rv[missIndexes[j]] = resultsList[j]
+
+        return rv
+
+    def _handleLookbackMultipleCalcJobResultsReady(self, jobId, results):
+        """Draws a batch of results of the current
+        LookbackMultipleCalcJob.  Results of other jobs are ignored.
+
+        Arguments:
+        jobId   - int value for the id of the job.
+        results - list of tuples (index, list of datetime.datetime
+                  objects), where 'index' is the index into
+                  self.lookbackMultipleCalcJobTargets.
+        """
+
+        if jobId != self.lookbackMultipleCalcJobId or \
+           len(self.lookbackMultipleCalcJobTargets) == 0:
+            return
+
+        cache = self._getLookbackMultipleResultCache()
+        if cache != None:
+            cache.variant = self.lookbackMultipleCalcJobCacheVariant
+            cache.putMany(\
+                [self.lookbackMultipleCalcJobArgsTupleList[index] \
+                 for (index, resultDts) in results],
+                1,
+                [resultDts for (index, resultDts) in results])
+
+        for (index, resultDts) in results:
+            (drawState, pb) = self.lookbackMultipleCalcJobTargets[index]
+
+            # Skip results of LookbackMultiples that are not drawn
+            # anymore.
+            lookbackMultiple = drawState["lookbackMultiple"]
+            if self.lookbackMultipleDrawStates.get(id(lookbackMultiple),
+                                                   None) is not drawState:
+                continue
+
+            self._addLookbackMultiplePriceBarGraphicsItems(drawState,
+                                                           pb,
+                                                           resultDts)
+
+    def _handleLookbackMultipleCalcJobCalculationsFinished(self,
+                                                            jobId,
+                                                            completedFlag):
+        """Marks the ranges of the current LookbackMultipleCalcJob as
+        drawn, if all of its results were drawn.
+        """
+
+        if jobId != self.lookbackMultipleCalcJobId:
+            return
+
+        if completedFlag == True:
+            for (drawState, startDt, endDt) in \
+                    self.lookbackMultipleCalcJobRanges:
+
+                lookbackMultiple = drawState["lookbackMultiple"]
+                if self.lookbackMultipleDrawStates.\
+                       get(id(lookbackMultiple), None) is drawState:
+
+                    self._extendLookbackMultipleDrawnRange(drawState,
+                                                           startDt,
+                                                           endDt)
+        else:
+            self.log.warning("LookbackMultiple calculations did not " + \
+                             "complete.  Not all " + \
+                             "LookbackMultiplePriceBars are drawn.")
+
+        if self.lookbackMultipleResultCache != None and \
+           self.log.isEnabledFor(logging.INFO) == True:
+
+            self.log.info(self.lookbackMultipleResultCache.getStatisticsStr())
+
+        self.lookbackMultipleCalcJob = None
+        self.lookbackMultipleCalcJobArgsTupleList = []
+        self.lookbackMultipleCalcJobTargets = []
+        self.lookbackMultipleCalcJobRanges = []
+
+    def _handleLookbackMultipleCalcJobThreadFinished(self):
+        """Releases the LookbackMultipleCalcJobs whose threads have
+        finished.
+        """
+
+        for job in list(PriceBarChartWidget.lookbackMultipleCalcJobsRunning):
+            if job.isFinished() == True:
+                job.wait()
+                PriceBarChartWidget.lookbackMultipleCalcJobsRunning.remove(job)
+
+    def _scaleLookbackMultiplePriceBarGraphicsItem(self,
+                                                   item,
+                                                   lmpb,
+                                                   scaling):
+        """Sets the prices of the given LookbackMultiplePriceBar to the
+        prices of its historic PriceBar scaled with
+        _scaleLookbackMultiplePriceBarPrice(), sets it in the given
+        LookbackMultiplePriceBarGraphicsItem, and moves the item to the
+        position of the scaled prices.
+
+        Arguments:
+        item    - LookbackMultiplePriceBarGraphicsItem to scale.
+        lmpb    - LookbackMultiplePriceBar of the item.
+        scaling - tuple of (highestViewPrice, lowestViewPrice,
+                  highestPriceBarPrice, lowestPriceBarPrice), as used
+                  by _scaleLookbackMultiplePriceBarPrice().
+        """
+
+        pb = lmpb.historicPriceBar
+
+        (highestViewPrice,
+         lowestViewPrice,
+         highestPriceBarPrice,
+         lowestPriceBarPrice) = scaling
+
+        lmpb.open = \
+            self._scaleLookbackMultiplePriceBarPrice(\
+                highestViewPrice,
+                lowestViewPrice,
+                highestPriceBarPrice,
+                lowestPriceBarPrice,
+                priceBarPriceToScale=pb.open)
+        lmpb.high = \
+            self._scaleLookbackMultiplePriceBarPrice(\
+                highestViewPrice,
+                lowestViewPrice,
+                highestPriceBarPrice,
+                lowestPriceBarPrice,
+                priceBarPriceToScale=pb.high)
+        lmpb.low = \
+            self._scaleLookbackMultiplePriceBarPrice(\
+                highestViewPrice,
+                lowestViewPrice,
+                highestPriceBarPrice,
+                lowestPriceBarPrice,
+                priceBarPriceToScale=pb.low)
+        lmpb.close = \
+            self._scaleLookbackMultiplePriceBarPrice(\
+                highestViewPrice,
+                lowestViewPrice,
+                highestPriceBarPrice,
+                lowestPriceBarPrice,
+                priceBarPriceToScale=pb.close)
+
+        # This also schedules the redraw for the new prices.
+        item.setLookbackMultiplePriceBar(lmpb)
+
+        # X location based on the timestamp.
+        x = self.graphicsScene.datetimeToSceneXPos(lmpb.timestamp)
+
+        # Y location based on the mid price (average of high and low).
+        y = self.graphicsScene.priceToSceneYPos(lmpb.midPrice())
+
+        # Set the position, in parent coordinates.
+        item.setPos(QPointF(x, y))
+
+        self.graphicsScene.clearCachedLookbackMultiplePriceBarIndex()
+
+    def _removeLookbackMultiplePriceBarsOutside(self,
+                                                drawState,
+                                                startDt,
+                                                endDt):
+        """Removes the LookbackMultiplePriceBarGraphicsItems of the
+        given draw state (see drawLookbackMultiplePriceBars()) whose
+        historic PriceBar timestamps are outside of 'startDt' to
+        'endDt', and shrinks the drawn range of the draw state to
+        match.  If 'startDt' is None, then all of them are removed.
+        """
+
+        # The items are checked even if the drawn range is within
+        # 'startDt' to 'endDt', because a cancelled calculation can
+        # leave items outside of the drawn range.
+        numRemoved = 0
+        for timestamp in list(drawState["items"].keys()):
+            if startDt == None or not (startDt <= timestamp <= endDt):
+                for item in drawState["items"][timestamp]:
+                    # The user may have removed the item already.
+                    if item.scene() != None:
+                        self.graphicsScene.removeItem(item)
+                    numRemoved += 1
+                del drawState["items"][timestamp]
+
+        if numRemoved > 0:
+            self.graphicsScene.clearCachedLookbackMultiplePriceBarIndex()
+
+        if startDt == None or drawState["startDt"] == None or \
+           drawState["endDt"] < startDt or drawState["startDt"] > endDt:
+
+            drawState["startDt"] = None
+            drawState["endDt"] = None
+        else:
+            drawState["startDt"] = max(drawState["startDt"], startDt)
+            drawState["endDt"] = min(drawState["endDt"], endDt)
+
+        if self.log.isEnabledFor(logging.DEBUG) == True:
+            self.log.debug("Removed {} LookbackMultiplePriceBars.".\
+                           format(numRemoved))
+
+    def _handleGraphicsViewScrolledOrZoomed(self):
+        """Called when the visible area of the QGraphicsView changes.
+        Schedules an incremental redraw of the
+        LookbackMultiplePriceBars, if there are any drawn.
+        """
+
+        if self.lookbackMultiplesToRedraw != None:
+            # Restarting the timer makes a scroll or zoom in progress
+            # cause only one redraw, after it stops.
+            self.lookbackMultipleRedrawTimer.start()
+
+    def _handleLookbackMultipleRedrawTimerTimeout(self):
+        """Redraws the LookbackMultiplePriceBars for the current view,
+        if enabled in QSettings.
+        """
+
+        if self.lookbackMultiplesToRedraw == None:
+            return
+
+        settings = QSettings()
+        key = SettingsKeys.lookbackMultipleIncrementalRedrawEnabledKey
+        value = settings.value(key, \
+            SettingsKeys.lookbackMultipleIncrementalRedrawEnabledDefValue,
+            type=bool)
+
+        if value == True:
+            self.drawLookbackMultiplePriceBars(\
+                self.lookbackMultiplesToRedraw)
+
 
     def _getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture(self, argsTupleList):
         """Makes LookbackMultiple calculations into the future by
@@ -42606,6 +44039,8 @@ class PriceBarChartWidget(QWidget):
           - Local serial calculations.
           - Local parallel calculations (multiple processes).
           - Remote parallel calculations (multiple processes, distributed).
+          - Hybrid parallel calculations (local processes first, the
+            overflow distributed, and local if the server is unreachable).
             
         Arguments:
         argsTupleList - List of tuple objects.  
@@ -42666,47 +44101,23 @@ class PriceBarChartWidget(QWidget):
             SettingsKeys.lookbackMultipleCalcModelDefValue,
             type=str)
 
+        self._applyLookbackMultipleEphemerisInterpolatorEnabled(value)
+
         if value == str(LookbackMultipleCalcModel.local_serial):
             self.log.debug(\
                 "Doing LookbackMultiple calculations local serial.")
             
-            for argsTuple in argsTupleList:
-                
-                # Extract variable values from the tuple.
-                planetName = argsTuple[0]
-                centricityType = argsTuple[1]
-                longitudeType = argsTuple[2]
-                referenceDt = argsTuple[3]
-                desiredDeltaDegrees = argsTuple[4]
-                maxErrorTd = argsTuple[5]
-                locationLongitudeDegrees = argsTuple[6]
-                locationLatitudeDegrees = argsTuple[7]
-                locationElevationMeters = argsTuple[8]
-
-                # Initialize ephemeris.
-                LookbackMultipleUtils.initializeEphemeris(\
-                    locationLongitudeDegrees, 
-                    locationLatitudeDegrees,
-                    locationElevationMeters)
-                
-                # Do LookbackMultiple calculations.
-                dts = \
-                    LookbackMultipleUtils.\
-                    getDatetimesOfLongitudeDeltaDegreesInFuture(\
-                        planetName,
-                        centricityType,
-                        longitudeType,
-                        referenceDt,
-                        desiredDeltaDegrees,
-                        maxErrorTd)
-
-                rv.append(dts)
+            # Tuples for the same planet are done together in one
+            # pass through time.
+            rv = self._sweepLookbackMultipleDatetimesLocalSerial(\
+                argsTupleList, 1)
                 
         elif value == str(LookbackMultipleCalcModel.local_parallel):
             self.log.debug(\
                 "Doing LookbackMultiple calculations local parallel.")
 
             # Run calculations in parallel, locally.
+            self._applyLookbackMultipleCalcNumProcesses()
             rv = \
                LookbackMultipleParallel.\
                getDatetimesOfLongitudeDeltaDegreesInFutureParallel(\
@@ -42722,6 +44133,15 @@ class PriceBarChartWidget(QWidget):
             rv = self._runLookbackMultipleCalculationsRemoteParallel(\
                 methodName, argsTupleList)
 
+        elif value == str(LookbackMultipleCalcModel.hybrid_parallel):
+            self.log.debug(\
+                "Doing LookbackMultiple calculations hybrid parallel.")
+
+            # Run calculations in parallel, locally and remotely.
+            self._applyLookbackMultipleCalcNumProcesses()
+            rv = self._runLookbackMultipleCalculationsHybridParallel(\
+                argsTupleList, 1)
+
         else:
             errorMsg = "QSettings had an unknown or unsupported " + \
                        "LookbackMultiple calculation model/architecture.  " + \
@@ -42751,6 +44171,8 @@ class PriceBarChartWidget(QWidget):
           - Local serial calculations.
           - Local parallel calculations (multiple processes).
           - Remote parallel calculations (multiple processes, distributed).
+          - Hybrid parallel calculations (local processes first, the
+            overflow distributed, and local if the server is unreachable).
             
         Arguments:
         argsTupleList - List of tuple objects.  
@@ -42810,48 +44232,24 @@ class PriceBarChartWidget(QWidget):
         value = settings.value(key, \
             SettingsKeys.lookbackMultipleCalcModelDefValue,
             type=str)
+
+        self._applyLookbackMultipleEphemerisInterpolatorEnabled(value)
         
         if value == str(LookbackMultipleCalcModel.local_serial):
             self.log.debug(\
                 "Doing LookbackMultiple calculations local serial.")
             
-            for argsTuple in argsTupleList:
-                
-                # Extract variable values from the tuple.
-                planetName = argsTuple[0]
-                centricityType = argsTuple[1]
-                longitudeType = argsTuple[2]
-                referenceDt = argsTuple[3]
-                desiredDeltaDegrees = argsTuple[4]
-                maxErrorTd = argsTuple[5]
-                locationLongitudeDegrees = argsTuple[6]
-                locationLatitudeDegrees = argsTuple[7]
-                locationElevationMeters = argsTuple[8]
-
-                # Initialize ephemeris.
-                LookbackMultipleUtils.initializeEphemeris(\
-                    locationLongitudeDegrees, 
-                    locationLatitudeDegrees,
-                    locationElevationMeters)
-                
-                # Do LookbackMultiple calculations.
-                dts = \
-                    LookbackMultipleUtils.\
-                    getDatetimesOfLongitudeDeltaDegreesInPast(\
-                        planetName,
-                        centricityType,
-                        longitudeType,
-                        referenceDt,
-                        desiredDeltaDegrees,
-                        maxErrorTd)
-
-                rv.append(dts)
+            # Tuples for the same planet are done together in one
+            # pass through time.
+            rv = self._sweepLookbackMultipleDatetimesLocalSerial(\
+                argsTupleList, -1)
                 
         elif value == str(LookbackMultipleCalcModel.local_parallel):
             self.log.debug(\
                 "Doing LookbackMultiple calculations local parallel.")
 
             # Run calculations in parallel, locally.
+            self._applyLookbackMultipleCalcNumProcesses()
             rv = \
                LookbackMultipleParallel.\
                getDatetimesOfLongitudeDeltaDegreesInPastParallel(\
@@ -42867,6 +44265,15 @@ class PriceBarChartWidget(QWidget):
             rv = self._runLookbackMultipleCalculationsRemoteParallel(\
                 methodName, argsTupleList)
 
+        elif value == str(LookbackMultipleCalcModel.hybrid_parallel):
+            self.log.debug(\
+                "Doing LookbackMultiple calculations hybrid parallel.")
+
+            # Run calculations in parallel, locally and remotely.
+            self._applyLookbackMultipleCalcNumProcesses()
+            rv = self._runLookbackMultipleCalculationsHybridParallel(\
+                argsTupleList, -1)
+
         else:
             errorMsg = "QSettings had an unknown or unsupported " + \
                        "LookbackMultiple calculation model/architecture.  " + \
@@ -42887,10 +44294,107 @@ class PriceBarChartWidget(QWidget):
         self.log.debug("Exiting _getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInPast()")
         return rv
 
-    def _runLookbackMultipleCalculationsRemoteParallel(self, 
+    def _sweepLookbackMultipleDatetimesLocalSerial(self,
+                                                   argsTupleList,
+                                                   direction):
+        """Makes the LookbackMultiple calculations of
+        _getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture()
+        or _getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInPast()
+        locally, in this process.
+
+        The tuples are grouped by planet, centricity type, longitude
+        type, maximum error and location.  Each group is calculated
+        with a single pass through time via
+        LookbackMultipleUtils.sweepDatetimesOfLongitudeDeltaDegreesInFuture()
+        (or InPast()), instead of one search per tuple.
+
+        Arguments:
+        argsTupleList - List of tuple objects, as described in
+                        _getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture().
+        direction     - int value.  1 for calculations into the
+                        future, -1 for calculations into the past.
+
+        Returns:
+        List of list of datetime.datetime objects.
+        Each list within the list corresponds to the
+        respective tuple within argsTupleList.
+        """
+
+        rv = [None] * len(argsTupleList)
+
+        # Dictionary holding the indexes into argsTupleList for each
+        # group.
+        #
+        # Key is the tuple:
+        #   (planetName, centricityType, longitudeType, maxErrorTd,
+        #    locationLongitudeDegrees, locationLatitudeDegrees,
+        #    locationElevationMeters)
+        groups = {}
+        for i in range(len(argsTupleList)):
+            argsTuple = argsTupleList[i]
+            key = argsTuple[0:3] + argsTuple[5:9]
+            groups.setdefault(key, []).append(i)
+
+        for (key, indexes) in groups.items():
+
+            # Extract variable values from the key.
+            planetName = key[0]
+            centricityType = key[1]
+            longitudeType = key[2]
+            maxErrorTd = key[3]
+            locationLongitudeDegrees = key[4]
+            locationLatitudeDegrees = key[5]
+            locationElevationMeters = key[6]
+
+            referenceDts = [argsTupleList[i][3] for i in indexes]
+            desiredDeltaDegreesList = \
+                sorted(set([argsTupleList[i][4] for i in indexes]))
+
+            # Initialize ephemeris.
+            LookbackMultipleUtils.initializeEphemeris(\
+                locationLongitudeDegrees,
+                locationLatitudeDegrees,
+                locationElevationMeters)
+
+            # Do LookbackMultiple calculations.
+            if direction > 0:
+                results = \
+                    LookbackMultipleUtils.\
+                    sweepDatetimesOfLongitudeDeltaDegreesInFuture(\
+                        planetName,
+                        centricityType,
+                        longitudeType,
+                        referenceDts,
+                        desiredDeltaDegreesList,
+                        maxErrorTd)
+            else:
+                results = \
+                    LookbackMultipleUtils.\
+                    sweepDatetimesOfLongitudeDeltaDegreesInPast(\
+                        planetName,
+                        centricityType,
+                        longitudeType,
+                        referenceDts,
+                        desiredDeltaDegreesList,
+                        maxErrorTd)
+
+            for j in range(len(indexes)):
+                i = indexes[j]
+                deltaIndex = \
+                    desiredDeltaDegreesList.index(argsTupleList[i][4])
+                rv[i] = results[j][deltaIndex]
+
+        return rv
+
+    def _runLookbackMultipleCalculationsRemoteParallel(self,
                                                        methodName, 
                                                        argsTupleList):
-        """
+        """Makes LookbackMultiple calculations on the distributed
+        client workers of the LookbackMultiple server configured in
+        QSettings.  The results are consumed as the workers complete
+        them.  If no result arrives within the timeout configured in
+        QSettings, the calculations are aborted.
+
         Arguments:
         methodName   - str holding one of the following:
                        getDatetimesOfLongitudeDeltaDegreesInFuture
@@ -42935,6 +44439,7 @@ class PriceBarChartWidget(QWidget):
         The datetime.datetime objects are the timestamps
         where the planet is at the elapsed number of
         degrees away from the longitude at 'referenceDt'.
+        This is an empty list if the calculations were aborted.
         """
 
         if methodName != "getDatetimesOfLongitudeDeltaDegreesInFuture" and \
@@ -42945,7 +44450,93 @@ class PriceBarChartWidget(QWidget):
                 format(methodName)
             self.log.error(errStr)
             raise ValueError(errStr)
-        
+
+        direction = 1
+        if methodName == "getDatetimesOfLongitudeDeltaDegreesInPast":
+            direction = -1
+
+        client = self._connectLookbackMultipleRemoteClient()
+        if client == None:
+            rv = []
+            return rv
+
+        # Submit tasks, and consume the results as the workers
+        # complete them.
+        self.log.info("Submitting {} tasks ...".format(len(argsTupleList)))
+
+        try:
+            resultsList = \
+                client.getDatetimesOfLongitudeDeltaDegrees(argsTupleList,
+                                                           direction)
+        except (OSError, EOFError) as e:
+            errorStr = "Lost the connection to the " + \
+                "LookbackMultiple server {} port {}.  ".\
+                format(client.serverAddress, client.serverPort) + \
+                "Aborting calculations.  e == {}".format(e)
+            self.log.error(errorStr)
+            QMessageBox.warning(self, 
+                                "Connection Error",
+                                errorStr,
+                                QMessageBox.Ok,
+                                QMessageBox.NoButton);
+            rv = []
+            return rv
+
+        if client.numResultsMissing > 0:
+            errorStr = "{} of {} LookbackMultiple results ".\
+                format(client.numResultsMissing, len(argsTupleList)) + \
+                "were not obtained from the " + \
+                "LookbackMultiple server {} port {} ".\
+                format(client.serverAddress, client.serverPort) + \
+                "within the timeout of {} sec.  ".\
+                format(client.timeoutSec) + \
+                "Please verify that client workers are running.  " + \
+                "Aborting calculations."
+            self.log.error(errorStr)
+            QMessageBox.warning(self, 
+                                "Timeout Error",
+                                errorStr,
+                                QMessageBox.Ok,
+                                QMessageBox.NoButton);
+            rv = []
+            return rv
+
+        self.log.info("Done consuming all tasks submitted.") 
+        return resultsList
+
+    def _runLookbackMultipleCalculationsHybridParallel(self,
+                                                       argsTupleList,
+                                                       direction):
+        """Makes LookbackMultiple calculations in the processes of the
+        LookbackMultipleParallel pool, and offloads the overflow to
+        the distributed client workers of the LookbackMultiple server
+        configured in QSettings, with a
+        LookbackMultipleHybridScheduler.  If the server cannot be
+        used, the calculations are all done locally.
+
+        Arguments:
+        argsTupleList - List of tuple objects, as described in
+                        _getLookbackMultipleDatetimesOfLongitudeDeltaDegreesInFuture().
+        direction     - int value.  1 for calculations into the
+                        future, -1 for calculations into the past.
+
+        Returns:
+        List of list of datetime.datetime objects.
+        Each list within the list corresponds to the
+        respective tuple within argsTupleList.
+        """
+
+        scheduler = LookbackMultipleHybridScheduler(\
+            self._createLookbackMultipleRemoteClient())
+
+        return scheduler.getDatetimesOfLongitudeDeltaDegrees(argsTupleList,
+                                                             direction)
+
+    def _createLookbackMultipleRemoteClient(self):
+        """Returns an unconnected LookbackMultipleRemoteClient for the
+        LookbackMultiple server configured in QSettings.
+        """
+
         # Get QSettings values for what server to connect to, for
         # submitting tasks and retrieving results.
         settings = QSettings()
@@ -42971,23 +44562,41 @@ class PriceBarChartWidget(QWidget):
             SettingsKeys.lookbackMultipleCalcRemoteServerAuthKeyDefValue,
             type=str)
         serverAuthKey = value.encode("utf-8")
+
+        # Seconds without results before giving up (int).
+        key = SettingsKeys.lookbackMultipleCalcRemoteTimeoutSecKey
+        value = settings.value(key, \
+            SettingsKeys.lookbackMultipleCalcRemoteTimeoutSecDefValue,
+            type=int)
+        timeoutSec = value
            
-        class QueueManager(BaseManager):
-            pass
-            
-        QueueManager.register("getTaskQueue", 
-                              callable=lambda: taskQueue)
-        QueueManager.register("getResultQueue", 
-                              callable=lambda: resultQueue)
-    
-        manager = QueueManager(address=(serverAddress, serverPort), 
-                               authkey=serverAuthKey)
+        # The user waits for these calculations, so they go ahead of
+        # the jobs of scripts sharing the server.
+        client = LookbackMultipleRemoteClient(\
+            serverAddress,
+            serverPort,
+            serverAuthKey,
+            timeoutSec,
+            LookbackMultipleRemoteClient.PRIORITY_INTERACTIVE)
+
+        return client
+
+    def _connectLookbackMultipleRemoteClient(self):
+        """Returns a LookbackMultipleRemoteClient connected to the
+        LookbackMultiple server configured in QSettings, or None if
+        the connection failed.  Errors are logged and shown to the
+        user.
+        """
+
+        client = self._createLookbackMultipleRemoteClient()
+        serverAddress = client.serverAddress
+        serverPort = client.serverPort
 
         self.log.debug("LookbackMultiple client tasker connecting " + \
                        "to server {} port {} ...".\
                        format(serverAddress, serverPort))
         try:
-            manager.connect()
+            client.connect()
         except ConnectionRefusedError as e:
             endl = os.linesep
             errorStr = "Caught ConnectionRefusedError while " + \
@@ -43001,8 +44610,7 @@ class PriceBarChartWidget(QWidget):
                                 errorStr,
                                 QMessageBox.Ok,
                                 QMessageBox.NoButton);
-            rv = []
-            return rv
+            return None
         except AuthenticationError as e:
             endl = os.linesep
             errorStr = "Caught AuthenticationError while " + \
@@ -43017,146 +44625,11 @@ class PriceBarChartWidget(QWidget):
                                 errorStr,
                                 QMessageBox.Ok,
                                 QMessageBox.NoButton);
-            rv = []
-            return rv
+            return None
                            
         self.log.debug("LookbackMultiple client tasker connected.")
-        
-        taskQueue = manager.getTaskQueue()
-        resultQueue = manager.getResultQueue()
-
-        # The remote parallel distributed method takes a list of tuples with
-        # different arguments/parameters.  This list holds the reformatted
-        # parameters.
-        newArgsTupleList = []
-
-        for i in range(len(argsTupleList)):
-            argsTuple = argsTupleList[i]
-                            
-            # Extract variable values from the tuple.
-            planetName = argsTuple[0]
-            centricityType = argsTuple[1]
-            longitudeType = argsTuple[2]
-            referenceDt = argsTuple[3]
-            desiredDeltaDegrees = argsTuple[4]
-            maxErrorTd = argsTuple[5]
-            locationLongitudeDegrees = argsTuple[6]
-            locationLatitudeDegrees = argsTuple[7]
-            locationElevationMeters = argsTuple[8]
-            
-            # Variables not in the original tuple.
-            methodToRun = methodName
-            taskId = i
-
-            # Assemble a new tuple for sending to the remote server.
-            newArgsTuple = (\
-                methodToRun,
-                taskId,
-                planetName, 
-                centricityType, 
-                longitudeType, 
-                referenceDt, 
-                desiredDeltaDegrees, 
-                maxErrorTd, 
-                locationLongitudeDegrees, 
-                locationLatitudeDegrees, 
-                locationElevationMeters)
-            
-            newArgsTupleList.append(newArgsTuple)
-            
-        # Submit tasks.
-        self.log.info("Submitting {} tasks ...".format(len(newArgsTupleList)))
-        for argsTuple in newArgsTupleList:
-            taskQueue.put(argsTuple)
-        self.log.info("Submitting {} tasks completed.".\
-                  format(len(newArgsTupleList)))
-            
-        # Block, waiting for all the tasks to complete.
-        self.log.info("Waiting for all tasks to complete ...")
-
-        taskQueue.join()
 
-        self.log.info("Tasks completed.  Now analyzing results ...")
-        
-        # Initialize the results list that will be returned.  
-        #
-        # The results extracted out of the resultQueue is not guaranteed to be
-        # in the same order as the corresponding tasks submitted to the
-        # taskQueue.  This is the results after we have put them in the correct
-        # order.
-        resultsList = [None] * len(newArgsTupleList)
-
-        resultCount = 0
-        while resultCount < len(newArgsTupleList):
-
-            # Get a result.
-            (argsTuple, resultDts) = resultQueue.get()
-             
-            argIndex = 0
-            methodToRun = argsTuple[argIndex]
-            argIndex += 1
-            taskId = argsTuple[argIndex]
-            argIndex += 1
-            planetName = argsTuple[argIndex]
-            argIndex += 1
-            centricityType = argsTuple[argIndex]
-            argIndex += 1
-            longitudeType = argsTuple[argIndex]
-            argIndex += 1
-            referenceDt = argsTuple[argIndex]
-            argIndex += 1
-            desiredDeltaDegrees = argsTuple[argIndex]
-            argIndex += 1
-            maxErrorTd = argsTuple[argIndex]
-            argIndex += 1
-            locationLongitudeDegrees = argsTuple[argIndex]
-            argIndex += 1
-            locationLatitudeDegrees = argsTuple[argIndex]
-            argIndex += 1
-            locationElevationMeters = argsTuple[argIndex]
-            argIndex += 1
-            
-
-            # Place the resultDts in the correct place.
-            resultsList[taskId] = resultDts
-
-            # Debug output.
-            if self.log.isEnabledFor(logging.DEBUG) == True:
-                endl = os.linesep
-                argsTupleStr = \
-                    "methodToRun == {}".format(methodToRun) + endl + \
-                    "taskId == {}".format(taskId) + endl + \
-                    "planetName == {}".format(planetName) + endl + \
-                    "centricityType == {}".format(centricityType) + endl + \
-                    "longitudeType == {}".format(longitudeType) + endl + \
-                    "referenceDt == {}".format(referenceDt) + endl + \
-                    "desiredDeltaDegrees == {}".\
-                    format(desiredDeltaDegrees) + endl + \
-                    "maxErrorTd == {}".format(maxErrorTd) + endl + \
-                    "locationLongitudeDegrees == {}".\
-                    format(locationLongitudeDegrees) + endl + \
-                    "locationLatitudeDegrees == {}".\
-                    format(locationLatitudeDegrees) + endl + \
-                    "locationElevationMeters == {}".\
-                    format(locationElevationMeters)
-    
-                self.log.debug("Obtained result: " + \
-                          "argsTuple == {}, ".format(argsTuple) + 
-                          "len(resultDts) == {}".format(len(resultDts)))
-                for i in range(len(resultDts)):
-                    dt = resultDts[i]
-                    self.log.debug("  resultDts[{}] == {}".format(i, dt))
-
-            # Notify that the consumption of this result is complete.
-            resultQueue.task_done()
-
-            resultCount += 1
-            if self.log.isEnabledFor(logging.DEBUG) == True:
-                self.log.debug("We have consumed {} total results now.".\
-                          format(resultCount))
-    
-        self.log.info("Done consuming all tasks submitted.") 
-        return resultsList
+        return client
 
     def clearAllLookbackMultiplePriceBars(self):
         """Causes the removal of all LookbackMultiplePriceBarGraphicsItems.
@@ -43169,6 +44642,13 @@ class PriceBarChartWidget(QWidget):
         """
 
         self.log.debug("Entered clearAllLookbackMultiplePriceBars()")
+
+        # Nothing is drawn anymore, so there is nothing to redraw when
+        # the view is scrolled or zoomed.
+        self.lookbackMultipleRedrawTimer.stop()
+        self._cancelLookbackMultipleCalcJob()
+        self.lookbackMultiplesToRedraw = None
+        self.lookbackMultipleDrawStates = {}
         
         # Go through all the QGraphicsItems and remove the artifact items.
         graphicsItems = self.graphicsScene.items()
@@ -43184,6 +44664,8 @@ class PriceBarChartWidget(QWidget):
                                
                 if item.scene() != None:
                     self.graphicsScene.removeItem(item)
+
+        self.graphicsScene.clearCachedLookbackMultiplePriceBarIndex()
                 
         self.log.debug("Exiting clearAllLookbackMultiplePriceBars()")
 
@@ -43287,6 +44769,11 @@ class PriceBarChartWidget(QWidget):
                 self.log.debug("Applying settings to PriceBarGraphicsItem.")
                 item.loadSettingsFromPriceBarChartSettings(\
                     self.priceBarChartSettings)
+            elif isinstance(item, PriceBarLayerGraphicsItem):
+                self.log.debug("Applying settings to " +
+                               "PriceBarLayerGraphicsItem.")
+                item.loadSettingsFromPriceBarChartSettings(\
+                    self.priceBarChartSettings)
             elif isinstance(item, BarCountGraphicsItem):
                 self.log.debug("Applying settings to BarCountGraphicsItem.")
                 item.loadSettingsFromPriceBarChartSettings(\
@@ -43888,6 +45375,10 @@ class PriceBarChartWidget(QWidget):
         the widget.
         """
 
+        # PriceBars that are no longer selected are drawn by the
+        # PriceBarLayerGraphicsItem again.
+        self.graphicsScene.removeUnusedPriceBarGraphicsItems()
+
         selectedItems = self.graphicsScene.selectedItems()
 
         numPriceBarGraphicsItemsSelected = 0
@@ -44086,6 +45577,23 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         self.lowestPriceBar = None
         self.earliestPriceBar = None
         self.latestPriceBar = None
+
+        # QGraphicsItem that draws all the PriceBars.
+        self.priceBarLayerGraphicsItem = PriceBarLayerGraphicsItem()
+        self.addItem(self.priceBarLayerGraphicsItem)
+
+        # PriceBarGraphicsItems created for the PriceBars that the user
+        # interacts with, keyed by the index of the PriceBar in the
+        # PriceBarLayerGraphicsItem.
+        self.priceBarGraphicsItems = {}
+
+        # Indexes of the open, high, low and close points of the
+        # PriceBars, and of the LookbackMultiplePriceBarGraphicsItems,
+        # for the getClosest*() queries.  See _createOHLCIndex().  The
+        # index of the LookbackMultiplePriceBarGraphicsItems is
+        # created when needed.
+        self.priceBarIndex = self._createOHLCIndex([], [], [], [], [])
+        self.lookbackMultiplePriceBarIndex = None
         
         # Adding or removing an artifact graphics item counts as
         # something changed.
@@ -44837,6 +46345,458 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         
         return QPointF(sceneX, sceneY)
 
+    def loadPriceBars(self, priceBars, priceBarChartSettings):
+        """Adds the given PriceBars to the PriceBars drawn by the
+        PriceBarLayerGraphicsItem of this scene.
+
+        Arguments:
+        priceBars - list of PriceBar objects.
+        priceBarChartSettings - PriceBarChartSettings object with the
+                                settings for drawing the PriceBars.
+        """
+
+        self.log.debug("Entered loadPriceBars({} pricebars)".\
+                       format(len(priceBars)))
+
+        layer = self.priceBarLayerGraphicsItem
+        layer.loadSettingsFromPriceBarChartSettings(priceBarChartSettings)
+
+        self._setLayerPriceBars(layer.getPriceBars() + list(priceBars))
+
+        self.log.debug("Leaving loadPriceBars({} pricebars)".\
+                       format(len(priceBars)))
+
+    def clearPriceBars(self):
+        """Removes all the PriceBars from this scene, including the
+        PriceBarGraphicsItems created for them.
+        """
+
+        for item in self.priceBarGraphicsItems.values():
+            if item.scene() == self:
+                self.removeItem(item)
+
+        self.priceBarGraphicsItems = {}
+        self.priceBarLayerGraphicsItem.setPriceBars([])
+
+        self._updatePriceBarIndex()
+        self.clearCachedPriceBars()
+
+    def removePriceBar(self, priceBar):
+        """Removes the given PriceBar from this scene, including the
+        PriceBarGraphicsItem created for it.
+        """
+
+        layer = self.priceBarLayerGraphicsItem
+
+        index = layer.getIndexOfPriceBar(priceBar)
+        if index == None:
+            return
+
+        item = self.priceBarGraphicsItems.pop(index, None)
+        if item != None and item.scene() == self:
+            self.removeItem(item)
+
+        self._removePriceBarIndexEntry(index)
+        layer.removePriceBar(index)
+
+        self._updatePriceBarGraphicsItemIndexes()
+        self.clearCachedPriceBars()
+
+    def updatePriceBar(self, priceBar):
+        """Updates the drawing of the given PriceBar, after its
+        timestamp or prices were modified.
+        """
+
+        layer = self.priceBarLayerGraphicsItem
+
+        index = layer.getIndexOfPriceBar(priceBar)
+        if index == None:
+            return
+
+        self._removePriceBarIndexEntry(index)
+        index = layer.updatePriceBar(index)
+        self._insertPriceBarIndexEntry(index)
+
+        self._updatePriceBarGraphicsItemIndexes()
+        self.clearCachedPriceBars()
+
+    def _updatePriceBarGraphicsItemIndexes(self):
+        """Updates the indexes that self.priceBarGraphicsItems are
+        keyed by, after the indexes of PriceBars of the
+        PriceBarLayerGraphicsItem changed.
+        """
+
+        layer = self.priceBarLayerGraphicsItem
+
+        priceBarGraphicsItems = {}
+        for item in self.priceBarGraphicsItems.values():
+            index = layer.getIndexOfPriceBar(item.getPriceBar())
+            priceBarGraphicsItems[index] = item
+
+        self.priceBarGraphicsItems = priceBarGraphicsItems
+
+    def _setLayerPriceBars(self, priceBars):
+        """Sets the PriceBars of the PriceBarLayerGraphicsItem, and
+        updates the indexes of the PriceBarGraphicsItems created for
+        them.
+        """
+
+        layer = self.priceBarLayerGraphicsItem
+
+        itemsByPriceBarId = {}
+        for item in self.priceBarGraphicsItems.values():
+            itemsByPriceBarId[id(item.getPriceBar())] = item
+
+        layer.setPriceBars(priceBars)
+
+        self.priceBarGraphicsItems = {}
+        for (priceBarId, item) in itemsByPriceBarId.items():
+            index = layer.indexesByPriceBarId[priceBarId]
+            self.priceBarGraphicsItems[index] = item
+            layer.setPriceBarExcluded(index, True)
+
+        self._updatePriceBarIndex()
+        self.clearCachedPriceBars()
+
+    def getPriceBarLayerGraphicsItem(self):
+        """Returns the PriceBarLayerGraphicsItem that draws the
+        PriceBars of this scene.
+        """
+
+        return self.priceBarLayerGraphicsItem
+
+    def getPriceBars(self):
+        """Returns the list of PriceBars in this scene, sorted by
+        timestamp.  The list must not be modified.
+        """
+
+        return self.priceBarLayerGraphicsItem.getPriceBars()
+
+    def getPriceBarGraphicsItemAt(self, pointF):
+        """Returns the PriceBarGraphicsItem of the PriceBar drawn at
+        the given point, creating it if it does not exist yet.  The
+        flags of a created item are set for the current tool mode of
+        the views of this scene.
+
+        Arguments:
+        pointF - QPointF in scene coordinates.
+
+        Returns:
+        PriceBarGraphicsItem, or None if there is no PriceBar drawn at
+        the given point.
+        """
+
+        layer = self.priceBarLayerGraphicsItem
+
+        index = layer.getPriceBarIndexAt(pointF)
+        if index == None:
+            return None
+
+        return self._getPriceBarGraphicsItem(index)
+
+    def getPriceBarGraphicsItemsInRect(self, rectF):
+        """Returns the list of PriceBarGraphicsItems of the PriceBars
+        drawn within or across the given rectangle, creating the ones
+        that do not exist yet.  The flags of a created item are set for
+        the current tool mode of the views of this scene.
+
+        Arguments:
+        rectF - QRectF in scene coordinates.
+        """
+
+        layer = self.priceBarLayerGraphicsItem
+
+        return [self._getPriceBarGraphicsItem(index) \
+                for index in layer.getPriceBarIndexesInRect(rectF)]
+
+    def _getPriceBarGraphicsItem(self, index):
+        """Returns the PriceBarGraphicsItem of the PriceBar at the given
+        index of the PriceBarLayerGraphicsItem, creating it if it does
+        not exist yet.
+        """
+
+        layer = self.priceBarLayerGraphicsItem
+
+        item = self.priceBarGraphicsItems.get(index)
+        if item != None:
+            return item
+
+        priceBar = layer.getPriceBar(index)
+
+        # Create the QGraphicsItem
+        item = PriceBarGraphicsItem()
+        item.loadSettingsFromPriceBarChartSettings(\
+            layer.getPriceBarChartSettings())
+        item.setPriceBar(priceBar)
+
+        # Add the item.
+        self.addItem(item)
+
+        # Make sure the proper flags are set for the mode we're in.
+        for view in self.views():
+            if isinstance(view, PriceBarChartGraphicsView):
+                view.setGraphicsItemFlagsPerCurrToolMode(item)
+
+        # X location based on the timestamp.
+        x = self.datetimeToSceneXPos(priceBar.timestamp)
+
+        # Y location based on the mid price (average of high and low).
+        y = self.priceToSceneYPos(priceBar.midPrice())
+
+        # Set the position, in parent coordinates.
+        item.setPos(QPointF(x, y))
+
+        # The item now draws the PriceBar.
+        self.priceBarGraphicsItems[index] = item
+        layer.setPriceBarExcluded(index, True)
+
+        return item
+
+    def removeUnusedPriceBarGraphicsItems(self):
+        """Removes the PriceBarGraphicsItems that are not selected.
+        Their PriceBars are drawn by the PriceBarLayerGraphicsItem
+        again.
+        """
+
+        layer = self.priceBarLayerGraphicsItem
+
+        for (index, item) in list(self.priceBarGraphicsItems.items()):
+            if item.isSelected() == False:
+                del self.priceBarGraphicsItems[index]
+
+                if item.scene() == self:
+                    self.removeItem(item)
+
+                layer.setPriceBarExcluded(index, False)
+
+    def getNumPriceBarsInSceneXRange(self, x1, x2):
+        """Returns the number of PriceBars with a scene X position
+        greater than the smaller of 'x1' and 'x2', and less than or
+        equal to the larger of them.
+        """
+
+        xs = self.priceBarLayerGraphicsItem.xs
+
+        return bisect.bisect_right(xs, max(x1, x2)) - \
+               bisect.bisect_right(xs, min(x1, x2))
+
+    def getPriceBarsInDatetimeRange(self, startDt, endDt):
+        """Returns the list of PriceBars with a timestamp between
+        'startDt' and 'endDt', inclusive, sorted by timestamp.
+        """
+
+        layer = self.priceBarLayerGraphicsItem
+
+        (startIndex, endIndex) = \
+            layer.getIndexRange(self.datetimeToSceneXPos(startDt),
+                                self.datetimeToSceneXPos(endDt))
+
+        # The scene X positions may round differently than the
+        # timestamps, so check the timestamps of the bars at the ends.
+        startIndex = max(0, startIndex - 1)
+        endIndex = min(layer.getNumPriceBars(), endIndex + 1)
+
+        return [pb for pb in layer.getPriceBars()[startIndex:endIndex] \
+                if startDt <= pb.timestamp <= endDt]
+
+    def _createOHLCIndex(self, xs, openYs, highYs, lowYs, closeYs):
+        """Returns a dict that indexes the open, high, low and close
+        points of bars for the getClosest*() queries.
+
+        Arguments:
+        xs      - sequence of the scene X positions of the bars, sorted.
+        openYs  - sequence of the scene Y positions of the opens.
+        highYs  - sequence of the scene Y positions of the highs.
+        lowYs   - sequence of the scene Y positions of the lows.
+        closeYs - sequence of the scene Y positions of the closes.
+        """
+
+        index = {}
+        index["xs"] = array.array('d', xs)
+        index["openYs"] = array.array('d', openYs)
+        index["highYs"] = array.array('d', highYs)
+        index["lowYs"] = array.array('d', lowYs)
+        index["closeYs"] = array.array('d', closeYs)
+
+        # Scene Y positions of all the highs and lows, sorted.
+        index["highLowYs"] = array.array('d', sorted(list(highYs) + \
+                                                     list(lowYs)))
+
+        return index
+
+    def _updatePriceBarIndex(self):
+        """Recreates self.priceBarIndex from the PriceBars of the
+        PriceBarLayerGraphicsItem.
+        """
+
+        layer = self.priceBarLayerGraphicsItem
+
+        self.priceBarIndex = \
+            self._createOHLCIndex(layer.xs,
+                                  [-1.0 * price for price in layer.opens],
+                                  [-1.0 * price for price in layer.highs],
+                                  [-1.0 * price for price in layer.lows],
+                                  [-1.0 * price for price in layer.closes])
+
+    def _removePriceBarIndexEntry(self, index):
+        """Removes the bar at the given index from self.priceBarIndex."""
+
+        priceBarIndex = self.priceBarIndex
+        highLowYs = priceBarIndex["highLowYs"]
+
+        for y in (priceBarIndex["highYs"][index],
+                  priceBarIndex["lowYs"][index]):
+            del highLowYs[bisect.bisect_left(highLowYs, y)]
+
+        for key in ("xs", "openYs", "highYs", "lowYs", "closeYs"):
+            del priceBarIndex[key][index]
+
+    def _insertPriceBarIndexEntry(self, index):
+        """Inserts the PriceBar at the given index of the
+        PriceBarLayerGraphicsItem into self.priceBarIndex, at the same
+        index.
+        """
+
+        layer = self.priceBarLayerGraphicsItem
+        priceBarIndex = self.priceBarIndex
+
+        priceBarIndex["xs"].insert(index, layer.xs[index])
+        priceBarIndex["openYs"].insert(index, -1.0 * layer.opens[index])
+        priceBarIndex["highYs"].insert(index, -1.0 * layer.highs[index])
+        priceBarIndex["lowYs"].insert(index, -1.0 * layer.lows[index])
+        priceBarIndex["closeYs"].insert(index, -1.0 * layer.closes[index])
+
+        bisect.insort(priceBarIndex["highLowYs"], -1.0 * layer.highs[index])
+        bisect.insort(priceBarIndex["highLowYs"], -1.0 * layer.lows[index])
+
+    def clearCachedLookbackMultiplePriceBarIndex(self):
+        """Clears the index of the LookbackMultiplePriceBarGraphicsItems
+        used by the getClosestLookbackMultiplePriceBar*() queries.  This
+        must be called when LookbackMultiplePriceBarGraphicsItems are
+        added, removed or moved.  The index is recreated the next time
+        it is needed.
+        """
+
+        self.lookbackMultiplePriceBarIndex = None
+
+    def _getLookbackMultiplePriceBarIndex(self):
+        """Returns the index of the LookbackMultiplePriceBarGraphicsItems
+        in the scene, creating it if it was cleared.
+        """
+
+        if self.lookbackMultiplePriceBarIndex != None:
+            return self.lookbackMultiplePriceBarIndex
+
+        points = []
+
+        graphicsItems = self.items()
+        for item in graphicsItems:
+            if isinstance(item, LookbackMultiplePriceBarGraphicsItem):
+                highPointF = item.getLookbackMultiplePriceBarHighScenePoint()
+
+                points.append(\
+                    (highPointF.x(),
+                     item.getLookbackMultiplePriceBarOpenScenePoint().y(),
+                     highPointF.y(),
+                     item.getLookbackMultiplePriceBarLowScenePoint().y(),
+                     item.getLookbackMultiplePriceBarCloseScenePoint().y()))
+
+        points.sort(key=lambda x: x[0])
+
+        self.lookbackMultiplePriceBarIndex = \
+            self._createOHLCIndex([p[0] for p in points],
+                                  [p[1] for p in points],
+                                  [p[2] for p in points],
+                                  [p[3] for p in points],
+                                  [p[4] for p in points])
+
+        return self.lookbackMultiplePriceBarIndex
+
+    def _getClosestOHLCPointInIndex(self, index, pointF,
+                                    scalingX=1.0, scalingY=1.0):
+        """Returns the open, high, low or close point in the given
+        index that is the closest to 'pointF', after scaling the X and
+        Y distances by 'scalingX' and 'scalingY'.
+
+        The bars are visited in order of increasing X distance from
+        'pointF', starting at the bisection point, so the search stops
+        at the first bar that is farther away in X alone than the
+        closest point found.
+
+        Returns:
+        QPointF in scene coordinates, or None if the index is empty.
+        """
+
+        xs = index["xs"]
+        openYs = index["openYs"]
+        highYs = index["highYs"]
+        lowYs = index["lowYs"]
+        closeYs = index["closeYs"]
+
+        numBars = len(xs)
+
+        pointX = pointF.x()
+        pointY = pointF.y()
+
+        closestPoint = None
+        smallestLength = None
+
+        right = bisect.bisect_left(xs, pointX)
+        left = right - 1
+
+        while left >= 0 or right < numBars:
+            # Visit the bar closer in X next.
+            if right >= numBars or \
+               (left >= 0 and pointX - xs[left] <= xs[right] - pointX):
+
+                i = left
+                left -= 1
+            else:
+                i = right
+                right += 1
+
+            dx = abs((xs[i] - pointX) * scalingX)
+
+            # All the remaining bars are at least this far away.
+            if smallestLength != None and dx >= smallestLength:
+                break
+
+            for y in (openYs[i], highYs[i], lowYs[i], closeYs[i]):
+                length = math.hypot(dx, (y - pointY) * scalingY)
+
+                if smallestLength == None or length < smallestLength:
+                    closestPoint = QPointF(xs[i], y)
+                    smallestLength = length
+
+        return closestPoint
+
+    def _getClosestXInIndex(self, index, x):
+        """Returns the scene X position in the given index that is the
+        closest to 'x', or None if the index is empty.
+        """
+
+        return self._getClosestValueInSortedArray(index["xs"], x)
+
+    def _getClosestHighLowYInIndex(self, index, y):
+        """Returns the scene Y position of a high or low in the given
+        index that is the closest to 'y', or None if the index is empty.
+        """
+
+        return self._getClosestValueInSortedArray(index["highLowYs"], y)
+
+    def _getClosestValueInSortedArray(self, values, value):
+        """Returns the value in the sorted sequence 'values' that is the
+        closest to 'value', or None if 'values' is empty.
+        """
+
+        i = bisect.bisect_left(values, value)
+
+        candidates = values[max(0, i - 1):i + 1]
+        if len(candidates) == 0:
+            return None
+
+        return min(candidates, key=lambda x: abs(x - value))
+
     def clearCachedPriceBars(self):
         """Clears what we pre-determined was the highest, lowest,
         earliest and latest PriceBars.  These will be recalculated the
@@ -44862,16 +46822,11 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         
         earliestPriceBar = None
         
-        graphicsItems = self.items()
-
-        for item in graphicsItems:
-            if isinstance(item, PriceBarGraphicsItem):
-                pb = item.getPriceBar()
+        # PriceBars are sorted by timestamp.
+        priceBars = self.priceBarLayerGraphicsItem.getPriceBars()
 
-                if earliestPriceBar == None:
-                    earliestPriceBar = pb
-                elif pb.timestamp < earliestPriceBar.timestamp:
-                    earliestPriceBar = pb
+        if len(priceBars) > 0:
+            earliestPriceBar = priceBars[0]
 
         # Cache for later usage.
         self.earliestPriceBar = earliestPriceBar
@@ -44892,16 +46847,11 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         
         latestPriceBar = None
         
-        graphicsItems = self.items()
-
-        for item in graphicsItems:
-            if isinstance(item, PriceBarGraphicsItem):
-                pb = item.getPriceBar()
+        # PriceBars are sorted by timestamp.
+        priceBars = self.priceBarLayerGraphicsItem.getPriceBars()
 
-                if latestPriceBar == None:
-                    latestPriceBar = pb
-                elif pb.timestamp > latestPriceBar.timestamp:
-                    latestPriceBar = pb
+        if len(priceBars) > 0:
+            latestPriceBar = priceBars[-1]
 
         # Cache for later usage.
         self.latestPriceBar = latestPriceBar
@@ -44922,17 +46872,14 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         
         highestPriceBar = None
         
-        graphicsItems = self.items()
+        priceBars = self.priceBarLayerGraphicsItem.getPriceBars()
 
-        for item in graphicsItems:
-            if isinstance(item, PriceBarGraphicsItem):
-                pb = item.getPriceBar()
-
-                if highestPriceBar == None:
-                    highestPriceBar = pb
-                elif pb.hasHigherHighThan(highestPriceBar):
-                    highestPriceBar = pb
-                    
+        for pb in priceBars:
+            if highestPriceBar == None:
+                highestPriceBar = pb
+            elif pb.hasHigherHighThan(highestPriceBar):
+                highestPriceBar = pb
+                
         # Cache for later usage.
         self.highestPriceBar = highestPriceBar
 
@@ -44952,16 +46899,13 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         
         lowestPriceBar = None
         
-        graphicsItems = self.items()
-
-        for item in graphicsItems:
-            if isinstance(item, PriceBarGraphicsItem):
-                pb = item.getPriceBar()
+        priceBars = self.priceBarLayerGraphicsItem.getPriceBars()
 
-                if lowestPriceBar == None:
-                    lowestPriceBar = pb
-                elif pb.hasLowerLowThan(lowestPriceBar):
-                    lowestPriceBar = pb
+        for pb in priceBars:
+            if lowestPriceBar == None:
+                lowestPriceBar = pb
+            elif pb.hasLowerLowThan(lowestPriceBar):
+                lowestPriceBar = pb
         
         # Cache for later usage.
         self.lowestPriceBar = lowestPriceBar
@@ -45091,108 +47035,15 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         """
 
         self.log.debug("Entered getClosestPriceBarOHLCPoint()")
-        
-        # QPointF for the closest point.
-        closestPoint = None
 
-        # Smallest length of line from pointF to desired point.
-        smallestLength = None
-        
-        # PriceBarGraphicsItem that is the closest.
-        closestPriceBarGraphicsItem = None
-        
-        # Allocate lines ahead of time so we don't have
-        # to create and destroy a whole bunch of them in the loop.
-        lineToOpen = QLineF()
-        lineToHigh = QLineF()
-        lineToLow = QLineF()
-        lineToClose = QLineF()
+        self.log.debug("PointF is: ({}, {})".format(pointF.x(), pointF.y()))
 
-        graphicsItems = self.items()
+        closestPoint = \
+            self._getClosestOHLCPointInIndex(self.priceBarIndex, pointF)
 
-        self.log.debug("PointF is: ({}, {})".format(pointF.x(), pointF.y()))
-                       
-        for item in graphicsItems:
-            if isinstance(item, PriceBarGraphicsItem):
-                # Get the points of the open, high, low, and close of
-                # this PriceBarGraphicsItem.
-                openPointF = item.getPriceBarOpenScenePoint()
-                highPointF = item.getPriceBarHighScenePoint()
-                lowPointF = item.getPriceBarLowScenePoint()
-                closePointF = item.getPriceBarCloseScenePoint()
-
-                #self.log.debug("openPointF is: ({}, {})".
-                #               format(openPointF.x(), openPointF.y()))
-                #self.log.debug("highPointF is: ({}, {})".
-                #               format(highPointF.x(), highPointF.y()))
-                #self.log.debug("lowPointF is: ({}, {})".
-                #               format(lowPointF.x(), lowPointF.y()))
-                #self.log.debug("closePointF is: ({}, {})".
-                #               format(closePointF.x(), closePointF.y()))
-
-                # Create lines so we can get the lengths between the points.
-                lineToOpen.setPoints(pointF, openPointF)
-                lineToHigh.setPoints(pointF, highPointF)
-                lineToLow.setPoints(pointF, lowPointF)
-                lineToClose.setPoints(pointF, closePointF)
-
-                lineToOpenLength = lineToOpen.length()
-                lineToHighLength = lineToHigh.length()
-                lineToLowLength = lineToLow.length()
-                lineToCloseLength = lineToClose.length()
-                
-                #self.log.debug("lineToOpenLength is: {}".\
-                #               format(lineToOpenLength))
-                #self.log.debug("lineToHighLength is: {}".\
-                #               format(lineToHighLength))
-                #self.log.debug("lineToLowLength is: {}".\
-                #               format(lineToLowLength))
-                #self.log.debug("lineToCloseLength is: {}".\
-                #               format(lineToCloseLength))
-
-                # Set the initial smallestLength as the first point if
-                # it is not set already.
-                if smallestLength == None:
-                    closestPoint = openPointF
-                    smallestLength = lineToOpen.length()
-                    closestPriceBarGraphicsItem = item
-
-                # Test the open, high, low, and close points to see if
-                # they are now the closest to pointF.
-                if lineToOpenLength < smallestLength:
-                    closestPoint = openPointF
-                    smallestLength = lineToOpenLength
-                    closestPriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: " +
-                    #               "({}, {})".format(closestPoint.x(),
-                    #                                 closestPoint.y()))
-
-                if lineToHighLength < smallestLength:
-                    closestPoint = highPointF
-                    smallestLength = lineToHighLength
-                    closestPriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: " +
-                    #               "({}, {})".format(closestPoint.x(),
-                    #                                 closestPoint.y()))
-
-                if lineToLowLength < smallestLength:
-                    closestPoint = lowPointF
-                    smallestLength = lineToLowLength
-                    closestPriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: " +
-                    #               "({}, {})".format(closestPoint.x(),
-                    #                                 closestPoint.y()))
-
-                if lineToCloseLength < smallestLength:
-                    closestPoint = closePointF
-                    smallestLength = lineToCloseLength
-                    closestPriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: " +
-                    #               "({}, {})".format(closestPoint.x(),
-                    #                                 closestPoint.y()))
-                    
-        self.log.debug("Closest point is: ({}, {})".format(closestPoint.x(),
-                                                           closestPoint.y()))
+        if closestPoint != None:
+            self.log.debug("Closest point is: ({}, {})".\
+                           format(closestPoint.x(), closestPoint.y()))
 
         self.log.debug("Exiting getClosestPriceBarOHLCPoint()")
         
@@ -45216,172 +47067,31 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         open, high, low, or close (in price and time), when computed
         using scaled view coordinates.
         """
-        
-        self.log.debug("Entered getClosestPriceBarOHLCViewPoint()")
-        
-        # QPointF for the closest point.
-        closestPoint = None
 
-        # Smallest length of line from pointF to desired point.
-        smallestLength = None
+        self.log.debug("Entered getClosestPriceBarOHLCViewPoint()")
         
-        # PriceBarGraphicsItem that is the closest.
-        closestPriceBarGraphicsItem = None
-
         # Scaling object to use.
         scaling = self.scaling
         
         self.log.debug("PointF is: ({}, {})".format(pointF.x(), pointF.y()))
 
-        viewScaledPointF = QPointF(pointF.x() * scaling.getViewScalingX(),
-                                   pointF.y() * scaling.getViewScalingY())
-        
-        self.log.debug("View-scaled PointF is: ({}, {})".\
-                       format(viewScaledPointF.x(), viewScaledPointF.y()))
-
-        # Allocate the points and lines ahead of time so we don't have
-        # to create and destroy a whole bunch of them in the loop.
-        viewScaledOpenPointF = QPointF()
-        viewScaledHighPointF = QPointF()
-        viewScaledLowPointF = QPointF()
-        viewScaledClosePointF = QPointF()
-        lineToOpen = QLineF()
-        lineToHigh = QLineF()
-        lineToLow = QLineF()
-        lineToClose = QLineF()
+        # Distances are compared in view-scaled coordinates, but the
+        # closest point is returned in scene coordinates.
+        closestPoint = \
+            self._getClosestOHLCPointInIndex(self.priceBarIndex,
+                                             pointF,
+                                             scaling.getViewScalingX(),
+                                             scaling.getViewScalingY())
 
-        graphicsItems = self.items()
-
-        for item in graphicsItems:
-            if isinstance(item, PriceBarGraphicsItem):
-                # Get the points of the open, high, low, and close of
-                # this PriceBarGraphicsItem.
-                openPointF = item.getPriceBarOpenScenePoint()
-                highPointF = item.getPriceBarHighScenePoint()
-                lowPointF = item.getPriceBarLowScenePoint()
-                closePointF = item.getPriceBarCloseScenePoint()
-
-                #self.log.debug("openPointF is: ({}, {})".
-                #               format(openPointF.x(), openPointF.y()))
-                #self.log.debug("highPointF is: ({}, {})".
-                #               format(highPointF.x(), highPointF.y()))
-                #self.log.debug("lowPointF is: ({}, {})".
-                #               format(lowPointF.x(), lowPointF.y()))
-                #self.log.debug("closePointF is: ({}, {})".
-                #               format(closePointF.x(), closePointF.y()))
-
-                viewScaledOpenPointF.\
-                    setX(openPointF.x() * scaling.getViewScalingX())
-                viewScaledOpenPointF.\
-                    setY(openPointF.y() * scaling.getViewScalingY())
-                
-                viewScaledHighPointF.\
-                    setX(highPointF.x() * scaling.getViewScalingX())
-                viewScaledHighPointF.\
-                    setY(highPointF.y() * scaling.getViewScalingY())
-                
-                viewScaledLowPointF.\
-                    setX(lowPointF.x() * scaling.getViewScalingX())
-                viewScaledLowPointF.\
-                    setY(lowPointF.y() * scaling.getViewScalingY())
-                
-                viewScaledClosePointF.\
-                    setX(closePointF.x() * scaling.getViewScalingX())
-                viewScaledClosePointF.\
-                    setY(closePointF.y() * scaling.getViewScalingY())
-
-                #self.log.debug("viewScaledOpenPointF is: ({}, {})".
-                #               format(viewScaledOpenPointF.x(),
-                #                      viewScaledOpenPointF.y()))
-                #self.log.debug("viewScaledHighPointF is: ({}, {})".
-                #               format(viewScaledHighPointF.x(),
-                #                      viewScaledHighPointF.y()))
-                #self.log.debug("viewScaledLowPointF is: ({}, {})".
-                #               format(viewScaledLowPointF.x(),
-                #                      viewScaledLowPointF.y()))
-                #self.log.debug("viewScaledClosePointF is: ({}, {})".
-                #               format(viewScaledClosePointF.x(),
-                #                      viewScaledClosePointF.y()))
-
-                # Create lines so we can get the lengths between the points.
-                lineToOpen.setPoints(viewScaledPointF, viewScaledOpenPointF)
-                lineToHigh.setPoints(viewScaledPointF, viewScaledHighPointF)
-                lineToLow.setPoints(viewScaledPointF, viewScaledLowPointF)
-                lineToClose.setPoints(viewScaledPointF, viewScaledClosePointF)
-
-                lineToOpenLength = lineToOpen.length()
-                lineToHighLength = lineToHigh.length()
-                lineToLowLength = lineToLow.length()
-                lineToCloseLength = lineToClose.length()
-                
-                #self.log.debug("lineToOpenLength is: {}".\
-                #               format(lineToOpenLength))
-                #self.log.debug("lineToHighLength is: {}".\
-                #               format(lineToHighLength))
-                #self.log.debug("lineToLowLength is: {}".\
-                #               format(lineToLowLength))
-                #self.log.debug("lineToCloseLength is: {}".\
-                #               format(lineToCloseLength))
-
-                # Set the initial smallestLength as the first point if
-                # it is not set already.
-                if smallestLength == None:
-                    # Here we are keeping the scene coordinate, not the
-                    # view-scaled one.
-                    closestPoint = openPointF
-                    smallestLength = lineToOpen.length()
-                    closestPriceBarGraphicsItem = item
-
-                # Test the open, high, low, and close points to see if
-                # they are now the closest to pointF.
-                if lineToOpenLength < smallestLength:
-                    # Here we are keeping the scene coordinate, not the
-                    # view-scaled one.
-                    closestPoint = openPointF
-                    smallestLength = lineToOpenLength
-                    closestPriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: ({}, {})".\
-                    #               format(closestPoint.x(),
-                    #                      closestPoint.y()))
-
-                if lineToHighLength < smallestLength:
-                    # Here we are keeping the scene coordinate, not the
-                    # view-scaled one.
-                    closestPoint = highPointF
-                    smallestLength = lineToHighLength
-                    closestPriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: ({}, {})".\
-                    #               format(closestPoint.x(),
-                    #                      closestPoint.y()))
-
-                if lineToLowLength < smallestLength:
-                    # Here we are keeping the scene coordinate, not the
-                    # view-scaled one.
-                    closestPoint = lowPointF
-                    smallestLength = lineToLowLength
-                    closestPriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: ({}, {})".\
-                    #               format(closestPoint.x(),
-                    #                      closestPoint.y()))
-
-                if lineToCloseLength < smallestLength:
-                    # Here we are keeping the scene coordinate, not the
-                    # view-scaled one.
-                    closestPoint = closePointF
-                    smallestLength = lineToCloseLength
-                    closestPriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: ({}, {})".\
-                    #               format(closestPoint.x(),
-                    #                      closestPoint.y()))
-                    
-        self.log.debug("Closest point is: ({}, {})".\
-                       format(closestPoint.x(), closestPoint.y()))
+        if closestPoint != None:
+            self.log.debug("Closest point is: ({}, {})".\
+                           format(closestPoint.x(), closestPoint.y()))
 
         self.log.debug("Exiting getClosestPriceBarOHLCViewPoint()")
         
         return closestPoint
         
-        
+
     def getClosestPriceBarX(self, pointF):
         """Gets the X position value of the closest PriceBar (on the X
         axis) to the given QPointF position.
@@ -45394,28 +47104,8 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         returns the X given in the input pointF.
         """
 
-        # Get all the QGraphicsItems.
-        graphicsItems = self.items()
-
-        closestPriceBarX = None
-        currClosestDistance = None
-
-        # Go through the PriceBarGraphicsItems and find the closest one in
-        # X coordinates.
-        for item in graphicsItems:
-            if isinstance(item, PriceBarGraphicsItem):
-
-                x = item.getPriceBarHighScenePoint().x()
-                distance = abs(pointF.x() - x)
-
-                if closestPriceBarX == None:
-                    closestPriceBarX = x
-                    currClosestDistance = distance
-                elif (currClosestDistance != None) and \
-                        (distance < currClosestDistance):
-
-                    closestPriceBarX = x
-                    currClosestDistance = distance
+        closestPriceBarX = \
+            self._getClosestXInIndex(self.priceBarIndex, pointF.x())
                     
         if closestPriceBarX == None:
             closestPriceBarX = pointF.x()
@@ -45435,42 +47125,8 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         returns the Y given in the input pointF.
         """
 
-        # Get all the QGraphicsItems.
-        graphicsItems = self.items()
-
-        closestPriceBarY = None
-        currClosestDistance = None
-
-        # Go through the PriceBarGraphicsItems and find the closest one in
-        # Y coordinates.
-        for item in graphicsItems:
-            if isinstance(item, PriceBarGraphicsItem):
-
-                # High price's Y.
-                y = item.getPriceBarHighScenePoint().y()
-                distance = abs(pointF.y() - y)
-                
-                if closestPriceBarY == None:
-                    closestPriceBarY = y
-                    currClosestDistance = distance
-                elif (currClosestDistance != None) and \
-                        (distance < currClosestDistance):
-
-                    closestPriceBarY = y
-                    currClosestDistance = distance
-
-                # Low price's Y.
-                y = item.getPriceBarLowScenePoint().y()
-                distance = abs(pointF.y() - y)
-
-                if closestPriceBarY == None:
-                    closestPriceBarY = y
-                    currClosestDistance = distance
-                elif (currClosestDistance != None) and \
-                        (distance < currClosestDistance):
-
-                    closestPriceBarY = y
-                    currClosestDistance = distance
+        closestPriceBarY = \
+            self._getClosestHighLowYInIndex(self.priceBarIndex, pointF.y())
                     
         if closestPriceBarY == None:
             closestPriceBarY = pointF.y()
@@ -45500,117 +47156,15 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         """
 
         self.log.debug("Entered getClosestLookbackMultiplePriceBarOHLCPoint()")
-        
-        # QPointF for the closest point.
-        closestPoint = None
 
-        # Smallest length of line from pointF to desired point.
-        smallestLength = None
-        
-        # LookbackMultiplePriceBarGraphicsItem that is the closest.
-        closestLookbackMultiplePriceBarGraphicsItem = None
-        
-        # Allocate lines ahead of time so we don't have
-        # to create and destroy a whole bunch of them in the loop.
-        lineToOpen = QLineF()
-        lineToHigh = QLineF()
-        lineToLow = QLineF()
-        lineToClose = QLineF()
+        self.log.debug("PointF is: ({}, {})".format(pointF.x(), pointF.y()))
 
-        graphicsItems = self.items()
+        closestPoint = \
+            self._getClosestOHLCPointInIndex(self._getLookbackMultiplePriceBarIndex(), pointF)
 
-        self.log.debug("PointF is: ({}, {})".format(pointF.x(), pointF.y()))
-                       
-        for item in graphicsItems:
-            if isinstance(item, LookbackMultiplePriceBarGraphicsItem):
-                # Get the points of the open, high, low, and close of
-                # this LookbackMultiplePriceBarGraphicsItem.
-                openPointF = item.getLookbackMultiplePriceBarOpenScenePoint()
-                highPointF = item.getLookbackMultiplePriceBarHighScenePoint()
-                lowPointF = item.getLookbackMultiplePriceBarLowScenePoint()
-                closePointF = item.getLookbackMultiplePriceBarCloseScenePoint()
-
-                #self.log.debug("openPointF is: ({}, {})".
-                #               format(openPointF.x(), openPointF.y()))
-                #self.log.debug("highPointF is: ({}, {})".
-                #               format(highPointF.x(), highPointF.y()))
-                #self.log.debug("lowPointF is: ({}, {})".
-                #               format(lowPointF.x(), lowPointF.y()))
-                #self.log.debug("closePointF is: ({}, {})".
-                #               format(closePointF.x(), closePointF.y()))
-
-                # Create lines so we can get the lengths between the points.
-                lineToOpen.setPoints(pointF, openPointF)
-                lineToHigh.setPoints(pointF, highPointF)
-                lineToLow.setPoints(pointF, lowPointF)
-                lineToClose.setPoints(pointF, closePointF)
-
-                lineToOpenLength = lineToOpen.length()
-                lineToHighLength = lineToHigh.length()
-                lineToLowLength = lineToLow.length()
-                lineToCloseLength = lineToClose.length()
-                
-                #self.log.debug("lineToOpenLength is: {}".\
-                #               format(lineToOpenLength))
-                #self.log.debug("lineToHighLength is: {}".\
-                #               format(lineToHighLength))
-                #self.log.debug("lineToLowLength is: {}".\
-                #               format(lineToLowLength))
-                #self.log.debug("lineToCloseLength is: {}".\
-                #               format(lineToCloseLength))
-
-                # Set the initial smallestLength as the first point if
-                # it is not set already.
-                if smallestLength == None:
-                    closestPoint = openPointF
-                    smallestLength = lineToOpen.length()
-                    closestLookbackMultiplePriceBarGraphicsItem = item
-
-                # Test the open, high, low, and close points to see if
-                # they are now the closest to pointF.
-                if lineToOpenLength < smallestLength:
-                    closestPoint = openPointF
-                    smallestLength = lineToOpenLength
-                    closestLookbackMultiplePriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: " +
-                    #               "({}, {})".format(closestPoint.x(),
-                    #                                 closestPoint.y()))
-
-                if lineToHighLength < smallestLength:
-                    closestPoint = highPointF
-                    smallestLength = lineToHighLength
-                    closestLookbackMultiplePriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: " +
-                    #               "({}, {})".format(closestPoint.x(),
-                    #                                 closestPoint.y()))
-
-                if lineToLowLength < smallestLength:
-                    closestPoint = lowPointF
-                    smallestLength = lineToLowLength
-                    closestLookbackMultiplePriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: " +
-                    #               "({}, {})".format(closestPoint.x(),
-                    #                                 closestPoint.y()))
-
-                if lineToCloseLength < smallestLength:
-                    closestPoint = closePointF
-                    smallestLength = lineToCloseLength
-                    closestLookbackMultiplePriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: " +
-                    #               "({}, {})".format(closestPoint.x(),
-                    #                                 closestPoint.y()))
-                    
-        if closestPoint == None:
-            # If the closestPoint is still None, then that means there are 
-            # no LookbackMultiplePriceBars.  
-            # In this case, use pointF as the closestPoint.
-            closestPoint = pointF
-
-            self.log.debug("There are no LookbackMultiplePriceBars, " + \
-                           "so useing pointF as the closest point.")
-        else:
-            self.log.debug("Closest point is: ({}, {})".format(closestPoint.x(),
-                                                               closestPoint.y()))
+        if closestPoint != None:
+            self.log.debug("Closest point is: ({}, {})".\
+                           format(closestPoint.x(), closestPoint.y()))
 
         self.log.debug("Exiting getClosestLookbackMultiplePriceBarOHLCPoint()")
         
@@ -45634,174 +47188,23 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         open, high, low, or close (in price and time), when computed
         using scaled view coordinates.
         """
-        
-        self.log.debug("Entered getClosestLookbackMultiplePriceBarOHLCViewPoint()")
-        
-        # QPointF for the closest point.
-        closestPoint = None
 
-        # Smallest length of line from pointF to desired point.
-        smallestLength = None
+        self.log.debug("Entered getClosestLookbackMultiplePriceBarOHLCViewPoint()")
         
-        # LookbackMultiplePriceBarGraphicsItem that is the closest.
-        closestLookbackMultiplePriceBarGraphicsItem = None
-
         # Scaling object to use.
         scaling = self.scaling
         
         self.log.debug("PointF is: ({}, {})".format(pointF.x(), pointF.y()))
 
-        viewScaledPointF = QPointF(pointF.x() * scaling.getViewScalingX(),
-                                   pointF.y() * scaling.getViewScalingY())
-        
-        self.log.debug("View-scaled PointF is: ({}, {})".\
-                       format(viewScaledPointF.x(), viewScaledPointF.y()))
-
-        # Allocate the points and lines ahead of time so we don't have
-        # to create and destroy a whole bunch of them in the loop.
-        viewScaledOpenPointF = QPointF()
-        viewScaledHighPointF = QPointF()
-        viewScaledLowPointF = QPointF()
-        viewScaledClosePointF = QPointF()
-        lineToOpen = QLineF()
-        lineToHigh = QLineF()
-        lineToLow = QLineF()
-        lineToClose = QLineF()
-
-        graphicsItems = self.items()
+        # Distances are compared in view-scaled coordinates, but the
+        # closest point is returned in scene coordinates.
+        closestPoint = \
+            self._getClosestOHLCPointInIndex(self._getLookbackMultiplePriceBarIndex(),
+                                             pointF,
+                                             scaling.getViewScalingX(),
+                                             scaling.getViewScalingY())
 
-        for item in graphicsItems:
-            if isinstance(item, LookbackMultiplePriceBarGraphicsItem):
-                # Get the points of the open, high, low, and close of
-                # this LookbackMultiplePriceBarGraphicsItem.
-                openPointF = item.getLookbackMultiplePriceBarOpenScenePoint()
-                highPointF = item.getLookbackMultiplePriceBarHighScenePoint()
-                lowPointF = item.getLookbackMultiplePriceBarLowScenePoint()
-                closePointF = item.getLookbackMultiplePriceBarCloseScenePoint()
-
-                #self.log.debug("openPointF is: ({}, {})".
-                #               format(openPointF.x(), openPointF.y()))
-                #self.log.debug("highPointF is: ({}, {})".
-                #               format(highPointF.x(), highPointF.y()))
-                #self.log.debug("lowPointF is: ({}, {})".
-                #               format(lowPointF.x(), lowPointF.y()))
-                #self.log.debug("closePointF is: ({}, {})".
-                #               format(closePointF.x(), closePointF.y()))
-
-                viewScaledOpenPointF.\
-                    setX(openPointF.x() * scaling.getViewScalingX())
-                viewScaledOpenPointF.\
-                    setY(openPointF.y() * scaling.getViewScalingY())
-                
-                viewScaledHighPointF.\
-                    setX(highPointF.x() * scaling.getViewScalingX())
-                viewScaledHighPointF.\
-                    setY(highPointF.y() * scaling.getViewScalingY())
-                
-                viewScaledLowPointF.\
-                    setX(lowPointF.x() * scaling.getViewScalingX())
-                viewScaledLowPointF.\
-                    setY(lowPointF.y() * scaling.getViewScalingY())
-                
-                viewScaledClosePointF.\
-                    setX(closePointF.x() * scaling.getViewScalingX())
-                viewScaledClosePointF.\
-                    setY(closePointF.y() * scaling.getViewScalingY())
-
-                #self.log.debug("viewScaledOpenPointF is: ({}, {})".
-                #               format(viewScaledOpenPointF.x(),
-                #                      viewScaledOpenPointF.y()))
-                #self.log.debug("viewScaledHighPointF is: ({}, {})".
-                #               format(viewScaledHighPointF.x(),
-                #                      viewScaledHighPointF.y()))
-                #self.log.debug("viewScaledLowPointF is: ({}, {})".
-                #               format(viewScaledLowPointF.x(),
-                #                      viewScaledLowPointF.y()))
-                #self.log.debug("viewScaledClosePointF is: ({}, {})".
-                #               format(viewScaledClosePointF.x(),
-                #                      viewScaledClosePointF.y()))
-
-                # Create lines so we can get the lengths between the points.
-                lineToOpen.setPoints(viewScaledPointF, viewScaledOpenPointF)
-                lineToHigh.setPoints(viewScaledPointF, viewScaledHighPointF)
-                lineToLow.setPoints(viewScaledPointF, viewScaledLowPointF)
-                lineToClose.setPoints(viewScaledPointF, viewScaledClosePointF)
-
-                lineToOpenLength = lineToOpen.length()
-                lineToHighLength = lineToHigh.length()
-                lineToLowLength = lineToLow.length()
-                lineToCloseLength = lineToClose.length()
-                
-                #self.log.debug("lineToOpenLength is: {}".\
-                #               format(lineToOpenLength))
-                #self.log.debug("lineToHighLength is: {}".\
-                #               format(lineToHighLength))
-                #self.log.debug("lineToLowLength is: {}".\
-                #               format(lineToLowLength))
-                #self.log.debug("lineToCloseLength is: {}".\
-                #               format(lineToCloseLength))
-
-                # Set the initial smallestLength as the first point if
-                # it is not set already.
-                if smallestLength == None:
-                    # Here we are keeping the scene coordinate, not the
-                    # view-scaled one.
-                    closestPoint = openPointF
-                    smallestLength = lineToOpen.length()
-                    closestLookbackMultiplePriceBarGraphicsItem = item
-
-                # Test the open, high, low, and close points to see if
-                # they are now the closest to pointF.
-                if lineToOpenLength < smallestLength:
-                    # Here we are keeping the scene coordinate, not the
-                    # view-scaled one.
-                    closestPoint = openPointF
-                    smallestLength = lineToOpenLength
-                    closestLookbackMultiplePriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: ({}, {})".\
-                    #               format(closestPoint.x(),
-                    #                      closestPoint.y()))
-
-                if lineToHighLength < smallestLength:
-                    # Here we are keeping the scene coordinate, not the
-                    # view-scaled one.
-                    closestPoint = highPointF
-                    smallestLength = lineToHighLength
-                    closestLookbackMultiplePriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: ({}, {})".\
-                    #               format(closestPoint.x(),
-                    #                      closestPoint.y()))
-
-                if lineToLowLength < smallestLength:
-                    # Here we are keeping the scene coordinate, not the
-                    # view-scaled one.
-                    closestPoint = lowPointF
-                    smallestLength = lineToLowLength
-                    closestLookbackMultiplePriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: ({}, {})".\
-                    #               format(closestPoint.x(),
-                    #                      closestPoint.y()))
-
-                if lineToCloseLength < smallestLength:
-                    # Here we are keeping the scene coordinate, not the
-                    # view-scaled one.
-                    closestPoint = closePointF
-                    smallestLength = lineToCloseLength
-                    closestLookbackMultiplePriceBarGraphicsItem = item
-                    #self.log.debug("New closest point is now: ({}, {})".\
-                    #               format(closestPoint.x(),
-                    #                      closestPoint.y()))
-                    
-
-        if closestPoint == None:
-            # If the closestPoint is still None, then that means there are 
-            # no LookbackMultiplePriceBars.  
-            # In this case, use pointF as the closestPoint.
-            closestPoint = pointF
-
-            self.log.debug("There are no LookbackMultiplePriceBars, " + \
-                           "so useing pointF as the closest point.")
-        else:    
+        if closestPoint != None:
             self.log.debug("Closest point is: ({}, {})".\
                            format(closestPoint.x(), closestPoint.y()))
 
@@ -45809,7 +47212,7 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         
         return closestPoint
         
-        
+
     def getClosestLookbackMultiplePriceBarX(self, pointF):
         """Gets the X position value of the closest LookbackMultiplePriceBar (on the X
         axis) to the given QPointF position.
@@ -45822,28 +47225,8 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         returns the X given in the input pointF.
         """
 
-        # Get all the QGraphicsItems.
-        graphicsItems = self.items()
-
-        closestLookbackMultiplePriceBarX = None
-        currClosestDistance = None
-
-        # Go through the LookbackMultiplePriceBarGraphicsItems and find the closest one in
-        # X coordinates.
-        for item in graphicsItems:
-            if isinstance(item, LookbackMultiplePriceBarGraphicsItem):
-
-                x = item.getLookbackMultiplePriceBarHighScenePoint().x()
-                distance = abs(pointF.x() - x)
-
-                if closestLookbackMultiplePriceBarX == None:
-                    closestLookbackMultiplePriceBarX = x
-                    currClosestDistance = distance
-                elif (currClosestDistance != None) and \
-                        (distance < currClosestDistance):
-
-                    closestLookbackMultiplePriceBarX = x
-                    currClosestDistance = distance
+        closestLookbackMultiplePriceBarX = \
+            self._getClosestXInIndex(self._getLookbackMultiplePriceBarIndex(), pointF.x())
                     
         if closestLookbackMultiplePriceBarX == None:
             closestLookbackMultiplePriceBarX = pointF.x()
@@ -45863,42 +47246,8 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         returns the Y given in the input pointF.
         """
 
-        # Get all the QGraphicsItems.
-        graphicsItems = self.items()
-
-        closestLookbackMultiplePriceBarY = None
-        currClosestDistance = None
-
-        # Go through the LookbackMultiplePriceBarGraphicsItems and find the closest one in
-        # Y coordinates.
-        for item in graphicsItems:
-            if isinstance(item, LookbackMultiplePriceBarGraphicsItem):
-
-                # High price's Y.
-                y = item.getLookbackMultiplePriceBarHighScenePoint().y()
-                distance = abs(pointF.y() - y)
-                
-                if closestLookbackMultiplePriceBarY == None:
-                    closestLookbackMultiplePriceBarY = y
-                    currClosestDistance = distance
-                elif (currClosestDistance != None) and \
-                        (distance < currClosestDistance):
-
-                    closestLookbackMultiplePriceBarY = y
-                    currClosestDistance = distance
-
-                # Low price's Y.
-                y = item.getLookbackMultiplePriceBarLowScenePoint().y()
-                distance = abs(pointF.y() - y)
-
-                if closestLookbackMultiplePriceBarY == None:
-                    closestLookbackMultiplePriceBarY = y
-                    currClosestDistance = distance
-                elif (currClosestDistance != None) and \
-                        (distance < currClosestDistance):
-
-                    closestLookbackMultiplePriceBarY = y
-                    currClosestDistance = distance
+        closestLookbackMultiplePriceBarY = \
+            self._getClosestHighLowYInIndex(self._getLookbackMultiplePriceBarIndex(), pointF.y())
                     
         if closestLookbackMultiplePriceBarY == None:
             closestLookbackMultiplePriceBarY = pointF.y()
@@ -46149,14 +47498,7 @@ class PriceBarChartGraphicsScene(QGraphicsScene):
         in the scene.
         """
         
-        count = 0
-
-        graphicsItems = self.items()
-        for item in graphicsItems:
-            if isinstance(item, LookbackMultiplePriceBarGraphicsItem):
-                count += 1
-        
-        return count
+        return len(self._getLookbackMultiplePriceBarIndex()["xs"])
 
     def setAstroChart1(self, x):
         """Emits the astroChart1Update signal so that an external
@@ -46531,6 +47873,50 @@ class PriceBarChartGraphicsView(QGraphicsView):
         self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
         #self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
 
+        # PriceBars selected with the rubber band need their own
+        # PriceBarGraphicsItems.
+        self.rubberBandChanged.connect(self._handleRubberBandChanged)
+
+    def _handleRubberBandChanged(self,
+                                 rubberBandRect,
+                                 fromScenePoint,
+                                 toScenePoint):
+        """Creates the PriceBarGraphicsItems of the PriceBars within the
+        rubber band, so that the scene selects them along with the
+        other items.  The PriceBarLayerGraphicsItem that draws the
+        PriceBars is not selectable.  QGraphicsView emits
+        rubberBandChanged before it sets the selection area of the
+        scene.
+
+        When the rubber band is released, the PriceBarGraphicsItems
+        that were created but not selected are removed.
+
+        Arguments:
+        rubberBandRect - QRect of the rubber band, in viewport
+                         coordinates.  This is a null QRect when the
+                         rubber band is released.
+        fromScenePoint - QPointF where the drag started, in scene
+                         coordinates.
+        toScenePoint   - QPointF where the drag is now, in scene
+                         coordinates.
+        """
+
+        scene = self.scene()
+        if not isinstance(scene, PriceBarChartGraphicsScene):
+            return
+
+        if rubberBandRect.isNull():
+            scene.removeUnusedPriceBarGraphicsItems()
+            return
+
+        # PriceBarGraphicsItems are only selectable in this mode.
+        if self.toolMode != \
+               PriceBarChartGraphicsView.ToolMode['ReadOnlyPointerTool']:
+            return
+
+        scene.getPriceBarGraphicsItemsInRect(\
+            self.mapToScene(rubberBandRect).boundingRect())
+
     def setPriceBarChartSettings(self, priceBarChartSettings):
         """Stores the reference to PriceBarChartSettings to be used in
         creating new QGraphicsItems.
@@ -47937,6 +49323,10 @@ class PriceBarChartGraphicsView(QGraphicsView):
         # See if the user has right clicked on a QGraphicsItem.
         items = []
         if scene != None:
+            # The PriceBar at this position needs its own
+            # PriceBarGraphicsItem for the context menu.
+            scene.getPriceBarGraphicsItemAt(clickPosF)
+            
             items = scene.items(clickPosF,
                                 Qt.ContainsItemBoundingRect,
                                 Qt.AscendingOrder)
@@ -48163,6 +49553,34 @@ class PriceBarChartGraphicsView(QGraphicsView):
         if scene != None:
             scene.openAstrolog(clickPosF.x())
         
+    def updatePriceBarLevelOfDetail(self):
+        """Sets the level of detail of the PriceBarLayerGraphicsItem of
+        the scene according to the current transform, so that the
+        number of PriceBar lines painted is bounded by the viewport
+        width rather than by the number of PriceBars.
+        """
+
+        scene = self.scene()
+
+        if isinstance(scene, PriceBarChartGraphicsScene):
+            m11 = abs(self.transform().m11())
+
+            if m11 > 0.0:
+                layer = scene.getPriceBarLayerGraphicsItem()
+                levelOfDetail = \
+                    layer.getLevelOfDetailForSceneWidthPerPixel(1.0 / m11)
+                layer.setLevelOfDetail(levelOfDetail)
+
+    def paintEvent(self, qpaintevent):
+        """Overwrites the QGraphicsView.paintEvent() function.
+        The level of detail of the PriceBars is updated here, since
+        the transform is changed from many places.
+        """
+
+        self.updatePriceBarLevelOfDetail()
+
+        super().paintEvent(qpaintevent)
+
     def wheelEvent(self, qwheelevent):
         """Triggered when the mouse wheel is scrolled."""
 
@@ -49484,6 +50902,11 @@ class PriceBarChartGraphicsView(QGraphicsView):
                 menu = self.createContextMenu(clickPosF, readOnlyFlag=True)
                 menu.exec_(qmouseevent.globalPos())
             else:
+                # The PriceBar at this position needs its own
+                # PriceBarGraphicsItem to be selected.
+                if self.scene() != None:
+                    self.scene().getPriceBarGraphicsItemAt(clickPosF)
+                    
                 self.log.debug("Passing mouse press event to super().")
                 super().mousePressEvent(qmouseevent)
 
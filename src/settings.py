@@ -44,6 +44,69 @@ class SettingsKeys():
     lookbackMultipleCalcModelDefValue = \
         "LookbackMultipleCalcModel.local_parallel"
     
+    # QSettings key for the number of processes used for
+    # LookbackMultiple calculation, running local parallel (int).
+    # Zero means the number of CPUs.
+    lookbackMultipleCalcNumProcessesKey = \
+        "lookbackmultiple/numProcesses"
+
+    # QSettings default value for the number of processes used for
+    # LookbackMultiple calculation, running local parallel (int).
+    lookbackMultipleCalcNumProcessesDefValue = 0
+    
+    # QSettings key for whether LookbackMultiplePriceBars are updated
+    # incrementally when the QGraphicsView is scrolled or zoomed (bool).
+    lookbackMultipleIncrementalRedrawEnabledKey = \
+        "lookbackmultiple/incrementalRedrawEnabled"
+
+    # QSettings default value for whether LookbackMultiplePriceBars are
+    # updated incrementally when the QGraphicsView is scrolled or
+    # zoomed (bool).
+    lookbackMultipleIncrementalRedrawEnabledDefValue = True
+    
+    # QSettings key for whether the local LookbackMultiple
+    # calculations get the planet longitudes from an
+    # EphemerisInterpolator instead of the Swiss Ephemeris (bool).
+    lookbackMultipleEphemerisInterpolatorEnabledKey = \
+        "lookbackmultiple/ephemerisInterpolatorEnabled"
+
+    # QSettings default value for whether the local LookbackMultiple
+    # calculations get the planet longitudes from an
+    # EphemerisInterpolator instead of the Swiss Ephemeris (bool).
+    lookbackMultipleEphemerisInterpolatorEnabledDefValue = False
+    
+    # QSettings key for whether LongitudeTimelines of the planets are
+    # built and kept in files next to the PriceChartDocument, for the
+    # local serial LookbackMultiple calculations (bool).
+    lookbackMultipleLongitudeTimelinesEnabledKey = \
+        "lookbackmultiple/longitudeTimelinesEnabled"
+
+    # QSettings default value for whether LongitudeTimelines of the
+    # planets are built and kept in files next to the
+    # PriceChartDocument, for the local serial LookbackMultiple
+    # calculations (bool).
+    lookbackMultipleLongitudeTimelinesEnabledDefValue = True
+    
+    # QSettings key for whether the results of LookbackMultiple
+    # calculations are cached in a file next to the PriceChartDocument
+    # (bool).
+    lookbackMultipleResultCacheEnabledKey = \
+        "lookbackmultiple/resultCacheEnabled"
+
+    # QSettings default value for whether the results of
+    # LookbackMultiple calculations are cached in a file next to the
+    # PriceChartDocument (bool).
+    lookbackMultipleResultCacheEnabledDefValue = True
+    
+    # QSettings key for the maximum number of results kept in the
+    # LookbackMultiple result cache of a PriceChartDocument (int).
+    lookbackMultipleResultCacheMaxEntriesKey = \
+        "lookbackmultiple/resultCacheMaxEntries"
+
+    # QSettings default value for the maximum number of results kept
+    # in the LookbackMultiple result cache of a PriceChartDocument (int).
+    lookbackMultipleResultCacheMaxEntriesDefValue = 1000000
+    
     # QSettings key for the server address used for LookbackMultiple
     # calculation, running parallel distributed.
     lookbackMultipleCalcRemoteServerAddressKey = \
@@ -71,6 +134,18 @@ class SettingsKeys():
     # LookbackMultiple calculation, running parallel distributed.
     lookbackMultipleCalcRemoteServerAuthKeyDefValue = "password"
     
+    # QSettings key for the number of seconds to wait for any result
+    # from the server used for LookbackMultiple calculation, running
+    # parallel distributed, before giving up on the rest (int).
+    lookbackMultipleCalcRemoteTimeoutSecKey = \
+        "lookbackmultiple/serverTimeoutSec"
+    
+    # QSettings default value for the number of seconds to wait for
+    # any result from the server used for LookbackMultiple
+    # calculation, running parallel distributed, before giving up on
+    # the rest (int).
+    lookbackMultipleCalcRemoteTimeoutSecDefValue = 120
+    
     # QSettings key for the BarCountGraphicsItem color (QColor object).
     barCountGraphicsItemColorSettingsKey = \
         "ui/pricebarchart/barCountGraphicsItemColor"
@@ -44,6 +44,9 @@ from astrologychart import AstrologyChartWidget
 from astrologychart import PlanetaryInfoTableWidget
 from lookbackmultiple_ui import LookbackMultiplePanelWidget
 
+# For the file name of the LookbackMultiple result cache.
+from lookbackmultiple_cache import LookbackMultipleResultCache
+
 class MainWindow(QMainWindow):
     """The QMainWindow class that is a multiple document interface (MDI)."""
 
@@ -4517,6 +4520,9 @@ class PriceChartDocument(QMdiSubWindow):
 
             self.isUntitled = False
 
+            # LookbackMultiple results are cached next to the file.
+            self.widgets.setDocumentFilename(self.filename)
+
             # The title is set to the filename without the path.
             loc = self.filename.rfind(os.sep)
             loc += len(os.sep)
@@ -5779,6 +5785,31 @@ class PriceChartDocumentWidget(QWidget):
 
         self.priceBarChartWidget.setTimezone(timezone)
 
+    def setDocumentFilename(self, filename):
+        """Sets the filename of this PriceChartDocument.  The results
+        of LookbackMultiple calculations, and the LongitudeTimelines of
+        the planets, are cached in files next to it.
+
+        Arguments:
+
+        filename - str holding the path of the PriceChartDocument file.
+        """
+
+        cacheFilename = None
+        if filename != "":
+            cacheFilename = \
+                LookbackMultipleResultCache.getCacheFilename(filename)
+
+        self.priceBarChartWidget.\
+            setLookbackMultipleResultCacheFilename(cacheFilename)
+
+        documentFilename = None
+        if filename != "":
+            documentFilename = filename
+
+        self.priceBarChartWidget.\
+            setLongitudeTimelineDocumentFilename(documentFilename)
+
     def loadPriceBars(self, priceBars):
         """Loads the price bars into the widgets.
         